@@ -3,12 +3,13 @@ import threading
 import time
 from datetime import datetime
 from decimal import Decimal
-from typing import TYPE_CHECKING, List, Optional, Set, Tuple
+from typing import TYPE_CHECKING, Dict, List, Optional
 
 import pandas as pd
 
 from hummingbot.client.performance import PerformanceMetrics
 from hummingbot.client.settings import MAXIMUM_TRADE_FILLS_DISPLAY_OUTPUT, AllConnectorSettings
+from hummingbot.client.trades_aggregator import MarketKey, TradesAggregate
 from hummingbot.client.ui.interface_utils import format_df_for_printout
 from hummingbot.core.utils.async_utils import safe_ensure_future
 from hummingbot.model.trade_fill import TradeFill
@@ -39,23 +40,28 @@ class HistoryCommand:
             self.notify("\n  Please first import a strategy config file of which to show historical performance.")
             return
         start_time = get_timestamp(days) if days > 0 else self.init_time
-        with self.trading_core.trade_fill_db.get_new_session() as session:
-            trades: List[TradeFill] = self._get_trades_from_session(
-                int(start_time * 1e3),
-                session=session,
-                config_file_path=self.strategy_file_name)
-            if not trades:
-                self.notify("\n  No past trades to report.")
-                return
-            if verbose:
-                self.list_trades(start_time)
-            safe_ensure_future(self.history_report(start_time, trades, precision))
+        safe_ensure_future(self._history(start_time, verbose, precision))
+
+    async def _history(self,  # type: HummingbotApplication
+                       start_time: float,
+                       verbose: bool,
+                       precision: Optional[int]):
+        aggregates: Dict[MarketKey, TradesAggregate] = await self.trading_core.aggregate_trades(start_time)
+        if not aggregates:
+            self.notify("\n  No past trades to report.")
+            return
+        if verbose:
+            self.list_trades(start_time)
+        await self.history_report(start_time, aggregates, precision)
 
     def get_history_trades_json(self,  # type: HummingbotApplication
                                 days: float = 0):
         if self.strategy_file_name is None:
             return
         start_time = get_timestamp(days) if days > 0 else self.init_time
+        if threading.current_thread() != threading.main_thread():
+            # Remote commands run in their own thread, which can wait for the recorder without blocking the event loop
+            asyncio.run_coroutine_threadsafe(self.trading_core.flush_markets_recorder(), self.ev_loop).result()
         with self.trading_core.trade_fill_db.get_new_session() as session:
             trades: List[TradeFill] = self._get_trades_from_session(
                 int(start_time * 1e3),
@@ -65,24 +71,21 @@ class HistoryCommand:
 
     async def history_report(self,  # type: HummingbotApplication
                              start_time: float,
-                             trades: List[TradeFill],
+                             aggregates: Dict[MarketKey, TradesAggregate],
                              precision: Optional[int] = None,
                              display_report: bool = True) -> Decimal:
-        market_info: Set[Tuple[str, str]] = set((t.market, t.symbol) for t in trades)
         if display_report:
             self.report_header(start_time)
+        try:
+            performance_metrics = await self.trading_core.calculate_performance_metrics_by_market(start_time,
+                                                                                                  aggregates)
+        except asyncio.TimeoutError:
+            self.notify(
+                "\nA network error prevented the balances retrieval to complete. See logs for more details."
+            )
+            raise
         return_pcts = []
-        for market, symbol in market_info:
-            cur_trades = [t for t in trades if t.market == market and t.symbol == symbol]
-            network_timeout = float(self.client_config_map.commands_timeout.other_commands_timeout)
-            try:
-                cur_balances = await asyncio.wait_for(self.trading_core.get_current_balances(market), network_timeout)
-            except asyncio.TimeoutError:
-                self.notify(
-                    "\nA network error prevented the balances retrieval to complete. See logs for more details."
-                )
-                raise
-            perf = await PerformanceMetrics.create(symbol, cur_trades, cur_balances)
+        for (market, symbol), perf in performance_metrics.items():
             if display_report:
                 self.report_performance_by_market(market, symbol, perf, precision)
             return_pcts.append(perf.return_pct)
@@ -183,6 +186,7 @@ class HistoryCommand:
 
         lines = []
 
+        # Reads the trades already in the database, history() waits for the markets recorder before listing them
         with self.trading_core.trade_fill_db.get_new_session() as session:
             queried_trades: List[TradeFill] = self._get_trades_from_session(
                 int(start_time * 1e3),
@@ -77,6 +77,10 @@ class StatusCommand:
         else:
             st_status = self.trading_core.strategy.format_status()
         status = paper_trade + "\n" + st_status
+        if self.trading_core.clock is not None:
+            clock_status = self.trading_core.clock.tick_metrics.format_report()
+            if clock_status:
+                status += "\n\n" + clock_status
         return status
 
     def application_warning(self):
@@ -4,6 +4,7 @@ from dataclasses import dataclass
 from decimal import Decimal
 from typing import Any, Dict, List, Optional, Tuple
 
+from hummingbot.client.trades_aggregator import TradesAggregate
 from hummingbot.connector.utils import combine_to_hb_trading_pair, split_hb_trading_pair
 from hummingbot.core.data_type.common import PositionAction, TradeType
 from hummingbot.core.data_type.trade_fee import DeductedFromReturnsTradeFee, TokenAmount
@@ -71,6 +72,34 @@ class PerformanceMetrics:
         await performance._initialize_metrics(trading_pair, trades, current_balances)
         return performance
 
+    @classmethod
+    async def create_from_aggregate(cls,
+                                    trading_pair: str,
+                                    aggregate: TradesAggregate,
+                                    current_balances: Dict[str, Decimal],
+                                    rates: Optional[Dict[str, Decimal]] = None) -> 'PerformanceMetrics':
+        """
+        Calculates the metrics from the sums over the trades instead of the trades. The trade PnL of derivatives
+        depends on the sequence of the trades, they need to go through create.
+        :param trading_pair: the trading market to get performance metrics
+        :param aggregate: the aggregate of the trades of the market
+        :param current_balances: current user account balance
+        :param rates: the conversion rates of the trading pair and of the fee tokens, see rate_pairs
+        """
+        performance = PerformanceMetrics()
+        await performance._initialize_metrics_from_aggregate(trading_pair, aggregate, current_balances, rates)
+        return performance
+
+    @staticmethod
+    def rate_pairs(trading_pair: str, aggregate: TradesAggregate) -> List[str]:
+        """
+        The conversion rates needed to calculate the metrics of an aggregate: the price of the trading pair and the
+        rates of the fee tokens to the quote.
+        """
+        quote = split_hb_trading_pair(trading_pair)[1]
+        return [trading_pair] + [combine_to_hb_trading_pair(fee_token, quote)
+                                 for fee_token in aggregate.fees if fee_token != quote]
+
     @staticmethod
     def position_order(open: list, close: list) -> Tuple[Any, Any]:
         """
@@ -196,6 +225,11 @@ class PerformanceMetrics:
 
             self.s_vol_quote += self._process_deducted_fees_impact_in_quote_vol(trade)
 
+        self._calculate_volume_totals()
+
+        return buys, sells
+
+    def _calculate_volume_totals(self):
         self.tot_vol_base = self.b_vol_base + self.s_vol_base
         self.tot_vol_quote = self.b_vol_quote + self.s_vol_quote
 
@@ -206,8 +240,6 @@ class PerformanceMetrics:
         self.avg_b_price = abs(self.avg_b_price)
         self.avg_s_price = abs(self.avg_s_price)
 
-        return buys, sells
-
     def _process_deducted_fees_impact_in_quote_vol(self, trade):
         fee_percent = None
         fee_type = ""
@@ -248,12 +280,17 @@ class PerformanceMetrics:
             for flat_fee in flat_fees:
                 self.fees[flat_fee.token] += flat_fee.amount
 
+        rate_pairs = [combine_to_hb_trading_pair(fee_token, quote) for fee_token in self.fees if fee_token != quote]
+        rates = await RateOracle.get_instance().stored_or_live_rates(rate_pairs)
+        self._convert_fees_to_quote(quote, rates)
+
+    def _convert_fees_to_quote(self, quote: str, rates: Dict[str, Decimal]):
         for fee_token, fee_amount in self.fees.items():
             if fee_token == quote:
                 self.fee_in_quote += fee_amount
             else:
                 rate_pair: str = combine_to_hb_trading_pair(fee_token, quote)
-                last_price = await RateOracle.get_instance().stored_or_live_rate(rate_pair)
+                last_price = rates.get(rate_pair)
                 if last_price is not None:
                     self.fee_in_quote += fee_amount * last_price
                 else:
@@ -302,15 +339,57 @@ class PerformanceMetrics:
         self.num_sells = len(sells)
         self.num_trades = self.num_buys + self.num_sells
 
+        self.start_price = Decimal(str(trades[0].price))
+        self.cur_price = await RateOracle.get_instance().stored_or_live_rate(trading_pair)
+        if self.cur_price is None:
+            self.cur_price = Decimal(str(trades[-1].price))
+        self._calculate_balances_and_values(base, quote, current_balances)
+        self._calculate_trade_pnl(buys, sells)
+
+        await self._calculate_fees(quote, trades)
+
+        self.total_pnl = self.trade_pnl - self.fee_in_quote
+        self.return_pct = self.divide(self.total_pnl, self.hold_value)
+
+    async def _initialize_metrics_from_aggregate(self,
+                                                 trading_pair: str,
+                                                 aggregate: TradesAggregate,
+                                                 current_balances: Dict[str, Decimal],
+                                                 rates: Optional[Dict[str, Decimal]] = None):
+        base, quote = split_hb_trading_pair(trading_pair)
+        if rates is None:
+            rates = await RateOracle.get_instance().stored_or_live_rates(self.rate_pairs(trading_pair, aggregate))
+
+        self.b_vol_base = aggregate.b_vol_base
+        self.b_vol_quote = s_decimal_0 - aggregate.b_vol_quote
+        self.s_vol_base = s_decimal_0 - aggregate.s_vol_base
+        self.s_vol_quote = aggregate.s_vol_quote - aggregate.deducted_fees_in_quote
+        self._calculate_volume_totals()
+
+        self.num_buys = aggregate.num_buys
+        self.num_sells = aggregate.num_sells
+        self.num_trades = aggregate.num_trades
+
+        self.start_price = aggregate.first_price
+        self.cur_price = rates.get(trading_pair)
+        if self.cur_price is None:
+            self.cur_price = aggregate.last_price
+        self._calculate_balances_and_values(base, quote, current_balances)
+        self.trade_pnl = self.cur_value - self.hold_value
+
+        for fee_token, fee_amount in aggregate.fees.items():
+            self.fees[fee_token] += fee_amount
+        self._convert_fees_to_quote(quote, rates)
+
+        self.total_pnl = self.trade_pnl - self.fee_in_quote
+        self.return_pct = self.divide(self.total_pnl, self.hold_value)
+
+    def _calculate_balances_and_values(self, base: str, quote: str, current_balances: Dict[str, Decimal]):
         self.cur_base_bal = current_balances.get(base, s_decimal_0)
         self.cur_quote_bal = current_balances.get(quote, s_decimal_0)
         self.start_base_bal = self.cur_base_bal - self.tot_vol_base
         self.start_quote_bal = self.cur_quote_bal - self.tot_vol_quote
 
-        self.start_price = Decimal(str(trades[0].price))
-        self.cur_price = await RateOracle.get_instance().stored_or_live_rate(trading_pair)
-        if self.cur_price is None:
-            self.cur_price = Decimal(str(trades[-1].price))
         self.start_base_ratio_pct = self.divide(self.start_base_bal * self.start_price,
                                                 (self.start_base_bal * self.start_price) + self.start_quote_bal)
         self.cur_base_ratio_pct = self.divide(self.cur_base_bal * self.cur_price,
@@ -318,9 +397,3 @@ class PerformanceMetrics:
 
         self.hold_value = (self.start_base_bal * self.cur_price) + self.start_quote_bal
         self.cur_value = (self.cur_base_bal * self.cur_price) + self.cur_quote_bal
-        self._calculate_trade_pnl(buys, sells)
-
-        await self._calculate_fees(quote, trades)
-
-        self.total_pnl = self.trade_pnl - self.fee_in_quote
-        self.return_pct = self.divide(self.total_pnl, self.hold_value)
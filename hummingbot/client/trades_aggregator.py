@@ -0,0 +1,348 @@
+import time
+from dataclasses import dataclass, field
+from decimal import Decimal
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from sqlalchemy import BigInteger, Text, and_, func, or_, true, type_coerce
+from sqlalchemy.orm import Session
+
+from hummingbot.connector.utils import split_hb_trading_pair
+from hummingbot.core.data_type.common import PositionAction, TradeType
+from hummingbot.core.data_type.trade_fee import DeductedFromReturnsTradeFee
+from hummingbot.model.sql_connection_manager import SQLConnectionManager
+from hummingbot.model.trade_fill import TradeFill
+
+s_decimal_0 = Decimal("0")
+
+# Trades are aggregated by UTC day
+AGGREGATION_PERIOD_MS = 24 * 60 * 60 * 1000
+# Trades can be recorded a while after they happened, the periods that ended less than this ago are not cached yet
+SETTLEMENT_DELAY_MS = 60 * 60 * 1000
+
+MarketKey = Tuple[str, str]
+
+
+@dataclass
+class TradesAggregate:
+    """
+    Sums over the trades of a market and trading pair, enough to calculate the spot performance metrics without the
+    trades themselves. Volumes are positive, the aggregates of different periods can be added together.
+    """
+    market: str
+    symbol: str
+
+    num_buys: int = 0
+    num_sells: int = 0
+    # Trades with a NIL position action, derivative trades are the ones with an open or close position action
+    num_nil_position_buys: int = 0
+    num_nil_position_sells: int = 0
+
+    b_vol_base: Decimal = s_decimal_0
+    b_vol_quote: Decimal = s_decimal_0
+    s_vol_base: Decimal = s_decimal_0
+    s_vol_quote: Decimal = s_decimal_0
+    # Part of the quote volume paid as fees deducted from the returns
+    deducted_fees_in_quote: Decimal = s_decimal_0
+    # Fees paid by token, the percent fees are in the quote token
+    fees: Dict[str, Decimal] = field(default_factory=dict)
+
+    first_timestamp: Optional[int] = None
+    first_price: Decimal = s_decimal_0
+    last_timestamp: Optional[int] = None
+    last_price: Decimal = s_decimal_0
+
+    @property
+    def num_trades(self) -> int:
+        return self.num_buys + self.num_sells
+
+    @property
+    def are_derivatives(self) -> bool:
+        """
+        Same rule as PerformanceMetrics._are_derivatives, applied to the buys and to the sells
+        """
+        return ((self.num_buys > 0 and self.num_nil_position_buys == 0)
+                or (self.num_sells > 0 and self.num_nil_position_sells == 0))
+
+    def add_trades(self,
+                   trade_type: str,
+                   position: Optional[str],
+                   fee_percent: Optional[Decimal],
+                   fee_deducted_from_returns: bool,
+                   count: int,
+                   price: Decimal,
+                   amount: Decimal,
+                   notional: Decimal,
+                   first_timestamp: int,
+                   last_timestamp: int):
+        """
+        Adds trades of the same side, position action, percent fee and price. Their flat fees are added apart with
+        add_fee.
+
+        :param fee_percent: the percent fee of the trades, if any
+        :param fee_deducted_from_returns: whether the fee is deducted from the returns instead of added to the cost
+        :param count: the number of trades
+        :param price: the price of the trades
+        :param amount: the total amount of the trades
+        :param notional: the total amount times the price
+        :param first_timestamp: the timestamp of the first of the trades
+        :param last_timestamp: the timestamp of the last of the trades
+        """
+        is_nil_position = position == PositionAction.NIL.value
+        if trade_type.upper() == TradeType.BUY.name:
+            self.num_buys += count
+            self.num_nil_position_buys += count if is_nil_position else 0
+            self.b_vol_base += amount
+            self.b_vol_quote += notional
+        elif trade_type.upper() == TradeType.SELL.name:
+            self.num_sells += count
+            self.num_nil_position_sells += count if is_nil_position else 0
+            self.s_vol_base += amount
+            self.s_vol_quote += notional
+
+        if fee_percent is not None:
+            quote = split_hb_trading_pair(self.symbol)[1]
+            self.add_fee(quote, notional * fee_percent)
+            if fee_deducted_from_returns:
+                self.deducted_fees_in_quote += notional * fee_percent
+
+        self._update_first_and_last_price(first_timestamp, price, last_timestamp, price)
+
+    def add_fee(self, token: str, amount: Decimal):
+        self.fees[token] = self.fees.get(token, s_decimal_0) + amount
+
+    def add(self, other: "TradesAggregate"):
+        self.num_buys += other.num_buys
+        self.num_sells += other.num_sells
+        self.num_nil_position_buys += other.num_nil_position_buys
+        self.num_nil_position_sells += other.num_nil_position_sells
+        self.b_vol_base += other.b_vol_base
+        self.b_vol_quote += other.b_vol_quote
+        self.s_vol_base += other.s_vol_base
+        self.s_vol_quote += other.s_vol_quote
+        self.deducted_fees_in_quote += other.deducted_fees_in_quote
+        for token, fee_amount in other.fees.items():
+            self.add_fee(token, fee_amount)
+        if other.first_timestamp is not None:
+            self._update_first_and_last_price(
+                other.first_timestamp, other.first_price, other.last_timestamp, other.last_price)
+
+    def _update_first_and_last_price(self,
+                                     first_timestamp: int,
+                                     first_price: Decimal,
+                                     last_timestamp: int,
+                                     last_price: Decimal):
+        if self.first_timestamp is None or first_timestamp < self.first_timestamp:
+            self.first_timestamp = first_timestamp
+            self.first_price = first_price
+        if self.last_timestamp is None or last_timestamp >= self.last_timestamp:
+            self.last_timestamp = last_timestamp
+            self.last_price = last_price
+
+
+class TradesAggregator:
+    """
+    Aggregates the trades of a strategy config by market and trading pair for the performance report.
+
+    The trades are grouped and summed in SQL by day, side, position action, percent fee and price, so the rows fetched
+    are far fewer than the trades and no TradeFill object is built. Amounts and prices are summed as the integers
+    stored in the database, which keeps the sums exact. The flat fees, usually different for every trade, are fetched
+    by a second query as the amounts stored in the trade fee JSON and summed as decimals. The aggregates of the days
+    that are over are cached, so that asking again for the performance since any date only queries the trades of the
+    first and of the current day.
+
+    The queries use the SQLite JSON functions. With other database engines the trades are loaded and aggregated one
+    by one, and the performance metrics are calculated from the trades, see aggregates_in_sql.
+    """
+
+    def __init__(self, sql: SQLConnectionManager):
+        self._sql = sql
+        # Aggregates by config file path, then by period start timestamp, then by market and trading pair
+        self._aggregates_by_period: Dict[str, Dict[int, Dict[MarketKey, TradesAggregate]]] = {}
+
+    @property
+    def aggregates_in_sql(self) -> bool:
+        """
+        Whether the trades are aggregated by the database, which requires the SQLite JSON functions
+        """
+        return self._sql.engine.dialect.name == "sqlite"
+
+    def aggregate(self, config_file_path: str, start_timestamp: int) -> Dict[MarketKey, TradesAggregate]:
+        """
+        Aggregates the trades of the config since the start timestamp.
+
+        :param config_file_path: the config file path of the strategy, matched as in the history command
+        :param start_timestamp: the start timestamp in milliseconds
+        :return: the aggregates of the trades by market and trading pair
+        """
+        if not self.aggregates_in_sql:
+            return self._aggregate_loaded_trades(config_file_path, start_timestamp)
+        cached_periods = self._aggregates_by_period.setdefault(config_file_path, {})
+        cacheable_end = (self._current_timestamp() - SETTLEMENT_DELAY_MS) // AGGREGATION_PERIOD_MS * AGGREGATION_PERIOD_MS
+        first_period = -(-start_timestamp // AGGREGATION_PERIOD_MS) * AGGREGATION_PERIOD_MS
+        periods = list(range(first_period, cacheable_end, AGGREGATION_PERIOD_MS))
+
+        ranges: List[Tuple[int, Optional[int]]] = []
+        missing_periods = [period for period in periods if period not in cached_periods]
+        if len(periods) == 0:
+            ranges.append((start_timestamp, None))
+        else:
+            if start_timestamp < first_period:
+                ranges.append((start_timestamp, first_period))
+            if len(missing_periods) > 0:
+                ranges.append((missing_periods[0], missing_periods[-1] + AGGREGATION_PERIOD_MS))
+            ranges.append((cacheable_end, None))
+
+        queried_periods = self._query_aggregates_by_period(config_file_path, ranges)
+
+        if len(missing_periods) > 0:
+            for period in range(missing_periods[0], missing_periods[-1] + AGGREGATION_PERIOD_MS, AGGREGATION_PERIOD_MS):
+                cached_periods[period] = queried_periods.pop(period, {})
+
+        result: Dict[MarketKey, TradesAggregate] = {}
+        aggregates = [cached_periods[period] for period in periods] + list(queried_periods.values())
+        for period_aggregates in aggregates:
+            for key, aggregate in period_aggregates.items():
+                if key not in result:
+                    result[key] = TradesAggregate(market=aggregate.market, symbol=aggregate.symbol)
+                result[key].add(aggregate)
+        return result
+
+    def get_trades(self, config_file_path: str, start_timestamp: int, market: str, symbol: str) -> List[TradeFill]:
+        """
+        Loads the trades of a market and trading pair, for the metrics that depend on the sequence of trades
+        """
+        with self._sql.get_new_session() as session:
+            return (session
+                    .query(TradeFill)
+                    .filter(TradeFill.timestamp >= start_timestamp,
+                            TradeFill.config_file_path.like(f"%{config_file_path}%"),
+                            TradeFill.market == market,
+                            TradeFill.symbol == symbol)
+                    .order_by(TradeFill.timestamp.asc())
+                    .all())
+
+    def clear(self):
+        self._aggregates_by_period.clear()
+
+    def _aggregate_loaded_trades(self, config_file_path: str, start_timestamp: int) -> Dict[MarketKey, TradesAggregate]:
+        deducted_fee_type = DeductedFromReturnsTradeFee.type_descriptor_for_json()
+        result: Dict[MarketKey, TradesAggregate] = {}
+        with self._sql.get_new_session() as session:
+            trades = (session
+                      .query(TradeFill)
+                      .filter(TradeFill.timestamp >= start_timestamp,
+                              TradeFill.config_file_path.like(f"%{config_file_path}%"))
+                      .all())
+            for trade in trades:
+                aggregate = result.get((trade.market, trade.symbol))
+                if aggregate is None:
+                    aggregate = result[(trade.market, trade.symbol)] = TradesAggregate(market=trade.market,
+                                                                                       symbol=trade.symbol)
+                price = Decimal(str(trade.price))
+                amount = Decimal(str(trade.amount))
+                fee_percent = trade.trade_fee.get("percent")
+                aggregate.add_trades(trade_type=trade.trade_type,
+                                     position=trade.position,
+                                     fee_percent=Decimal(str(fee_percent)) if fee_percent is not None else None,
+                                     fee_deducted_from_returns=trade.trade_fee.get("fee_type") == deducted_fee_type,
+                                     count=1,
+                                     price=price,
+                                     amount=amount,
+                                     notional=price * amount,
+                                     first_timestamp=trade.timestamp,
+                                     last_timestamp=trade.timestamp)
+                for flat_fee in trade.trade_fee.get("flat_fees", []):
+                    aggregate.add_fee(flat_fee["token"], Decimal(str(flat_fee["amount"])))
+        return result
+
+    def _query_aggregates_by_period(
+            self,
+            config_file_path: str,
+            ranges: List[Tuple[int, Optional[int]]]) -> Dict[int, Dict[MarketKey, TradesAggregate]]:
+        aggregates_by_period: Dict[int, Dict[MarketKey, TradesAggregate]] = {}
+        if len(ranges) == 0:
+            return aggregates_by_period
+        amount_multiplier = TradeFill.amount.type.multiplier_int
+        price_multiplier = TradeFill.price.type.multiplier_int
+        deducted_fee_type = DeductedFromReturnsTradeFee.type_descriptor_for_json()
+        with self._sql.get_new_session() as session:
+            for row in self._query_trade_groups(session, config_file_path, ranges):
+                (period, market, symbol, trade_type, position, fee_percent, fee_type, price, count, amount,
+                 first_timestamp, last_timestamp) = row
+                aggregate = self._period_aggregate(aggregates_by_period, period, market, symbol)
+                aggregate.add_trades(trade_type=trade_type,
+                                     position=position,
+                                     fee_percent=Decimal(str(fee_percent)) if fee_percent is not None else None,
+                                     fee_deducted_from_returns=fee_type == deducted_fee_type,
+                                     count=count,
+                                     price=Decimal(price) / price_multiplier,
+                                     amount=Decimal(amount) / amount_multiplier,
+                                     notional=Decimal(price * amount) / (price_multiplier * amount_multiplier),
+                                     first_timestamp=first_timestamp,
+                                     last_timestamp=last_timestamp)
+            for period, market, symbol, token, fee_amount in self._query_flat_fees(session, config_file_path, ranges):
+                aggregate = self._period_aggregate(aggregates_by_period, period, market, symbol)
+                aggregate.add_fee(token, Decimal(str(fee_amount)))
+        return aggregates_by_period
+
+    @staticmethod
+    def _period_aggregate(aggregates_by_period: Dict[int, Dict[MarketKey, TradesAggregate]],
+                          period: int,
+                          market: str,
+                          symbol: str) -> TradesAggregate:
+        period_aggregates = aggregates_by_period.setdefault(period * AGGREGATION_PERIOD_MS, {})
+        aggregate = period_aggregates.get((market, symbol))
+        if aggregate is None:
+            aggregate = period_aggregates[(market, symbol)] = TradesAggregate(market=market, symbol=symbol)
+        return aggregate
+
+    @staticmethod
+    def _trades_filter(config_file_path: str, ranges: List[Tuple[int, Optional[int]]]):
+        range_filters = [and_(TradeFill.timestamp >= start, TradeFill.timestamp < end) if end is not None
+                         else TradeFill.timestamp >= start
+                         for start, end in ranges]
+        return and_(TradeFill.config_file_path.like(f"%{config_file_path}%"), or_(*range_filters))
+
+    @staticmethod
+    def _query_trade_groups(session: Session,
+                            config_file_path: str,
+                            ranges: List[Tuple[int, Optional[int]]]) -> Iterable[Tuple]:
+        # Bypass the decimal and JSON conversions, the values are converted once per group
+        raw_price = type_coerce(TradeFill.price, BigInteger)
+        raw_amount = type_coerce(TradeFill.amount, BigInteger)
+        raw_trade_fee = type_coerce(TradeFill.trade_fee, Text)
+        period = TradeFill.timestamp // AGGREGATION_PERIOD_MS
+        group_by = (period, TradeFill.market, TradeFill.symbol, TradeFill.trade_type, TradeFill.position,
+                    func.json_extract(raw_trade_fee, "$.percent"), func.json_extract(raw_trade_fee, "$.fee_type"),
+                    raw_price)
+        return (session
+                .query(*group_by,
+                       func.count(),
+                       func.sum(raw_amount),
+                       func.min(TradeFill.timestamp),
+                       func.max(TradeFill.timestamp))
+                .filter(TradesAggregator._trades_filter(config_file_path, ranges))
+                .group_by(*group_by))
+
+    @staticmethod
+    def _query_flat_fees(session: Session,
+                         config_file_path: str,
+                         ranges: List[Tuple[int, Optional[int]]]) -> Iterable[Tuple]:
+        # One row per flat fee of every trade. The amounts are stored as strings, they are summed as decimals by the
+        # caller since SQLite would sum them as floats
+        flat_fee = (func.json_each(type_coerce(TradeFill.trade_fee, Text), "$.flat_fees")
+                    .table_valued("value")
+                    .alias("flat_fee"))
+        return (session
+                .query(TradeFill.timestamp // AGGREGATION_PERIOD_MS,
+                       TradeFill.market,
+                       TradeFill.symbol,
+                       func.json_extract(flat_fee.c.value, "$.token"),
+                       func.json_extract(flat_fee.c.value, "$.amount"))
+                .select_from(TradeFill)
+                .join(flat_fee, true())
+                .filter(TradesAggregator._trades_filter(config_file_path, ranges)))
+
+    @staticmethod
+    def _current_timestamp() -> int:
+        return int(time.time() * 1e3)
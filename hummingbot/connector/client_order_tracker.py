@@ -2,10 +2,10 @@ import asyncio
 import logging
 from collections import defaultdict
 from decimal import Decimal
-from itertools import chain
-from typing import TYPE_CHECKING, Callable, Dict, Optional
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Any, Callable, Dict, Mapping, Optional, Set, Tuple
 
-from cachetools import TTLCache
+from cachetools import Cache, TTLCache
 
 from hummingbot.core.data_type.common import TradeType
 from hummingbot.core.data_type.in_flight_order import InFlightOrder, OrderState, OrderUpdate, TradeUpdate
@@ -28,6 +28,39 @@ if TYPE_CHECKING:
 
 cot_logger = None
 
+_EMPTY_ORDERS_VIEW: Mapping[str, InFlightOrder] = MappingProxyType({})
+
+
+class _CachedOrders(TTLCache):
+    """
+    TTLCache of orders that notifies the orders added, and the orders removed either explicitly or because they
+    expired or did not fit in the cache anymore
+    """
+
+    def __init__(self,
+                 maxsize: int,
+                 ttl: float,
+                 on_added: Callable[[InFlightOrder], None],
+                 on_removed: Callable[[InFlightOrder], None]):
+        super().__init__(maxsize=maxsize, ttl=ttl)
+        self._on_added = on_added
+        self._on_removed = on_removed
+
+    def __setitem__(self, key, value, **kwargs):
+        super().__setitem__(key, value, **kwargs)
+        self._on_added(value)
+
+    def __delitem__(self, key, **kwargs):
+        order = Cache.__getitem__(self, key)
+        super().__delitem__(key, **kwargs)
+        self._on_removed(order)
+
+    def expire(self, time=None):
+        expired = super().expire(time)
+        for _, order in expired:
+            self._on_removed(order)
+        return expired
+
 
 class ClientOrderTracker:
 
@@ -55,9 +88,26 @@ class ClientOrderTracker:
         self._connector: ConnectorBase = connector
         self._lost_order_count_limit = lost_order_count_limit
         self._in_flight_orders: Dict[str, InFlightOrder] = {}
-        self._cached_orders: TTLCache = TTLCache(maxsize=self.MAX_CACHE_SIZE, ttl=self.CACHED_ORDER_TTL)
+        self._cached_orders: TTLCache = _CachedOrders(maxsize=self.MAX_CACHE_SIZE,
+                                                      ttl=self.CACHED_ORDER_TTL,
+                                                      on_added=self._reindex_order,
+                                                      on_removed=self._reindex_order)
         self._lost_orders: Dict[str, InFlightOrder] = {}
 
+        # Secondary indexes, kept up to date every time an order moves between the active, cached and lost orders
+        self._fillable_orders_by_exchange_order_id: Dict[str, InFlightOrder] = {}
+        self._updatable_orders_by_exchange_order_id: Dict[str, InFlightOrder] = {}
+        # Orders that did not have an exchange order id when indexed. It can be set later outside the tracker.
+        self._orders_without_exchange_order_id: Dict[str, InFlightOrder] = {}
+        self._active_orders_by_trading_pair: Dict[str, Dict[str, InFlightOrder]] = {}
+        self._active_orders_by_state: Dict[OrderState, Dict[str, InFlightOrder]] = {}
+        self._active_order_index_keys: Dict[str, Tuple[str, OrderState]] = {}
+
+        # Orders that changed since the last call to pop_tracking_state_changes (None until the first call), and the
+        # orders reported as tracked
+        self._changed_order_ids: Optional[Set[str]] = None
+        self._reported_order_ids: Set[str] = set()
+
         self._order_tracking_task: Optional[asyncio.Task] = None
         self._last_poll_timestamp: int = -1
         self._order_not_found_records: Dict[str, int] = defaultdict(lambda: 0)
@@ -91,15 +141,13 @@ class ClientOrderTracker:
         return {**self.active_orders, **self.cached_orders, **self.lost_orders}
 
     @property
-    def all_fillable_orders_by_exchange_order_id(self) -> Dict[str, InFlightOrder]:
+    def all_fillable_orders_by_exchange_order_id(self) -> Mapping[str, InFlightOrder]:
         """
-        Same as `all_fillable_orders`, but the orders are mapped by exchange order ID.
+        Same as `all_fillable_orders`, but the orders are mapped by exchange order ID (orders without exchange order ID
+        are not included). Read only view of an index maintained by the tracker.
         """
-        orders_map = {
-            order.exchange_order_id: order
-            for order in chain(self.active_orders.values(), self.cached_orders.values(), self.lost_orders.values())
-        }
-        return orders_map
+        self._refresh_indexes()
+        return MappingProxyType(self._fillable_orders_by_exchange_order_id)
 
     @property
     def all_updatable_orders(self) -> Dict[str, InFlightOrder]:
@@ -109,14 +157,13 @@ class ClientOrderTracker:
         return {**self.active_orders, **self.lost_orders}
 
     @property
-    def all_updatable_orders_by_exchange_order_id(self) -> Dict[str, InFlightOrder]:
+    def all_updatable_orders_by_exchange_order_id(self) -> Mapping[str, InFlightOrder]:
         """
-        Same as `all_updatable_orders`, but the orders are mapped by exchange order ID.
+        Same as `all_updatable_orders`, but the orders are mapped by exchange order ID (orders without exchange order
+        ID are not included). Read only view of an index maintained by the tracker.
         """
-        orders_map = {
-            order.exchange_order_id: order for order in chain(self.active_orders.values(), self.lost_orders.values())
-        }
-        return orders_map
+        self._refresh_indexes()
+        return MappingProxyType(self._updatable_orders_by_exchange_order_id)
 
     @property
     def current_timestamp(self) -> int:
@@ -141,12 +188,17 @@ class ClientOrderTracker:
         self._lost_order_count_limit = value
 
     def start_tracking_order(self, order: InFlightOrder):
+        previous_order = self._in_flight_orders.get(order.client_order_id)
         self._in_flight_orders[order.client_order_id] = order
+        if previous_order is not None and previous_order is not order:
+            self._reindex_order(previous_order)
+        self._reindex_order(order)
 
     def stop_tracking_order(self, client_order_id: str):
         if client_order_id in self._in_flight_orders:
-            self._cached_orders[client_order_id] = self._in_flight_orders[client_order_id]
-            del self._in_flight_orders[client_order_id]
+            order = self._in_flight_orders.pop(client_order_id)
+            # Adding the order to the cache reindexes it
+            self._cached_orders[client_order_id] = order
             if client_order_id in self._order_not_found_records:
                 del self._order_not_found_records[client_order_id]
 
@@ -161,7 +213,28 @@ class ClientOrderTracker:
                 self.start_tracking_order(order)
             elif order.is_failure:
                 # If the order is marked as failed but is still in the tracking states, it was a lost order
-                self._lost_orders[order.client_order_id] = order
+                self._add_lost_order(order)
+
+    def pop_tracking_state_changes(self) -> Dict[str, Optional[Dict[str, Any]]]:
+        """
+        Returns the tracking states (JSON representation) of the updatable orders that changed since the previous call,
+        and None for the orders reported before that are not updatable anymore. Applying the changes to the tracking
+        states of the previous call gives the current tracking states. The first call reports all the updatable orders.
+        """
+        changed_order_ids = self._changed_order_ids
+        if changed_order_ids is None:
+            changed_order_ids = set(self._in_flight_orders) | set(self._lost_orders)
+        changes = {}
+        for client_order_id in changed_order_ids:
+            order = self._in_flight_orders.get(client_order_id) or self._lost_orders.get(client_order_id)
+            if order is not None:
+                changes[client_order_id] = order.to_json()
+                self._reported_order_ids.add(client_order_id)
+            elif client_order_id in self._reported_order_ids:
+                changes[client_order_id] = None
+                self._reported_order_ids.discard(client_order_id)
+        self._changed_order_ids = set()
+        return changes
 
     def fetch_tracked_order(self, client_order_id: str) -> Optional[InFlightOrder]:
         return self._in_flight_orders.get(client_order_id, None)
@@ -172,44 +245,63 @@ class ClientOrderTracker:
     def fetch_order(
         self, client_order_id: Optional[str] = None, exchange_order_id: Optional[str] = None
     ) -> Optional[InFlightOrder]:
-        found_order = None
+        """
+        Looks for an active or cached order, by client order id first and then by exchange order id
+        """
+        found_order = self._cached_orders.get(client_order_id) or self._in_flight_orders.get(client_order_id)
 
-        if client_order_id in self.all_orders:
-            found_order = self.all_orders[client_order_id]
-        elif exchange_order_id is not None:
-            found_order = next(
-                (order for order in self.all_orders.values() if order.exchange_order_id == exchange_order_id), None
-            )
+        if found_order is None and exchange_order_id is not None:
+            self._refresh_indexes()
+            order = self._fillable_orders_by_exchange_order_id.get(exchange_order_id)
+            if order is not None and (self._in_flight_orders.get(order.client_order_id) is order
+                                      or self._cached_orders.get(order.client_order_id) is order):
+                found_order = order
 
         return found_order
 
     def fetch_lost_order(
         self, client_order_id: Optional[str] = None, exchange_order_id: Optional[str] = None
     ) -> Optional[InFlightOrder]:
-        found_order = None
+        found_order = self._lost_orders.get(client_order_id)
 
-        if client_order_id in self._lost_orders:
-            found_order = self._lost_orders[client_order_id]
-        elif exchange_order_id is not None:
-            found_order = next(
-                (order for order in self._lost_orders.values() if order.exchange_order_id == exchange_order_id),
-                None)
+        if found_order is None and exchange_order_id is not None:
+            self._refresh_indexes()
+            order = self._updatable_orders_by_exchange_order_id.get(exchange_order_id)
+            if order is not None and self._lost_orders.get(order.client_order_id) is order:
+                found_order = order
 
         return found_order
 
+    def fetch_active_orders_by_trading_pair(self, trading_pair: str) -> Mapping[str, InFlightOrder]:
+        """
+        Returns a read only view of the active orders of a trading pair, by client order id
+        """
+        orders = self._active_orders_by_trading_pair.get(trading_pair)
+        return _EMPTY_ORDERS_VIEW if orders is None else MappingProxyType(orders)
+
+    def fetch_active_orders_by_state(self, state: OrderState) -> Mapping[str, InFlightOrder]:
+        """
+        Returns a read only view of the active orders in the given state, by client order id
+        """
+        orders = self._active_orders_by_state.get(state)
+        return _EMPTY_ORDERS_VIEW if orders is None else MappingProxyType(orders)
+
     def process_order_update(self, order_update: OrderUpdate):
         return safe_ensure_future(self._process_order_update(order_update))
 
     def process_trade_update(self, trade_update: TradeUpdate):
         client_order_id: str = trade_update.client_order_id
 
-        tracked_order: Optional[InFlightOrder] = self.all_fillable_orders.get(client_order_id)
+        tracked_order: Optional[InFlightOrder] = (self._lost_orders.get(client_order_id)
+                                                  or self._cached_orders.get(client_order_id)
+                                                  or self._in_flight_orders.get(client_order_id))
 
         if tracked_order:
             previous_executed_amount_base: Decimal = tracked_order.executed_amount_base
 
             updated: bool = tracked_order.update_with_trade_update(trade_update)
             if updated:
+                self._mark_changed(tracked_order.client_order_id)
                 self._trigger_order_fills(
                     tracked_order=tracked_order,
                     prev_executed_amount_base=previous_executed_amount_base,
@@ -248,7 +340,7 @@ class ClientOrderTracker:
                     )
                     await self._process_order_update(order_update)
                     del self._cached_orders[client_order_id]
-                    self._lost_orders[tracked_order.client_order_id] = tracked_order
+                    self._add_lost_order(tracked_order)
         else:
             lost_order = self._lost_orders.get(client_order_id)
             if lost_order is not None:
@@ -291,6 +383,7 @@ class ClientOrderTracker:
 
             updated: bool = tracked_order.update_with_order_update(order_update)
             if updated:
+                self._reindex_order(tracked_order)
                 self._trigger_order_creation(tracked_order, previous_state, order_update.new_state)
                 self._trigger_order_completion(tracked_order, order_update)
         else:
@@ -301,9 +394,76 @@ class ClientOrderTracker:
                 if order_update.new_state in [OrderState.CANCELED, OrderState.FILLED, OrderState.FAILED]:
                     # If the order officially reaches a final state after being lost it should be removed from the lost list
                     del self._lost_orders[lost_order.client_order_id]
+                    self._reindex_order(lost_order)
             else:
                 self.logger().debug(f"Order is not/no longer being tracked ({order_update})")
 
+    def _add_lost_order(self, order: InFlightOrder):
+        self._lost_orders[order.client_order_id] = order
+        self._reindex_order(order)
+
+    def _mark_changed(self, client_order_id: str):
+        # Changes are only collected once someone asked for them
+        if self._changed_order_ids is not None:
+            self._changed_order_ids.add(client_order_id)
+
+    def _refresh_indexes(self):
+        """
+        Removes the expired cached orders and indexes the exchange order ids assigned since the orders were indexed
+        """
+        self._cached_orders.expire()
+        for order in list(self._orders_without_exchange_order_id.values()):
+            if order.exchange_order_id is not None:
+                self._reindex_order(order)
+
+    def _reindex_order(self, order: InFlightOrder):
+        """
+        Updates the secondary indexes of an order after it was added to or removed from the active, cached or lost
+        orders, or after its state or exchange order id changed
+        """
+        client_order_id = order.client_order_id
+        self._mark_changed(client_order_id)
+        is_active = self._in_flight_orders.get(client_order_id) is order
+        is_updatable = is_active or self._lost_orders.get(client_order_id) is order
+        is_fillable = is_updatable or self._cached_orders.get(client_order_id) is order
+
+        exchange_order_id = order.exchange_order_id
+        if exchange_order_id is None:
+            self._set_index_entry(self._orders_without_exchange_order_id, client_order_id, order, is_fillable)
+        else:
+            self._set_index_entry(self._orders_without_exchange_order_id, client_order_id, order, False)
+            self._set_index_entry(self._fillable_orders_by_exchange_order_id, exchange_order_id, order, is_fillable)
+            self._set_index_entry(self._updatable_orders_by_exchange_order_id, exchange_order_id, order, is_updatable)
+
+        index_keys = (order.trading_pair, order.current_state)
+        previous_index_keys = self._active_order_index_keys.get(client_order_id)
+        if previous_index_keys == index_keys and is_active:
+            return
+        if previous_index_keys is not None:
+            previous_trading_pair, previous_state = previous_index_keys
+            self._remove_from_bucket(self._active_orders_by_trading_pair, previous_trading_pair, client_order_id)
+            self._remove_from_bucket(self._active_orders_by_state, previous_state, client_order_id)
+            del self._active_order_index_keys[client_order_id]
+        if is_active:
+            self._active_orders_by_trading_pair.setdefault(order.trading_pair, {})[client_order_id] = order
+            self._active_orders_by_state.setdefault(order.current_state, {})[client_order_id] = order
+            self._active_order_index_keys[client_order_id] = index_keys
+
+    @staticmethod
+    def _set_index_entry(index: Dict, key, order: InFlightOrder, present: bool):
+        if present:
+            index[key] = order
+        elif index.get(key) is order:
+            del index[key]
+
+    @staticmethod
+    def _remove_from_bucket(buckets: Dict, bucket_key, client_order_id: str):
+        bucket = buckets.get(bucket_key)
+        if bucket is not None:
+            bucket.pop(client_order_id, None)
+            if len(bucket) == 0:
+                del buckets[bucket_key]
+
     def _trigger_created_event(self, order: InFlightOrder):
         event_tag = MarketEvent.BuyOrderCreated if order.trade_type is TradeType.BUY else MarketEvent.SellOrderCreated
         event_class: Callable = BuyOrderCreatedEvent if order.trade_type is TradeType.BUY else SellOrderCreatedEvent
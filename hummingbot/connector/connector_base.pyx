@@ -184,6 +184,13 @@ cdef class ConnectorBase(NetworkIterator):
         """
         raise NotImplementedError
 
+    def is_trading_pair_ready(self, trading_pair: str) -> bool:
+        """
+        Indicates whether the connector is ready to be used for the given trading pair. Connectors that initialize
+        their trading pairs separately override it, so a pair can be used before the others are ready.
+        """
+        return self.ready
+
     @property
     def in_flight_orders(self) -> Dict[str, InFlightOrderBase]:
         raise NotImplementedError
@@ -192,6 +199,14 @@ cdef class ConnectorBase(NetworkIterator):
     def tracking_states(self) -> Dict[str, any]:
         return {}
 
+    def pop_tracking_state_changes(self) -> Optional[Dict[str, Optional[Dict[str, any]]]]:
+        """
+        Returns the tracking states of the orders that changed since the previous call, with None for the orders that
+        are not tracked anymore, so only the changes have to be persisted. None when the connector does not keep track
+        of the changes, and the whole tracking_states has to be saved instead.
+        """
+        return None
+
     def restore_tracking_states(self, saved_states: Dict[str, any]):
         """
         Restores the tracking states from a previously saved state.
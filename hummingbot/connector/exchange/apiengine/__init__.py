@@ -1,3 +0,0 @@
-from hummingbot.connector.exchange.apiengine.apiengine_exchange import ApiEngineExchange
-
-__all__ = ["ApiEngineExchange"]
\ No newline at end of file
@@ -29,6 +29,8 @@ from hummingbot.core.web_assistant.web_assistants_factory import WebAssistantsFa
 
 class BinanceExchange(ExchangePyBase):
     UPDATE_ORDER_STATUS_MIN_INTERVAL = 10.0
+    ORDER_BOOK_BATCHED_ROUTING = True
+    RESERVED_CAPACITY_LIMIT_IDS = [CONSTANTS.ORDER_PATH_URL]
 
     web_utils = web_utils
 
@@ -17,6 +17,7 @@ if TYPE_CHECKING:
 
 
 class GateIoAPIOrderBookDataSource(OrderBookTrackerDataSource):
+    CONTIGUOUS_DIFF_UPDATE_IDS = True
 
     _logger: Optional[HummingbotLogger] = None
 
@@ -3,6 +3,8 @@
 from collections import namedtuple
 from typing import Dict, List, Optional
 
+import numpy as np
+
 from hummingbot.core.data_type.order_book_message import OrderBookMessage, OrderBookMessageType
 from hummingbot.core.data_type.order_book_row import OrderBookRow
 
@@ -71,6 +73,14 @@ class NdaxOrderBookMessage(OrderBookMessage):
         bids.sort(key=lambda row: (row.price, row.update_id))
         return bids
 
+    @property
+    def asks_array(self) -> np.ndarray:
+        return self._levels_array([(row.price, row.amount) for row in self.asks])
+
+    @property
+    def bids_array(self) -> np.ndarray:
+        return self._levels_array([(row.price, row.amount) for row in self.bids])
+
     def _order_book_row_for_entry(self, entry: NdaxOrderBookEntry) -> OrderBookRow:
         price = float(entry.price)
         amount = float(entry.quantity) if entry.actionType != self._DELETE_ACTION_TYPE else 0.0
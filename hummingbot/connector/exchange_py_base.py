@@ -3,6 +3,7 @@ import copy
 import logging
 import math
 from abc import ABC, abstractmethod
+from contextlib import nullcontext
 from decimal import Decimal
 from typing import Any, AsyncIterable, Callable, Dict, List, Optional, Tuple
 
@@ -14,8 +15,11 @@ from hummingbot.connector.exchange_base import ExchangeBase
 from hummingbot.connector.time_synchronizer import TimeSynchronizer
 from hummingbot.connector.trading_rule import TradingRule
 from hummingbot.connector.utils import get_new_client_order_id
-from hummingbot.core.api_throttler.async_throttler import AsyncThrottler
-from hummingbot.core.api_throttler.data_types import RateLimit
+from hummingbot.core.api_throttler.async_sliding_window_throttler import (
+    AsyncSlidingWindowThrottler,
+    request_priority,
+)
+from hummingbot.core.api_throttler.data_types import RateLimit, RequestPriority
 from hummingbot.core.data_type.cancellation_result import CancellationResult
 from hummingbot.core.data_type.common import OrderType, TradeType
 from hummingbot.core.data_type.in_flight_order import InFlightOrder, OrderState, OrderUpdate, TradeUpdate
@@ -42,6 +46,14 @@ class ExchangePyBase(ExchangeBase, ABC):
     TRADING_RULES_INTERVAL = 30 * MINUTE
     TRADING_FEES_INTERVAL = TWELVE_HOURS
     TICK_INTERVAL_LIMIT = 60.0
+    # Share of the rate limits kept for order creation and cancellation requests. It only applies to the limits of the
+    # order requests listed in RESERVED_CAPACITY_LIMIT_IDS and to the ones linked to them, so connectors opt in by
+    # listing the limit IDs of their order creation and cancellation endpoints
+    RESERVED_REQUEST_CAPACITY: Dict[RequestPriority, float] = {RequestPriority.HIGH: 0.2}
+    RESERVED_CAPACITY_LIMIT_IDS: List[str] = []
+    # Route the order book messages of all the trading pairs through a single queue drained in batches, see
+    # OrderBookTracker. Worth it for connectors with busy diff streams on many trading pairs.
+    ORDER_BOOK_BATCHED_ROUTING: bool = False
 
     def __init__(self,
                  balance_asset_limit: Optional[Dict[str, Dict[str, Decimal]]] = None,
@@ -61,9 +73,11 @@ class ExchangePyBase(ExchangeBase, ABC):
         self._lost_orders_update_task: Optional[asyncio.Task] = None
 
         self._time_synchronizer = TimeSynchronizer()
-        self._throttler = AsyncThrottler(
+        self._throttler = AsyncSlidingWindowThrottler(
             rate_limits=self.rate_limits_rules,
-            limits_share_percentage=rate_limits_share_pct)
+            limits_share_percentage=rate_limits_share_pct,
+            reserved_capacity=self.RESERVED_REQUEST_CAPACITY,
+            reserved_limit_ids=self.RESERVED_CAPACITY_LIMIT_IDS)
         self._poll_notifier = asyncio.Event()
 
         # init Auth and Api factory
@@ -75,7 +89,8 @@ class ExchangePyBase(ExchangeBase, ABC):
         self._set_order_book_tracker(OrderBookTracker(
             data_source=self._orderbook_ds,
             trading_pairs=self.trading_pairs,
-            domain=self.domain))
+            domain=self.domain,
+            batched_routing=self.ORDER_BOOK_BATCHED_ROUTING))
 
         # init UserStream Data Source and Tracker
         self._user_stream_tracker = self._create_user_stream_tracker()
@@ -182,6 +197,14 @@ class ExchangePyBase(ExchangeBase, ABC):
         """
         return all(self.status_dict.values())
 
+    def is_trading_pair_ready(self, trading_pair: str) -> bool:
+        """
+        Returns True if the connector is ready to operate on the trading pair: everything but the order books is
+        initialized, and the order book of the trading pair is, even if the other order books are not yet.
+        """
+        return (all(ready for name, ready in self.status_dict.items() if name != "order_books_initialized") and
+                self.order_book_tracker.is_order_book_ready(trading_pair))
+
     @property
     def name_cap(self) -> str:
         return self.name.capitalize()
@@ -193,6 +216,13 @@ class ExchangePyBase(ExchangeBase, ABC):
         """
         return {key: value.to_json() for key, value in self._order_tracker.all_updatable_orders.items()}
 
+    def pop_tracking_state_changes(self) -> Optional[Dict[str, Optional[Dict[str, Any]]]]:
+        """
+        Returns the tracking states of the orders that changed since the previous call (None for the orders not
+        tracked anymore)
+        """
+        return self._order_tracker.pop_tracking_state_changes()
+
     @abstractmethod
     def supported_order_types(self) -> List[OrderType]:
         raise NotImplementedError
@@ -467,15 +497,16 @@ class ExchangePyBase(ExchangeBase, ABC):
             )
 
     async def _place_order_and_process_update(self, order: InFlightOrder, **kwargs) -> str:
-        exchange_order_id, update_timestamp = await self._place_order(
-            order_id=order.client_order_id,
-            trading_pair=order.trading_pair,
-            amount=order.amount,
-            trade_type=order.trade_type,
-            order_type=order.order_type,
-            price=order.price,
-            **kwargs,
-        )
+        with request_priority(RequestPriority.HIGH):
+            exchange_order_id, update_timestamp = await self._place_order(
+                order_id=order.client_order_id,
+                trading_pair=order.trading_pair,
+                amount=order.amount,
+                trade_type=order.trade_type,
+                order_type=order.order_type,
+                price=order.price,
+                **kwargs,
+            )
 
         order_update: OrderUpdate = OrderUpdate(
             client_order_id=order.client_order_id,
@@ -545,7 +576,8 @@ class ExchangePyBase(ExchangeBase, ABC):
         return None
 
     async def _execute_order_cancel_and_process_update(self, order: InFlightOrder) -> bool:
-        cancelled = await self._place_cancel(order.client_order_id, order)
+        with request_priority(RequestPriority.HIGH):
+            cancelled = await self._place_cancel(order.client_order_id, order)
         if cancelled:
             update_timestamp = self.current_timestamp
             if update_timestamp is None or math.isnan(update_timestamp):
@@ -734,7 +766,8 @@ class ExchangePyBase(ExchangeBase, ABC):
         """
         while True:
             try:
-                await safe_gather(self._update_trading_rules())
+                with request_priority(RequestPriority.LOW):
+                    await safe_gather(self._update_trading_rules())
                 await self._sleep(self.TRADING_RULES_INTERVAL)
             except NotImplementedError:
                 raise
@@ -754,7 +787,8 @@ class ExchangePyBase(ExchangeBase, ABC):
         """
         while True:
             try:
-                await safe_gather(self._update_trading_fees())
+                with request_priority(RequestPriority.LOW):
+                    await safe_gather(self._update_trading_fees())
                 await self._sleep(self.TRADING_FEES_INTERVAL)
             except NotImplementedError:
                 raise
@@ -779,10 +813,11 @@ class ExchangePyBase(ExchangeBase, ABC):
         while True:
             try:
                 await self._poll_notifier.wait()
-                await self._update_time_synchronizer()
+                with request_priority(RequestPriority.LOW):
+                    await self._update_time_synchronizer()
 
-                # the following method is implementation-specific
-                await self._status_polling_loop_fetch_updates()
+                    # the following method is implementation-specific
+                    await self._status_polling_loop_fetch_updates()
 
                 self._last_poll_timestamp = self.current_timestamp
                 self._poll_notifier = asyncio.Event()
@@ -820,8 +855,9 @@ class ExchangePyBase(ExchangeBase, ABC):
         """
         while True:
             try:
-                await self._cancel_lost_orders()
-                await self._update_lost_orders_status()
+                with request_priority(RequestPriority.LOW):
+                    await self._cancel_lost_orders()
+                    await self._update_lost_orders_status()
                 await self._sleep(self.SHORT_POLL_INTERVAL)
             except NotImplementedError:
                 raise
@@ -898,37 +934,42 @@ class ExchangePyBase(ExchangeBase, ABC):
             return_err: bool = False,
             limit_id: Optional[str] = None,
             headers: Optional[Dict[str, Any]] = None,
+            priority: Optional[RequestPriority] = None,
             **kwargs,
     ) -> Dict[str, Any]:
-
+        """
+        :param priority: the throttling priority of the request. By default, the one of the calling task (order
+            creation and cancellation requests are HIGH, the polling loops' requests are LOW)
+        """
         last_exception = None
         rest_assistant = await self._web_assistants_factory.get_rest_assistant()
 
         url = overwrite_url or await self._api_request_url(path_url=path_url, is_auth_required=is_auth_required)
 
-        for _ in range(2):
-            try:
-                request_result = await rest_assistant.execute_request(
-                    url=url,
-                    params=params,
-                    data=data,
-                    method=method,
-                    is_auth_required=is_auth_required,
-                    return_err=return_err,
-                    throttler_limit_id=limit_id if limit_id else path_url,
-                    headers=headers,
-                )
-
-                return request_result
-            except IOError as request_exception:
-                last_exception = request_exception
-                if self._is_request_exception_related_to_time_synchronizer(request_exception=request_exception):
-                    await self._update_time_synchronizer()
-                else:
-                    raise
-
-        # Failed even after the last retry
-        raise last_exception
+        with request_priority(priority) if priority is not None else nullcontext():
+            for _ in range(2):
+                try:
+                    request_result = await rest_assistant.execute_request(
+                        url=url,
+                        params=params,
+                        data=data,
+                        method=method,
+                        is_auth_required=is_auth_required,
+                        return_err=return_err,
+                        throttler_limit_id=limit_id if limit_id else path_url,
+                        headers=headers,
+                    )
+
+                    return request_result
+                except IOError as request_exception:
+                    last_exception = request_exception
+                    if self._is_request_exception_related_to_time_synchronizer(request_exception=request_exception):
+                        await self._update_time_synchronizer()
+                    else:
+                        raise
+
+            # Failed even after the last retry
+            raise last_exception
 
     async def _status_polling_loop_fetch_updates(self):
         """
@@ -2,11 +2,13 @@ import asyncio
 import json
 import logging
 import os.path
+import queue
 import threading
 import time
 from decimal import Decimal
+from functools import partial
 from shutil import move
-from typing import Dict, List, Optional, Tuple, Union
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple, Union
 
 import pandas as pd
 from sqlalchemy.orm import Query, Session
@@ -40,6 +42,7 @@ from hummingbot.model.executors import Executors
 from hummingbot.model.funding_payment import FundingPayment
 from hummingbot.model.market_data import MarketData
 from hummingbot.model.market_state import MarketState
+from hummingbot.model.market_state_change import MarketStateChange
 from hummingbot.model.order import Order
 from hummingbot.model.order_status import OrderStatus
 from hummingbot.model.position import Position
@@ -50,8 +53,31 @@ from hummingbot.model.trade_fill import TradeFill
 from hummingbot.strategy_v2.controllers.controller_base import ControllerConfigBase
 from hummingbot.strategy_v2.models.executors_info import ExecutorInfo
 
+# A database write, run by the recorder within a transaction of the given session
+DatabaseWrite = Callable[[Session], None]
+
 
 class MarketsRecorder:
+    """
+    Records the orders, fills and market states of the connectors in the database.
+
+    Once started, the recorder writes behind: the events are turned into records on the event loop and queued, and a
+    writer thread commits them in batches, one transaction per batch, every flush interval or as soon as a batch is
+    full. The market states are saved once per batch for every connector that had events, instead of on every event.
+    flush() is an awaitable barrier that completes once everything recorded is in the database, the readers of the
+    recorded tables await it first. flush_blocking() waits for the writer thread blocking the caller, and is only meant
+    for the shutdown. Before start() and after stop() the records are written synchronously.
+
+    The executors, positions and controllers are still written synchronously from the event loop thread, so those
+    commits can run at the same time as a batch of the writer thread. SQLite serializes the two writers, the one that
+    finds the database locked waits for it up to the busy_timeout set by SQLConnectionManager, so lowering that
+    timeout can make either write fail with "database is locked".
+
+    For connectors that report which orders changed (pop_tracking_state_changes) only those orders are appended to the
+    MarketStateChange log, and a full MarketState snapshot replaces the log every MARKET_STATES_COMPACTION_THRESHOLD
+    changes. restore_market_states replays the log over the snapshot. When the market states of a connector fail to be
+    written, the next write of that connector is a snapshot, so the log does not miss the changes that were lost.
+    """
     _logger = None
     _shared_instance: "MarketsRecorder" = None
     market_event_tag_map: Dict[int, MarketEvent] = {
@@ -59,6 +85,11 @@ class MarketsRecorder:
         for event_obj in MarketEvent.__members__.values()
     }
 
+    DEFAULT_FLUSH_INTERVAL = 1.0
+    DEFAULT_FLUSH_BATCH_SIZE = 100
+    FLUSH_TIMEOUT = 30.0
+    MARKET_STATES_COMPACTION_THRESHOLD = 1000
+
     @classmethod
     def logger(cls) -> HummingbotLogger:
         if cls._logger is None:
@@ -76,11 +107,33 @@ class MarketsRecorder:
                  markets: List[ConnectorBase],
                  config_file_path: str,
                  strategy_name: str,
-                 market_data_collection: MarketDataCollectionConfigMap):
+                 market_data_collection: MarketDataCollectionConfigMap,
+                 flush_interval: float = DEFAULT_FLUSH_INTERVAL,
+                 flush_batch_size: int = DEFAULT_FLUSH_BATCH_SIZE,
+                 incremental_market_states: bool = True):
+        """
+        :param flush_interval: maximum seconds a record waits before being written to the database
+        :param flush_batch_size: number of pending records that triggers a write without waiting for the interval
+        :param incremental_market_states: save only the orders that changed when the connector supports it, instead of
+            the whole tracking states
+        """
         if threading.current_thread() != threading.main_thread():
             raise EnvironmentError("MarketsRecorded can only be initialized from the main thread.")
 
         self._ev_loop: asyncio.AbstractEventLoop = asyncio.get_event_loop()
+        self._flush_interval: float = flush_interval
+        self._flush_batch_size: int = flush_batch_size
+        self._pending_writes: List[DatabaseWrite] = []
+        # Connectors whose market states have to be saved with the next batch (used as an ordered set)
+        self._markets_with_pending_states: Dict[ConnectorBase, None] = {}
+        self._incremental_market_states: bool = incremental_market_states
+        # Changes logged per market since its last snapshot. Markets without snapshot in this session are not included.
+        self._market_state_changes_since_snapshot: Dict[str, int] = {}
+        # Markets whose last market states write failed, added by the writer thread
+        self._markets_with_failed_states: Set[str] = set()
+        self._flush_handle: Optional[asyncio.TimerHandle] = None
+        self._write_queue: queue.Queue = queue.Queue()
+        self._writer_thread: Optional[threading.Thread] = None
         self._sql_manager: SQLConnectionManager = sql
         self._markets: List[ConnectorBase] = markets
         self._config_file_path: str = config_file_path
@@ -131,28 +184,28 @@ class MarketsRecorder:
         while True:
             try:
                 if all(ex.ready for ex in self._markets):
-                    with self._sql_manager.get_new_session() as session:
-                        with session.begin():
-                            for market in self._markets:
-                                exchange = market.display_name
-                                for trading_pair in market.trading_pairs:
-                                    mid_price = market.get_price_by_type(trading_pair, PriceType.MidPrice)
-                                    best_bid = market.get_price_by_type(trading_pair, PriceType.BestBid)
-                                    best_ask = market.get_price_by_type(trading_pair, PriceType.BestAsk)
-                                    order_book = market.get_order_book(trading_pair)
-                                    depth = self._market_data_collection_config.market_data_collection_depth + 1
-                                    market_data = MarketData(
-                                        timestamp=self.db_timestamp,
-                                        exchange=exchange,
-                                        trading_pair=trading_pair,
-                                        mid_price=mid_price,
-                                        best_bid=best_bid,
-                                        best_ask=best_ask,
-                                        order_book={
-                                            "bid": list(order_book.bid_entries())[:depth],
-                                            "ask": list(order_book.ask_entries())[:depth]}
-                                    )
-                                    session.add(market_data)
+                    market_data_records = []
+                    for market in self._markets:
+                        exchange = market.display_name
+                        for trading_pair in market.trading_pairs:
+                            mid_price = market.get_price_by_type(trading_pair, PriceType.MidPrice)
+                            best_bid = market.get_price_by_type(trading_pair, PriceType.BestBid)
+                            best_ask = market.get_price_by_type(trading_pair, PriceType.BestAsk)
+                            order_book = market.get_order_book(trading_pair)
+                            depth = self._market_data_collection_config.market_data_collection_depth + 1
+                            market_data = MarketData(
+                                timestamp=self.db_timestamp,
+                                exchange=exchange,
+                                trading_pair=trading_pair,
+                                mid_price=mid_price,
+                                best_bid=best_bid,
+                                best_ask=best_ask,
+                                order_book={
+                                    "bid": list(order_book.bid_entries())[:depth],
+                                    "ask": list(order_book.ask_entries())[:depth]}
+                            )
+                            market_data_records.append(market_data)
+                    self._record(partial(self._add_records, market_data_records))
             except asyncio.CancelledError:
                 raise
             except Exception as e:
@@ -177,6 +230,7 @@ class MarketsRecorder:
         return int(time.time() * 1e3)
 
     def start(self):
+        self._start_writer()
         for market in self._markets:
             for event_pair in self._event_pairs:
                 market.add_listener(event_pair[0], event_pair[1])
@@ -219,6 +273,172 @@ class MarketsRecorder:
                 market.remove_listener(event_pair[0], event_pair[1])
         if self._market_data_collection_task is not None:
             self._market_data_collection_task.cancel()
+        self._stop_writer()
+
+    async def flush(self, timeout: float = FLUSH_TIMEOUT) -> bool:
+        """
+        Writes all the records pending and waits until they are committed, without blocking the event loop. Has to be
+        called from the event loop thread.
+
+        :param timeout: maximum seconds to wait for the writer thread
+        :return: True if everything recorded so far is in the database, False if the timeout expired
+        """
+        self._submit_pending_writes()
+        if self._writer_thread is None:
+            return True
+        barrier: asyncio.Future = self._ev_loop.create_future()
+        self._write_queue.put(barrier)
+        try:
+            await asyncio.wait_for(barrier, timeout)
+            return True
+        except asyncio.TimeoutError:
+            self.logger().warning(f"The database writes were not completed within {timeout} seconds.")
+            return False
+
+    def flush_blocking(self, timeout: float = FLUSH_TIMEOUT) -> bool:
+        """
+        Same as flush() but blocks the calling thread while waiting, only to be used when shutting down. Has to be
+        called from the event loop thread.
+
+        :param timeout: maximum seconds to wait for the writer thread
+        :return: True if everything recorded so far is in the database, False if the timeout expired
+        """
+        self._submit_pending_writes()
+        if self._writer_thread is None:
+            return True
+        barrier = threading.Event()
+        self._write_queue.put(barrier)
+        written = barrier.wait(timeout)
+        if not written:
+            self.logger().warning(f"The database writes were not completed within {timeout} seconds.")
+        return written
+
+    def _start_writer(self):
+        if self._writer_thread is None:
+            self._writer_thread = threading.Thread(target=self._write_loop, name="MarketsRecorderWriter", daemon=True)
+            self._writer_thread.start()
+
+    def _stop_writer(self):
+        if self._writer_thread is not None:
+            self.flush_blocking()
+            self._write_queue.put(None)
+            self._writer_thread.join(timeout=self.FLUSH_TIMEOUT)
+            self._writer_thread = None
+
+    def _record(self, write: Optional[DatabaseWrite], market: Optional[ConnectorBase] = None):
+        """
+        Queues a database write and, when a market is given, the save of its market states
+        """
+        if write is not None:
+            self._pending_writes.append(write)
+        if market is not None:
+            self._markets_with_pending_states[market] = None
+        if self._writer_thread is None or len(self._pending_writes) >= self._flush_batch_size:
+            self._submit_pending_writes()
+        elif self._flush_handle is None:
+            self._flush_handle = self._ev_loop.call_later(self._flush_interval, self._submit_pending_writes)
+
+    def _submit_pending_writes(self):
+        """
+        Takes the market states snapshots and hands the pending writes to the writer thread as one batch (or writes
+        them right away when the writer is not running)
+        """
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        batch = self._pending_writes
+        self._pending_writes = []
+        timestamp = self.db_timestamp
+        for market in self._markets_with_pending_states:
+            market_states_write = self._market_states_write(market, timestamp)
+            if market_states_write is not None:
+                batch.append(market_states_write)
+        self._markets_with_pending_states.clear()
+
+        if len(batch) == 0:
+            return
+        if self._writer_thread is None:
+            self._write_batch(batch)
+        else:
+            self._write_queue.put(batch)
+
+    def _market_states_write(self, market: ConnectorBase, timestamp: int) -> Optional[DatabaseWrite]:
+        """
+        The write that saves the market states of a connector: the orders that changed since the previous write, or a
+        snapshot of all of them. A snapshot is taken the first time in the session, when the connector does not report
+        its changes and every MARKET_STATES_COMPACTION_THRESHOLD changes.
+        """
+        market_name = market.display_name
+        changes = market.pop_tracking_state_changes()
+        changes_count = self._market_state_changes_since_snapshot.get(market_name)
+        if market_name in self._markets_with_failed_states:
+            self._markets_with_failed_states.discard(market_name)
+            changes_count = None
+        if self._incremental_market_states and changes is not None and changes_count is not None:
+            if len(changes) == 0:
+                return None
+            changes_count += len(changes)
+            if changes_count < self.MARKET_STATES_COMPACTION_THRESHOLD:
+                self._market_state_changes_since_snapshot[market_name] = changes_count
+                return partial(self._save_market_state_changes, self._config_file_path, market_name, changes, timestamp)
+        self._market_state_changes_since_snapshot[market_name] = 0
+        return partial(self._save_market_states_snapshot,
+                       self._config_file_path,
+                       market_name,
+                       market.tracking_states,
+                       timestamp)
+
+    def _write_loop(self):
+        while True:
+            item = self._write_queue.get()
+            if item is None:
+                return
+            if isinstance(item, threading.Event):
+                item.set()
+            elif isinstance(item, asyncio.Future):
+                try:
+                    self._ev_loop.call_soon_threadsafe(self._release_barrier, item)
+                except RuntimeError:
+                    # The event loop was closed while flushing, nobody is waiting for the barrier anymore
+                    pass
+            else:
+                self._write_batch(item)
+
+    @staticmethod
+    def _release_barrier(barrier: asyncio.Future):
+        # The barrier is cancelled when the flush times out
+        if not barrier.done():
+            barrier.set_result(True)
+
+    def _write_batch(self, batch: List[DatabaseWrite]):
+        try:
+            with self._sql_manager.get_new_session() as session:
+                with session.begin():
+                    for write in batch:
+                        write(session)
+        except Exception:
+            if len(batch) == 1:
+                self.logger().error("Unexpected error while saving to the database.", exc_info=True)
+                market_name = self._market_states_write_market(batch[0])
+                if market_name is not None:
+                    self._markets_with_failed_states.add(market_name)
+            else:
+                # Retry the writes one by one so a single invalid record does not discard the whole batch
+                for write in batch:
+                    self._write_batch([write])
+
+    def _market_states_write_market(self, write: DatabaseWrite) -> Optional[str]:
+        """
+        The market of a write returned by _market_states_write, None for the other writes
+        """
+        if isinstance(write, partial) and write.func in (self._save_market_state_changes,
+                                                         self._save_market_states_snapshot):
+            return write.args[1]
+        return None
+
+    @staticmethod
+    def _add_records(records: List[Any], session: Session):
+        session.add_all(records)
 
     def store_or_update_executor(self, executor):
         with self._sql_manager.get_new_session() as session:
@@ -308,6 +528,9 @@ class MarketsRecorder:
     def get_orders_for_config_and_market(self, config_file_path: str, market: ConnectorBase,
                                          with_exchange_order_id_present: Optional[bool] = False,
                                          number_of_rows: Optional[int] = None) -> List[Order]:
+        """
+        Reads the orders committed to the database, await flush() first to include the ones still being written
+        """
         with self._sql_manager.get_new_session() as session:
             filters = [Order.config_file_path == config_file_path,
                        Order.market == market.display_name]
@@ -323,6 +546,9 @@ class MarketsRecorder:
                 return query.limit(number_of_rows).all()
 
     def get_trades_for_config(self, config_file_path: str, number_of_rows: Optional[int] = None) -> List[TradeFill]:
+        """
+        Reads the trades committed to the database, await flush() first to include the ones still being written
+        """
         with self._sql_manager.get_new_session() as session:
             query: Query = (session
                             .query(TradeFill)
@@ -334,25 +560,82 @@ class MarketsRecorder:
                 return query.limit(number_of_rows).all()
 
     def save_market_states(self, config_file_path: str, market: ConnectorBase, session: Session):
-        market_states: Optional[MarketState] = self.get_market_states(config_file_path, market, session=session)
-        timestamp: int = self.db_timestamp
+        self._save_market_states_snapshot(config_file_path,
+                                          market.display_name,
+                                          market.tracking_states,
+                                          self.db_timestamp,
+                                          session)
 
+    @staticmethod
+    def _save_market_states_snapshot(config_file_path: str,
+                                     market_name: str,
+                                     saved_state: Dict[str, Any],
+                                     timestamp: int,
+                                     session: Session):
+        market_states: Optional[MarketState] = (session
+                                                .query(MarketState)
+                                                .filter(MarketState.config_file_path == config_file_path,
+                                                        MarketState.market == market_name)
+                                                .one_or_none())
         if market_states is not None:
-            market_states.saved_state = market.tracking_states
+            market_states.saved_state = saved_state
             market_states.timestamp = timestamp
         else:
             market_states = MarketState(config_file_path=config_file_path,
-                                        market=market.display_name,
+                                        market=market_name,
                                         timestamp=timestamp,
-                                        saved_state=market.tracking_states)
+                                        saved_state=saved_state)
             session.add(market_states)
+        # The snapshot includes all the changes logged before it
+        (session
+         .query(MarketStateChange)
+         .filter(MarketStateChange.config_file_path == config_file_path,
+                 MarketStateChange.market == market_name)
+         .delete(synchronize_session=False))
+
+    @staticmethod
+    def _save_market_state_changes(config_file_path: str,
+                                   market_name: str,
+                                   changes: Dict[str, Optional[Dict[str, Any]]],
+                                   timestamp: int,
+                                   session: Session):
+        session.add_all([MarketStateChange(config_file_path=config_file_path,
+                                           market=market_name,
+                                           timestamp=timestamp,
+                                           client_order_id=client_order_id,
+                                           saved_state=saved_state)
+                         for client_order_id, saved_state in changes.items()])
 
     def restore_market_states(self, config_file_path: str, market: ConnectorBase):
+        """
+        Restores the market states committed to the database, await flush() first to include the ones still being
+        written
+        """
         with self._sql_manager.get_new_session() as session:
             market_states: Optional[MarketState] = self.get_market_states(config_file_path, market, session=session)
-
-            if market_states is not None:
-                market.restore_tracking_states(market_states.saved_state)
+            saved_states: Dict[str, Any] = dict(market_states.saved_state) if market_states is not None else {}
+            state_changes: List[MarketStateChange] = self.get_market_state_changes(config_file_path,
+                                                                                   market,
+                                                                                   session=session)
+            for state_change in state_changes:
+                if state_change.saved_state is None:
+                    saved_states.pop(state_change.client_order_id, None)
+                else:
+                    saved_states[state_change.client_order_id] = state_change.saved_state
+
+            if market_states is not None or len(state_changes) > 0:
+                market.restore_tracking_states(saved_states)
+
+    def get_market_state_changes(self,
+                                 config_file_path: str,
+                                 market: ConnectorBase,
+                                 session: Session) -> List[MarketStateChange]:
+        query: Query = (session
+                        .query(MarketStateChange)
+                        .filter(MarketStateChange.config_file_path == config_file_path,
+                                MarketStateChange.market == market.display_name)
+                        .order_by(MarketStateChange.id))
+        return query.all()
 
     def get_market_states(self,
                           config_file_path: str,
@@ -377,31 +660,27 @@ class MarketsRecorder:
         timestamp = int(evt.creation_timestamp * 1e3)
         event_type: MarketEvent = self.market_event_tag_map[event_tag]
 
-        with self._sql_manager.get_new_session() as session:
-            with session.begin():
-                order_record: Order = Order(id=evt.order_id,
-                                            config_file_path=self._config_file_path,
-                                            strategy=self._strategy_name,
-                                            market=market.display_name,
-                                            symbol=evt.trading_pair,
-                                            base_asset=base_asset,
-                                            quote_asset=quote_asset,
-                                            creation_timestamp=timestamp,
-                                            order_type=evt.type.name,
-                                            amount=Decimal(evt.amount),
-                                            leverage=evt.leverage if evt.leverage else 1,
-                                            price=Decimal(evt.price) if evt.price == evt.price else Decimal(0),
-                                            position=evt.position if evt.position else PositionAction.NIL.value,
-                                            last_status=event_type.name,
-                                            last_update_timestamp=timestamp,
-                                            exchange_order_id=evt.exchange_order_id)
-                order_status: OrderStatus = OrderStatus(order=order_record,
-                                                        timestamp=timestamp,
-                                                        status=event_type.name)
-                session.add(order_record)
-                session.add(order_status)
-                market.add_exchange_order_ids_from_market_recorder({evt.exchange_order_id: evt.order_id})
-                self.save_market_states(self._config_file_path, market, session=session)
+        order_record: Order = Order(id=evt.order_id,
+                                    config_file_path=self._config_file_path,
+                                    strategy=self._strategy_name,
+                                    market=market.display_name,
+                                    symbol=evt.trading_pair,
+                                    base_asset=base_asset,
+                                    quote_asset=quote_asset,
+                                    creation_timestamp=timestamp,
+                                    order_type=evt.type.name,
+                                    amount=Decimal(evt.amount),
+                                    leverage=evt.leverage if evt.leverage else 1,
+                                    price=Decimal(evt.price) if evt.price == evt.price else Decimal(0),
+                                    position=evt.position if evt.position else PositionAction.NIL.value,
+                                    last_status=event_type.name,
+                                    last_update_timestamp=timestamp,
+                                    exchange_order_id=evt.exchange_order_id)
+        order_status: OrderStatus = OrderStatus(order=order_record,
+                                                timestamp=timestamp,
+                                                status=event_type.name)
+        market.add_exchange_order_ids_from_market_recorder({evt.exchange_order_id: evt.order_id})
+        self._record(partial(self._add_records, [order_record, order_status]), market)
 
     def _did_fill_order(self,
                         event_tag: int,
@@ -416,56 +695,55 @@ class MarketsRecorder:
         event_type: MarketEvent = self.market_event_tag_map[event_tag]
         order_id: str = evt.order_id
 
-        with self._sql_manager.get_new_session() as session:
-            with session.begin():
-                # Try to find the order record, and update it if necessary.
-                order_record: Optional[Order] = session.query(Order).filter(Order.id == order_id).one_or_none()
-                if order_record is not None:
-                    order_record.last_status = event_type.name
-                    order_record.last_update_timestamp = timestamp
-
-                # Order status and trade fill record should be added even if the order record is not found, because it's
-                # possible for fill event to come in before the order created event for market orders.
-                order_status: OrderStatus = OrderStatus(order_id=order_id,
-                                                        timestamp=timestamp,
-                                                        status=event_type.name)
-                try:
-                    fee_in_quote = evt.trade_fee.fee_amount_in_token(
-                        trading_pair=evt.trading_pair,
-                        price=evt.price,
-                        order_amount=evt.amount,
-                        token=quote_asset,
-                        exchange=market
-                    )
-                except Exception as e:
-                    self.logger().error(f"Error calculating fee in quote: {e}, will be stored in the DB as 0.")
-                    fee_in_quote = 0
-                trade_fill_record: TradeFill = TradeFill(
-                    config_file_path=self.config_file_path,
-                    strategy=self.strategy_name,
-                    market=market.display_name,
-                    symbol=evt.trading_pair,
-                    base_asset=base_asset,
-                    quote_asset=quote_asset,
-                    timestamp=timestamp,
-                    order_id=order_id,
-                    trade_type=evt.trade_type.name,
-                    order_type=evt.order_type.name,
-                    price=evt.price,
-                    amount=evt.amount,
-                    leverage=evt.leverage if evt.leverage else 1,
-                    trade_fee=evt.trade_fee.to_json(),
-                    trade_fee_in_quote=fee_in_quote,
-                    exchange_trade_id=evt.exchange_trade_id,
-                    position=evt.position if evt.position else PositionAction.NIL.value,
-                )
-                session.add(order_status)
-                session.add(trade_fill_record)
-                self.save_market_states(self._config_file_path, market, session=session)
-
-                market.add_trade_fills_from_market_recorder({TradeFillOrderDetails(trade_fill_record.market,
-                                                                                   trade_fill_record.exchange_trade_id,
-                                                                                   trade_fill_record.symbol)})
+        # Order status and trade fill record should be added even if the order record is not found, because it's
+        # possible for fill event to come in before the order created event for market orders.
+        order_status: OrderStatus = OrderStatus(order_id=order_id,
+                                                timestamp=timestamp,
+                                                status=event_type.name)
+        try:
+            fee_in_quote = evt.trade_fee.fee_amount_in_token(
+                trading_pair=evt.trading_pair,
+                price=evt.price,
+                order_amount=evt.amount,
+                token=quote_asset,
+                exchange=market
+            )
+        except Exception as e:
+            self.logger().error(f"Error calculating fee in quote: {e}, will be stored in the DB as 0.")
+            fee_in_quote = 0
+        trade_fill_record: TradeFill = TradeFill(
+            config_file_path=self.config_file_path,
+            strategy=self.strategy_name,
+            market=market.display_name,
+            symbol=evt.trading_pair,
+            base_asset=base_asset,
+            quote_asset=quote_asset,
+            timestamp=timestamp,
+            order_id=order_id,
+            trade_type=evt.trade_type.name,
+            order_type=evt.order_type.name,
+            price=evt.price,
+            amount=evt.amount,
+            leverage=evt.leverage if evt.leverage else 1,
+            trade_fee=evt.trade_fee.to_json(),
+            trade_fee_in_quote=fee_in_quote,
+            exchange_trade_id=evt.exchange_trade_id,
+            position=evt.position if evt.position else PositionAction.NIL.value,
+        )
+        market.add_trade_fills_from_market_recorder({TradeFillOrderDetails(trade_fill_record.market,
+                                                                           trade_fill_record.exchange_trade_id,
+                                                                           trade_fill_record.symbol)})
+        self._record(partial(self._write_fill, order_id, event_type.name, timestamp, [order_status, trade_fill_record]),
+                     market)
+
+    @staticmethod
+    def _write_fill(order_id: str, status: str, timestamp: int, records: List[Any], session: Session):
+        # Try to find the order record, and update it if necessary.
+        order_record: Optional[Order] = session.query(Order).filter(Order.id == order_id).one_or_none()
+        if order_record is not None:
+            order_record.last_status = status
+            order_record.last_update_timestamp = timestamp
+        session.add_all(records)
 
     def _did_complete_funding_payment(self,
                                       event_tag: int,
@@ -475,21 +753,21 @@ class MarketsRecorder:
             self._ev_loop.call_soon_threadsafe(self._did_complete_funding_payment, event_tag, market, evt)
             return
 
-        timestamp: float = evt.timestamp
+        funding_payment_record: FundingPayment = FundingPayment(timestamp=evt.timestamp,
+                                                                config_file_path=self.config_file_path,
+                                                                market=market.display_name,
+                                                                rate=evt.funding_rate,
+                                                                symbol=evt.trading_pair,
+                                                                amount=float(evt.amount))
+        self._record(partial(self._write_funding_payment, funding_payment_record))
 
-        with self._sql_manager.get_new_session() as session:
-            with session.begin():
-                # Try to find the funding payment has been recorded already.
-                payment_record: Optional[FundingPayment] = session.query(FundingPayment).filter(
-                    FundingPayment.timestamp == timestamp).one_or_none()
-                if payment_record is None:
-                    funding_payment_record: FundingPayment = FundingPayment(timestamp=timestamp,
-                                                                            config_file_path=self.config_file_path,
-                                                                            market=market.display_name,
-                                                                            rate=evt.funding_rate,
-                                                                            symbol=evt.trading_pair,
-                                                                            amount=float(evt.amount))
-                    session.add(funding_payment_record)
+    @staticmethod
+    def _write_funding_payment(funding_payment_record: FundingPayment, session: Session):
+        # Try to find the funding payment has been recorded already.
+        payment_record: Optional[FundingPayment] = session.query(FundingPayment).filter(
+            FundingPayment.timestamp == funding_payment_record.timestamp).one_or_none()
+        if payment_record is None:
+            session.add(funding_payment_record)
 
     @staticmethod
     def _csv_matches_header(file_path: str, header: tuple) -> bool:
@@ -533,20 +811,20 @@ class MarketsRecorder:
 
         timestamp: int = self.db_timestamp
         event_type: MarketEvent = self.market_event_tag_map[event_tag]
-        order_id: str = evt.order_id
 
-        with self._sql_manager.get_new_session() as session:
-            with session.begin():
-                order_record: Optional[Order] = session.query(Order).filter(Order.id == order_id).one_or_none()
-
-                if order_record is not None:
-                    order_record.last_status = event_type.name
-                    order_record.last_update_timestamp = timestamp
-                    order_status: OrderStatus = OrderStatus(order_id=order_id,
-                                                            timestamp=timestamp,
-                                                            status=event_type.name)
-                    session.add(order_status)
-                    self.save_market_states(self._config_file_path, market, session=session)
+        self._record(partial(self._write_order_status, evt.order_id, event_type.name, timestamp), market)
+
+    @staticmethod
+    def _write_order_status(order_id: str, status: str, timestamp: int, session: Session):
+        order_record: Optional[Order] = session.query(Order).filter(Order.id == order_id).one_or_none()
+
+        if order_record is not None:
+            order_record.last_status = status
+            order_record.last_update_timestamp = timestamp
+            order_status: OrderStatus = OrderStatus(order_id=order_id,
+                                                    timestamp=timestamp,
+                                                    status=status)
+            session.add(order_status)
 
     def _did_cancel_order(self,
                           event_tag: int,
@@ -582,15 +860,12 @@ class MarketsRecorder:
 
         timestamp: int = self.db_timestamp
 
-        with self._sql_manager.get_new_session() as session:
-            with session.begin():
-                rp_update: RangePositionUpdate = RangePositionUpdate(hb_id=evt.order_id,
-                                                                     timestamp=timestamp,
-                                                                     tx_hash=evt.exchange_order_id,
-                                                                     token_id=evt.token_id,
-                                                                     trade_fee=evt.trade_fee.to_json())
-                session.add(rp_update)
-                self.save_market_states(self._config_file_path, connector, session=session)
+        rp_update: RangePositionUpdate = RangePositionUpdate(hb_id=evt.order_id,
+                                                             timestamp=timestamp,
+                                                             tx_hash=evt.exchange_order_id,
+                                                             token_id=evt.token_id,
+                                                             trade_fee=evt.trade_fee.to_json())
+        self._record(partial(self._add_records, [rp_update]), connector)
 
     def _did_close_position(self,
                             event_tag: int,
@@ -600,17 +875,14 @@ class MarketsRecorder:
             self._ev_loop.call_soon_threadsafe(self._did_close_position, event_tag, connector, evt)
             return
 
-        with self._sql_manager.get_new_session() as session:
-            with session.begin():
-                rp_fees: RangePositionCollectedFees = RangePositionCollectedFees(config_file_path=self._config_file_path,
-                                                                                 strategy=self._strategy_name,
-                                                                                 token_id=evt.token_id,
-                                                                                 token_0=evt.token_0,
-                                                                                 token_1=evt.token_1,
-                                                                                 claimed_fee_0=Decimal(evt.claimed_fee_0),
-                                                                                 claimed_fee_1=Decimal(evt.claimed_fee_1))
-                session.add(rp_fees)
-                self.save_market_states(self._config_file_path, connector, session=session)
+        rp_fees: RangePositionCollectedFees = RangePositionCollectedFees(config_file_path=self._config_file_path,
+                                                                         strategy=self._strategy_name,
+                                                                         token_id=evt.token_id,
+                                                                         token_0=evt.token_0,
+                                                                         token_1=evt.token_1,
+                                                                         claimed_fee_0=Decimal(evt.claimed_fee_0),
+                                                                         claimed_fee_1=Decimal(evt.claimed_fee_1))
+        self._record(partial(self._add_records, [rp_fees]), connector)
 
     @staticmethod
     async def _sleep(delay):
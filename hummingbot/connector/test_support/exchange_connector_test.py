@@ -5,7 +5,7 @@ from abc import ABC, abstractmethod
 from decimal import Decimal
 from test.isolated_asyncio_wrapper_test_case import IsolatedAsyncioWrapperTestCase
 from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple, Union
-from unittest.mock import AsyncMock, patch
+from unittest.mock import AsyncMock, PropertyMock, patch
 
 from aioresponses import aioresponses
 from aioresponses.core import RequestCall
@@ -622,6 +622,16 @@ class AbstractExchangeConnectorTests:
             self.assertEqual(self._expected_initial_status_dict(), status_dict)
             self.assertFalse(self.exchange.ready)
 
+        def test_trading_pair_ready_before_all_order_books(self):
+            status_dict = {name: True for name in self._expected_initial_status_dict()}
+            status_dict["order_books_initialized"] = False
+            self.exchange.order_book_tracker._init_durations[self.trading_pair] = 0.1
+
+            with patch.object(type(self.exchange), "status_dict", new_callable=PropertyMock, return_value=status_dict):
+                self.assertFalse(self.exchange.ready)
+                self.assertTrue(self.exchange.is_trading_pair_ready(self.trading_pair))
+                self.assertFalse(self.exchange.is_trading_pair_ready("OTHER-PAIR"))
+
         @aioresponses()
         async def test_update_trading_rules(self, mock_api):
             self.exchange._set_current_timestamp(1000)
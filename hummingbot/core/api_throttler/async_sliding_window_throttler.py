@@ -0,0 +1,321 @@
+import asyncio
+import bisect
+import itertools
+import time
+from collections import deque
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from decimal import Decimal
+from typing import Deque, Dict, Iterable, Iterator, List, Optional, Set, Tuple
+
+from hummingbot.core.api_throttler.async_request_context_base import MAX_CAPACITY_REACHED_WARNING_INTERVAL
+from hummingbot.core.api_throttler.async_throttler_base import AsyncThrottlerBase
+from hummingbot.core.api_throttler.data_types import RateLimit, RequestPriority
+
+_request_priority: ContextVar[RequestPriority] = ContextVar("request_priority", default=RequestPriority.NORMAL)
+
+
+def current_request_priority() -> RequestPriority:
+    """
+    The priority of the requests issued from the current task (NORMAL unless set with request_priority)
+    """
+    return _request_priority.get()
+
+
+@contextmanager
+def request_priority(priority: RequestPriority) -> Iterator[None]:
+    """
+    Sets the priority of the requests issued within the context, including the ones issued by tasks created in it.
+    Throttlers that do not support priorities ignore it.
+    """
+    token = _request_priority.set(priority)
+    try:
+        yield
+    finally:
+        _request_priority.reset(token)
+
+
+class LimitWindow:
+    """
+    Sliding window of the capacity used from one RateLimit.
+
+    Requests recorded within the same bucket (a fraction of the time interval) are merged, so the window holds a
+    bounded number of entries whatever the request rate. A bucket is released when its latest request leaves the
+    window, which can only hold capacity a bit longer than an exact log, never less.
+    """
+
+    __slots__ = ("rate_limit", "limit", "hold_time", "bucket_width", "buckets", "used")
+
+    def __init__(self, rate_limit: RateLimit, safety_margin_pct: float, buckets_per_window: int):
+        self.rate_limit: RateLimit = rate_limit
+        self.limit: float = float(rate_limit.limit)
+        self.hold_time: float = float(rate_limit.time_interval) * (1 + safety_margin_pct)
+        self.bucket_width: float = float(rate_limit.time_interval) / buckets_per_window
+        # Each bucket is [first timestamp, last timestamp, weight]
+        self.buckets: Deque[List[float]] = deque()
+        self.used: float = 0.0
+
+    def expire(self, now: float):
+        buckets = self.buckets
+        while len(buckets) > 0 and now - buckets[0][1] >= self.hold_time:
+            self.used -= buckets.popleft()[2]
+        if len(buckets) == 0:
+            self.used = 0.0
+
+    def has_capacity(self, weight: float, limit: Optional[float] = None) -> bool:
+        """
+        :param limit: the part of the limit the request can use, the whole limit by default
+        """
+        limit = self.limit if limit is None else limit
+        # A request heavier than the limit can only go through alone
+        return self.used + weight <= limit or len(self.buckets) == 0
+
+    def record(self, now: float, weight: float):
+        buckets = self.buckets
+        if len(buckets) > 0 and now - buckets[-1][0] < self.bucket_width:
+            last_bucket = buckets[-1]
+            last_bucket[1] = now
+            last_bucket[2] += weight
+        else:
+            buckets.append([now, now, weight])
+        self.used += weight
+
+    def available_at(self, weight: float, limit: Optional[float] = None) -> float:
+        """
+        The time at which enough capacity will have been released for a request of the given weight
+        """
+        limit = self.limit if limit is None else limit
+        released = 0.0
+        for _, last_timestamp, bucket_weight in self.buckets:
+            released += bucket_weight
+            if self.used - released + weight <= limit:
+                return last_timestamp + self.hold_time
+        return self.buckets[-1][1] + self.hold_time
+
+
+@dataclass(order=True)
+class _Waiter:
+    priority: int
+    sequence: int
+    usages: List[Tuple[LimitWindow, float, float]] = field(compare=False)
+    future: asyncio.Future = field(compare=False)
+
+
+class SlidingWindowRequestContext:
+    """
+    An async context ('async with' syntax) that waits until the AsyncSlidingWindowThrottler lets the request through.
+    """
+
+    def __init__(self, throttler: "AsyncSlidingWindowThrottler", limit_id: str, priority: RequestPriority):
+        self._throttler = throttler
+        self._limit_id = limit_id
+        self._priority = priority
+
+    async def acquire(self):
+        await self._throttler.acquire(limit_id=self._limit_id, priority=self._priority)
+
+    async def __aenter__(self):
+        await self.acquire()
+
+    async def __aexit__(self, exc_type, exc, tb):
+        pass
+
+
+class AsyncSlidingWindowThrottler(AsyncThrottlerBase):
+    """
+    Handles call rate limits like AsyncThrottler, keeping a running total of the capacity used per RateLimit instead of
+    scanning a shared task log on every check.
+
+    Requests that have to wait are queued by priority and then by arrival. A queued request is let through as soon as
+    all its limits have capacity and no request ahead of it is waiting on one of those limits. Instead of polling, the
+    throttler computes when the first blocked request will have capacity and wakes up at that time.
+
+    A share of the limits can be reserved for a priority: requests of lower priorities can not use it, so a burst of
+    background requests never leaves urgent ones (like order cancels) waiting for capacity. The reservation can be
+    restricted to the limits used by some requests (like order creation and cancellation), leaving the limits of the
+    other endpoints whole. When no priority is given to execute_task, the one set with request_priority for the
+    current task is used.
+    """
+
+    BUCKETS_PER_WINDOW = 100
+
+    def __init__(self,
+                 rate_limits: List[RateLimit],
+                 retry_interval: float = 0.1,
+                 safety_margin_pct: Optional[float] = 0.05,  # An extra safety margin, in percentage.
+                 limits_share_percentage: Optional[Decimal] = None,
+                 reserved_capacity: Optional[Dict[RequestPriority, float]] = None,
+                 reserved_limit_ids: Optional[Iterable[str]] = None,
+                 ):
+        """
+        :param rate_limits: List of RateLimit(s).
+        :param retry_interval: Kept for compatibility with AsyncThrottler, wake-ups are computed from the limits.
+        :param safety_margin_pct: Percentage of the time interval added to how long a request holds capacity.
+        :param limits_share_percentage: Percentage of the limits to be used by this instance (important when multiple
+            bots operate with the same account)
+        :param reserved_capacity: Share (between 0 and 1) of the reserved limits that only requests with the given
+            priority, or a higher one, can use.
+        :param reserved_limit_ids: The limit IDs of the requests the capacity is reserved for. The reservation only
+            applies to these limits and to the ones linked to them. When not given it applies to every limit.
+        """
+        reserved_capacity = reserved_capacity or {}
+        if sum(reserved_capacity.values()) >= 1 or any(share < 0 for share in reserved_capacity.values()):
+            raise ValueError(f"Invalid reserved capacity {reserved_capacity}. The shares must be positive and leave "
+                             f"capacity to the lowest priority.")
+        self._safety_margin_pct: float = safety_margin_pct
+        self._reserved_capacity: Dict[RequestPriority, float] = dict(reserved_capacity)
+        self._reserved_limit_ids: Optional[Set[str]] = (
+            None if reserved_limit_ids is None else set(reserved_limit_ids))
+        super().__init__(rate_limits=rate_limits,
+                         retry_interval=retry_interval,
+                         safety_margin_pct=safety_margin_pct,
+                         limits_share_percentage=limits_share_percentage)
+        self._waiters: List[_Waiter] = []
+        self._sequence = itertools.count()
+        self._wake_up_handle: Optional[asyncio.TimerHandle] = None
+        self._last_max_cap_warning_ts: float = 0.0
+
+    def set_rate_limits(self, rate_limits: List[RateLimit]):
+        super().set_rate_limits(rate_limits)
+        self._windows: Dict[str, LimitWindow] = {
+            rate_limit.limit_id: LimitWindow(rate_limit=rate_limit,
+                                             safety_margin_pct=self._safety_margin_pct,
+                                             buckets_per_window=self.BUCKETS_PER_WINDOW)
+            for rate_limit in self._rate_limits
+        }
+        self._reserved_windows: Set[str] = self._limits_with_reservation()
+        self._usages_cache: Dict[Tuple[str, RequestPriority], List[Tuple[LimitWindow, float, float]]] = {}
+
+    def execute_task(self, limit_id: str, priority: Optional[RequestPriority] = None) -> SlidingWindowRequestContext:
+        """
+        Creates an async context where code within the context (a task) can be run only when all rate
+        limits have capacity for the new task.
+        :param limit_id: the limit_id associated with the APi request
+        :param priority: the priority of the request over the other requests waiting for capacity. Defaults to the
+            priority set for the current task with request_priority
+        :return: An async context (used with async with syntax)
+        """
+        priority = current_request_priority() if priority is None else priority
+        return SlidingWindowRequestContext(throttler=self, limit_id=limit_id, priority=priority)
+
+    async def acquire(self, limit_id: str, priority: RequestPriority = RequestPriority.NORMAL):
+        usages = self._usages(limit_id, priority)
+        now = self._time()
+        if len(self._waiters) == 0 and self._has_capacity(usages, now):
+            self._record(usages, now)
+            return
+
+        waiter = _Waiter(priority=int(priority),
+                         sequence=next(self._sequence),
+                         usages=usages,
+                         future=asyncio.get_running_loop().create_future())
+        bisect.insort(self._waiters, waiter)
+        self._dispatch()
+        try:
+            await waiter.future
+        except asyncio.CancelledError:
+            if waiter in self._waiters:
+                self._waiters.remove(waiter)
+                self._dispatch()
+            raise
+
+    def usable_share(self, priority: RequestPriority) -> float:
+        """
+        The share of every limit that requests with the given priority can use
+        """
+        return 1 - sum(share for reserved_priority, share in self._reserved_capacity.items()
+                       if reserved_priority < priority)
+
+    def _limits_with_reservation(self) -> Set[str]:
+        """
+        The IDs of the limits the reserved capacity applies to
+        """
+        if self._reserved_limit_ids is None:
+            return set(self._windows)
+        limit_ids: Set[str] = set()
+        for reserved_limit_id in self._reserved_limit_ids:
+            rate_limit, related_limits = self.get_related_limits(limit_id=reserved_limit_id)
+            if rate_limit is not None:
+                limit_ids.add(rate_limit.limit_id)
+                limit_ids.update(limit.limit_id for limit, _ in related_limits)
+        return limit_ids
+
+    def _usages(self, limit_id: str, priority: RequestPriority) -> List[Tuple[LimitWindow, float, float]]:
+        """
+        The windows a request uses, each with the weight of the request and the part of the limit it can use
+        """
+        usages = self._usages_cache.get((limit_id, priority))
+        if usages is None:
+            usable_share = self.usable_share(priority)
+            rate_limit, related_limits = self.get_related_limits(limit_id=limit_id)
+            usages = []
+            if rate_limit is not None:
+                for limit, weight in [(rate_limit, rate_limit.weight)] + list(related_limits):
+                    window = self._windows[limit.limit_id]
+                    share = usable_share if limit.limit_id in self._reserved_windows else 1
+                    usages.append((window, float(weight), window.limit * share))
+            self._usages_cache[(limit_id, priority)] = usages
+        return usages
+
+    @staticmethod
+    def _has_capacity(usages: List[Tuple[LimitWindow, float, float]], now: float) -> bool:
+        for window, weight, limit in usages:
+            window.expire(now)
+            if not window.has_capacity(weight, limit):
+                return False
+        return True
+
+    @staticmethod
+    def _record(usages: List[Tuple[LimitWindow, float, float]], now: float):
+        for window, weight, _ in usages:
+            window.record(now, weight)
+
+    def _dispatch(self):
+        """
+        Lets through the queued requests that have capacity, in priority order, and schedules the next wake-up
+        """
+        if self._wake_up_handle is not None:
+            self._wake_up_handle.cancel()
+            self._wake_up_handle = None
+
+        now = self._time()
+        blocked_windows: Set[int] = set()
+        next_wake_up: Optional[float] = None
+        waiting: List[_Waiter] = []
+        for waiter in self._waiters:
+            if waiter.future.done():
+                continue
+            window_ids = [id(window) for window, _, _ in waiter.usages]
+            if not blocked_windows.isdisjoint(window_ids):
+                waiting.append(waiter)
+                continue
+            if self._has_capacity(waiter.usages, now):
+                self._record(waiter.usages, now)
+                waiter.future.set_result(None)
+                continue
+            waiting.append(waiter)
+            blocked_windows.update(window_ids)
+            available_at = max(window.available_at(weight, limit)
+                               for window, weight, limit in waiter.usages
+                               if not window.has_capacity(weight, limit))
+            next_wake_up = available_at if next_wake_up is None else min(next_wake_up, available_at)
+            self._log_capacity_reached(waiter, now)
+        self._waiters = waiting
+
+        if next_wake_up is not None:
+            self._wake_up_handle = asyncio.get_event_loop().call_later(max(0.0, next_wake_up - now), self._dispatch)
+
+    def _log_capacity_reached(self, waiter: _Waiter, now: float):
+        if self._last_max_cap_warning_ts < now - MAX_CAPACITY_REACHED_WARNING_INTERVAL:
+            for window, weight, limit in waiter.usages:
+                if not window.has_capacity(weight, limit):
+                    rate_limit = window.rate_limit
+                    self.logger().notify(f"API rate limit on {rate_limit.limit_id} ({rate_limit.limit} calls per "
+                                         f"{rate_limit.time_interval}s) has almost reached. Limits used "
+                                         f"is {window.used:g} in the last {rate_limit.time_interval} seconds")
+                    self._last_max_cap_warning_ts = now
+                    break
+
+    def _time(self) -> float:
+        return time.monotonic()
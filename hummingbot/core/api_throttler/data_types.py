@@ -1,4 +1,5 @@
 from dataclasses import dataclass
+from enum import IntEnum
 from typing import (
     List,
     Optional,
@@ -13,6 +14,15 @@ RequestWeight = int     # Integer representing the request weight of the path ur
 Seconds = float
 
 
+class RequestPriority(IntEnum):
+    """
+    Order in which the requests waiting for capacity are let through, lower values first.
+    """
+    HIGH = 0  # order creation and cancellation
+    NORMAL = 1
+    LOW = 2  # status polling and other periodic updates
+
+
 @dataclass
 class LinkedLimitWeightPair:
     limit_id: str
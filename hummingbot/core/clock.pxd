@@ -10,3 +10,7 @@ cdef class Clock:
         list _current_context
         double _current_tick
         bint _started
+        double _slow_tick_threshold
+        list _slow_tick_listeners
+        double _last_slow_tick_warning_ts
+        object _tick_metrics
@@ -3,10 +3,11 @@
 import asyncio
 import logging
 import time
-from typing import List
+from typing import Callable, List, Optional
 
 from hummingbot.core.time_iterator import TimeIterator
 from hummingbot.core.time_iterator cimport TimeIterator
+from hummingbot.core.clock_metrics import ClockMetrics, SlowTickReport
 from hummingbot.core.clock_mode import ClockMode
 from hummingbot.logger import HummingbotLogger
 
@@ -14,6 +15,8 @@ s_logger = None
 
 
 cdef class Clock:
+    SLOW_TICK_WARNING_INTERVAL = 60.0
+
     @classmethod
     def logger(cls) -> HummingbotLogger:
         global s_logger
@@ -21,12 +24,15 @@ cdef class Clock:
             s_logger = logging.getLogger(__name__)
         return s_logger
 
-    def __init__(self, clock_mode: ClockMode, tick_size: float = 1.0, start_time: float = 0.0, end_time: float = 0.0):
+    def __init__(self, clock_mode: ClockMode, tick_size: float = 1.0, start_time: float = 0.0, end_time: float = 0.0,
+                 slow_tick_threshold: Optional[float] = None):
         """
         :param clock_mode: either real time mode or back testing mode
         :param tick_size: time interval of each tick
         :param start_time: (back testing mode only) start of simulation in UNIX timestamp
         :param end_time: (back testing mode only) end of simulation in UNIX timestamp. NaN to simulate to end of data.
+        :param slow_tick_threshold: (real time mode only) seconds of event loop lag plus tick duration above which a
+            tick is reported as slow. Defaults to the tick size.
         """
         self._clock_mode = clock_mode
         self._tick_size = tick_size
@@ -36,6 +42,10 @@ cdef class Clock:
         self._child_iterators = []
         self._current_context = None
         self._started = False
+        self._slow_tick_threshold = tick_size if slow_tick_threshold is None else slow_tick_threshold
+        self._slow_tick_listeners = []
+        self._last_slow_tick_warning_ts = 0.0
+        self._tick_metrics = ClockMetrics()
 
     @property
     def clock_mode(self) -> ClockMode:
@@ -57,6 +67,28 @@ cdef class Clock:
     def current_timestamp(self) -> float:
         return self._current_tick
 
+    @property
+    def slow_tick_threshold(self) -> float:
+        return self._slow_tick_threshold
+
+    @property
+    def tick_metrics(self) -> ClockMetrics:
+        """
+        Event loop lag and tick duration histograms, overall and per child iterator, collected in real time mode
+        """
+        return self._tick_metrics
+
+    def add_slow_tick_listener(self, listener: Callable[[SlowTickReport], None]):
+        """
+        Registers a callback called with the SlowTickReport of every slow tick
+        """
+        if listener not in self._slow_tick_listeners:
+            self._slow_tick_listeners.append(listener)
+
+    def remove_slow_tick_listener(self, listener: Callable[[SlowTickReport], None]):
+        if listener in self._slow_tick_listeners:
+            self._slow_tick_listeners.remove(listener)
+
     def __enter__(self) -> Clock:
         if self._current_context is not None:
             raise EnvironmentError("Clock context is not re-entrant.")
@@ -90,6 +122,10 @@ cdef class Clock:
             TimeIterator child_iterator
             double now = time.time()
             double next_tick_time
+            double loop_lag
+            double tick_start
+            double iterator_start
+            list iterator_durations
 
         if self._current_context is None:
             raise EnvironmentError("run() and run_til() can only be used within the context of a `with...` statement.")
@@ -110,11 +146,15 @@ cdef class Clock:
                 # Sleep until the next tick
                 next_tick_time = ((now // self._tick_size) + 1) * self._tick_size
                 await asyncio.sleep(next_tick_time - now)
+                loop_lag = max(0.0, time.time() - next_tick_time)
                 self._current_tick = next_tick_time
 
                 # Run through all the child iterators.
+                iterator_durations = []
+                tick_start = time.perf_counter()
                 for ci in self._current_context:
                     child_iterator = ci
+                    iterator_start = time.perf_counter()
                     try:
                         child_iterator.c_tick(self._current_tick)
                     except StopIteration:
@@ -122,11 +162,30 @@ cdef class Clock:
                         return
                     except Exception:
                         self.logger().error("Unexpected error running clock tick.", exc_info=True)
+                    iterator_durations.append((child_iterator, time.perf_counter() - iterator_start))
+                self._record_tick_timings(loop_lag, time.perf_counter() - tick_start, iterator_durations)
         finally:
             for ci in self._current_context:
                 child_iterator = ci
                 child_iterator._clock = None
 
+    def _record_tick_timings(self, loop_lag: float, duration: float, iterator_durations: list):
+        report = self._tick_metrics.record_tick(timestamp=self._current_tick,
+                                                loop_lag=loop_lag,
+                                                duration=duration,
+                                                iterator_durations=iterator_durations,
+                                                slow_tick_threshold=self._slow_tick_threshold)
+        if report is None:
+            return
+        if self._last_slow_tick_warning_ts < self._current_tick - self.SLOW_TICK_WARNING_INTERVAL:
+            self.logger().warning(report.format())
+            self._last_slow_tick_warning_ts = self._current_tick
+        for listener in self._slow_tick_listeners:
+            try:
+                listener(report)
+            except Exception:
+                self.logger().error("Unexpected error notifying a slow clock tick.", exc_info=True)
+
     def backtest_til(self, timestamp: float):
         cdef TimeIterator child_iterator
 
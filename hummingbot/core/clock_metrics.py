@@ -0,0 +1,185 @@
+import bisect
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Any, Deque, Dict, List, Optional, Tuple
+
+# Upper bounds, in seconds, of the histogram buckets. The last bucket holds everything above 10 seconds.
+TIMING_BUCKET_BOUNDS: Tuple[float, ...] = (
+    0.0001, 0.00025, 0.0005,
+    0.001, 0.0025, 0.005,
+    0.01, 0.025, 0.05,
+    0.1, 0.25, 0.5,
+    1.0, 2.5, 5.0, 10.0,
+)
+
+
+class TimingHistogram:
+    """
+    Histogram of durations over fixed, roughly logarithmic, buckets. Recording is O(log(buckets)) and the memory used
+    does not grow with the number of samples, so it can be kept for the whole life of the bot.
+    """
+
+    __slots__ = ("counts", "count", "total", "max", "last")
+
+    def __init__(self):
+        self.counts: List[int] = [0] * (len(TIMING_BUCKET_BOUNDS) + 1)
+        self.count: int = 0
+        self.total: float = 0.0
+        self.max: float = 0.0
+        self.last: float = 0.0
+
+    def record(self, seconds: float):
+        self.counts[bisect.bisect_left(TIMING_BUCKET_BOUNDS, seconds)] += 1
+        self.count += 1
+        self.total += seconds
+        self.last = seconds
+        if seconds > self.max:
+            self.max = seconds
+
+    @property
+    def mean(self) -> float:
+        return self.total / self.count if self.count > 0 else 0.0
+
+    def percentile(self, pct: float) -> float:
+        """
+        The upper bound of the bucket that holds the given percentile, capped by the largest duration recorded
+        """
+        if self.count == 0:
+            return 0.0
+        rank = pct / 100 * self.count
+        cumulative = 0
+        for index, bucket_count in enumerate(self.counts):
+            cumulative += bucket_count
+            if cumulative >= rank and bucket_count > 0:
+                if index == len(TIMING_BUCKET_BOUNDS):
+                    return self.max
+                return min(TIMING_BUCKET_BOUNDS[index], self.max)
+        return self.max
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "count": self.count,
+            "mean": self.mean,
+            "p50": self.percentile(50),
+            "p99": self.percentile(99),
+            "max": self.max,
+            "last": self.last,
+        }
+
+
+@dataclass
+class SlowTickReport:
+    """
+    Timings of a tick that did not finish within the clock's slow tick threshold
+    """
+    timestamp: float
+    duration: float
+    loop_lag: float
+    # Time spent in the tick of every child iterator, slowest first
+    iterator_durations: List[Tuple[str, float]] = field(default_factory=list)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "timestamp": self.timestamp,
+            "duration": self.duration,
+            "loop_lag": self.loop_lag,
+            "iterator_durations": dict(self.iterator_durations),
+        }
+
+    def format(self, top: int = 3) -> str:
+        slowest = ", ".join(f"{name} {duration * 1e3:.1f} ms" for name, duration in self.iterator_durations[:top])
+        return (f"Slow clock tick at {self.timestamp:.0f}: {self.duration * 1e3:.1f} ms in ticks, "
+                f"{self.loop_lag * 1e3:.1f} ms of event loop lag. Slowest: {slowest or 'none'}")
+
+
+def iterator_name(iterator: Any) -> str:
+    name = getattr(iterator, "display_name", None) or getattr(iterator, "name", None)
+    if not isinstance(name, str) or len(name) == 0:
+        name = type(iterator).__name__
+    return name
+
+
+class ClockMetrics:
+    """
+    Tick timings of a realtime Clock: how late the event loop woke the clock up, how long the ticks took and how long
+    each child iterator took, plus the latest slow tick reports.
+    """
+
+    MAX_SLOW_TICK_REPORTS = 20
+
+    def __init__(self):
+        self.loop_lag: TimingHistogram = TimingHistogram()
+        self.tick_duration: TimingHistogram = TimingHistogram()
+        self.iterator_durations: Dict[str, TimingHistogram] = {}
+        self.slow_ticks: Deque[SlowTickReport] = deque(maxlen=self.MAX_SLOW_TICK_REPORTS)
+        self.slow_tick_count: int = 0
+
+    def record_tick(self,
+                    timestamp: float,
+                    loop_lag: float,
+                    duration: float,
+                    iterator_durations: List[Tuple[Any, float]],
+                    slow_tick_threshold: float) -> Optional[SlowTickReport]:
+        """
+        Records the timings of a tick.
+
+        :param timestamp: the tick timestamp
+        :param loop_lag: seconds between the scheduled tick time and the clock waking up
+        :param duration: seconds spent ticking all the child iterators
+        :param iterator_durations: child iterators with the seconds spent in their tick
+        :param slow_tick_threshold: the tick is slow when the loop lag plus the duration exceed it
+        :return: the report of the tick when it is slow, None otherwise
+        """
+        self.loop_lag.record(loop_lag)
+        self.tick_duration.record(duration)
+        named_durations = []
+        for iterator, iterator_duration in iterator_durations:
+            name = iterator_name(iterator)
+            histogram = self.iterator_durations.get(name)
+            if histogram is None:
+                histogram = self.iterator_durations[name] = TimingHistogram()
+            histogram.record(iterator_duration)
+            named_durations.append((name, iterator_duration))
+
+        if loop_lag + duration <= slow_tick_threshold:
+            return None
+        named_durations.sort(key=lambda item: item[1], reverse=True)
+        report = SlowTickReport(timestamp=timestamp,
+                                duration=duration,
+                                loop_lag=loop_lag,
+                                iterator_durations=named_durations)
+        self.slow_ticks.append(report)
+        self.slow_tick_count += 1
+        return report
+
+    def reset(self):
+        self.__init__()
+
+    def report(self) -> Dict[str, Any]:
+        return {
+            "ticks": self.tick_duration.count,
+            "slow_ticks": self.slow_tick_count,
+            "tick_duration": self.tick_duration.to_dict(),
+            "loop_lag": self.loop_lag.to_dict(),
+            "iterators": {name: histogram.to_dict() for name, histogram in self.iterator_durations.items()},
+            "last_slow_ticks": [report.to_dict() for report in self.slow_ticks],
+        }
+
+    def format_report(self, top: int = 3) -> str:
+        if self.tick_duration.count == 0:
+            return ""
+        tick, lag = self.tick_duration, self.loop_lag
+        lines = [
+            "  Clock:",
+            f"    Ticks: {tick.count} ({self.slow_tick_count} slow)"
+            f" | Tick duration p50/p99/max: {tick.percentile(50) * 1e3:.1f}/{tick.percentile(99) * 1e3:.1f}/"
+            f"{tick.max * 1e3:.1f} ms"
+            f" | Loop lag p99/max: {lag.percentile(99) * 1e3:.1f}/{lag.max * 1e3:.1f} ms",
+        ]
+        slowest = sorted(self.iterator_durations.items(), key=lambda item: item[1].total, reverse=True)[:top]
+        for name, histogram in slowest:
+            lines.append(f"    {name}: mean {histogram.mean * 1e3:.2f} ms, p99 {histogram.percentile(99) * 1e3:.1f} ms,"
+                         f" max {histogram.max * 1e3:.1f} ms")
+        if len(self.slow_ticks) > 0:
+            lines.append(f"    Last slow tick: {self.slow_ticks[-1].format(top=top)}")
+        return "\n".join(lines)
@@ -0,0 +1,153 @@
+#include "OrderBookDepthIndex.h"
+#include <algorithm>
+#include <cmath>
+#include <functional>
+
+OrderBookDepthIndex::OrderBookDepthIndex() {
+    this->isBuy = true;
+    this->valid = false;
+}
+
+void OrderBookDepthIndex::rebuild(const std::set<OrderBookEntry> &book, bool isBuy) {
+    double base = 0;
+    double quote = 0;
+
+    this->prices.clear();
+    this->amounts.clear();
+    this->cumulativeBase.clear();
+    this->cumulativeQuote.clear();
+    this->prices.reserve(book.size());
+    this->amounts.reserve(book.size());
+    this->cumulativeBase.reserve(book.size());
+    this->cumulativeQuote.reserve(book.size());
+
+    if (isBuy) {
+        for (std::set<OrderBookEntry>::const_iterator it = book.begin(); it != book.end(); ++it) {
+            base += it->getAmount();
+            quote += it->getAmount() * it->getPrice();
+            this->prices.push_back(it->getPrice());
+            this->amounts.push_back(it->getAmount());
+            this->cumulativeBase.push_back(base);
+            this->cumulativeQuote.push_back(quote);
+        }
+    } else {
+        for (std::set<OrderBookEntry>::const_reverse_iterator it = book.rbegin(); it != book.rend(); ++it) {
+            base += it->getAmount();
+            quote += it->getAmount() * it->getPrice();
+            this->prices.push_back(it->getPrice());
+            this->amounts.push_back(it->getAmount());
+            this->cumulativeBase.push_back(base);
+            this->cumulativeQuote.push_back(quote);
+        }
+    }
+    this->isBuy = isBuy;
+    this->valid = true;
+}
+
+void OrderBookDepthIndex::invalidate() {
+    this->valid = false;
+}
+
+bool OrderBookDepthIndex::isValid() const {
+    return this->valid;
+}
+
+size_t OrderBookDepthIndex::size() const {
+    return this->prices.size();
+}
+
+// Index of the first level at which the cumulative volume reaches the target, or size() if the book is not deep
+// enough. NaN targets are never reached.
+static size_t firstLevelReaching(const std::vector<double> &cumulative, double target) {
+    if (std::isnan(target)) {
+        return cumulative.size();
+    }
+    return std::lower_bound(cumulative.begin(), cumulative.end(), target) - cumulative.begin();
+}
+
+size_t OrderBookDepthIndex::levelsWithinPrice(double price) const {
+    if (this->isBuy) {
+        return std::upper_bound(this->prices.begin(), this->prices.end(), price) - this->prices.begin();
+    }
+    return std::upper_bound(this->prices.begin(), this->prices.end(), price, std::greater<double>()) -
+        this->prices.begin();
+}
+
+double OrderBookDepthIndex::priceForVolume(double volume, double &cumulativeVolume) const {
+    const size_t level = firstLevelReaching(this->cumulativeBase, volume);
+    if (level == this->size()) {
+        cumulativeVolume = this->size() > 0 ? this->cumulativeBase.back() : 0;
+        return NAN;
+    }
+    cumulativeVolume = this->cumulativeBase[level];
+    return this->prices[level];
+}
+
+double OrderBookDepthIndex::vwapForVolume(double volume, double &totalVolume) const {
+    const size_t level = firstLevelReaching(this->cumulativeBase, volume);
+    if (level == this->size()) {
+        totalVolume = this->size() > 0 ? this->cumulativeBase.back() : 0;
+        return NAN;
+    }
+    const double price = this->prices[level];
+    const double amount = this->amounts[level];
+    double totalCost = this->cumulativeQuote[level] - amount * price;
+    totalVolume = this->cumulativeBase[level] - amount;
+    const double incrementalAmount = volume - totalVolume;
+    totalCost += incrementalAmount * price;
+    totalVolume += incrementalAmount;
+    return totalCost / totalVolume;
+}
+
+double OrderBookDepthIndex::priceForQuoteVolume(double quoteVolume, double &cumulativeQuoteVolume) const {
+    const size_t level = firstLevelReaching(this->cumulativeQuote, quoteVolume);
+    if (level == this->size()) {
+        cumulativeQuoteVolume = this->size() > 0 ? this->cumulativeQuote.back() : 0;
+        return NAN;
+    }
+    cumulativeQuoteVolume = this->cumulativeQuote[level];
+    return this->prices[level];
+}
+
+double OrderBookDepthIndex::quoteVolumeForBaseAmount(double baseAmount) const {
+    const size_t level = firstLevelReaching(this->cumulativeBase, baseAmount);
+    if (level == this->size()) {
+        return this->size() > 0 ? this->cumulativeQuote.back() : 0;
+    }
+    const double baseBefore = level > 0 ? this->cumulativeBase[level - 1] : 0;
+    const double quoteBefore = level > 0 ? this->cumulativeQuote[level - 1] : 0;
+    return quoteBefore + (baseAmount - baseBefore) * this->prices[level];
+}
+
+double OrderBookDepthIndex::volumeForPrice(double price, double &resultPrice) const {
+    const size_t levels = this->levelsWithinPrice(price);
+    if (levels == 0) {
+        resultPrice = NAN;
+        return 0;
+    }
+    resultPrice = this->prices[levels - 1];
+    return this->cumulativeBase[levels - 1];
+}
+
+double OrderBookDepthIndex::quoteVolumeForPrice(double price, double &resultPrice) const {
+    const size_t levels = this->levelsWithinPrice(price);
+    if (levels == 0) {
+        resultPrice = NAN;
+        return 0;
+    }
+    resultPrice = this->prices[levels - 1];
+    return this->cumulativeQuote[levels - 1];
+}
+
+void OrderBookDepthIndex::walkForVolumes(const double *volumes, size_t count,
+                                         double *prices, double *vwaps, double *filledVolumes,
+                                         double *quoteVolumes) const {
+    double cumulativeVolume;
+    double totalVolume;
+    for (size_t i = 0; i < count; ++i) {
+        prices[i] = this->priceForVolume(volumes[i], cumulativeVolume);
+        vwaps[i] = this->vwapForVolume(volumes[i], totalVolume);
+        filledVolumes[i] = std::min(cumulativeVolume, volumes[i]);
+        quoteVolumes[i] = this->quoteVolumeForBaseAmount(volumes[i]);
+    }
+}
@@ -0,0 +1,39 @@
+#ifndef _ORDER_BOOK_DEPTH_INDEX_H
+#define _ORDER_BOOK_DEPTH_INDEX_H
+
+#include <stddef.h>
+#include <set>
+#include <vector>
+#include "OrderBookEntry.h"
+
+// Cumulative base and quote volumes of one order book side, in walk order (ascending asks or descending bids).
+// Lets depth queries binary search instead of walking the book from the top. The index has to be rebuilt after
+// the book side changes.
+class OrderBookDepthIndex {
+    std::vector<double> prices;
+    std::vector<double> amounts;
+    std::vector<double> cumulativeBase;
+    std::vector<double> cumulativeQuote;
+    bool isBuy;
+    bool valid;
+
+    size_t levelsWithinPrice(double price) const;
+
+    public:
+        OrderBookDepthIndex();
+        void rebuild(const std::set<OrderBookEntry> &book, bool isBuy);
+        void invalidate();
+        bool isValid() const;
+        size_t size() const;
+
+        double priceForVolume(double volume, double &cumulativeVolume) const;
+        double vwapForVolume(double volume, double &totalVolume) const;
+        double priceForQuoteVolume(double quoteVolume, double &cumulativeQuoteVolume) const;
+        double quoteVolumeForBaseAmount(double baseAmount) const;
+        double volumeForPrice(double price, double &resultPrice) const;
+        double quoteVolumeForPrice(double price, double &resultPrice) const;
+        void walkForVolumes(const double *volumes, size_t count,
+                            double *prices, double *vwaps, double *filledVolumes, double *quoteVolumes) const;
+};
+
+#endif
@@ -0,0 +1,207 @@
+#include "OrderBookDepthWalk.h"
+#include <algorithm>
+#include <cmath>
+
+template <typename Iterator>
+static double priceForVolume(Iterator it, const Iterator end, double volume, double &cumulativeVolume) {
+    cumulativeVolume = 0;
+    for (; it != end; ++it) {
+        cumulativeVolume += it->getAmount();
+        if (cumulativeVolume >= volume) {
+            return it->getPrice();
+        }
+    }
+    return NAN;
+}
+
+template <typename Iterator>
+static double vwapForVolume(Iterator it, const Iterator end, double volume, double &totalVolume) {
+    double totalCost = 0;
+    totalVolume = 0;
+    for (; it != end; ++it) {
+        const double price = it->getPrice();
+        const double amount = it->getAmount();
+        totalCost += amount * price;
+        totalVolume += amount;
+        if (totalVolume >= volume) {
+            totalCost -= amount * price;
+            totalVolume -= amount;
+            const double incrementalAmount = volume - totalVolume;
+            totalCost += incrementalAmount * price;
+            totalVolume += incrementalAmount;
+            return totalCost / totalVolume;
+        }
+    }
+    return NAN;
+}
+
+template <typename Iterator>
+static double priceForQuoteVolume(Iterator it, const Iterator end, double quoteVolume,
+                                  double &cumulativeQuoteVolume) {
+    cumulativeQuoteVolume = 0;
+    for (; it != end; ++it) {
+        cumulativeQuoteVolume += it->getAmount() * it->getPrice();
+        if (cumulativeQuoteVolume >= quoteVolume) {
+            return it->getPrice();
+        }
+    }
+    return NAN;
+}
+
+template <typename Iterator>
+static double quoteVolumeForBaseAmount(Iterator it, const Iterator end, double baseAmount) {
+    double cumulativeVolume = 0;
+    double cumulativeBaseAmount = 0;
+    for (; it != end; ++it) {
+        double rowAmount = it->getAmount();
+        if (rowAmount + cumulativeBaseAmount >= baseAmount) {
+            rowAmount = baseAmount - cumulativeBaseAmount;
+        }
+        cumulativeBaseAmount += rowAmount;
+        cumulativeVolume += rowAmount * it->getPrice();
+        if (cumulativeBaseAmount >= baseAmount) {
+            break;
+        }
+    }
+    return cumulativeVolume;
+}
+
+template <typename Iterator>
+static double volumeForPrice(Iterator it, const Iterator end, bool isBuy, bool quoteVolume, double price,
+                             double &resultPrice) {
+    double cumulativeVolume = 0;
+    resultPrice = NAN;
+    for (; it != end; ++it) {
+        const double rowPrice = it->getPrice();
+        if (isBuy ? rowPrice > price : rowPrice < price) {
+            break;
+        }
+        cumulativeVolume += quoteVolume ? it->getAmount() * rowPrice : it->getAmount();
+        resultPrice = rowPrice;
+    }
+    return cumulativeVolume;
+}
+
+template <typename Iterator>
+static void simulateFill(Iterator it, const Iterator end, double amount, std::vector<OrderBookEntry> &fills) {
+    double amountLeft = amount;
+    for (; it != end; ++it) {
+        if (it->getAmount() < amountLeft) {
+            fills.push_back(*it);
+            amountLeft -= it->getAmount();
+        } else {
+            fills.push_back(OrderBookEntry(it->getPrice(), amountLeft, it->getUpdateId()));
+            break;
+        }
+    }
+}
+
+template <typename Iterator>
+static void walkForVolumes(Iterator it, const Iterator end, const double *volumes, size_t count,
+                           double *prices, double *vwaps, double *filledVolumes, double *quoteVolumes) {
+    std::vector<size_t> order(count);
+    for (size_t i = 0; i < count; ++i) {
+        order[i] = i;
+    }
+    // NaN volumes can never be filled, so they are kept at the end of the walk order.
+    std::stable_sort(order.begin(), order.end(), [volumes](size_t a, size_t b) {
+        return !std::isnan(volumes[a]) && (std::isnan(volumes[b]) || volumes[a] < volumes[b]);
+    });
+
+    size_t next = 0;
+    double cumulativeVolume = 0;
+    double cumulativeCost = 0;
+    for (; it != end && next < count; ++it) {
+        const double price = it->getPrice();
+        const double amount = it->getAmount();
+        const double levelVolume = cumulativeVolume + amount;
+        const double levelCost = cumulativeCost + amount * price;
+        while (next < count && levelVolume >= volumes[order[next]]) {
+            const size_t index = order[next];
+            const double volume = volumes[index];
+            const double remaining = volume - cumulativeVolume;
+            prices[index] = price;
+            vwaps[index] = (levelCost - amount * price + remaining * price) / (cumulativeVolume + remaining);
+            filledVolumes[index] = volume;
+            quoteVolumes[index] = cumulativeCost + remaining * price;
+            ++next;
+        }
+        cumulativeVolume = levelVolume;
+        cumulativeCost = levelCost;
+    }
+    for (; it != end; ++it) {
+        cumulativeVolume += it->getAmount();
+        cumulativeCost += it->getAmount() * it->getPrice();
+    }
+    for (; next < count; ++next) {
+        const size_t index = order[next];
+        prices[index] = NAN;
+        vwaps[index] = NAN;
+        filledVolumes[index] = std::min(cumulativeVolume, volumes[index]);
+        quoteVolumes[index] = cumulativeCost;
+    }
+}
+
+double depthPriceForVolume(const std::set<OrderBookEntry> &book, bool isBuy, double volume,
+                           double &cumulativeVolume) {
+    if (isBuy) {
+        return priceForVolume(book.begin(), book.end(), volume, cumulativeVolume);
+    }
+    return priceForVolume(book.rbegin(), book.rend(), volume, cumulativeVolume);
+}
+
+double depthVwapForVolume(const std::set<OrderBookEntry> &book, bool isBuy, double volume,
+                          double &totalVolume) {
+    if (isBuy) {
+        return vwapForVolume(book.begin(), book.end(), volume, totalVolume);
+    }
+    return vwapForVolume(book.rbegin(), book.rend(), volume, totalVolume);
+}
+
+double depthPriceForQuoteVolume(const std::set<OrderBookEntry> &book, bool isBuy, double quoteVolume,
+                                double &cumulativeQuoteVolume) {
+    if (isBuy) {
+        return priceForQuoteVolume(book.begin(), book.end(), quoteVolume, cumulativeQuoteVolume);
+    }
+    return priceForQuoteVolume(book.rbegin(), book.rend(), quoteVolume, cumulativeQuoteVolume);
+}
+
+double depthQuoteVolumeForBaseAmount(const std::set<OrderBookEntry> &book, bool isBuy, double baseAmount) {
+    if (isBuy) {
+        return quoteVolumeForBaseAmount(book.begin(), book.end(), baseAmount);
+    }
+    return quoteVolumeForBaseAmount(book.rbegin(), book.rend(), baseAmount);
+}
+
+double depthVolumeForPrice(const std::set<OrderBookEntry> &book, bool isBuy, double price, double &resultPrice) {
+    if (isBuy) {
+        return volumeForPrice(book.begin(), book.end(), isBuy, false, price, resultPrice);
+    }
+    return volumeForPrice(book.rbegin(), book.rend(), isBuy, false, price, resultPrice);
+}
+
+double depthQuoteVolumeForPrice(const std::set<OrderBookEntry> &book, bool isBuy, double price,
+                                double &resultPrice) {
+    if (isBuy) {
+        return volumeForPrice(book.begin(), book.end(), isBuy, true, price, resultPrice);
+    }
+    return volumeForPrice(book.rbegin(), book.rend(), isBuy, true, price, resultPrice);
+}
+
+void depthSimulateFill(const std::set<OrderBookEntry> &book, bool isBuy, double amount,
+                       std::vector<OrderBookEntry> &fills) {
+    if (isBuy) {
+        simulateFill(book.begin(), book.end(), amount, fills);
+    } else {
+        simulateFill(book.rbegin(), book.rend(), amount, fills);
+    }
+}
+
+void depthWalkForVolumes(const std::set<OrderBookEntry> &book, bool isBuy, const double *volumes, size_t count,
+                         double *prices, double *vwaps, double *filledVolumes, double *quoteVolumes) {
+    if (isBuy) {
+        walkForVolumes(book.begin(), book.end(), volumes, count, prices, vwaps, filledVolumes, quoteVolumes);
+    } else {
+        walkForVolumes(book.rbegin(), book.rend(), volumes, count, prices, vwaps, filledVolumes, quoteVolumes);
+    }
+}
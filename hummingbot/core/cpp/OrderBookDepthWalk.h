@@ -0,0 +1,30 @@
+#ifndef _ORDER_BOOK_DEPTH_WALK_H
+#define _ORDER_BOOK_DEPTH_WALK_H
+
+#include <stddef.h>
+#include <set>
+#include <vector>
+#include "OrderBookEntry.h"
+
+// Depth walks over one side of an order book. When isBuy is true the ask book is walked from the lowest price
+// upwards, otherwise the bid book is walked from the highest price downwards.
+
+double depthPriceForVolume(const std::set<OrderBookEntry> &book, bool isBuy, double volume,
+                           double &cumulativeVolume);
+double depthVwapForVolume(const std::set<OrderBookEntry> &book, bool isBuy, double volume,
+                          double &totalVolume);
+double depthPriceForQuoteVolume(const std::set<OrderBookEntry> &book, bool isBuy, double quoteVolume,
+                                double &cumulativeQuoteVolume);
+double depthQuoteVolumeForBaseAmount(const std::set<OrderBookEntry> &book, bool isBuy, double baseAmount);
+double depthVolumeForPrice(const std::set<OrderBookEntry> &book, bool isBuy, double price, double &resultPrice);
+double depthQuoteVolumeForPrice(const std::set<OrderBookEntry> &book, bool isBuy, double price,
+                                double &resultPrice);
+void depthSimulateFill(const std::set<OrderBookEntry> &book, bool isBuy, double amount,
+                       std::vector<OrderBookEntry> &fills);
+
+// Answers many base volume queries with a single walk. Results are written at the index of the corresponding
+// volume, and the volumes do not need to be sorted.
+void depthWalkForVolumes(const std::set<OrderBookEntry> &book, bool isBuy, const double *volumes, size_t count,
+                         double *prices, double *vwaps, double *filledVolumes, double *quoteVolumes);
+
+#endif
@@ -0,0 +1,22 @@
+# distutils: language=c++
+
+from libcpp cimport bool as cppbool
+from libcpp.set cimport set
+
+from hummingbot.core.data_type.OrderBookEntry cimport OrderBookEntry
+
+cdef extern from "../cpp/OrderBookDepthIndex.h":
+    cdef cppclass OrderBookDepthIndex:
+        OrderBookDepthIndex()
+        void rebuild(const set[OrderBookEntry] &book, cppbool isBuy)
+        void invalidate()
+        cppbool isValid() const
+        size_t size() const
+        double priceForVolume(double volume, double &cumulativeVolume) const
+        double vwapForVolume(double volume, double &totalVolume) const
+        double priceForQuoteVolume(double quoteVolume, double &cumulativeQuoteVolume) const
+        double quoteVolumeForBaseAmount(double baseAmount) const
+        double volumeForPrice(double price, double &resultPrice) const
+        double quoteVolumeForPrice(double price, double &resultPrice) const
+        void walkForVolumes(const double *volumes, size_t count,
+                            double *prices, double *vwaps, double *filledVolumes, double *quoteVolumes) const
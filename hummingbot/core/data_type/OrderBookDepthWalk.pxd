@@ -0,0 +1,22 @@
+# distutils: language=c++
+
+from libcpp cimport bool as cppbool
+from libcpp.set cimport set
+from libcpp.vector cimport vector
+
+from hummingbot.core.data_type.OrderBookEntry cimport OrderBookEntry
+
+cdef extern from "../cpp/OrderBookDepthWalk.h":
+    double depthPriceForVolume(const set[OrderBookEntry] &book, cppbool isBuy, double volume,
+                               double &cumulativeVolume)
+    double depthVwapForVolume(const set[OrderBookEntry] &book, cppbool isBuy, double volume, double &totalVolume)
+    double depthPriceForQuoteVolume(const set[OrderBookEntry] &book, cppbool isBuy, double quoteVolume,
+                                    double &cumulativeQuoteVolume)
+    double depthQuoteVolumeForBaseAmount(const set[OrderBookEntry] &book, cppbool isBuy, double baseAmount)
+    double depthVolumeForPrice(const set[OrderBookEntry] &book, cppbool isBuy, double price, double &resultPrice)
+    double depthQuoteVolumeForPrice(const set[OrderBookEntry] &book, cppbool isBuy, double price,
+                                    double &resultPrice)
+    void depthSimulateFill(const set[OrderBookEntry] &book, cppbool isBuy, double amount,
+                           vector[OrderBookEntry] &fills)
+    void depthWalkForVolumes(const set[OrderBookEntry] &book, cppbool isBuy, const double *volumes, size_t count,
+                             double *prices, double *vwaps, double *filledVolumes, double *quoteVolumes)
@@ -1,8 +1,14 @@
 # distutils: language=c++
+from libcpp.set cimport set
+
 from hummingbot.core.data_type.order_book cimport OrderBook
+from hummingbot.core.data_type.OrderBookEntry cimport OrderBookEntry
 
 cdef class CompositeOrderBook(OrderBook):
     cdef:
         OrderBook _traded_order_book
+        set[OrderBookEntry] _composite_bid_book
+        set[OrderBookEntry] _composite_ask_book
 
+    cdef set[OrderBookEntry] *c_depth_book(self, bint is_buy)
     cdef double c_get_price(self, bint is_buy) except? -1
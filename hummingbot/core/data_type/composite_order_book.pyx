@@ -28,6 +28,7 @@ cdef class CompositeOrderBook(OrderBook):
     def clear_traded_order_book(self):
         self._traded_order_book._bid_book.clear()
         self._traded_order_book._ask_book.clear()
+        self.c_invalidate_depth_index()
 
     def record_filled_order(self, order_fill_event):
         cdef:
@@ -71,6 +72,7 @@ cdef class CompositeOrderBook(OrderBook):
             cpp_bids.push_back(OrderBookEntry(price, amount, timestamp))
 
         self._traded_order_book.c_apply_diffs(cpp_bids, cpp_asks, timestamp)
+        self.c_invalidate_depth_index()
 
     def original_bid_entries(self) -> Iterator[OrderBookRow]:
         return super().bid_entries()
@@ -175,6 +177,38 @@ cdef class CompositeOrderBook(OrderBook):
 
         self._traded_order_book.c_apply_diffs(cpp_bids_changes, cpp_asks_changes, self._last_diff_uid)
 
+    cdef set[OrderBookEntry] *c_depth_book(self, bint is_buy):
+        """
+        Builds the composite book side (original entries less the recorded fills) so the native depth queries walk
+        the same levels bid_entries and ask_entries would yield.
+        """
+        cdef:
+            set[OrderBookEntry] *book = ref(self._ask_book) if is_buy else ref(self._bid_book)
+            set[OrderBookEntry] *traded_book = (ref(self._traded_order_book._ask_book) if is_buy
+                                                else ref(self._traded_order_book._bid_book))
+            set[OrderBookEntry] *composite_book = ref(self._composite_ask_book) if is_buy else ref(self._composite_bid_book)
+            set[OrderBookEntry].iterator order_it = deref(book).begin()
+            set[OrderBookEntry].iterator traded_order_it
+            OrderBookEntry original_order_entry
+            double composite_amount
+
+        deref(composite_book).clear()
+        if deref(traded_book).empty():
+            return book
+        while order_it != deref(book).end():
+            original_order_entry = deref(order_it)
+            composite_amount = original_order_entry.getAmount()
+            traded_order_it = deref(traded_book).find(original_order_entry)
+            if traded_order_it != deref(traded_book).end():
+                composite_amount -= deref(traded_order_it).getAmount()
+            if composite_amount > 0:
+                deref(composite_book).insert(deref(composite_book).end(),
+                                             OrderBookEntry(original_order_entry.getPrice(),
+                                                            composite_amount,
+                                                            original_order_entry.getUpdateId()))
+            inc(order_it)
+        return composite_book
+
     cdef double c_get_price(self, bint is_buy) except? -1:
         cdef:
             set[OrderBookEntry] *book = ref(self._ask_book) if is_buy else ref(self._bid_book)
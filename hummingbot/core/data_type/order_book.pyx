@@ -1,6 +1,5 @@
 # distutils: language=c++
-# distutils: sources=hummingbot/core/cpp/OrderBookEntry.cpp
-import bisect
+# distutils: sources=['hummingbot/core/cpp/OrderBookEntry.cpp', 'hummingbot/core/cpp/OrderBookDepthWalk.cpp', 'hummingbot/core/cpp/OrderBookDepthIndex.cpp']
 import logging
 import time
 from typing import (
@@ -8,6 +7,7 @@ from typing import (
     Iterator,
     List,
     Optional,
+    Sequence,
     Tuple,
 )
 
@@ -23,6 +23,17 @@ from cython.operator cimport(
 from hummingbot.core.data_type.order_book_message import OrderBookMessage
 from hummingbot.core.data_type.order_book_query_result import OrderBookQueryResult
 from hummingbot.core.data_type.order_book_row import OrderBookRow
+from hummingbot.core.data_type.OrderBookDepthWalk cimport (
+    depthPriceForQuoteVolume,
+    depthPriceForVolume,
+    depthQuoteVolumeForBaseAmount,
+    depthQuoteVolumeForPrice,
+    depthSimulateFill,
+    depthVolumeForPrice,
+    depthVwapForVolume,
+    depthWalkForVolumes,
+)
+from hummingbot.core.data_type.OrderBookDepthIndex cimport OrderBookDepthIndex
 from hummingbot.core.data_type.OrderBookEntry cimport truncateOverlapEntries
 from hummingbot.logger import HummingbotLogger
 from hummingbot.core.event.events import (
@@ -35,6 +46,27 @@ cimport numpy as np
 ob_logger = None
 NaN = float("nan")
 
+# Row layout of the arrays exported by OrderBook.to_numpy(). The update ID is kept as int64, since exchange update IDs
+# can be above 2^53 and would lose precision as float64.
+ORDER_BOOK_ROW_DTYPE = np.dtype([("price", np.float64), ("amount", np.float64), ("update_id", np.int64)])
+
+
+cdef c_append_levels(vector[OrderBookEntry] *entries, object levels, int64_t update_id):
+    cdef:
+        double[:, :] levels_view
+        Py_ssize_t i
+
+    if isinstance(levels, np.ndarray):
+        if levels.size == 0:
+            return
+        levels_view = np.asarray(levels, dtype=np.float64)
+        deref(entries).reserve(deref(entries).size() + levels_view.shape[0])
+        for i in range(levels_view.shape[0]):
+            deref(entries).push_back(OrderBookEntry(levels_view[i, 0], levels_view[i, 1], update_id))
+    else:
+        for level in levels:
+            deref(entries).push_back(OrderBookEntry(float(level[0]), float(level[1]), update_id))
+
 
 cdef class OrderBook(PubSub):
     ORDER_BOOK_TRADE_EVENT_TAG = OrderBookEvent.TradeEvent.value
@@ -46,7 +78,7 @@ cdef class OrderBook(PubSub):
             ob_logger = logging.getLogger(__name__)
         return ob_logger
 
-    def __init__(self, dex=False):
+    def __init__(self, dex=False, depth_index=False):
         super().__init__()
         self._snapshot_uid = 0
         self._last_diff_uid = 0
@@ -55,6 +87,7 @@ cdef class OrderBook(PubSub):
         self._last_applied_trade = -1000.0
         self._last_trade_price_rest_updated = -1000
         self._dex = dex
+        self._depth_index_enabled = depth_index
 
     cdef c_apply_diffs(self, vector[OrderBookEntry] bids, vector[OrderBookEntry] asks, int64_t update_id):
         cdef:
@@ -95,6 +128,7 @@ cdef class OrderBook(PubSub):
 
         # Remember the last diff update ID.
         self._last_diff_uid = update_id
+        self.c_invalidate_depth_index()
 
     cdef c_apply_snapshot(self, vector[OrderBookEntry] bids, vector[OrderBookEntry] asks, int64_t update_id):
         cdef:
@@ -135,6 +169,7 @@ cdef class OrderBook(PubSub):
 
         # Remember the last snapshot update ID.
         self._snapshot_uid = update_id
+        self.c_invalidate_depth_index()
 
     cdef c_apply_trade(self, object trade_event):
         self._last_trade_price = trade_event.price
@@ -161,6 +196,20 @@ cdef class OrderBook(PubSub):
     def last_trade_price_rest_updated(self, value: float):
         self._last_trade_price_rest_updated = value
 
+    @property
+    def depth_index_enabled(self) -> bool:
+        """
+        When enabled, depth queries binary search a cumulative volume index of the book instead of walking it from
+        the top. The index is rebuilt lazily on the first query after the book changes, so it pays off when several
+        queries are made between updates.
+        """
+        return self._depth_index_enabled
+
+    @depth_index_enabled.setter
+    def depth_index_enabled(self, value: bool):
+        self._depth_index_enabled = value
+        self.c_invalidate_depth_index()
+
     @property
     def snapshot_uid(self) -> int:
         return self._snapshot_uid
@@ -171,12 +220,70 @@ cdef class OrderBook(PubSub):
 
     @property
     def snapshot(self) -> Tuple[pd.DataFrame, pd.DataFrame]:
-        bids_rows = list(self.bid_entries())
-        asks_rows = list(self.ask_entries())
-        bids_df = pd.DataFrame(data=bids_rows, columns=OrderBookRow._fields, dtype="float64")
-        asks_df = pd.DataFrame(data=asks_rows, columns=OrderBookRow._fields, dtype="float64")
+        bids_array, asks_array = self.to_numpy()
+        bids_df = pd.DataFrame(data=bids_array, columns=OrderBookRow._fields, dtype="float64")
+        asks_df = pd.DataFrame(data=asks_array, columns=OrderBookRow._fields, dtype="float64")
         return bids_df, asks_df
 
+    def to_numpy(self,
+                 depth: Optional[int] = None,
+                 bids_out: Optional[np.ndarray] = None,
+                 asks_out: Optional[np.ndarray] = None) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Exports the book as structured arrays of ORDER_BOOK_ROW_DTYPE, best prices first.
+
+        :param depth: maximum number of levels to export per side, all levels if None
+        :param bids_out: optional preallocated ORDER_BOOK_ROW_DTYPE array to fill with the bids
+        :param asks_out: optional preallocated ORDER_BOOK_ROW_DTYPE array to fill with the asks
+        :return: the filled (bids, asks) arrays, views into bids_out and asks_out when they are given
+        """
+        return self.c_depth_to_numpy(False, depth, bids_out), self.c_depth_to_numpy(True, depth, asks_out)
+
+    cdef object c_depth_to_numpy(self, bint is_buy, object depth, object out):
+        cdef:
+            set[OrderBookEntry] *book = self.c_depth_book(is_buy)
+            size_t rows = deref(book).size()
+            double[:] prices
+            double[:] amounts
+            np.int64_t[:] update_ids
+            size_t row = 0
+            set[OrderBookEntry].iterator ask_it
+            set[OrderBookEntry].reverse_iterator bid_it
+
+        if depth is not None:
+            if depth < 0:
+                raise ValueError(f"Order book export depth must not be negative, got {depth}.")
+            rows = min(rows, <size_t>depth)
+        if out is None:
+            out = np.empty(rows, dtype=ORDER_BOOK_ROW_DTYPE)
+        elif out.dtype != ORDER_BOOK_ROW_DTYPE or out.ndim != 1 or not out.flags.c_contiguous:
+            raise ValueError("Order book export buffers must be contiguous one dimensional ORDER_BOOK_ROW_DTYPE arrays.")
+        elif len(out) < rows:
+            raise ValueError(f"Order book export buffer holds {len(out)} rows, {rows} are needed.")
+        if rows == 0:
+            return out[:0]
+
+        prices = out["price"]
+        amounts = out["amount"]
+        update_ids = out["update_id"]
+        if is_buy:
+            ask_it = deref(book).begin()
+            while row < rows:
+                prices[row] = deref(ask_it).getPrice()
+                amounts[row] = deref(ask_it).getAmount()
+                update_ids[row] = deref(ask_it).getUpdateId()
+                inc(ask_it)
+                row += 1
+        else:
+            bid_it = deref(book).rbegin()
+            while row < rows:
+                prices[row] = deref(bid_it).getPrice()
+                amounts[row] = deref(bid_it).getAmount()
+                update_ids[row] = deref(bid_it).getUpdateId()
+                inc(bid_it)
+                row += 1
+        return out[:rows]
+
     def apply_diffs(self, bids: List[OrderBookRow], asks: List[OrderBookRow], update_id: int):
         cdef:
             vector[OrderBookEntry] cpp_bids
@@ -197,6 +304,49 @@ cdef class OrderBook(PubSub):
             cpp_asks.push_back(OrderBookEntry(row.price, row.amount, row.update_id))
         self.c_apply_snapshot(cpp_bids, cpp_asks, update_id)
 
+    def apply_raw_diffs(self, bids: Sequence, asks: Sequence, update_id: int):
+        """
+        Applies diffs given as raw levels, without materializing OrderBookRow tuples.
+
+        :param bids: (n, 2+) float64 array, or [price, amount, ...] rows of strings or numbers
+        :param asks: (n, 2+) float64 array, or [price, amount, ...] rows of strings or numbers
+        :param update_id: the update ID of all the levels
+        """
+        cdef:
+            vector[OrderBookEntry] cpp_bids
+            vector[OrderBookEntry] cpp_asks
+        c_append_levels(ref(cpp_bids), bids, update_id)
+        c_append_levels(ref(cpp_asks), asks, update_id)
+        self.c_apply_diffs(cpp_bids, cpp_asks, update_id)
+
+    def apply_raw_snapshot(self, bids: Sequence, asks: Sequence, update_id: int):
+        """
+        Applies a snapshot given as raw levels, see apply_raw_diffs.
+        """
+        cdef:
+            vector[OrderBookEntry] cpp_bids
+            vector[OrderBookEntry] cpp_asks
+        c_append_levels(ref(cpp_bids), bids, update_id)
+        c_append_levels(ref(cpp_asks), asks, update_id)
+        self.c_apply_snapshot(cpp_bids, cpp_asks, update_id)
+
+    def apply_diff_messages(self, messages: Sequence[OrderBookMessage]):
+        """
+        Coalesces consecutive diff messages into a single diff. Each level keeps the update ID of its message, and a
+        level repeated in several messages ends up with its latest amount.
+
+        :param messages: diff messages, in the order they were received
+        """
+        cdef:
+            vector[OrderBookEntry] cpp_bids
+            vector[OrderBookEntry] cpp_asks
+        if len(messages) == 0:
+            return
+        for message in messages:
+            c_append_levels(ref(cpp_bids), message.bids_array, message.update_id)
+            c_append_levels(ref(cpp_asks), message.asks_array, message.update_id)
+        self.c_apply_diffs(cpp_bids, cpp_asks, messages[-1].update_id)
+
     def apply_trade(self, trade: OrderBookTradeEvent):
         self.c_apply_trade(trade)
 
@@ -226,13 +376,14 @@ cdef class OrderBook(PubSub):
             vector[OrderBookEntry] cpp_bids
             vector[OrderBookEntry] cpp_asks
             int64_t last_update_id = 0
-
-        for row in bids_array:
-            cpp_bids.push_back(OrderBookEntry(row[0], row[1], <int64_t>(row[2])))
-            last_update_id = max(last_update_id, <int64_t>row[2])
-        for row in asks_array:
-            cpp_asks.push_back(OrderBookEntry(row[0], row[1], <int64_t>(row[2])))
-            last_update_id = max(last_update_id, <int64_t>row[2])
+            Py_ssize_t i
+
+        for i in range(bids_array.shape[0]):
+            cpp_bids.push_back(OrderBookEntry(bids_array[i, 0], bids_array[i, 1], <int64_t>bids_array[i, 2]))
+            last_update_id = max(last_update_id, <int64_t>bids_array[i, 2])
+        for i in range(asks_array.shape[0]):
+            cpp_asks.push_back(OrderBookEntry(asks_array[i, 0], asks_array[i, 1], <int64_t>asks_array[i, 2]))
+            last_update_id = max(last_update_id, <int64_t>asks_array[i, 2])
         self.c_apply_diffs(cpp_bids, cpp_asks, last_update_id)
 
     def apply_numpy_snapshot(self, bids_array: np.ndarray, asks_array: np.ndarray):
@@ -253,13 +404,14 @@ cdef class OrderBook(PubSub):
             vector[OrderBookEntry] cpp_bids
             vector[OrderBookEntry] cpp_asks
             int64_t last_update_id = 0
-
-        for row in bids_array:
-            cpp_bids.push_back(OrderBookEntry(row[0], row[1], <int64_t>(row[2])))
-            last_update_id = max(last_update_id, <int64_t>row[2])
-        for row in asks_array:
-            cpp_asks.push_back(OrderBookEntry(row[0], row[1], <int64_t>(row[2])))
-            last_update_id = max(last_update_id, <int64_t>row[2])
+            Py_ssize_t i
+
+        for i in range(bids_array.shape[0]):
+            cpp_bids.push_back(OrderBookEntry(bids_array[i, 0], bids_array[i, 1], <int64_t>bids_array[i, 2]))
+            last_update_id = max(last_update_id, <int64_t>bids_array[i, 2])
+        for i in range(asks_array.shape[0]):
+            cpp_asks.push_back(OrderBookEntry(asks_array[i, 0], asks_array[i, 1], <int64_t>asks_array[i, 2]))
+            last_update_id = max(last_update_id, <int64_t>asks_array[i, 2])
         self.c_apply_snapshot(cpp_bids, cpp_asks, last_update_id)
 
     def bid_entries(self) -> Iterator[OrderBookRow]:
@@ -281,32 +433,40 @@ cdef class OrderBook(PubSub):
             inc(it)
 
     def simulate_buy(self, amount: float) -> List[OrderBookRow]:
-        amount_left = amount
-        retval = []
-        for ask_entry in self.ask_entries():
-            ask_entry = ask_entry
-            if ask_entry.amount < amount_left:
-                retval.append(ask_entry)
-                amount_left -= ask_entry.amount
-            else:
-                retval.append(OrderBookRow(ask_entry.price, amount_left, ask_entry.update_id))
-                amount_left = 0.0
-                break
-        return retval
+        return self.c_simulate_fill(True, amount)
 
     def simulate_sell(self, amount: float) -> List[OrderBookRow]:
-        amount_left = amount
-        retval = []
-        for bid_entry in self.bid_entries():
-            bid_entry = bid_entry
-            if bid_entry.amount < amount_left:
-                retval.append(bid_entry)
-                amount_left -= bid_entry.amount
-            else:
-                retval.append(OrderBookRow(bid_entry.price, amount_left, bid_entry.update_id))
-                amount_left = 0.0
-                break
-        return retval
+        return self.c_simulate_fill(False, amount)
+
+    cdef list c_simulate_fill(self, bint is_buy, double amount):
+        cdef:
+            vector[OrderBookEntry] fills
+            OrderBookEntry entry
+        depthSimulateFill(deref(self.c_depth_book(is_buy)), is_buy, amount, fills)
+        return [OrderBookRow(entry.getPrice(), entry.getAmount(), entry.getUpdateId()) for entry in fills]
+
+    cdef set[OrderBookEntry] *c_depth_book(self, bint is_buy):
+        """
+        Returns the book side walked by the depth queries - the ask book for buys and the bid book for sells.
+        """
+        return ref(self._ask_book) if is_buy else ref(self._bid_book)
+
+    cdef OrderBookDepthIndex *c_depth_index(self, bint is_buy):
+        """
+        Returns the up to date cumulative depth index of the side walked by the depth queries, or NULL if the index is
+        disabled.
+        """
+        cdef:
+            OrderBookDepthIndex *depth_index = ref(self._ask_depth_index) if is_buy else ref(self._bid_depth_index)
+        if not self._depth_index_enabled:
+            return NULL
+        if not deref(depth_index).isValid():
+            deref(depth_index).rebuild(deref(self.c_depth_book(is_buy)), is_buy)
+        return depth_index
+
+    cdef c_invalidate_depth_index(self):
+        self._bid_depth_index.invalidate()
+        self._ask_depth_index.invalidate()
 
     cdef double c_get_price(self, bint is_buy) except? -1:
         cdef:
@@ -320,143 +480,126 @@ cdef class OrderBook(PubSub):
 
     cdef OrderBookQueryResult c_get_price_for_volume(self, bint is_buy, double volume):
         cdef:
+            OrderBookDepthIndex *depth_index = self.c_depth_index(is_buy)
             double cumulative_volume = 0
-            double result_price = NaN
+            double result_price
 
-        if is_buy:
-            for order_book_row in self.ask_entries():
-                cumulative_volume += order_book_row.amount
-                if cumulative_volume >= volume:
-                    result_price = order_book_row.price
-                    break
+        if depth_index != NULL:
+            result_price = deref(depth_index).priceForVolume(volume, cumulative_volume)
         else:
-            for order_book_row in self.bid_entries():
-                cumulative_volume += order_book_row.amount
-                if cumulative_volume >= volume:
-                    result_price = order_book_row.price
-                    break
+            result_price = depthPriceForVolume(deref(self.c_depth_book(is_buy)), is_buy, volume, cumulative_volume)
 
         return OrderBookQueryResult(NaN, volume, result_price, min(cumulative_volume, volume))
 
     cdef OrderBookQueryResult c_get_vwap_for_volume(self, bint is_buy, double volume):
         cdef:
-            double total_cost = 0
+            OrderBookDepthIndex *depth_index = self.c_depth_index(is_buy)
             double total_volume = 0
-            double result_vwap = NaN
-        if is_buy:
-            for order_book_row in self.ask_entries():
-                total_cost += order_book_row.amount * order_book_row.price
-                total_volume += order_book_row.amount
-                if total_volume >= volume:
-                    total_cost -= order_book_row.amount * order_book_row.price
-                    total_volume -= order_book_row.amount
-                    incremental_amount = volume - total_volume
-                    total_cost += incremental_amount * order_book_row.price
-                    total_volume += incremental_amount
-                    result_vwap = total_cost / total_volume
-                    break
+            double result_vwap
+
+        if depth_index != NULL:
+            result_vwap = deref(depth_index).vwapForVolume(volume, total_volume)
         else:
-            for order_book_row in self.bid_entries():
-                total_cost += order_book_row.amount * order_book_row.price
-                total_volume += order_book_row.amount
-                if total_volume >= volume:
-                    total_cost -= order_book_row.amount * order_book_row.price
-                    total_volume -= order_book_row.amount
-                    incremental_amount = volume - total_volume
-                    total_cost += incremental_amount * order_book_row.price
-                    total_volume += incremental_amount
-                    result_vwap = total_cost / total_volume
-                    break
+            result_vwap = depthVwapForVolume(deref(self.c_depth_book(is_buy)), is_buy, volume, total_volume)
 
         return OrderBookQueryResult(NaN, volume, result_vwap, min(total_volume, volume))
 
     cdef OrderBookQueryResult c_get_price_for_quote_volume(self, bint is_buy, double quote_volume):
         cdef:
+            OrderBookDepthIndex *depth_index = self.c_depth_index(is_buy)
             double cumulative_volume = 0
-            double result_price = NaN
+            double result_price
 
-        if is_buy:
-            for order_book_row in self.ask_entries():
-                cumulative_volume += order_book_row.amount * order_book_row.price
-                if cumulative_volume >= quote_volume:
-                    result_price = order_book_row.price
-                    break
+        if depth_index != NULL:
+            result_price = deref(depth_index).priceForQuoteVolume(quote_volume, cumulative_volume)
         else:
-            for order_book_row in self.bid_entries():
-                cumulative_volume += order_book_row.amount * order_book_row.price
-                if cumulative_volume >= quote_volume:
-                    result_price = order_book_row.price
-                    break
+            result_price = depthPriceForQuoteVolume(deref(self.c_depth_book(is_buy)), is_buy, quote_volume,
+                                                    cumulative_volume)
 
         return OrderBookQueryResult(NaN, quote_volume, result_price, min(cumulative_volume, quote_volume))
 
     cdef OrderBookQueryResult c_get_quote_volume_for_base_amount(self, bint is_buy, double base_amount):
         cdef:
-            double cumulative_volume = 0
-            double cumulative_base_amount = 0
-            double row_amount = 0
+            OrderBookDepthIndex *depth_index = self.c_depth_index(is_buy)
+            double cumulative_volume
 
-        if is_buy:
-            for order_book_row in self.ask_entries():
-                row_amount = order_book_row.amount
-                if row_amount + cumulative_base_amount >= base_amount:
-                    row_amount = base_amount - cumulative_base_amount
-                cumulative_base_amount += row_amount
-                cumulative_volume += row_amount * order_book_row.price
-                if cumulative_base_amount >= base_amount:
-                    break
+        if depth_index != NULL:
+            cumulative_volume = deref(depth_index).quoteVolumeForBaseAmount(base_amount)
         else:
-            for order_book_row in self.bid_entries():
-                row_amount = order_book_row.amount
-                if row_amount + cumulative_base_amount >= base_amount:
-                    row_amount = base_amount - cumulative_base_amount
-                cumulative_base_amount += row_amount
-                cumulative_volume += row_amount * order_book_row.price
-                if cumulative_base_amount >= base_amount:
-                    break
+            cumulative_volume = depthQuoteVolumeForBaseAmount(deref(self.c_depth_book(is_buy)), is_buy, base_amount)
 
         return OrderBookQueryResult(NaN, base_amount, NaN, cumulative_volume)
 
     cdef OrderBookQueryResult c_get_volume_for_price(self, bint is_buy, double price):
         cdef:
-            double cumulative_volume = 0
+            OrderBookDepthIndex *depth_index = self.c_depth_index(is_buy)
             double result_price = NaN
+            double cumulative_volume
 
-        if is_buy:
-            for order_book_row in self.ask_entries():
-                if order_book_row.price > price:
-                    break
-                cumulative_volume += order_book_row.amount
-                result_price = order_book_row.price
+        if depth_index != NULL:
+            cumulative_volume = deref(depth_index).volumeForPrice(price, result_price)
         else:
-            for order_book_row in self.bid_entries():
-                if order_book_row.price < price:
-                    break
-                cumulative_volume += order_book_row.amount
-                result_price = order_book_row.price
+            cumulative_volume = depthVolumeForPrice(deref(self.c_depth_book(is_buy)), is_buy, price, result_price)
 
         return OrderBookQueryResult(price, NaN, result_price, cumulative_volume)
 
     cdef OrderBookQueryResult c_get_quote_volume_for_price(self, bint is_buy, double price):
         cdef:
-            double cumulative_volume = 0
+            OrderBookDepthIndex *depth_index = self.c_depth_index(is_buy)
             double result_price = NaN
+            double cumulative_volume
 
-        if is_buy:
-            for order_book_row in self.ask_entries():
-                if order_book_row.price > price:
-                    break
-                cumulative_volume += order_book_row.amount * order_book_row.price
-                result_price = order_book_row.price
+        if depth_index != NULL:
+            cumulative_volume = deref(depth_index).quoteVolumeForPrice(price, result_price)
         else:
-            for order_book_row in self.bid_entries():
-                if order_book_row.price < price:
-                    break
-                cumulative_volume += order_book_row.amount * order_book_row.price
-                result_price = order_book_row.price
+            cumulative_volume = depthQuoteVolumeForPrice(deref(self.c_depth_book(is_buy)), is_buy, price,
+                                                         result_price)
 
         return OrderBookQueryResult(price, NaN, result_price, cumulative_volume)
 
+    def walk_depth_for_volumes(self,
+                               is_buy: bool,
+                               volumes: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Answers many base volume queries with a single walk down the book.
+
+        :param is_buy: True to walk the ask book, False to walk the bid book
+        :param volumes: the base volumes to query, in any order
+        :return: arrays of (price, vwap, filled volume, quote volume) aligned with the volumes. Price and vwap are
+        NaN where the book is not deep enough, matching get_price_for_volume and get_vwap_for_volume.
+        """
+        cdef:
+            OrderBookDepthIndex *depth_index = self.c_depth_index(is_buy)
+            double[::1] volumes_view = np.ascontiguousarray(volumes, dtype=np.float64).reshape(-1)
+            size_t count = volumes_view.shape[0]
+            np.ndarray[np.float64_t, ndim=2] results = np.empty((4, count), dtype=np.float64)
+            double[:, ::1] results_view = results
+
+        if count > 0 and depth_index != NULL:
+            deref(depth_index).walkForVolumes(&volumes_view[0], count, &results_view[0, 0], &results_view[1, 0],
+                                              &results_view[2, 0], &results_view[3, 0])
+        elif count > 0:
+            depthWalkForVolumes(deref(self.c_depth_book(is_buy)), is_buy, &volumes_view[0], count,
+                                &results_view[0, 0], &results_view[1, 0], &results_view[2, 0], &results_view[3, 0])
+        return results[0], results[1], results[2], results[3]
+
+    def get_prices_for_volumes(self, is_buy: bool, volumes: List[float]) -> List[OrderBookQueryResult]:
+        prices, _, filled_volumes, _ = self.walk_depth_for_volumes(is_buy, volumes)
+        return [OrderBookQueryResult(NaN, volume, price, filled_volume)
+                for volume, price, filled_volume in zip(volumes, prices, filled_volumes)]
+
+    def get_vwaps_for_volumes(self, is_buy: bool, volumes: List[float]) -> List[OrderBookQueryResult]:
+        _, vwaps, filled_volumes, _ = self.walk_depth_for_volumes(is_buy, volumes)
+        return [OrderBookQueryResult(NaN, volume, vwap, filled_volume)
+                for volume, vwap, filled_volume in zip(volumes, vwaps, filled_volumes)]
+
+    def get_quote_volumes_for_base_amounts(self,
+                                           is_buy: bool,
+                                           base_amounts: List[float]) -> List[OrderBookQueryResult]:
+        _, _, _, quote_volumes = self.walk_depth_for_volumes(is_buy, base_amounts)
+        return [OrderBookQueryResult(NaN, base_amount, NaN, quote_volume)
+                for base_amount, quote_volume in zip(base_amounts, quote_volumes)]
+
     def get_price_for_volume(self, is_buy: bool, volume: float) -> OrderBookQueryResult:
         return self.c_get_price_for_volume(is_buy, volume)
 
@@ -476,8 +619,9 @@ cdef class OrderBook(PubSub):
         return self.c_get_quote_volume_for_price(is_buy, price)
 
     def restore_from_snapshot_and_diffs(self, snapshot: OrderBookMessage, diffs: List[OrderBookMessage]):
-        replay_position = bisect.bisect_right(diffs, snapshot)
-        replay_diffs = diffs[replay_position:]
-        self.apply_snapshot(snapshot.bids, snapshot.asks, snapshot.update_id)
+        # OrderBookMessage ordering falls back to timestamps and treats diffs as greater than any snapshot, so the diffs
+        # to replay are selected by update ID.
+        replay_diffs = [diff for diff in diffs if diff.update_id > snapshot.update_id]
+        self.apply_raw_snapshot(snapshot.bids_array, snapshot.asks_array, snapshot.update_id)
         for diff in replay_diffs:
-            self.apply_diffs(diff.bids, diff.asks, diff.update_id)
+            self.apply_raw_diffs(diff.bids_array, diff.asks_array, diff.update_id)
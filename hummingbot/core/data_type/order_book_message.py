@@ -1,7 +1,9 @@
 from collections import namedtuple
 from enum import Enum
-from functools import total_ordering
-from typing import Dict, List, Optional
+from functools import cached_property, total_ordering
+from typing import Any, Dict, List, Optional
+
+import numpy as np
 
 from hummingbot.core.data_type.order_book_row import OrderBookRow
 
@@ -52,18 +54,53 @@ class OrderBookMessage(namedtuple("_OrderBookMessage", "type, content, timestamp
     def trading_pair(self) -> str:
         return self.content["trading_pair"]
 
-    @property
+    @cached_property
     def asks(self) -> List[OrderBookRow]:
         return [
             OrderBookRow(float(price), float(amount), self.update_id) for price, amount, *trash in self.content["asks"]
         ]
 
-    @property
+    @cached_property
     def bids(self) -> List[OrderBookRow]:
         return [
             OrderBookRow(float(price), float(amount), self.update_id) for price, amount, *trash in self.content["bids"]
         ]
 
+    @cached_property
+    def asks_array(self) -> np.ndarray:
+        """
+        The ask levels as a (n, 2) float64 array of [price, amount], all of them sharing the message update_id.
+        Parsed once per message, and applied to order books with OrderBook.apply_raw_diffs without creating any
+        OrderBookRow.
+        """
+        return self._levels_array(self.content.get("asks", []))
+
+    @cached_property
+    def bids_array(self) -> np.ndarray:
+        """
+        The bid levels as a (n, 2) float64 array of [price, amount], all of them sharing the message update_id.
+        """
+        return self._levels_array(self.content.get("bids", []))
+
+    @staticmethod
+    def _levels_array(levels: Any) -> np.ndarray:
+        # Connectors can put already parsed arrays in the message content, otherwise levels are [price, amount, ...]
+        # rows of strings or numbers as received from the exchange.
+        if not isinstance(levels, (list, tuple, np.ndarray)):
+            levels = list(levels)
+        try:
+            levels_array = np.asarray(levels, dtype=np.float64)
+        except (TypeError, ValueError):
+            # Rows with extra fields of different lengths or types
+            levels_array = np.array([(price, amount) for price, amount, *trash in levels], dtype=np.float64)
+        if levels_array.size == 0:
+            levels_array = levels_array.reshape(0, 2)
+        elif levels_array.ndim != 2 or levels_array.shape[1] < 2:
+            raise ValueError(f"Order book levels must be [price, amount, ...] rows, got shape {levels_array.shape}.")
+        elif levels_array.shape[1] > 2:
+            levels_array = np.ascontiguousarray(levels_array[:, :2])
+        return levels_array
+
     @property
     def has_update_id(self) -> bool:
         return self.type in {OrderBookMessageType.DIFF, OrderBookMessageType.SNAPSHOT}
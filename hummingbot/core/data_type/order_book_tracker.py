@@ -3,7 +3,7 @@ import logging
 import time
 from collections import defaultdict, deque
 from enum import Enum
-from typing import Deque, Dict, List, Optional, Tuple
+from typing import Any, Callable, Deque, Dict, List, Optional, Set, Tuple
 
 import pandas as pd
 
@@ -23,6 +23,9 @@ class OrderBookTrackerDataSourceType(Enum):
 
 class OrderBookTracker:
     PAST_DIFF_WINDOW_SIZE: int = 32
+    MAX_CONCURRENT_SNAPSHOT_REQUESTS: int = 8
+    SNAPSHOT_RETRY_INTERVAL: float = 5.0
+    MAX_BATCH_SIZE: int = 1000
     _obt_logger: Optional[HummingbotLogger] = None
 
     @classmethod
@@ -31,8 +34,21 @@ class OrderBookTracker:
             cls._obt_logger = logging.getLogger(__name__)
         return cls._obt_logger
 
-    def __init__(self, data_source: OrderBookTrackerDataSource, trading_pairs: List[str], domain: Optional[str] = None):
+    def __init__(self,
+                 data_source: OrderBookTrackerDataSource,
+                 trading_pairs: List[str],
+                 domain: Optional[str] = None,
+                 batched_routing: bool = False):
+        """
+        :param data_source: the data source providing the snapshots and the diff, snapshot and trade streams
+        :param trading_pairs: the trading pairs to track
+        :param domain: the exchange domain, if any
+        :param batched_routing: when True the diff and snapshot messages of all pairs share a single queue, drained
+            in batches by one router task that coalesces consecutive diffs of a pair into a single update, instead
+            of one queue and one tracking task per pair
+        """
         self._domain: Optional[str] = domain
+        self._batched_routing: bool = batched_routing
         self._data_source: OrderBookTrackerDataSource = data_source
         self._trading_pairs: List[str] = trading_pairs
         self._order_books_initialized: asyncio.Event = asyncio.Event()
@@ -45,6 +61,11 @@ class OrderBookTracker:
         self._order_book_trade_stream: asyncio.Queue = asyncio.Queue()
         self._ev_loop: asyncio.BaseEventLoop = asyncio.get_event_loop()
         self._saved_message_queues: Dict[str, Deque[OrderBookMessage]] = defaultdict(lambda: deque(maxlen=1000))
+        self._order_book_ready_events: Dict[str, asyncio.Event] = defaultdict(asyncio.Event)
+        self._init_started_timestamp: Optional[float] = None
+        self._init_completed_timestamp: Optional[float] = None
+        self._init_durations: Dict[str, float] = {}
+        self._init_attempts: Dict[str, int] = defaultdict(int)
 
         self._emit_trade_event_task: Optional[asyncio.Task] = None
         self._init_order_books_task: Optional[asyncio.Task] = None
@@ -55,6 +76,22 @@ class OrderBookTracker:
         self._order_book_snapshot_router_task: Optional[asyncio.Task] = None
         self._update_last_trade_prices_task: Optional[asyncio.Task] = None
         self._order_book_stream_listener_task: Optional[asyncio.Task] = None
+        self._order_book_batch_router_task: Optional[asyncio.Task] = None
+
+        self._batches_processed: int = 0
+        self._batched_messages: int = 0
+        self._coalesced_diff_messages: int = 0
+        self._coalesced_diff_updates: int = 0
+        self._last_batch_queue_depth: int = 0
+        self._max_batch_queue_depth: int = 0
+
+        self._resyncing_pairs: Set[str] = set()
+        self._resync_tasks: Dict[str, asyncio.Task] = {}
+        self._resync_buffers: Dict[str, List[OrderBookMessage]] = {}
+        self._sequence_gaps: Dict[str, int] = defaultdict(int)
+        self._resyncs: Dict[str, int] = defaultdict(int)
+
+        self._update_listeners: List[Callable[[str], None]] = []
 
     @property
     def data_source(self) -> OrderBookTrackerDataSource:
@@ -68,6 +105,65 @@ class OrderBookTracker:
     def ready(self) -> bool:
         return self._order_books_initialized.is_set()
 
+    @property
+    def ready_trading_pairs(self) -> List[str]:
+        """
+        The trading pairs whose order book has been initialized, in the order they became ready
+        """
+        return list(self._init_durations)
+
+    def is_order_book_ready(self, trading_pair: str) -> bool:
+        return trading_pair in self._init_durations
+
+    @property
+    def init_metrics(self) -> Dict[str, Any]:
+        """
+        Startup metrics of the order books initialization: how many books are ready, the elapsed time of the whole
+        initialization (None while it is still running), and the seconds and snapshot attempts it took for each pair,
+        from its first snapshot request until its order book was ready
+        """
+        total_seconds = None
+        if self._init_started_timestamp is not None and self._init_completed_timestamp is not None:
+            total_seconds = self._init_completed_timestamp - self._init_started_timestamp
+        return {
+            "initialized": len(self._init_durations),
+            "total": len(self._trading_pairs),
+            "total_seconds": total_seconds,
+            "seconds_per_pair": dict(self._init_durations),
+            "attempts_per_pair": dict(self._init_attempts),
+        }
+
+    @property
+    def batched_routing(self) -> bool:
+        return self._batched_routing
+
+    @property
+    def batch_routing_stats(self) -> Dict[str, float]:
+        """
+        Counters of the batched router: queue depth seen when draining (last and max), batches and messages
+        processed, and how many diff messages were applied per order book update (the coalescing ratio)
+        """
+        return {
+            "batches": self._batches_processed,
+            "messages": self._batched_messages,
+            "diff_messages": self._coalesced_diff_messages,
+            "diff_updates": self._coalesced_diff_updates,
+            "coalescing_ratio": (self._coalesced_diff_messages / self._coalesced_diff_updates
+                                 if self._coalesced_diff_updates > 0 else 0.0),
+            "last_queue_depth": self._last_batch_queue_depth,
+            "max_queue_depth": self._max_batch_queue_depth,
+        }
+
+    @property
+    def sequence_gap_stats(self) -> Dict[str, Dict[str, int]]:
+        """
+        Per pair counters of the diff sequence gaps detected and of the snapshots requested to resync the order books
+        """
+        return {
+            "gaps": dict(self._sequence_gaps),
+            "resyncs": dict(self._resyncs),
+        }
+
     @property
     def snapshot(self) -> Dict[str, Tuple[pd.DataFrame, pd.DataFrame]]:
         return {
@@ -75,6 +171,18 @@ class OrderBookTracker:
             for trading_pair, order_book in self._order_books.items()
         }
 
+    def add_update_listener(self, listener: Callable[[str], None]):
+        """
+        Registers a callable invoked with the trading pair every time its order book changes: when it is initialized,
+        when diffs are applied and when it is restored from a snapshot. Listeners run in the tracking task, so they
+        should only record the change and leave any heavier work to be scheduled on the event loop.
+        """
+        self._update_listeners.append(listener)
+
+    def remove_update_listener(self, listener: Callable[[str], None]):
+        if listener in self._update_listeners:
+            self._update_listeners.remove(listener)
+
     def start(self):
         self.stop()
         self._init_order_books_task = safe_ensure_future(
@@ -89,18 +197,27 @@ class OrderBookTracker:
         self._order_book_trade_listener_task = safe_ensure_future(
             self._data_source.listen_for_trades(self._ev_loop, self._order_book_trade_stream)
         )
-        self._order_book_snapshot_listener_task = safe_ensure_future(
-            self._data_source.listen_for_order_book_snapshots(self._ev_loop, self._order_book_snapshot_stream)
-        )
         self._order_book_stream_listener_task = safe_ensure_future(
             self._data_source.listen_for_subscriptions()
         )
-        self._order_book_diff_router_task = safe_ensure_future(
-            self._order_book_diff_router()
-        )
-        self._order_book_snapshot_router_task = safe_ensure_future(
-            self._order_book_snapshot_router()
-        )
+        if self._batched_routing:
+            # Snapshots go through the diff stream, so the messages of each pair keep their arrival order
+            self._order_book_snapshot_listener_task = safe_ensure_future(
+                self._data_source.listen_for_order_book_snapshots(self._ev_loop, self._order_book_diff_stream)
+            )
+            self._order_book_batch_router_task = safe_ensure_future(
+                self._order_book_batch_router()
+            )
+        else:
+            self._order_book_snapshot_listener_task = safe_ensure_future(
+                self._data_source.listen_for_order_book_snapshots(self._ev_loop, self._order_book_snapshot_stream)
+            )
+            self._order_book_diff_router_task = safe_ensure_future(
+                self._order_book_diff_router()
+            )
+            self._order_book_snapshot_router_task = safe_ensure_future(
+                self._order_book_snapshot_router()
+            )
         self._update_last_trade_prices_task = safe_ensure_future(
             self._update_last_trade_prices_loop()
         )
@@ -128,6 +245,9 @@ class OrderBookTracker:
         if self._order_book_snapshot_router_task is not None:
             self._order_book_snapshot_router_task.cancel()
             self._order_book_snapshot_router_task = None
+        if self._order_book_batch_router_task is not None:
+            self._order_book_batch_router_task.cancel()
+            self._order_book_batch_router_task = None
         if self._update_last_trade_prices_task is not None:
             self._update_last_trade_prices_task.cancel()
             self._update_last_trade_prices_task = None
@@ -137,11 +257,25 @@ class OrderBookTracker:
             for _, task in self._tracking_tasks.items():
                 task.cancel()
             self._tracking_tasks.clear()
+        for task in self._resync_tasks.values():
+            task.cancel()
+        self._resync_tasks.clear()
+        self._resyncing_pairs.clear()
+        self._resync_buffers.clear()
         self._order_books_initialized.clear()
+        for event in self._order_book_ready_events.values():
+            event.clear()
+        self._init_durations.clear()
+        self._init_attempts.clear()
+        self._init_started_timestamp = None
+        self._init_completed_timestamp = None
 
     async def wait_ready(self):
         await self._order_books_initialized.wait()
 
+    async def wait_order_book_ready(self, trading_pair: str):
+        await self._order_book_ready_events[trading_pair].wait()
+
     async def _update_last_trade_prices_loop(self):
         '''
         Updates last trade price for all order books through REST API, it is to initiate last_trade_price and as
@@ -175,15 +309,59 @@ class OrderBookTracker:
     async def _init_order_books(self):
         """
         Initialize order books
+
+        The snapshots are requested concurrently, with at most MAX_CONCURRENT_SNAPSHOT_REQUESTS in flight. The pace of
+        the requests is set by the throttler the data source uses for its REST calls, so the initialization takes as
+        long as the exchange rate limits require. Each order book starts being tracked as soon as its snapshot is
+        applied.
         """
-        for index, trading_pair in enumerate(self._trading_pairs):
-            self._order_books[trading_pair] = await self._initial_order_book_for_trading_pair(trading_pair)
+        self._init_started_timestamp = time.perf_counter()
+        self._init_completed_timestamp = None
+        semaphore = asyncio.Semaphore(self.MAX_CONCURRENT_SNAPSHOT_REQUESTS)
+        await asyncio.gather(*[
+            self._init_order_book(trading_pair=trading_pair, semaphore=semaphore)
+            for trading_pair in self._trading_pairs
+        ])
+        self._init_completed_timestamp = time.perf_counter()
+        self.logger().info(f"Initialized {len(self._trading_pairs)} order books in "
+                           f"{self._init_completed_timestamp - self._init_started_timestamp:.2f} seconds.")
+        self._order_books_initialized.set()
+
+    async def _init_order_book(self, trading_pair: str, semaphore: asyncio.Semaphore):
+        # The duration of the pair starts with its first snapshot request, not while it waits for a free request slot
+        pair_started_timestamp: Optional[float] = None
+        while True:
+            try:
+                async with semaphore:
+                    if pair_started_timestamp is None:
+                        pair_started_timestamp = time.perf_counter()
+                    self._init_attempts[trading_pair] += 1
+                    order_book = await self._initial_order_book_for_trading_pair(trading_pair)
+                break
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                self.logger().network(
+                    f"Unexpected error initializing order book for {trading_pair}.",
+                    exc_info=True,
+                    app_warning_msg=f"Unexpected error initializing order book for {trading_pair}. "
+                                    f"Retrying after {self.SNAPSHOT_RETRY_INTERVAL:.0f} seconds."
+                )
+                await self._sleep(delay=self.SNAPSHOT_RETRY_INTERVAL)
+
+        self._order_books[trading_pair] = order_book
+        self._notify_update(trading_pair)
+        if self._batched_routing:
+            saved_messages: Deque[OrderBookMessage] = self._saved_message_queues[trading_pair]
+            self._apply_messages(trading_pair, list(saved_messages))
+            saved_messages.clear()
+        else:
             self._tracking_message_queues[trading_pair] = asyncio.Queue()
             self._tracking_tasks[trading_pair] = safe_ensure_future(self._track_single_book(trading_pair))
-            self.logger().info(f"Initialized order book for {trading_pair}. "
-                               f"{index + 1}/{len(self._trading_pairs)} completed.")
-            await self._sleep(delay=1)
-        self._order_books_initialized.set()
+        self._init_durations[trading_pair] = time.perf_counter() - pair_started_timestamp
+        self._order_book_ready_events[trading_pair].set()
+        self.logger().info(f"Initialized order book for {trading_pair}. "
+                           f"{len(self._init_durations)}/{len(self._trading_pairs)} completed.")
 
     async def _order_book_diff_router(self):
         """
@@ -238,7 +416,6 @@ class OrderBookTracker:
         """
         Route the real-time order book snapshot messages to the correct order book.
         """
-        await self._order_books_initialized.wait()
         while True:
             try:
                 ob_message: OrderBookMessage = await self._order_book_snapshot_stream.get()
@@ -253,6 +430,196 @@ class OrderBookTracker:
                 self.logger().error("Unknown error. Retrying after 5 seconds.", exc_info=True)
                 await asyncio.sleep(5.0)
 
+    async def _order_book_batch_router(self):
+        """
+        Routes the diff and snapshot messages of all the order books from the single diff stream (batched mode).
+        Every wake up drains up to MAX_BATCH_SIZE queued messages and applies them in one go.
+        """
+        while True:
+            try:
+                messages: List[OrderBookMessage] = [await self._order_book_diff_stream.get()]
+                queue_depth: int = self._order_book_diff_stream.qsize()
+                while len(messages) < self.MAX_BATCH_SIZE and not self._order_book_diff_stream.empty():
+                    messages.append(self._order_book_diff_stream.get_nowait())
+
+                self._batches_processed += 1
+                self._batched_messages += len(messages)
+                self._last_batch_queue_depth = queue_depth + 1
+                self._max_batch_queue_depth = max(self._max_batch_queue_depth, self._last_batch_queue_depth)
+                self._process_message_batch(messages)
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                self.logger().network(
+                    "Unexpected error routing order book messages.",
+                    exc_info=True,
+                    app_warning_msg="Unexpected error routing order book messages. Retrying after 5 seconds."
+                )
+                await asyncio.sleep(5.0)
+
+    def _process_message_batch(self, messages: List[OrderBookMessage]):
+        messages_per_pair: Dict[str, List[OrderBookMessage]] = defaultdict(list)
+        for message in messages:
+            trading_pair: str = message.trading_pair
+            if trading_pair not in self._order_books:
+                if message.type is OrderBookMessageType.DIFF:
+                    # Save diff messages received before snapshots are ready
+                    self._saved_message_queues[trading_pair].append(message)
+                continue
+            saved_messages: Deque[OrderBookMessage] = self._saved_message_queues[trading_pair]
+            if len(saved_messages) > 0:
+                messages_per_pair[trading_pair].extend(saved_messages)
+                saved_messages.clear()
+            messages_per_pair[trading_pair].append(message)
+
+        for trading_pair, pair_messages in messages_per_pair.items():
+            try:
+                self._apply_messages(trading_pair, pair_messages)
+            except Exception:
+                self.logger().network(
+                    f"Unexpected error tracking order book for {trading_pair}.",
+                    exc_info=True,
+                    app_warning_msg="Unexpected error tracking order book."
+                )
+
+    def _apply_messages(self, trading_pair: str, messages: List[OrderBookMessage]):
+        """
+        Applies the messages of one pair in order. Runs of consecutive diffs are coalesced into a single update, and a
+        snapshot restores the book replaying the past diffs window.
+        """
+        order_book: OrderBook = self._order_books[trading_pair]
+        past_diffs_window: Deque[OrderBookMessage] = self._past_diffs_windows[trading_pair]
+        diffs: List[OrderBookMessage] = []
+        updated: bool = False
+        last_update_id: int = max(order_book.snapshot_uid, order_book.last_diff_uid)
+        for message in messages:
+            if message.type is OrderBookMessageType.DIFF:
+                if order_book.snapshot_uid > message.update_id or self._is_stale_diff(message, last_update_id):
+                    continue
+                past_diffs_window.append(message)
+                if not self._diff_continues_book(trading_pair, message, last_update_id):
+                    continue
+                diffs.append(message)
+                last_update_id = message.update_id
+                updated = True
+            elif message.type is OrderBookMessageType.SNAPSHOT:
+                self._apply_coalesced_diffs(order_book, diffs)
+                diffs = []
+                self._restore_order_book(trading_pair, order_book, message)
+                last_update_id = max(order_book.snapshot_uid, order_book.last_diff_uid)
+                updated = True
+        self._apply_coalesced_diffs(order_book, diffs)
+        if updated:
+            self._notify_update(trading_pair)
+
+    def _apply_coalesced_diffs(self, order_book: OrderBook, diffs: List[OrderBookMessage]):
+        if len(diffs) > 0:
+            order_book.apply_diff_messages(diffs)
+            self._coalesced_diff_messages += len(diffs)
+            self._coalesced_diff_updates += 1
+
+    def _notify_update(self, trading_pair: str):
+        for listener in self._update_listeners:
+            try:
+                listener(trading_pair)
+            except Exception:
+                self.logger().error(f"Unexpected error notifying the order book update of {trading_pair}.",
+                                    exc_info=True)
+
+    def _is_sequence_checked(self, message: OrderBookMessage) -> bool:
+        return self._data_source.CONTIGUOUS_DIFF_UPDATE_IDS and "first_update_id" in message.content
+
+    def _is_stale_diff(self, message: OrderBookMessage, last_update_id: int) -> bool:
+        """
+        Diffs whose updates are all already included in the order book
+        """
+        return self._is_sequence_checked(message) and message.update_id <= last_update_id
+
+    def _diff_continues_book(self, trading_pair: str, message: OrderBookMessage, last_update_id: int) -> bool:
+        """
+        Checks the diff can be applied to the order book. When the data source sequence is contiguous and the diff
+        does not start right after the last update of the book, some diffs were lost and a resync is requested.
+        Diffs received while the pair is being resynced are not applied, they are buffered and replayed after the new
+        snapshot.
+        """
+        if trading_pair in self._resyncing_pairs:
+            self._resync_buffers[trading_pair].append(message)
+            return False
+        if self._is_sequence_checked(message) and message.first_update_id > last_update_id + 1:
+            self._sequence_gaps[trading_pair] += 1
+            self.logger().warning(f"Order book diffs missing for {trading_pair} (expected update {last_update_id + 1}, "
+                                  f"received {message.first_update_id}). Requesting a new snapshot.")
+            self._start_resync(trading_pair)
+            self._resync_buffers[trading_pair].append(message)
+            return False
+        return True
+
+    def _restore_order_book(self, trading_pair: str, order_book: OrderBook, snapshot: OrderBookMessage):
+        past_diffs: List[OrderBookMessage] = self._diffs_to_replay(trading_pair)
+        order_book.restore_from_snapshot_and_diffs(snapshot, past_diffs)
+        self._resyncing_pairs.discard(trading_pair)
+        if not self._replay_is_contiguous(snapshot, past_diffs):
+            self._sequence_gaps[trading_pair] += 1
+            self.logger().warning(f"Order book diffs missing for {trading_pair} after restoring a snapshot. "
+                                  f"Requesting a new snapshot.")
+            self._start_resync(trading_pair)
+
+    def _diffs_to_replay(self, trading_pair: str) -> List[OrderBookMessage]:
+        """
+        The diffs to replay on top of the snapshot: the past diffs window followed by all the diffs buffered while the
+        pair was being resynced, so a snapshot that took long to fetch on a busy pair does not need another resync
+        """
+        buffered_diffs: List[OrderBookMessage] = self._resync_buffers.pop(trading_pair, [])
+        buffered_ids: Set[int] = {id(diff) for diff in buffered_diffs}
+        past_diffs: List[OrderBookMessage] = [diff for diff in self._past_diffs_windows[trading_pair]
+                                              if id(diff) not in buffered_ids]
+        past_diffs.extend(buffered_diffs)
+        return past_diffs
+
+    def _replay_is_contiguous(self, snapshot: OrderBookMessage, diffs: List[OrderBookMessage]) -> bool:
+        expected_update_id: int = snapshot.update_id + 1
+        for diff in diffs:
+            if diff.update_id <= snapshot.update_id or not self._is_sequence_checked(diff):
+                continue
+            if diff.first_update_id > expected_update_id:
+                return False
+            expected_update_id = diff.update_id + 1
+        return True
+
+    def _start_resync(self, trading_pair: str):
+        self._resyncing_pairs.add(trading_pair)
+        self._resync_buffers.setdefault(trading_pair, [])
+        if trading_pair not in self._resync_tasks:
+            self._resync_tasks[trading_pair] = safe_ensure_future(self._resync_order_book(trading_pair))
+
+    async def _resync_order_book(self, trading_pair: str):
+        """
+        Requests a snapshot for a single order book and queues it behind the messages already received for the pair,
+        so it is restored replaying the diffs buffered while it was requested
+        """
+        try:
+            while True:
+                try:
+                    snapshot: OrderBookMessage = await self._data_source.get_order_book_snapshot(trading_pair)
+                    break
+                except asyncio.CancelledError:
+                    raise
+                except Exception:
+                    self.logger().network(
+                        f"Unexpected error requesting the order book snapshot for {trading_pair}.",
+                        exc_info=True,
+                        app_warning_msg=f"Unexpected error requesting the order book snapshot for {trading_pair}. "
+                                        f"Retrying after {self.SNAPSHOT_RETRY_INTERVAL:.0f} seconds."
+                    )
+                    await self._sleep(delay=self.SNAPSHOT_RETRY_INTERVAL)
+            self._resyncs[trading_pair] += 1
+            if self._batched_routing:
+                self._order_book_diff_stream.put_nowait(snapshot)
+            else:
+                self._tracking_message_queues[trading_pair].put_nowait(snapshot)
+        finally:
+            self._resync_tasks.pop(trading_pair, None)
+
     async def _track_single_book(self, trading_pair: str):
         past_diffs_window = self._past_diffs_windows[trading_pair]
 
@@ -272,8 +639,14 @@ class OrderBookTracker:
                     message = await message_queue.get()
 
                 if message.type is OrderBookMessageType.DIFF:
-                    order_book.apply_diffs(message.bids, message.asks, message.update_id)
+                    last_update_id: int = max(order_book.snapshot_uid, order_book.last_diff_uid)
+                    if self._is_stale_diff(message, last_update_id):
+                        continue
                     past_diffs_window.append(message)
+                    if not self._diff_continues_book(trading_pair, message, last_update_id):
+                        continue
+                    order_book.apply_raw_diffs(message.bids_array, message.asks_array, message.update_id)
+                    self._notify_update(trading_pair)
                     diff_messages_accepted += 1
 
                     # Output some statistics periodically.
@@ -283,8 +656,8 @@ class OrderBookTracker:
                         diff_messages_accepted = 0
                     last_message_timestamp = now
                 elif message.type is OrderBookMessageType.SNAPSHOT:
-                    past_diffs: List[OrderBookMessage] = list(past_diffs_window)
-                    order_book.restore_from_snapshot_and_diffs(message, past_diffs)
+                    self._restore_order_book(trading_pair, order_book, message)
+                    self._notify_update(trading_pair)
             except asyncio.CancelledError:
                 raise
             except Exception:
@@ -299,7 +672,6 @@ class OrderBookTracker:
         last_message_timestamp: float = time.time()
         messages_accepted: int = 0
         messages_rejected: int = 0
-        await self._order_books_initialized.wait()
         while True:
             try:
                 trade_message: OrderBookMessage = await self._order_book_trade_stream.get()
@@ -13,6 +13,9 @@ from hummingbot.logger import HummingbotLogger
 
 class OrderBookTrackerDataSource(metaclass=ABCMeta):
     FULL_ORDER_BOOK_RESET_DELTA_SECONDS = 60 * 60
+    # True when each diff message includes a first_update_id that follows the update_id of the previous diff (and of
+    # the snapshots), so the order book tracker can detect missing diffs
+    CONTIGUOUS_DIFF_UPDATE_IDS = False
 
     _logger: Optional[HummingbotLogger] = None
 
@@ -67,6 +70,16 @@ class OrderBookTrackerDataSource(metaclass=ABCMeta):
         order_book.apply_snapshot(snapshot_msg.bids, snapshot_msg.asks, snapshot_msg.update_id)
         return order_book
 
+    async def get_order_book_snapshot(self, trading_pair: str) -> OrderBookMessage:
+        """
+        Requests a snapshot of the exchange order book for a particular trading pair
+
+        :param trading_pair: the trading pair for which the order book has to be retrieved
+
+        :return: the snapshot message
+        """
+        return await self._order_book_snapshot(trading_pair=trading_pair)
+
     async def listen_for_subscriptions(self):
         """
         Connects to the trade events and order diffs websocket endpoints and listens to the messages sent by the
@@ -1,7 +1,7 @@
 import asyncio
 import logging
 from decimal import Decimal
-from typing import Dict, Optional
+from typing import Dict, List, Optional
 
 import hummingbot.client.settings  # noqa
 from hummingbot.connector.utils import combine_to_hb_trading_pair
@@ -185,6 +185,20 @@ class RateOracle(NetworkBase):
 
         return rate
 
+    async def stored_or_live_rates(self, pairs: List[str]) -> Dict[str, Optional[Decimal]]:
+        """
+        Finds the conversion rates of several trading pairs at once, using the local prices or, when they are not
+            initialized, a single fetch of the prices from the source
+
+        :param pairs: A list of trading pairs, e.g. ["BTC-USDT", "ETH-USDT"]
+
+        :return A dictionary of the conversion rate by trading pair, None for the pairs without rate
+        """
+        if len(pairs) == 0:
+            return {}
+        prices = self._prices if self._prices else await self._source.get_prices(quote_token=self._quote_token)
+        return {pair: find_rate(prices, pair) for pair in pairs}
+
     async def rate_async(self, pair: str) -> Decimal:
         """
         Finds a conversion rate in an async operation, it is a class method which can be used directly without having to
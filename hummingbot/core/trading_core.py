@@ -17,10 +17,12 @@ from hummingbot.client.config.config_helpers import ClientConfigAdapter, get_str
 from hummingbot.client.config.strategy_config_data_types import BaseStrategyConfigMap
 from hummingbot.client.performance import PerformanceMetrics
 from hummingbot.client.settings import SCRIPT_STRATEGIES_MODULE, STRATEGIES
+from hummingbot.client.trades_aggregator import MarketKey, TradesAggregate, TradesAggregator
 from hummingbot.connector.connector_metrics_collector import DummyMetricsCollector, MetricsCollector
 from hummingbot.connector.exchange_base import ExchangeBase
 from hummingbot.connector.markets_recorder import MarketsRecorder
 from hummingbot.core.clock import Clock, ClockMode
+from hummingbot.core.clock_metrics import SlowTickReport
 from hummingbot.core.connector_manager import ConnectorManager
 from hummingbot.core.gateway.gateway_http_client import GatewayHttpClient
 from hummingbot.core.rate_oracle.rate_oracle import RateOracle
@@ -94,6 +96,7 @@ class TradingCore:
         # Core components
         self.connector_manager = ConnectorManager(self.client_config_map)
         self.clock: Optional[Clock] = None
+        self._slow_tick_listeners: List[Callable[[SlowTickReport], None]] = []
 
         # Strategy components (optional)
         self.strategy: Optional[StrategyBase] = None
@@ -107,6 +110,7 @@ class TradingCore:
         self.kill_switch: Optional[KillSwitch] = None
         self.markets_recorder: Optional[MarketsRecorder] = None
         self.trade_fill_db: Optional[SQLConnectionManager] = None
+        self.trades_aggregator: Optional[TradesAggregator] = None
 
         # Metrics collectors mapping (connector_name -> MetricsCollector)
         self._metrics_collectors: Dict[str, MetricsCollector] = {}
@@ -164,6 +168,20 @@ class TradingCore:
         """Set the strategy file name."""
         self._strategy_file_name = value
 
+    def add_slow_tick_listener(self, listener: Callable[[SlowTickReport], None]):
+        """Register a callback for the slow ticks of the current clock and of the clocks started later."""
+        if listener not in self._slow_tick_listeners:
+            self._slow_tick_listeners.append(listener)
+        if self.clock is not None:
+            self.clock.add_slow_tick_listener(listener)
+
+    def remove_slow_tick_listener(self, listener: Callable[[SlowTickReport], None]):
+        """Unregister a slow tick callback."""
+        if listener in self._slow_tick_listeners:
+            self._slow_tick_listeners.remove(listener)
+        if self.clock is not None:
+            self.clock.remove_slow_tick_listener(listener)
+
     async def start_clock(self) -> bool:
         """
         Start the clock system without requiring a strategy.
@@ -179,6 +197,8 @@ class TradingCore:
             tick_size = self.client_config_map.tick_size
             self.logger().info(f"Creating the clock with tick size: {tick_size}")
             self.clock = Clock(ClockMode.REALTIME, tick_size=tick_size)
+            for listener in self._slow_tick_listeners:
+                self.clock.add_slow_tick_listener(listener)
 
             # Add all connectors to clock
             for connector in self.connector_manager.connectors.values():
@@ -338,6 +358,13 @@ class TradingCore:
         except Exception:
             return False
 
+    async def flush_markets_recorder(self):
+        """
+        Waits until the events recorded so far by the markets recorder are saved in the database.
+        """
+        if self.markets_recorder:
+            await self.markets_recorder.flush()
+
     def initialize_markets_recorder(self, db_name: str = None):
         """
         Initialize markets recorder for trade persistence.
@@ -359,6 +386,7 @@ class TradingCore:
         self.trade_fill_db = SQLConnectionManager.get_trade_fills_instance(
             self.client_config_map, db_name
         )
+        self.trades_aggregator = TradesAggregator(self.trade_fill_db)
 
         self.markets_recorder = MarketsRecorder(
             self.trade_fill_db,
@@ -549,6 +577,7 @@ class TradingCore:
 
                 # Restore market states if markets recorder exists
                 if self.markets_recorder:
+                    await self.markets_recorder.flush()
                     for market in self.markets.values():
                         self.markets_recorder.restore_market_states(self._strategy_file_name, market)
 
@@ -660,6 +689,7 @@ class TradingCore:
             'connectors': self.connector_manager.get_status(),
             'kill_switch_enabled': self.client_config_map.kill_switch_mode.model_config.get("title") == "kill_switch_enabled",
             'markets_recorder_active': self.markets_recorder is not None,
+            'clock_metrics': self.clock.tick_metrics.report() if self.clock is not None else None,
         }
 
     def add_notifier(self, notifier: NotifierBase):
@@ -736,16 +766,50 @@ class TradingCore:
         if any(not market.ready for market in self.connector_manager.connectors.values()):
             return s_decimal_0
 
-        start_time = self.init_time
+        perf_metrics = await self.calculate_performance_metrics_by_market(self.init_time)
+        returns_pct = [perf.return_pct for perf in perf_metrics.values()]
+        return sum(returns_pct) / len(returns_pct) if len(returns_pct) > 0 else s_decimal_0
+
+    async def aggregate_trades(self, start_time: float) -> Dict[MarketKey, TradesAggregate]:
+        """
+        Aggregates the trades of the strategy since the start time by connector and trading pair.
+        """
+        await self.flush_markets_recorder()
+        return self.trades_aggregator.aggregate(self.strategy_file_name, int(start_time * 1e3))
 
-        with self.trade_fill_db.get_new_session() as session:
-            trades: List[TradeFill] = self._get_trades_from_session(
-                int(start_time * 1e3),
-                session=session,
-                config_file_path=self.strategy_file_name)
-            perf_metrics = await self.calculate_performance_metrics_by_connector_pair(trades)
-            returns_pct = [perf.return_pct for perf in perf_metrics]
-            return sum(returns_pct) / len(returns_pct) if len(returns_pct) > 0 else s_decimal_0
+    async def calculate_performance_metrics_by_market(
+            self,
+            start_time: float,
+            aggregates: Optional[Dict[MarketKey, TradesAggregate]] = None) -> Dict[MarketKey, PerformanceMetrics]:
+        """
+        Calculates performance metrics by connector and trading pair of the trades of the strategy since the start
+        time, from the trades aggregated in the database. The conversion rates of all the markets are looked up at once.
+        The metrics of derivatives, and of all the markets when the database cannot aggregate the trades, are
+        calculated from the trades.
+        """
+        if aggregates is None:
+            aggregates = await self.aggregate_trades(start_time)
+        rate_pairs: Set[str] = set()
+        for (market, symbol), aggregate in aggregates.items():
+            rate_pairs.update(PerformanceMetrics.rate_pairs(symbol, aggregate))
+        rates = await RateOracle.get_instance().stored_or_live_rates(list(rate_pairs))
+
+        performance_metrics: Dict[MarketKey, PerformanceMetrics] = {}
+        for (market, symbol), aggregate in aggregates.items():
+            network_timeout = float(self.client_config_map.commands_timeout.other_commands_timeout)
+            try:
+                cur_balances = await asyncio.wait_for(self.get_current_balances(market), network_timeout)
+            except asyncio.TimeoutError:
+                self.logger().warning("A network error prevented the balances retrieval to complete. See logs for more details.")
+                raise
+            if aggregate.are_derivatives or not self.trades_aggregator.aggregates_in_sql:
+                trades = self.trades_aggregator.get_trades(
+                    self.strategy_file_name, int(start_time * 1e3), market, symbol)
+                perf = await PerformanceMetrics.create(symbol, trades, cur_balances)
+            else:
+                perf = await PerformanceMetrics.create_from_aggregate(symbol, aggregate, cur_balances, rates)
+            performance_metrics[(market, symbol)] = perf
+        return performance_metrics
 
     async def calculate_performance_metrics_by_connector_pair(self, trades: List[TradeFill]) -> List[PerformanceMetrics]:
         """
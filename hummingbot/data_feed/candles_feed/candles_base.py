@@ -1,7 +1,7 @@
 import asyncio
+import functools
 import os
 import time
-from collections import deque
 from typing import List, Optional
 
 import numpy as np
@@ -15,13 +15,15 @@ from hummingbot.core.utils.async_utils import safe_ensure_future
 from hummingbot.core.web_assistant.connections.data_types import RESTMethod, WSJSONRequest
 from hummingbot.core.web_assistant.web_assistants_factory import WebAssistantsFactory
 from hummingbot.core.web_assistant.ws_assistant import WSAssistant
+from hummingbot.data_feed.candles_feed.candles_buffer import CandlesBuffer, CandlesUpdate
+from hummingbot.data_feed.candles_feed.candles_store import CandlesStore
 from hummingbot.data_feed.candles_feed.data_types import HistoricalCandlesConfig
 
 
 class CandlesBase(NetworkBase):
     """
     This class serves as a base class for fetching and storing candle data from a cryptocurrency exchange.
-    The class uses the Rest and WS Assistants for all the IO operations, and a double-ended queue to store candles.
+    The class uses the Rest and WS Assistants for all the IO operations, and a columnar ring buffer to store candles.
     Also implements the Throttler module for API rate limiting, but it's not so necessary since the realtime data should
     be updated via websockets mainly.
     """
@@ -51,7 +53,7 @@ class CandlesBase(NetworkBase):
         async_throttler = AsyncThrottler(rate_limits=self.rate_limits)
         self._api_factory = WebAssistantsFactory(throttler=async_throttler)
         self.max_records = max_records
-        self._candles = deque(maxlen=max_records)
+        self._candles = CandlesBuffer(columns=self.columns, maxlen=max_records)
         self._listen_candles_task: Optional[asyncio.Task] = None
         self._trading_pair = trading_pair
         self._ex_trading_pair = self.get_exchange_trading_pair(trading_pair)
@@ -91,7 +93,7 @@ class CandlesBase(NetworkBase):
     @property
     def ready(self):
         """
-        This property returns a boolean indicating whether the _candles deque has reached its maximum length.
+        This property returns a boolean indicating whether the _candles buffer has reached its maximum length.
         """
         return len(self._candles) == self._candles.maxlen
 
@@ -141,9 +143,28 @@ class CandlesBase(NetworkBase):
     @property
     def candles_df(self) -> pd.DataFrame:
         """
-        This property returns the candles stored in the _candles deque as a Pandas DataFrame.
+        This property returns the candles stored in the _candles buffer as a Pandas DataFrame. The DataFrame is only
+        rebuilt from the buffer when the candles change, every call returns a copy of it that can be modified freely.
         """
-        return pd.DataFrame(self._candles, columns=self.columns, dtype=float)
+        return self._candles.to_dataframe().copy()
+
+    @property
+    def candles_version(self) -> int:
+        """
+        This property returns the version of the candles, incremented on every change.
+        """
+        return self._candles.version
+
+    def get_candles_since(self, version: int) -> CandlesUpdate:
+        """
+        This method returns the candles appended or updated since the given version, so that indicators can be
+        updated incrementally instead of being calculated again on all the candles.
+        :param version: the version of the previous update, 0 to get all the candles
+        :return: the changed candles, a copy that can be modified freely, and the version to ask the next update from
+        """
+        update = self._candles.candles_since(version)
+        update.candles = update.candles.copy()
+        return update
 
     def get_exchange_trading_pair(self, trading_pair):
         raise NotImplementedError
@@ -161,7 +182,47 @@ class CandlesBase(NetworkBase):
         df.sort_values(by="timestamp", ascending=False, inplace=True)
         self._candles.extendleft(df.values.tolist())
 
-    async def get_historical_candles(self, config: HistoricalCandlesConfig):
+    async def get_historical_candles(self, config: HistoricalCandlesConfig, store: Optional[CandlesStore] = None):
+        """
+        This method returns the candles of the time range of the config.
+        :param config: the connector, trading pair, interval and time range of the candles
+        :param store: the store of the candles already fetched. When provided, only the ranges missing from the store
+        are fetched from the exchange and the closed candles fetched are added to the store.
+        """
+        if store is None:
+            return await self._fetch_historical_candles(config)
+        # The store reads and writes files, it is called in an executor so it doesn't block the event loop
+        loop = asyncio.get_running_loop()
+        # The last candle is still open, it is returned but not stored
+        closed_candles_end = self._round_timestamp_to_interval_multiple(int(self._time()))
+        open_candles = []
+        missing_ranges = await loop.run_in_executor(None, functools.partial(
+            store.missing_ranges, config.connector_name, config.trading_pair, config.interval,
+            self.interval_in_seconds, config.start_time, config.end_time))
+        for start_time, end_time in missing_ranges:
+            candles_df = await self._fetch_historical_candles(HistoricalCandlesConfig(
+                connector_name=config.connector_name,
+                trading_pair=config.trading_pair,
+                interval=config.interval,
+                start_time=start_time,
+                end_time=end_time - self.interval_in_seconds,
+            ))
+            await loop.run_in_executor(None, functools.partial(
+                store.write, config.connector_name, config.trading_pair, config.interval, candles_df,
+                start_time, min(end_time, closed_candles_end)))
+            open_candles.append(candles_df[candles_df["timestamp"] >= closed_candles_end])
+        candles_df = await loop.run_in_executor(None, functools.partial(
+            store.read, config.connector_name, config.trading_pair, config.interval,
+            config.start_time, config.end_time))
+        if candles_df is None:
+            candles_df = pd.DataFrame(columns=self.columns, dtype=float)
+        if len(open_candles) > 0:
+            candles_df = pd.concat([candles_df, *open_candles], ignore_index=True)
+            candles_df = candles_df.drop_duplicates(subset=["timestamp"], keep="last").sort_values("timestamp")
+            candles_df = candles_df[candles_df["timestamp"] <= config.end_time].reset_index(drop=True)
+        return candles_df
+
+    async def _fetch_historical_candles(self, config: HistoricalCandlesConfig):
         candles_df = pd.DataFrame()
         try:
             await self.initialize_exchange_data()
@@ -321,7 +382,7 @@ class CandlesBase(NetworkBase):
 
     async def fill_historical_candles(self):
         """
-        This method fills the historical candles in the _candles deque until it reaches the maximum length.
+        This method fills the historical candles in the _candles buffer until it reaches the maximum length.
         """
         while not self.ready:
             await self._ws_candle_available.wait()
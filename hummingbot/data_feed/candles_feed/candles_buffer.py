@@ -0,0 +1,170 @@
+import itertools
+from dataclasses import dataclass
+from typing import Iterable, Iterator, List, Optional
+
+import numpy as np
+import pandas as pd
+
+# Versions are shared by all the buffers, a version of a buffer is never valid for a buffer created after it
+_versions = itertools.count(1)
+
+
+@dataclass
+class CandlesUpdate:
+    """
+    The candles that changed after a version of a candles buffer.
+
+    - candles: the candles appended or updated after the version, oldest first. The first one can be the last candle
+      already seen, updated since. When is_reset is True, all the candles of the buffer.
+    - version: the version of the buffer to ask the next update from
+    - is_reset: True when the candles already seen are not valid anymore (the buffer was cleared, older candles were
+      inserted or candles were dropped before being seen) and have to be replaced by the candles of the update
+    """
+    candles: pd.DataFrame
+    version: int
+    is_reset: bool
+
+
+class CandlesBuffer:
+    """
+    Fixed length buffer of candles stored by column in preallocated arrays.
+
+    The buffer supports the operations of the deque the candles feeds used to store their candles (append, appendleft,
+    extend, extendleft, clear, len, maxlen and indexing of rows), all O(1) per candle. Like in RingBuffer, the values
+    are written twice, at their position and one length further, so the candles in time order are always a contiguous
+    slice of the columns.
+
+    Every change gives the buffer a new, higher, version and the version at which each candle was last written is kept,
+    so that the candles changed since a version can be found without comparing values. The DataFrame of the candles is
+    built at most once per version.
+    """
+
+    def __init__(self, columns: List[str], maxlen: int):
+        self.columns = list(columns)
+        self.maxlen = maxlen
+        # One row per column, the candles are written at position and position + maxlen
+        self._values = np.zeros((len(self.columns), 2 * maxlen), dtype=np.float64)
+        self._row_versions = np.zeros(2 * maxlen, dtype=np.int64)
+        self._start = 0
+        self._size = 0
+        self._version = next(_versions)
+        # Version of the last change that was not an append or an update at the end of the buffer
+        self._reset_version = self._version
+        # Highest version at which one of the candles dropped from the buffer was written
+        self._dropped_version = 0
+        self._dataframe: Optional[pd.DataFrame] = None
+
+    @property
+    def version(self) -> int:
+        return self._version
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __getitem__(self, index: int) -> np.ndarray:
+        return self._values[:, self._start + self._index_offset(index)].copy()
+
+    def __setitem__(self, index: int, candle: Iterable[float]):
+        self._new_version()
+        self._write((self._start + self._index_offset(index)) % self.maxlen, candle)
+
+    def __iter__(self) -> Iterator[np.ndarray]:
+        return iter(self.to_numpy())
+
+    def __array__(self, dtype=None, copy=None) -> np.ndarray:
+        values = self.to_numpy()
+        return values if dtype is None else values.astype(dtype)
+
+    def append(self, candle: Iterable[float]):
+        if self.maxlen == 0:
+            return
+        self._new_version()
+        if self._size == self.maxlen:
+            self._drop(self._start)
+            self._start = (self._start + 1) % self.maxlen
+            self._write((self._start + self._size - 1) % self.maxlen, candle)
+        else:
+            self._write((self._start + self._size) % self.maxlen, candle)
+            self._size += 1
+
+    def appendleft(self, candle: Iterable[float]):
+        if self.maxlen == 0:
+            return
+        self._new_version()
+        self._reset_version = self._version
+        self._start = (self._start - 1) % self.maxlen
+        if self._size == self.maxlen:
+            self._drop(self._start)
+        else:
+            self._size += 1
+        self._write(self._start, candle)
+
+    def extend(self, candles: Iterable[Iterable[float]]):
+        for candle in candles:
+            self.append(candle)
+
+    def extendleft(self, candles: Iterable[Iterable[float]]):
+        for candle in candles:
+            self.appendleft(candle)
+
+    def clear(self):
+        self._new_version()
+        self._reset_version = self._version
+        self._start = 0
+        self._size = 0
+
+    def column(self, name: str) -> np.ndarray:
+        """
+        Read only view of the values of a column in time order. The view reflects the changes made after it was taken.
+        """
+        view = self._values[self.columns.index(name), self._start:self._start + self._size]
+        view.flags.writeable = False
+        return view
+
+    def to_numpy(self) -> np.ndarray:
+        """
+        Copy of the candles in time order, one row per candle
+        """
+        return self._values[:, self._start:self._start + self._size].T.copy()
+
+    def to_dataframe(self) -> pd.DataFrame:
+        """
+        The candles in time order. The DataFrame is shared by all the callers until the next change of the buffer.
+        """
+        if self._dataframe is None:
+            self._dataframe = pd.DataFrame(self._values[:, self._start:self._start + self._size].T,
+                                           columns=self.columns,
+                                           copy=True)
+        return self._dataframe
+
+    def candles_since(self, version: int) -> CandlesUpdate:
+        """
+        The candles appended or updated after the version, see CandlesUpdate.
+        :param version: the version returned by the previous update, 0 to get all the candles
+        """
+        dataframe = self.to_dataframe()
+        if version < self._reset_version or version < self._dropped_version or version > self._version:
+            return CandlesUpdate(candles=dataframe, version=self._version, is_reset=True)
+        changed = self._row_versions[self._start:self._start + self._size] > version
+        first_changed = int(np.argmax(changed)) if changed.any() else self._size
+        return CandlesUpdate(candles=dataframe.iloc[first_changed:], version=self._version, is_reset=False)
+
+    def _new_version(self):
+        self._version = next(_versions)
+        self._dataframe = None
+
+    def _index_offset(self, index: int) -> int:
+        offset = index + self._size if index < 0 else index
+        if offset < 0 or offset >= self._size:
+            raise IndexError("candles buffer index out of range")
+        return offset
+
+    def _write(self, position: int, candle: Iterable[float]):
+        values = np.asarray(candle, dtype=np.float64)
+        self._values[:, position] = values
+        self._values[:, position + self.maxlen] = values
+        self._row_versions[position] = self._version
+        self._row_versions[position + self.maxlen] = self._version
+
+    def _drop(self, position: int):
+        self._dropped_version = max(self._dropped_version, int(self._row_versions[position]))
@@ -0,0 +1,261 @@
+import json
+import logging
+import os
+import threading
+import time
+import uuid
+from contextlib import contextmanager
+from typing import Dict, Iterator, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from hummingbot import data_path
+from hummingbot.logger import HummingbotLogger
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+
+INDEX_FILE_NAME = "index.json"
+LOCK_FILE_NAME = "write.lock"
+# Chunk files of a directory above which a write merges them into one, so reads don't open too many files
+MAX_CHUNK_FILES = 32
+
+
+class CandlesStore:
+    """
+    On disk store of historical candles, shared by the processes that use the same root path.
+
+    The candles of a connector, trading pair and interval are kept in one directory:
+
+    - chunk files, NumPy files with one row per column (timestamp first), so every column is contiguous and a chunk
+      can be memory mapped and sliced by time without reading it all. Every write adds the candles fetched as a new
+      chunk, so it costs what it adds rather than the size of the whole series. Only the chunks overlapping the range
+      written are rewritten without the candles of the range, and once there are more than MAX_CHUNK_FILES they are
+      merged into one.
+    - index.json with the columns, the chunks with the first and last timestamp of their candles, and the time ranges
+      already fetched from the exchange, including the ranges without candles, so only the missing ranges are fetched
+      again
+
+    A write never modifies a chunk file, it writes new ones and then replaces the index, so readers always see a
+    complete version of the candles. The writes of a directory hold an exclusive lock on its lock file (flock, not
+    available on Windows, where only the writes of the same process are serialized), so writers of different processes
+    do not lose each other's candles. A chunk file missing when a reader gets to it is read as a missing range. Ranges
+    are half open ([start, end) in seconds) and aligned to the interval.
+
+    The methods read and write files, the coroutines call them in an executor so they don't block the event loop.
+    """
+    _logger: Optional[HummingbotLogger] = None
+
+    @classmethod
+    def logger(cls) -> HummingbotLogger:
+        if cls._logger is None:
+            cls._logger = logging.getLogger(__name__)
+        return cls._logger
+
+    def __init__(self, root_path: Optional[str] = None):
+        self._root_path = root_path
+        self._write_lock = threading.Lock()
+        # Memory mapped chunk files by directory and file name, the files are never modified
+        self._chunk_files: Dict[str, Dict[str, np.ndarray]] = {}
+
+    @property
+    def root_path(self) -> str:
+        return self._root_path or os.path.join(data_path(), "candles")
+
+    def covered_ranges(self, connector_name: str, trading_pair: str, interval: str) -> List[Tuple[int, int]]:
+        directory = self._directory(connector_name, trading_pair, interval)
+        index = self._read_index(directory)
+        if index is None or not self._chunk_files_exist(directory, index):
+            return []
+        return [tuple(time_range) for time_range in index["ranges"]]
+
+    def missing_ranges(self,
+                       connector_name: str,
+                       trading_pair: str,
+                       interval: str,
+                       interval_in_seconds: int,
+                       start_time: int,
+                       end_time: int) -> List[Tuple[int, int]]:
+        """
+        The ranges of candles between start_time and end_time (both included) that are not in the store.
+        :return: the missing ranges, [start, end) aligned to the interval
+        """
+        start, end = self.aligned_range(interval_in_seconds, start_time, end_time)
+        missing = []
+        for covered_start, covered_end in self.covered_ranges(connector_name, trading_pair, interval):
+            if covered_end <= start:
+                continue
+            if covered_start >= end:
+                break
+            if covered_start > start:
+                missing.append((start, covered_start))
+            start = max(start, covered_end)
+        if start < end:
+            missing.append((start, end))
+        return missing
+
+    def read(self,
+             connector_name: str,
+             trading_pair: str,
+             interval: str,
+             start_time: int,
+             end_time: int) -> Optional[pd.DataFrame]:
+        """
+        The stored candles with start_time <= timestamp <= end_time, None if nothing was ever stored or a chunk file
+        is missing.
+        """
+        directory = self._directory(connector_name, trading_pair, interval)
+        for _ in range(3):
+            index = self._read_index(directory)
+            if index is None:
+                return None
+            self._forget_chunk_files(directory, index)
+            try:
+                chunks = [self._chunk_file(directory, chunk_file)
+                          for chunk_file, first, last in index["chunks"] if first <= end_time and last >= start_time]
+                break
+            except FileNotFoundError:
+                # Replaced by another process after the index was read
+                continue
+        else:
+            self.logger().warning(f"The candles chunk files of {directory} are missing, the candles will be fetched "
+                                  f"again.")
+            return None
+        values = [chunk[:, np.searchsorted(chunk[0], start_time, side="left"):
+                        np.searchsorted(chunk[0], end_time, side="right")] for chunk in chunks]
+        values = np.concatenate(values, axis=1) if len(values) > 0 else np.empty((len(index["columns"]), 0))
+        return pd.DataFrame(values.T, columns=index["columns"], copy=True)
+
+    def write(self,
+              connector_name: str,
+              trading_pair: str,
+              interval: str,
+              candles: pd.DataFrame,
+              start_time: int,
+              end_time: int):
+        """
+        Stores the candles fetched for a range, replacing the stored candles of that range.
+        :param candles: the candles fetched, with a timestamp column
+        :param start_time: start of the range fetched, included
+        :param end_time: end of the range fetched, excluded. Only closed candles should be stored.
+        """
+        if end_time <= start_time:
+            return
+        directory = self._directory(connector_name, trading_pair, interval)
+        os.makedirs(directory, exist_ok=True)
+        with self._write_lock, self._directory_lock(directory):
+            index = self._read_index(directory)
+            if index is not None and not self._chunk_files_exist(directory, index):
+                self.logger().warning(f"The candles chunk files of {directory} are missing, only the new candles are "
+                                      f"kept.")
+                index = None
+            columns = list(candles.columns) if index is None else index["columns"]
+            new_values = candles[columns].to_numpy(dtype=np.float64).T
+            new_values = new_values[:, (new_values[0] >= start_time) & (new_values[0] < end_time)]
+            _, unique_positions = np.unique(new_values[0], return_index=True)
+            new_values = new_values[:, unique_positions]
+
+            chunks = []
+            ranges = [(start_time, end_time)]
+            if index is not None:
+                ranges.extend(tuple(time_range) for time_range in index["ranges"])
+                for chunk_file, first, last in index["chunks"]:
+                    if first >= end_time or last < start_time:
+                        chunks.append((chunk_file, first, last))
+                        continue
+                    # The chunk overlaps the range written, its candles before and after the range are written again
+                    values = np.load(os.path.join(directory, chunk_file))
+                    for part in (values[:, values[0] < start_time], values[:, values[0] >= end_time]):
+                        if part.shape[1] > 0:
+                            chunks.append(self._save_chunk(directory, part))
+            if new_values.shape[1] > 0:
+                chunks.append(self._save_chunk(directory, new_values))
+            chunks.sort(key=lambda chunk: chunk[1])
+            if len(chunks) > MAX_CHUNK_FILES:
+                values = np.concatenate([np.load(os.path.join(directory, chunk_file)) for chunk_file, _, _ in chunks],
+                                        axis=1)
+                chunks = [self._save_chunk(directory, values)]
+
+            temporary_index_path = os.path.join(directory, f"{INDEX_FILE_NAME}.{os.getpid()}.tmp")
+            with open(temporary_index_path, "w") as index_file:
+                json.dump({"columns": columns, "chunks": chunks, "ranges": self._merge_ranges(ranges)}, index_file)
+            os.replace(temporary_index_path, os.path.join(directory, INDEX_FILE_NAME))
+            previous_chunks = [] if index is None else [chunk_file for chunk_file, _, _ in index["chunks"]]
+            self._remove_old_chunk_files(directory, keep=[chunk_file for chunk_file, _, _ in chunks] + previous_chunks)
+
+    @staticmethod
+    def aligned_range(interval_in_seconds: int, start_time: int, end_time: int) -> Tuple[int, int]:
+        """
+        The [start, end) range of the candle timestamps between start_time and end_time, both included.
+        """
+        start = -(-int(start_time) // interval_in_seconds) * interval_in_seconds
+        end = (int(end_time) // interval_in_seconds + 1) * interval_in_seconds
+        return start, end
+
+    def _directory(self, connector_name: str, trading_pair: str, interval: str) -> str:
+        return os.path.join(self.root_path, connector_name, trading_pair, interval)
+
+    @staticmethod
+    @contextmanager
+    def _directory_lock(directory: str) -> Iterator[None]:
+        """
+        Exclusive lock of the writes of a directory among the processes, released when the lock file is closed
+        """
+        with open(os.path.join(directory, LOCK_FILE_NAME), "a") as lock_file:
+            if fcntl is not None:
+                fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX)
+            yield
+
+    @staticmethod
+    def _read_index(directory: str) -> Optional[dict]:
+        try:
+            with open(os.path.join(directory, INDEX_FILE_NAME)) as index_file:
+                return json.load(index_file)
+        except FileNotFoundError:
+            return None
+
+    @staticmethod
+    def _chunk_files_exist(directory: str, index: dict) -> bool:
+        return all(os.path.exists(os.path.join(directory, chunk_file)) for chunk_file, _, _ in index["chunks"])
+
+    @staticmethod
+    def _save_chunk(directory: str, values: np.ndarray) -> Tuple[str, float, float]:
+        chunk_file = f"candles_{time.time_ns()}_{uuid.uuid4().hex[:8]}.npy"
+        np.save(os.path.join(directory, chunk_file), np.ascontiguousarray(values))
+        return chunk_file, float(values[0, 0]), float(values[0, -1])
+
+    def _chunk_file(self, directory: str, chunk_file: str) -> np.ndarray:
+        chunk_files = self._chunk_files.setdefault(directory, {})
+        values = chunk_files.get(chunk_file)
+        if values is None:
+            values = chunk_files[chunk_file] = np.load(os.path.join(directory, chunk_file), mmap_mode="r")
+        return values
+
+    @staticmethod
+    def _merge_ranges(ranges: List[Tuple[int, int]]) -> List[Tuple[int, int]]:
+        merged = []
+        for start, end in sorted(ranges):
+            if len(merged) > 0 and start <= merged[-1][1]:
+                merged[-1] = (merged[-1][0], max(merged[-1][1], end))
+            else:
+                merged.append((start, end))
+        return merged
+
+    def _forget_chunk_files(self, directory: str, index: dict):
+        current_chunk_files = {chunk_file for chunk_file, _, _ in index["chunks"]}
+        cached_chunk_files = self._chunk_files.get(directory, {})
+        for chunk_file in list(cached_chunk_files):
+            if chunk_file not in current_chunk_files:
+                cached_chunk_files.pop(chunk_file, None)
+
+    def _remove_old_chunk_files(self, directory: str, keep: List[str]):
+        # The chunks of the previous index are kept for the readers that read it before it was replaced
+        for file_name in os.listdir(directory):
+            if file_name.startswith("candles_") and file_name.endswith(".npy") and file_name not in keep:
+                try:
+                    os.remove(os.path.join(directory, file_name))
+                except OSError:
+                    self.logger().debug(f"Could not remove {file_name}, it will be removed on the next write.")
@@ -2,7 +2,7 @@ import asyncio
 import logging
 import time
 from decimal import Decimal
-from typing import Dict, List, Optional, Tuple
+from typing import Callable, Dict, List, Optional, Set, Tuple
 
 import pandas as pd
 
@@ -18,8 +18,16 @@ from hummingbot.core.data_type.order_book_query_result import OrderBookQueryResu
 from hummingbot.core.gateway.gateway_http_client import GatewayHttpClient
 from hummingbot.core.rate_oracle.rate_oracle import RateOracle
 from hummingbot.core.utils.async_utils import safe_ensure_future
+from hummingbot.data_feed.candles_feed.candles_buffer import CandlesUpdate
 from hummingbot.data_feed.candles_feed.candles_factory import CandlesFactory
+from hummingbot.data_feed.candles_feed.candles_store import CandlesStore
 from hummingbot.data_feed.candles_feed.data_types import CandlesConfig
+from hummingbot.data_feed.market_subscriptions import (
+    MarketSubscription,
+    MarketSubscriptions,
+    PriceThresholdSubscription,
+    TopOfBookSubscription,
+)
 from hummingbot.logger import HummingbotLogger
 from hummingbot.strategy_v2.executors.data_types import ConnectorPair
 
@@ -35,8 +43,10 @@ class MarketDataProvider:
 
     def __init__(self,
                  connectors: Dict[str, ConnectorBase],
-                 rates_update_interval: int = 60):
+                 rates_update_interval: int = 60,
+                 candles_store: Optional[CandlesStore] = None):
         self.candles_feeds = {}  # Stores instances of candle feeds
+        self.candles_store = candles_store  # On disk store of the historical candles, if any
         self.connectors = connectors  # Stores instances of connectors
         self._rates_update_task = None
         self._rates_update_interval = rates_update_interval
@@ -44,6 +54,7 @@ class MarketDataProvider:
         self._non_trading_connectors = LazyDict[str, ConnectorBase](self._create_non_trading_connector)
         self._rates_required = GroupedSetDict[str, ConnectorPair]()
         self.conn_settings = AllConnectorSettings.get_connector_settings()
+        self.market_subscriptions = MarketSubscriptions(self.get_connector_with_fallback)
 
     def stop(self):
         for candle_feed in self.candles_feeds.values():
@@ -53,6 +64,7 @@ class MarketDataProvider:
             self._rates_update_task = None
         self.candles_feeds.clear()
         self._rates_required.clear()
+        self.market_subscriptions.stop()
 
     @property
     def ready(self) -> bool:
@@ -60,6 +72,23 @@ class MarketDataProvider:
         all_candles_feeds_running = all(feed.ready for feed in self.candles_feeds.values())
         return all_connectors_running and all_candles_feeds_running
 
+    def is_trading_pair_ready(self, connector_name: str, trading_pair: str) -> bool:
+        """
+        Returns whether the connector is ready to operate on the trading pair, which can happen before the connector
+        initialized all its trading pairs.
+        """
+        connector = self.connectors.get(connector_name)
+        return connector is not None and connector.is_trading_pair_ready(trading_pair)
+
+    def markets_ready(self, markets: Dict[str, Set[str]]) -> bool:
+        """
+        Returns whether all the candles feeds are ready and the connectors are ready to operate on the given markets.
+        :param markets: The trading pairs by connector name.
+        """
+        return (all(feed.ready for feed in self.candles_feeds.values()) and
+                all(self.is_trading_pair_ready(connector_name, trading_pair)
+                    for connector_name, trading_pairs in markets.items() for trading_pair in trading_pairs))
+
     def time(self):
         return time.time()
 
@@ -306,6 +335,48 @@ class MarketDataProvider:
         connector = self.get_connector_with_fallback(connector_name)
         return connector.get_price_by_type(trading_pair, price_type)
 
+    def subscribe_price_threshold(self, connector_name: str, trading_pair: str,
+                                  callback: Callable[[MarketSubscription], None],
+                                  lower: Optional[Decimal] = None, upper: Optional[Decimal] = None,
+                                  price_type: PriceType = PriceType.MidPrice) -> PriceThresholdSubscription:
+        """
+        Calls the callback once when the price of a trading pair crosses the lower or the upper threshold.
+        :param connector_name: str
+        :param trading_pair: str
+        :param callback: Callable, called with the subscription
+        :param lower: Decimal, fires at or below this price
+        :param upper: Decimal, fires at or above this price
+        :param price_type: PriceType, MidPrice, BestBid or BestAsk
+        :return: The subscription, to pass to unsubscribe.
+        """
+        return self.market_subscriptions.subscribe(PriceThresholdSubscription(
+            connector_name, trading_pair, callback, lower=lower, upper=upper, price_type=price_type))
+
+    def subscribe_top_of_book(self, connector_name: str, trading_pair: str,
+                              callback: Callable[[MarketSubscription], None],
+                              ticks: int = 1) -> TopOfBookSubscription:
+        """
+        Calls the callback whenever the best bid or the best ask of a trading pair moves by the number of ticks.
+        :param connector_name: str
+        :param trading_pair: str
+        :param callback: Callable, called with the subscription
+        :param ticks: int, the move in minimum price increments of the trading pair
+        :return: The subscription, to pass to unsubscribe.
+        """
+        try:
+            tick_size = Decimal(str(self.get_trading_rules(connector_name, trading_pair).min_price_increment))
+        except Exception:
+            tick_size = Decimal("0")
+        return self.market_subscriptions.subscribe(TopOfBookSubscription(
+            connector_name, trading_pair, callback, ticks=ticks, tick_size=tick_size))
+
+    def unsubscribe(self, subscription: MarketSubscription):
+        """
+        Removes a subscription of subscribe_price_threshold or subscribe_top_of_book.
+        :param subscription: MarketSubscription
+        """
+        self.market_subscriptions.unsubscribe(subscription)
+
     def get_funding_info(self, connector_name: str, trading_pair: str):
         """
         Retrieves the funding rate for a trading pair from the specified connector.
@@ -333,6 +404,25 @@ class MarketDataProvider:
         ))
         return candles.candles_df.iloc[-max_records:]
 
+    def get_candles_since(self, connector_name: str, trading_pair: str, interval: str, version: int,
+                          max_records: int = 500) -> CandlesUpdate:
+        """
+        Retrieves the candles for a trading pair appended or updated since the version of a previous update.
+        :param connector_name: str
+        :param trading_pair: str
+        :param interval: str
+        :param version: int, the version of the previous update or 0 to get all the candles
+        :param max_records: int
+        :return: CandlesUpdate with the changed candles and the version of the next update.
+        """
+        candles = self.get_candles_feed(CandlesConfig(
+            connector=connector_name,
+            trading_pair=trading_pair,
+            interval=interval,
+            max_records=max_records,
+        ))
+        return candles.get_candles_since(version)
+
     async def get_historical_candles_df(self, connector_name: str, trading_pair: str, interval: str,
                                         start_time: Optional[int] = None, end_time: Optional[int] = None,
                                         max_records: Optional[int] = None, max_cache_records: int = 10000):
@@ -347,6 +437,8 @@ class MarketDataProvider:
         :param max_records: Maximum number of records to return (optional)
         :param max_cache_records: Maximum records to keep in cache for efficiency
         :return: Candles dataframe for the requested range
+
+        With a candles store, the candles are read from the store and only the ranges missing from it are fetched.
         """
         import time
 
@@ -372,6 +464,26 @@ class MarketDataProvider:
             # Fallback to regular method if no time range specified
             return self.get_candles_df(connector_name, trading_pair, interval, max_records or 500)
 
+        if self.candles_store is not None:
+            candles_feed = self.get_candles_feed(CandlesConfig(
+                connector=connector_name,
+                trading_pair=trading_pair,
+                interval=interval,
+                max_records=max_cache_records
+            ))
+            try:
+                candles_df = await candles_feed.get_historical_candles(HistoricalCandlesConfig(
+                    connector_name=connector_name,
+                    trading_pair=trading_pair,
+                    interval=interval,
+                    start_time=start_time,
+                    end_time=end_time
+                ), store=self.candles_store)
+                return candles_df.iloc[-max_records:] if max_records else candles_df
+            except Exception as e:
+                self.logger().warning(f"Error fetching historical candles: {e}. Falling back to regular method.")
+                return self.get_candles_df(connector_name, trading_pair, interval, max_records or 500)
+
         # Get or create candles feed with extended cache
         candles_feed = self.get_candles_feed(CandlesConfig(
             connector=connector_name,
@@ -444,13 +556,11 @@ class MarketDataProvider:
 
                     # Update the candles feed cache
                     candles_feed._candles.clear()
-                    for _, row in combined_df.iterrows():
-                        candles_feed._candles.append(row.values)
+                    candles_feed._candles.extend(combined_df.to_numpy(dtype=float))
                 else:
                     # Update the candles feed cache with new data
                     candles_feed._candles.clear()
-                    for _, row in new_df.iloc[-max_cache_records:].iterrows():
-                        candles_feed._candles.append(row.values)
+                    candles_feed._candles.extend(new_df.iloc[-max_cache_records:].to_numpy(dtype=float))
 
                 # Return filtered data for requested range
                 final_df = candles_feed.candles_df
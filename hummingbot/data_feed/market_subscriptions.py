@@ -0,0 +1,273 @@
+import asyncio
+import functools
+import logging
+from decimal import Decimal
+from typing import Callable, Dict, List, Optional, Set, Tuple
+
+from hummingbot.connector.connector_base import ConnectorBase
+from hummingbot.core.data_type.common import PriceType
+from hummingbot.core.data_type.order_book_tracker import OrderBookTracker
+from hummingbot.core.utils.async_utils import safe_ensure_future
+from hummingbot.logger import HummingbotLogger
+
+Market = Tuple[str, str]
+
+
+class MarketSubscription:
+    """
+    Interest of a subscriber in the changes of a market. The callback is called with the subscription when the
+    trigger fires.
+    """
+
+    def __init__(self, connector_name: str, trading_pair: str, callback: Callable[["MarketSubscription"], None]):
+        self.connector_name = connector_name
+        self.trading_pair = trading_pair
+        self.callback = callback
+        self.active = True
+
+    @property
+    def market(self) -> Market:
+        return self.connector_name, self.trading_pair
+
+    def arm(self, best_bid: Decimal, best_ask: Decimal):
+        """
+        Takes the reference prices of the trigger, called once when the subscription is added.
+        """
+        pass
+
+    def evaluate(self, best_bid: Decimal, best_ask: Decimal) -> bool:
+        """
+        Returns whether the trigger fires for the current top of book.
+        """
+        raise NotImplementedError
+
+
+class PriceThresholdSubscription(MarketSubscription):
+    """
+    Fires once when the price goes at or below the lower threshold, or at or above the upper threshold. Call
+    set_thresholds to arm it again.
+    """
+
+    def __init__(self,
+                 connector_name: str,
+                 trading_pair: str,
+                 callback: Callable[[MarketSubscription], None],
+                 lower: Optional[Decimal] = None,
+                 upper: Optional[Decimal] = None,
+                 price_type: PriceType = PriceType.MidPrice):
+        super().__init__(connector_name, trading_pair, callback)
+        self.price_type = price_type
+        self.lower = lower
+        self.upper = upper
+
+    def set_thresholds(self, lower: Optional[Decimal], upper: Optional[Decimal]):
+        self.lower = lower
+        self.upper = upper
+        self.active = True
+
+    def evaluate(self, best_bid: Decimal, best_ask: Decimal) -> bool:
+        if self.price_type == PriceType.BestBid:
+            price = best_bid
+        elif self.price_type == PriceType.BestAsk:
+            price = best_ask
+        else:
+            price = (best_bid + best_ask) / 2
+        if (self.lower is not None and price <= self.lower) or (self.upper is not None and price >= self.upper):
+            self.active = False
+            return True
+        return False
+
+
+class TopOfBookSubscription(MarketSubscription):
+    """
+    Fires when the best bid or the best ask moved by at least the given number of ticks since the trigger last fired.
+    """
+
+    def __init__(self,
+                 connector_name: str,
+                 trading_pair: str,
+                 callback: Callable[[MarketSubscription], None],
+                 ticks: int = 1,
+                 tick_size: Decimal = Decimal("0")):
+        super().__init__(connector_name, trading_pair, callback)
+        self.ticks = ticks
+        self.tick_size = tick_size
+        self._reference_bid: Optional[Decimal] = None
+        self._reference_ask: Optional[Decimal] = None
+
+    def arm(self, best_bid: Decimal, best_ask: Decimal):
+        self._reference_bid = best_bid
+        self._reference_ask = best_ask
+
+    def evaluate(self, best_bid: Decimal, best_ask: Decimal) -> bool:
+        min_move = self.ticks * self.tick_size
+        if self._reference_bid is not None:
+            bid_move = abs(best_bid - self._reference_bid)
+            ask_move = abs(best_ask - self._reference_ask)
+            if max(bid_move, ask_move) < min_move or (bid_move == 0 and ask_move == 0):
+                return False
+        self._reference_bid = best_bid
+        self._reference_ask = best_ask
+        return True
+
+
+class MarketSubscriptions:
+    """
+    Evaluates the market subscriptions of many subscribers. For connectors with an order book tracker, the
+    subscriptions of a market are evaluated when the tracker applies an update to its order book: the updates are
+    collected as they arrive and evaluated once per event loop iteration, reading the top of book of each changed
+    market once. Connectors without a tracker fall back to a single polling task, which reads the top of book of a
+    market only if its order book changed since the previous poll. In both cases the cost depends on the markets that
+    changed rather than on the number of subscribers.
+    """
+    _logger: Optional[HummingbotLogger] = None
+
+    @classmethod
+    def logger(cls) -> HummingbotLogger:
+        if cls._logger is None:
+            cls._logger = logging.getLogger(__name__)
+        return cls._logger
+
+    def __init__(self, get_connector: Callable[[str], ConnectorBase], poll_interval: float = 0.1):
+        self._get_connector = get_connector
+        self.poll_interval = poll_interval
+        self._subscriptions: Dict[Market, List[MarketSubscription]] = {}
+        self._versions: Dict[Market, Tuple] = {}
+        self._poll_task: Optional[asyncio.Task] = None
+        self._hooked_connectors: Dict[str, Tuple[OrderBookTracker, Callable[[str], None]]] = {}
+        self._updated_markets: Set[Market] = set()
+        self._evaluation_handle: Optional[asyncio.Handle] = None
+
+    @property
+    def subscriptions_count(self) -> int:
+        return sum(len(subscriptions) for subscriptions in self._subscriptions.values())
+
+    def subscribe(self, subscription: MarketSubscription) -> MarketSubscription:
+        top_of_book = self._get_top_of_book(subscription.market)
+        if top_of_book is not None:
+            subscription.arm(*top_of_book)
+        self._subscriptions.setdefault(subscription.market, []).append(subscription)
+        if not self._hook_connector(subscription.connector_name) and (self._poll_task is None or self._poll_task.done()):
+            self._poll_task = safe_ensure_future(self._poll_loop())
+        return subscription
+
+    def unsubscribe(self, subscription: MarketSubscription):
+        subscription.active = False
+        subscriptions = self._subscriptions.get(subscription.market)
+        if subscriptions is not None and subscription in subscriptions:
+            subscriptions.remove(subscription)
+            if not subscriptions:
+                del self._subscriptions[subscription.market]
+                self._versions.pop(subscription.market, None)
+                self._updated_markets.discard(subscription.market)
+                if all(connector_name != subscription.connector_name for connector_name, _ in self._subscriptions):
+                    self._unhook_connector(subscription.connector_name)
+
+    def stop(self):
+        if self._poll_task is not None:
+            self._poll_task.cancel()
+            self._poll_task = None
+        if self._evaluation_handle is not None:
+            self._evaluation_handle.cancel()
+            self._evaluation_handle = None
+        for connector_name in list(self._hooked_connectors):
+            self._unhook_connector(connector_name)
+        for subscriptions in self._subscriptions.values():
+            for subscription in subscriptions:
+                subscription.active = False
+        self._subscriptions.clear()
+        self._versions.clear()
+        self._updated_markets.clear()
+
+    def _hook_connector(self, connector_name: str) -> bool:
+        """
+        Listens to the order book updates of the connector tracker. Returns False when the connector has no order book
+        tracker, so its markets have to be polled.
+        """
+        if connector_name in self._hooked_connectors:
+            return True
+        try:
+            tracker = getattr(self._get_connector(connector_name), "order_book_tracker", None)
+        except Exception:
+            tracker = None
+        if not isinstance(tracker, OrderBookTracker):
+            return False
+        listener = functools.partial(self._on_order_book_update, connector_name)
+        tracker.add_update_listener(listener)
+        self._hooked_connectors[connector_name] = (tracker, listener)
+        return True
+
+    def _unhook_connector(self, connector_name: str):
+        hook = self._hooked_connectors.pop(connector_name, None)
+        if hook is not None:
+            tracker, listener = hook
+            tracker.remove_update_listener(listener)
+
+    def _on_order_book_update(self, connector_name: str, trading_pair: str):
+        market = (connector_name, trading_pair)
+        if market not in self._subscriptions:
+            return
+        self._updated_markets.add(market)
+        if self._evaluation_handle is None:
+            self._evaluation_handle = asyncio.get_event_loop().call_soon(self._evaluate_updated_markets)
+
+    def _evaluate_updated_markets(self):
+        self._evaluation_handle = None
+        updated_markets = self._updated_markets
+        self._updated_markets = set()
+        for market in updated_markets:
+            subscriptions = self._subscriptions.get(market)
+            if subscriptions:
+                self._evaluate(market, subscriptions)
+
+    def _has_polled_markets(self) -> bool:
+        return any(connector_name not in self._hooked_connectors for connector_name, _ in self._subscriptions)
+
+    async def _poll_loop(self):
+        while self._has_polled_markets():
+            self.poll()
+            await asyncio.sleep(self.poll_interval)
+
+    def poll(self):
+        """
+        Evaluates the subscriptions of the markets of connectors without an order book tracker whose order book
+        changed, and calls the callbacks of the triggers that fired.
+        """
+        for market, subscriptions in list(self._subscriptions.items()):
+            if market[0] in self._hooked_connectors:
+                continue
+            version = self._get_version(market)
+            if version is not None:
+                if self._versions.get(market) == version:
+                    continue
+                self._versions[market] = version
+            self._evaluate(market, subscriptions)
+
+    def _evaluate(self, market: Market, subscriptions: List[MarketSubscription]):
+        top_of_book = self._get_top_of_book(market)
+        if top_of_book is None:
+            return
+        for subscription in list(subscriptions):
+            if subscription.active and subscription.evaluate(*top_of_book):
+                try:
+                    subscription.callback(subscription)
+                except Exception:
+                    self.logger().error(f"Error calling the subscription callback for {market}.", exc_info=True)
+
+    def _get_version(self, market: Market) -> Optional[Tuple]:
+        try:
+            order_book = self._get_connector(market[0]).get_order_book(market[1])
+            return order_book.snapshot_uid, order_book.last_diff_uid, order_book.last_applied_trade
+        except Exception:
+            return None
+
+    def _get_top_of_book(self, market: Market) -> Optional[Tuple[Decimal, Decimal]]:
+        try:
+            connector = self._get_connector(market[0])
+            best_bid = connector.get_price_by_type(market[1], PriceType.BestBid)
+            best_ask = connector.get_price_by_type(market[1], PriceType.BestAsk)
+        except Exception:
+            return None
+        if best_bid is None or best_ask is None or best_bid.is_nan() or best_ask.is_nan():
+            return None
+        return best_bid, best_ask
@@ -149,3 +149,38 @@ class AddTradeFeeInQuote(DatabaseTransformation):
     @property
     def to_version(self):
         return 20230516
+
+
+class AddQueryIndexes(DatabaseTransformation):
+    """
+    Indexes for the queries run on startup (orders of a config and market), by the history command (trades since a
+    timestamp) and to load the fills of an order, plus the unique market states index the model was missing. Only the
+    last market states saved for a config and market are kept, older duplicates would make the unique index fail.
+    """
+    index_queries = [
+        'CREATE INDEX IF NOT EXISTS o_config_market_timestamp_index '
+        'ON "Order" (config_file_path, market, creation_timestamp);',
+        'CREATE INDEX IF NOT EXISTS tf_timestamp_index ON TradeFill (timestamp);',
+        'CREATE INDEX IF NOT EXISTS tf_order_id_index ON TradeFill (order_id);',
+        'DELETE FROM MarketState WHERE rowid NOT IN '
+        '(SELECT MAX(rowid) FROM MarketState GROUP BY config_file_path, market);',
+        'CREATE UNIQUE INDEX IF NOT EXISTS ms_config_market_index ON MarketState (config_file_path, market);',
+        'PRAGMA optimize;',
+    ]
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+
+    def apply(self, db_handle: SQLConnectionManager) -> SQLConnectionManager:
+        with db_handle.engine.begin() as conn:
+            for query in self.index_queries:
+                conn.exec_driver_sql(query)
+        return db_handle
+
+    @property
+    def name(self):
+        return "AddQueryIndexes"
+
+    @property
+    def to_version(self):
+        return 20261018
@@ -0,0 +1,26 @@
+from sqlalchemy import JSON, BigInteger, Column, Index, Integer, Text
+
+from . import HummingbotBase
+
+
+class MarketStateChange(HummingbotBase):
+    """
+    Change of the tracking state of one order, appended after the last MarketState snapshot of the market. A null
+    saved_state means the order is not tracked anymore. Replaying the changes in id order over the snapshot gives the
+    latest tracking states.
+    """
+    __tablename__ = "MarketStateChange"
+    __table_args__ = (Index("msc_config_market_index",
+                            "config_file_path", "market", "id"),)
+
+    id = Column(Integer, primary_key=True, nullable=False, autoincrement=True)
+    config_file_path = Column(Text, nullable=False)
+    market = Column(Text, nullable=False)
+    timestamp = Column(BigInteger, nullable=False)
+    client_order_id = Column(Text, nullable=False)
+    saved_state = Column(JSON, nullable=True)
+
+    def __repr__(self) -> str:
+        return f"MarketStateChange(id='{self.id}', config_file_path='{self.config_file_path}', " \
+            f"market='{self.market}', timestamp={self.timestamp}, client_order_id='{self.client_order_id}', " \
+            f"saved_state={self.saved_state})"
@@ -1,9 +1,9 @@
 import logging
 from enum import Enum
 from os.path import join
-from typing import TYPE_CHECKING, Optional
+from typing import TYPE_CHECKING, Any, Dict, Optional
 
-from sqlalchemy import MetaData, create_engine, inspect
+from sqlalchemy import MetaData, create_engine, event, inspect
 from sqlalchemy.engine.base import Engine
 from sqlalchemy.orm import Query, Session, sessionmaker
 from sqlalchemy.schema import DropConstraint, ForeignKeyConstraint, Table
@@ -27,7 +27,19 @@ class SQLConnectionManager(TransactionBase):
     _scm_trade_fills_instance: Optional["SQLConnectionManager"] = None
 
     LOCAL_DB_VERSION_KEY = "local_db_version"
-    LOCAL_DB_VERSION_VALUE = "20230516"
+    LOCAL_DB_VERSION_VALUE = "20261018"
+
+    # Applied to every new connection to a SQLite database. The write-ahead log lets the markets recorder write while
+    # the client reads, and with synchronous=NORMAL a commit does not wait for the disk (a power loss can lose the
+    # last commits, never corrupt the database).
+    SQLITE_PRAGMAS: Dict[str, Any] = {
+        "journal_mode": "WAL",
+        "synchronous": "NORMAL",
+        "temp_store": "MEMORY",
+        "cache_size": -64000,  # In KiB
+        "mmap_size": 256 * 1024 * 1024,
+        "busy_timeout": 5000,  # In milliseconds
+    }
 
     @classmethod
     def logger(cls) -> HummingbotLogger:
@@ -73,6 +85,8 @@ class SQLConnectionManager(TransactionBase):
 
         if connection_type is SQLConnectionType.TRADE_FILLS:
             self._engine: Engine = create_engine(client_config_map.db_mode.get_url(self.db_path))
+            if self._engine.dialect.name == "sqlite":
+                event.listen(self._engine, "connect", self._set_sqlite_pragmas)
             self._metadata: MetaData = self.get_declarative_base().metadata
             self._metadata.create_all(self._engine)
 
@@ -100,6 +114,23 @@ class SQLConnectionManager(TransactionBase):
     def engine(self) -> Engine:
         return self._engine
 
+    @classmethod
+    def _set_sqlite_pragmas(cls, dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        try:
+            for pragma, value in cls.SQLITE_PRAGMAS.items():
+                cursor.execute(f"PRAGMA {pragma}={value}")
+        finally:
+            cursor.close()
+
+    def checkpoint(self):
+        """
+        Moves the content of the write-ahead log into the database file, so the file can be copied on its own
+        """
+        if self._engine.dialect.name == "sqlite":
+            with self._engine.connect() as conn:
+                conn.exec_driver_sql("PRAGMA wal_checkpoint(TRUNCATE)")
+
     def get_new_session(self) -> Session:
         return self._session_cls()
 
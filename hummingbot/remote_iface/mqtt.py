@@ -24,6 +24,7 @@ if TYPE_CHECKING:  # pragma: no cover
 from commlib.node import Node, NodeState
 from commlib.transports.mqtt import ConnectionParameters as MQTTConnectionParameters
 
+from hummingbot.core.clock_metrics import SlowTickReport
 from hummingbot.core.data_type.trade_fee import AddedToCostTradeFee, DeductedFromReturnsTradeFee
 from hummingbot.core.event import events
 from hummingbot.core.event.event_forwarder import SourceInfoEventForwarder
@@ -293,6 +294,8 @@ class MQTTCommands:
                     timeout=timeout
                 )
                 response.msg = res if res is not None else ''
+                if self._hb_app.trading_core.clock is not None:
+                    response.data = self._hb_app.trading_core.clock.tick_metrics.report()
         except asyncio.exceptions.TimeoutError:
             response.msg = f'Hummingbot status command timed out after {timeout} seconds'
             response.status = MQTT_STATUS_CODE.ERROR
@@ -686,12 +689,17 @@ class MQTTGateway(Node):
 
     def _init_status_updates(self):
         self._status_updates = MQTTStatusUpdates(self._hb_app, self)
+        self._hb_app.trading_core.add_slow_tick_listener(self._on_slow_tick)
 
     def _remove_status_updates(self):
         if self._status_updates is not None:
+            self._hb_app.trading_core.remove_slow_tick_listener(self._on_slow_tick)
             self._status_updates.stop()
             self._status_updates = None
 
+    def _on_slow_tick(self, report: SlowTickReport):
+        self.broadcast_status_update(report.format(), msg_type="slow_tick")
+
     def broadcast_status_update(self, *args, **kwargs):
         if self._status_updates is not None:
             self._status_updates.add_msg_to_queue(*args, **kwargs)
@@ -1,11 +1,22 @@
 import numpy as np
 import logging
 cimport numpy as np
+from libc.math cimport isnan, sqrt
 
 
 pmm_logger = None
 
 cdef class RingBuffer:
+    """
+    Fixed length buffer of the latest values added.
+
+    Values are written twice, at their position and one length further, so the values in insertion order are always
+    a contiguous slice of the storage and can be read without copies. Sums of the values and of their squares, both
+    shifted by a value close to the mean for numerical stability, are kept up to date on every insertion so mean,
+    variance and standard deviation are O(1). The sums are recomputed from the values every time the buffer wraps
+    around, which bounds the rounding errors accumulated by the running updates. NaN values are left out of the sums
+    and counted instead: the statistics are NaN while the window holds one and are right again once it leaves.
+    """
     @classmethod
     def logger(cls):
         global pmm_logger
@@ -13,68 +24,114 @@ cdef class RingBuffer:
             pmm_logger = logging.getLogger(__name__)
         return pmm_logger
 
-    def __cinit__(self, int length):
-        self._length = length
-        self._buffer = np.zeros(length, dtype=np.float64)
-        self._delimiter = 0
-        self._is_full = False
+    def __cinit__(self, int64_t length):
+        self.c_reset(length)
 
     def __dealloc__(self):
         self._buffer = None
 
-    cdef void c_add_value(self, float val):
+    cdef void c_reset(self, int64_t length):
+        self._length = length
+        self._buffer = np.zeros(2 * length, dtype=np.float64)
+        self._delimiter = 0
+        self._is_full = False
+        self._shift = 0.0
+        self._sum = 0.0
+        self._sum_squares = 0.0
+        self._nan_count = 0
+
+    cdef void c_add_value(self, double val):
+        cdef:
+            double shifted
+            double removed
+        if self.c_is_empty():
+            self._shift = 0.0 if isnan(val) else val
+        if self._is_full:
+            removed = self._buffer[self._delimiter]
+            if isnan(removed):
+                self._nan_count -= 1
+            else:
+                shifted = removed - self._shift
+                self._sum -= shifted
+                self._sum_squares -= shifted * shifted
+        if isnan(val):
+            self._nan_count += 1
+        else:
+            shifted = val - self._shift
+            self._sum += shifted
+            self._sum_squares += shifted * shifted
         self._buffer[self._delimiter] = val
+        self._buffer[self._delimiter + self._length] = val
         self.c_increment_delimiter()
+        if self._delimiter == 0:
+            self.c_update_statistics()
 
     cdef void c_increment_delimiter(self):
         self._delimiter = (self._delimiter + 1) % self._length
         if not self._is_full and self._delimiter == 0:
             self._is_full = True
 
+    cdef void c_update_statistics(self):
+        cdef np.ndarray[np.double_t, ndim=1] values = self.c_get_as_numpy_view()
+        cdef np.ndarray[np.double_t, ndim=1] shifted
+        if values.size == 0:
+            return
+        values = values[~np.isnan(values)]
+        self._nan_count = self.c_size() - values.size
+        if values.size == 0:
+            self._shift = 0.0
+            self._sum = 0.0
+            self._sum_squares = 0.0
+            return
+        self._shift = np.mean(values)
+        shifted = values - self._shift
+        self._sum = np.sum(shifted)
+        self._sum_squares = np.dot(shifted, shifted)
+
     cdef bint c_is_empty(self):
         return (not self._is_full) and (0==self._delimiter)
 
     cdef double c_get_last_value(self):
         if self.c_is_empty():
             return np.nan
-        return self._buffer[self._delimiter-1]
+        return self._buffer[self._delimiter + self._length - 1]
 
     cdef bint c_is_full(self):
         return self._is_full
 
+    cdef int64_t c_size(self):
+        return self._length if self._is_full else self._delimiter
+
     cdef double c_mean_value(self):
-        result = np.nan
-        if self._is_full:
-            result=np.mean(self.c_get_as_numpy_array())
-        return result
+        if not self._is_full or self._nan_count > 0:
+            return np.nan
+        return self._shift + self._sum / self._length
 
     cdef double c_variance(self):
-        result = np.nan
-        if self._is_full:
-            result = np.var(self.c_get_as_numpy_array())
-        return result
+        cdef double mean_shifted
+        if not self._is_full or self._nan_count > 0:
+            return np.nan
+        mean_shifted = self._sum / self._length
+        return max(0.0, self._sum_squares / self._length - mean_shifted * mean_shifted)
 
     cdef double c_std_dev(self):
-        result = np.nan
-        if self._is_full:
-            result = np.std(self.c_get_as_numpy_array())
-        return result
+        if not self._is_full:
+            return np.nan
+        return sqrt(self.c_variance())
 
-    cdef np.ndarray[np.double_t, ndim=1] c_get_as_numpy_array(self):
-        cdef np.ndarray[np.int16_t, ndim=1] indexes
+    cdef np.ndarray[np.double_t, ndim=1] c_get_as_numpy_view(self):
+        cdef:
+            np.ndarray[np.double_t, ndim=1] view
+            int64_t start = self._delimiter if self._is_full else 0
+        view = np.asarray(self._buffer)[start:start + self.c_size()]
+        view.flags.writeable = False
+        return view
 
-        if not self._is_full:
-            indexes = np.arange(0, stop=self._delimiter, dtype=np.int16)
-        else:
-            indexes = np.arange(self._delimiter, stop=self._delimiter + self._length,
-                                dtype=np.int16) % self._length
-        return np.asarray(self._buffer)[indexes]
+    cdef np.ndarray[np.double_t, ndim=1] c_get_as_numpy_array(self):
+        return self.c_get_as_numpy_view().copy()
 
     def __init__(self, length):
-        self._length = length
-        self._buffer = np.zeros(length, dtype=np.double)
-        self._delimiter = 0
-        self._is_full = False
+        pass
 
     def add_value(self, val):
         self.c_add_value(val)
@@ -82,6 +139,13 @@ cdef class RingBuffer:
     def get_as_numpy_array(self):
         return self.c_get_as_numpy_array()
 
+    def get_as_numpy_view(self):
+        """
+        Read only view of the values in insertion order. The view reflects the values added after it was taken, use
+        get_as_numpy_array to keep the current values.
+        """
+        return self.c_get_as_numpy_view()
+
     def get_last_value(self):
         return self.c_get_last_value()
 
@@ -89,6 +153,10 @@ cdef class RingBuffer:
     def is_full(self):
         return self.c_is_full()
 
+    @property
+    def size(self) -> int:
+        return self.c_size()
+
     @property
     def mean_value(self):
         return self.c_mean_value()
@@ -109,10 +177,7 @@ cdef class RingBuffer:
     def length(self, value):
         data = self.get_as_numpy_array()
 
-        self._length = value
-        self._buffer = np.zeros(value, dtype=np.float64)
-        self._delimiter = 0
-        self._is_full = False
+        self.c_reset(value)
 
         for val in data[-value:]:
             self.add_value(val)
@@ -20,9 +20,15 @@ cdef class TradingIntensityIndicator:
         list _last_quotes
         int _sampling_length
         int _samples_length
+        dict _level_amounts
+        dict _level_trade_counts
+        double _total_amount
+        double _changed_amount
 
     cdef c_calculate(self, timestamp)
     cdef c_register_trade(self, object trade)
+    cdef c_add_trade_to_sample(self, object sample_timestamp, double price_level, double amount)
+    cdef c_remove_sample(self, object sample_timestamp)
     cdef c_estimate_intensity(self)
 
 cdef class TradesForwarder(EventListener):
@@ -1,13 +1,10 @@
 # distutils: language=c++
 # distutils: sources=hummingbot/core/cpp/OrderBookEntry.cpp
 
-import warnings
-from decimal import Decimal
-from typing import Tuple
+import bisect
+from typing import Optional, Tuple
 
 import numpy as np
-from scipy.optimize import curve_fit
-from scipy.optimize import OptimizeWarning
 
 from hummingbot.core.data_type.common import (
     PriceType,
@@ -17,6 +14,90 @@ from hummingbot.core.event.event_listener cimport EventListener
 from hummingbot.core.event.events import OrderBookEvent
 from hummingbot.strategy.asset_price_delegate import AssetPriceDelegate
 
+# Amount used instead of zero fill amounts, to be able to calculate the log
+MIN_FILL_AMOUNT = 1e-10
+
+
+def fit_exponential_decay(price_levels: np.ndarray,
+                          amounts: np.ndarray,
+                          initial_kappa: float = 0.0,
+                          max_iterations: int = 50) -> Optional[Tuple[float, float]]:
+    """
+    Least squares fit of amounts = alpha * exp(-kappa * price_levels), with alpha and kappa positive.
+
+    For a given kappa the best alpha has a closed form, so only kappa is searched, with safeguarded Newton steps on the
+    log of the explained sum of squares. The search starts from the better of the closed form log-linear fit
+    (a regression of log(amounts) on the price levels) and the given initial kappa, usually the previous estimate.
+
+    :return: (alpha, kappa), or None when there are not enough distinct price levels to fit the curve
+    """
+    cdef:
+        double kappa
+        double step
+        double objective
+        double candidate_objective
+        int iteration
+
+    price_levels = np.asarray(price_levels, dtype=np.float64)
+    amounts = np.asarray(amounts, dtype=np.float64)
+    if price_levels.size < 2 or np.ptp(price_levels) == 0:
+        return None
+    # The fit does not depend on a shift of the price levels, shifting them to start at 0 avoids exp underflows
+    shifted_levels = price_levels - price_levels.min()
+    squared_levels = shifted_levels * shifted_levels
+
+    def sums(double k):
+        decay = np.exp(-k * shifted_levels)
+        weighted = amounts * decay
+        squared_decay = decay * decay
+        return (weighted.sum(), (shifted_levels * weighted).sum(), (squared_levels * weighted).sum(),
+                squared_decay.sum(), (shifted_levels * squared_decay).sum(), (squared_levels * squared_decay).sum())
+
+    def log_explained(double k) -> float:
+        decay = np.exp(-k * shifted_levels)
+        s1 = np.dot(amounts, decay)
+        return 2 * np.log(s1) - np.log(np.dot(decay, decay)) if s1 > 0 else -np.inf
+
+    centered_levels = shifted_levels - shifted_levels.mean()
+    log_amounts = np.log(amounts)
+    slope = np.dot(centered_levels, log_amounts - log_amounts.mean()) / np.dot(centered_levels, centered_levels)
+    kappa = max(0.0, -slope)
+    objective = log_explained(kappa)
+    if initial_kappa > 0:
+        candidate_objective = log_explained(initial_kappa)
+        if candidate_objective > objective:
+            kappa, objective = initial_kappa, candidate_objective
+
+    for iteration in range(max_iterations):
+        s1, s1_t, s1_tt, s2, s2_t, s2_tt = sums(kappa)
+        if s1 <= 0:
+            break
+        # First and second derivatives of log(s1(kappa)^2 / s2(kappa))
+        gradient = -2 * s1_t / s1 + 2 * s2_t / s2
+        curvature = 2 * (s1_tt / s1 - (s1_t / s1) ** 2) - 4 * (s2_tt / s2 - (s2_t / s2) ** 2)
+        if curvature < 0:
+            step = -gradient / curvature
+        else:
+            step = gradient / (abs(gradient) + 1) * (kappa + 1)
+        if kappa + step < 0:
+            step = -kappa
+        while abs(step) > 1e-15 * (1 + kappa):
+            candidate_objective = log_explained(kappa + step)
+            if candidate_objective >= objective:
+                break
+            step /= 2
+        else:
+            break
+        kappa += step
+        objective = candidate_objective
+        if abs(step) <= 1e-12 * (1 + kappa):
+            break
+
+    decay = np.exp(-kappa * shifted_levels)
+    alpha = np.dot(amounts, decay) / np.dot(decay, decay) * np.exp(kappa * price_levels.min())
+    return float(alpha), float(kappa)
+
+
 cdef class TradesForwarder(EventListener):
     def __init__(self, indicator: 'TradingIntensityIndicator'):
         self._indicator = indicator
@@ -26,6 +107,15 @@ cdef class TradesForwarder(EventListener):
 
 
 cdef class TradingIntensityIndicator:
+    """
+    Estimates the order book liquidity parameters alpha and kappa, fitting the amounts traded per price level (the
+    distance from the mid price before the trade) with alpha * exp(-kappa * price_level).
+
+    The amounts per price level are aggregated as trades come in and go out of the sampling window, and the curve is
+    only fitted again once they changed by more than REFIT_CHANGE_THRESHOLD of the total amount.
+    """
+
+    REFIT_CHANGE_THRESHOLD = 0.01
 
     def __init__(self, order_book: OrderBook, price_delegate: AssetPriceDelegate, sampling_length: int = 30):
         self._alpha = 0
@@ -39,8 +129,10 @@ cdef class TradingIntensityIndicator:
         self._sampling_length = sampling_length
         self._samples_length = 0
         self._last_quotes = []
-
-        warnings.simplefilter("ignore", OptimizeWarning)
+        self._level_amounts = {}
+        self._level_trade_counts = {}
+        self._total_amount = 0
+        self._changed_amount = 0
 
     @property
     def current_value(self) -> Tuple[float, float]:
@@ -84,18 +176,19 @@ cdef class TradingIntensityIndicator:
         self._last_quotes = [{'timestamp': timestamp, 'price': price}] + self._last_quotes
 
         latest_processed_quote_idx = None
-        for trade in self._current_trade_sample:
-            for i, quote in enumerate(self._last_quotes):
-                if quote["timestamp"] < trade.timestamp:
-                    if latest_processed_quote_idx is None or i < latest_processed_quote_idx:
-                        latest_processed_quote_idx = i
-                    trade = {"price_level": abs(trade.price - float(quote["price"])), "amount": trade.amount}
-
-                    if quote["timestamp"] + 1 not in self._trade_samples.keys():
-                        self._trade_samples[quote["timestamp"] + 1] = []
-
-                    self._trade_samples[quote["timestamp"] + 1] += [trade]
-                    break
+        if len(self._current_trade_sample) > 0:
+            # Negated timestamps are in ascending order, the quote of a trade is the first one older than the trade
+            negated_timestamps = [-quote["timestamp"] for quote in self._last_quotes]
+            for trade in self._current_trade_sample:
+                i = bisect.bisect_right(negated_timestamps, -trade.timestamp)
+                if i == len(self._last_quotes):
+                    continue
+                quote = self._last_quotes[i]
+                if latest_processed_quote_idx is None or i < latest_processed_quote_idx:
+                    latest_processed_quote_idx = i
+                self.c_add_trade_to_sample(quote["timestamp"] + 1,
+                                           abs(trade.price - float(quote["price"])),
+                                           trade.amount)
 
         # THere are no trades left to process
         self._current_trade_sample = []
@@ -103,19 +196,41 @@ cdef class TradingIntensityIndicator:
         if latest_processed_quote_idx is not None:
             self._last_quotes = self._last_quotes[0:latest_processed_quote_idx + 1]
 
-        if len(self._trade_samples.keys()) > self._sampling_length:
-            timestamps = list(self._trade_samples.keys())
-            timestamps.sort()
-            timestamps = timestamps[-self._sampling_length:]
-
-            trade_samples = {}
-            for timestamp in timestamps:
-                trade_samples[timestamp] = self._trade_samples[timestamp]
-            self._trade_samples = trade_samples
+        if len(self._trade_samples) > self._sampling_length:
+            timestamps = sorted(self._trade_samples.keys())
+            for timestamp in timestamps[:-self._sampling_length]:
+                self.c_remove_sample(timestamp)
 
         if self.is_sampling_buffer_full:
             self.c_estimate_intensity()
 
+    cdef c_add_trade_to_sample(self, object sample_timestamp, double price_level, double amount):
+        trades = self._trade_samples.get(sample_timestamp)
+        if trades is None:
+            trades = self._trade_samples[sample_timestamp] = []
+        trades.append({"price_level": price_level, "amount": amount})
+        self._level_amounts[price_level] = self._level_amounts.get(price_level, 0) + amount
+        self._level_trade_counts[price_level] = self._level_trade_counts.get(price_level, 0) + 1
+        self._total_amount += amount
+        self._changed_amount += abs(amount)
+
+    cdef c_remove_sample(self, object sample_timestamp):
+        for trade in self._trade_samples.pop(sample_timestamp):
+            price_level = trade["price_level"]
+            amount = trade["amount"]
+            trade_count = self._level_trade_counts[price_level] - 1
+            if trade_count == 0:
+                del self._level_amounts[price_level]
+                del self._level_trade_counts[price_level]
+            else:
+                self._level_amounts[price_level] -= amount
+                self._level_trade_counts[price_level] = trade_count
+            self._total_amount -= amount
+            self._changed_amount += abs(amount)
+        if len(self._trade_samples) == 0:
+            # Resets the rounding errors accumulated by the running total
+            self._total_amount = 0
+
     def register_trade(self, trade):
         """A helper method to be used in unit tests"""
         self.c_register_trade(trade)
@@ -124,43 +239,16 @@ cdef class TradingIntensityIndicator:
         self._current_trade_sample.append(trade)
 
     cdef c_estimate_intensity(self):
-        cdef:
-            dict trades_consolidated
-            list lambdas
-            list price_levels
-
-        # Calculate lambdas / trading intensities
-        lambdas = []
-
-        trades_consolidated = {}
-        price_levels = []
-        for timestamp in self._trade_samples.keys():
-            tick = self._trade_samples[timestamp]
-            for trade in tick:
-                if trade['price_level'] not in trades_consolidated.keys():
-                    trades_consolidated[trade['price_level']] = 0
-                    price_levels += [trade['price_level']]
-
-                trades_consolidated[trade['price_level']] += trade['amount']
-
-        price_levels = sorted(price_levels, reverse=True)
-
-        for price_level in price_levels:
-            lambdas += [trades_consolidated[price_level]]
+        if self._changed_amount <= self.REFIT_CHANGE_THRESHOLD * abs(self._total_amount):
+            return
 
+        price_levels = np.fromiter(self._level_amounts.keys(), dtype=np.float64, count=len(self._level_amounts))
+        amounts = np.fromiter(self._level_amounts.values(), dtype=np.float64, count=len(self._level_amounts))
         # Adjust to be able to calculate log
-        lambdas_adj = [10**-10 if x==0 else x for x in lambdas]
-
-        # Fit the probability density function; reuse previously calculated parameters as initial values
-        try:
-            params = curve_fit(lambda t, a, b: a*np.exp(-b*t),
-                               price_levels,
-                               lambdas_adj,
-                               p0=(self._alpha, self._kappa),
-                               method='dogbox',
-                               bounds=([0, 0], [np.inf, np.inf]))
-
-            self._kappa = Decimal(str(params[0][1]))
-            self._alpha = Decimal(str(params[0][0]))
-        except (RuntimeError, ValueError) as e:
-            pass
+        amounts[amounts <= 0] = MIN_FILL_AMOUNT
+
+        # Reuse the previously calculated kappa as initial value
+        params = fit_exponential_decay(price_levels, amounts, initial_kappa=self._kappa)
+        if params is not None:
+            self._alpha, self._kappa = params
+            self._changed_amount = 0
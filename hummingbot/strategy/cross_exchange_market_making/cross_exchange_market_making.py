@@ -387,6 +387,10 @@ class CrossExchangeMarketMakingStrategy(StrategyPyBase):
                 # Markets are ready, ok to proceed.
                 if LogOption.STATUS_REPORT:
                     self.logger().info("Markets are ready.")
+                # Taker books are queried for several sizes per tick, so let them binary search a depth index.
+                for market_pair in self._market_pairs.values():
+                    if not self.is_gateway_market(market_pair.taker):
+                        market_pair.taker.order_book.depth_index_enabled = True
 
         if not self._conversions_ready:
             for market_pair in self._market_pairs.values():
@@ -17,6 +17,7 @@ from hummingbot.connector.markets_recorder import MarketsRecorder
 from hummingbot.core.clock import Clock
 from hummingbot.core.data_type.common import MarketDict, PositionMode
 from hummingbot.data_feed.candles_feed.data_types import CandlesConfig
+from hummingbot.data_feed.candles_feed.candles_store import CandlesStore
 from hummingbot.data_feed.market_data_provider import MarketDataProvider
 from hummingbot.exceptions import InvalidController
 from hummingbot.remote_iface.mqtt import ETopicPublisher
@@ -62,6 +63,12 @@ class StrategyV2ConfigBase(BaseClientModel):
             "prompt_on_new": True,
         }
     )
+    store_historical_candles: bool = Field(
+        default=False,
+        json_schema_extra={
+            "prompt": "Do you want to keep the historical candles fetched on disk, shared with the backtests? (Yes/No): ",
+        }
+    )
 
     @field_validator("controllers_config", mode="before")
     @classmethod
@@ -170,6 +177,7 @@ class StrategyV2Base(ScriptStrategyBase):
     closed_executors_buffer: int = 100
     max_executors_close_attempts: int = 10
     config_update_interval: int = 10
+    performance_publish_interval: float = 10
 
     @classmethod
     def init_markets(cls, config: StrategyV2ConfigBase):
@@ -192,7 +200,8 @@ class StrategyV2Base(ScriptStrategyBase):
         self.controller_reports: Dict[str, Dict] = {}
 
         # Initialize the market data provider and executor orchestrator
-        self.market_data_provider = MarketDataProvider(connectors)
+        candles_store = CandlesStore() if config.store_historical_candles else None
+        self.market_data_provider = MarketDataProvider(connectors, candles_store=candles_store)
         self.market_data_provider.initialize_candles_feed_list(config.candles_config)
 
         # Initialize the controllers
@@ -208,6 +217,10 @@ class StrategyV2Base(ScriptStrategyBase):
         )
         self.mqtt_enabled = False
         self._pub: Optional[ETopicPublisher] = None
+        # Version of the orchestrator reports last published, the performance is published only when it changes
+        # and at most once every performance_publish_interval seconds
+        self._published_reports_version: Optional[int] = None
+        self._last_performance_publish_ts: float = 0
 
     def start(self, clock: Clock, timestamp: float) -> None:
         """
@@ -313,9 +326,27 @@ class StrategyV2Base(ScriptStrategyBase):
                 controller.executors_info = controller_report.get("executors", [])
                 controller.positions_held = controller_report.get("positions", [])
                 controller.executors_update_event.set()
+            if self._pub is not None:
+                self.publish_performance_reports()
         except Exception as e:
             self.logger().error(f"Error updating controller reports: {e}", exc_info=True)
 
+    def publish_performance_reports(self):
+        """
+        Publish the performance reports of the controllers over MQTT, if they changed since the last publication and
+        at least performance_publish_interval seconds passed since then. The unrealized PnL of the positions held moves
+        with the mid price, so the reports change on most ticks.
+        """
+        if self.current_timestamp < self._last_performance_publish_ts + self.performance_publish_interval:
+            return
+        reports_version, reports = self.executor_orchestrator.get_reports_snapshot()
+        if reports_version == self._published_reports_version:
+            return
+        self._pub({controller_id: report["performance"].model_dump(mode="json")
+                   for controller_id, report in reports.items() if controller_id in self.controllers})
+        self._published_reports_version = reports_version
+        self._last_performance_publish_ts = self.current_timestamp
+
     @staticmethod
     def is_perpetual(connector: str) -> bool:
         return "perpetual" in connector
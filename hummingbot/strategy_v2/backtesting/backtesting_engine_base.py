@@ -1,8 +1,9 @@
+import heapq
 import importlib
 import inspect
 import os
 from decimal import Decimal
-from typing import Dict, List, Optional, Type, Union
+from typing import Dict, List, Optional, Tuple, Type, Union
 
 import numpy as np
 import pandas as pd
@@ -15,14 +16,19 @@ from hummingbot.exceptions import InvalidController
 from hummingbot.strategy_v2.backtesting.backtesting_data_provider import BacktestingDataProvider
 from hummingbot.strategy_v2.backtesting.executor_simulator_base import ExecutorSimulation
 from hummingbot.strategy_v2.backtesting.executors_simulator.dca_executor_simulator import DCAExecutorSimulator
+from hummingbot.strategy_v2.backtesting.executors_simulator.grid_executor_simulator import GridExecutorSimulator
 from hummingbot.strategy_v2.backtesting.executors_simulator.position_executor_simulator import PositionExecutorSimulator
+from hummingbot.strategy_v2.backtesting.executors_simulator.xemm_executor_simulator import XEMMExecutorSimulator
 from hummingbot.strategy_v2.controllers.controller_base import ControllerBase, ControllerConfigBase
 from hummingbot.strategy_v2.controllers.directional_trading_controller_base import (
     DirectionalTradingControllerConfigBase,
 )
 from hummingbot.strategy_v2.controllers.market_making_controller_base import MarketMakingControllerConfigBase
+from hummingbot.strategy_v2.executors.data_types import ConnectorPair
 from hummingbot.strategy_v2.executors.dca_executor.data_types import DCAExecutorConfig
+from hummingbot.strategy_v2.executors.grid_executor.data_types import GridExecutorConfig
 from hummingbot.strategy_v2.executors.position_executor.data_types import PositionExecutorConfig
+from hummingbot.strategy_v2.executors.xemm_executor.data_types import XEMMExecutorConfig
 from hummingbot.strategy_v2.models.base import RunnableStatus
 from hummingbot.strategy_v2.models.executor_actions import CreateExecutorAction, StopExecutorAction
 from hummingbot.strategy_v2.models.executors import CloseType
@@ -38,6 +44,10 @@ class BacktestingEngineBase:
         self.backtesting_data_provider = BacktestingDataProvider(connectors={})
         self.position_executor_simulator = PositionExecutorSimulator()
         self.dca_executor_simulator = DCAExecutorSimulator()
+        self.grid_executor_simulator = GridExecutorSimulator()
+        self.xemm_executor_simulator = XEMMExecutorSimulator()
+        # Candles of the markets of the XEMM executors, aligned to the backtesting candles
+        self.xemm_market_data: Dict[Tuple[ConnectorPair, ConnectorPair], pd.DataFrame] = {}
 
     @classmethod
     def load_controller_config(cls,
@@ -83,23 +93,43 @@ class BacktestingEngineBase:
                               controller_config: ControllerConfigBase,
                               start: int, end: int,
                               backtesting_resolution: str = "1m",
-                              trade_cost=0.0006):
-        controller_class = self.__controller_class_cache.get_or_add(controller_config.controller_name, controller_config.get_controller_class)
-        # controller_class = controller_config.get_controller_class()
+                              trade_cost=0.0006,
+                              vectorized: bool = True,
+                              max_loss_quote: Optional[float] = None):
         # Load historical candles
-        self.backtesting_data_provider.update_backtesting_time(start, end)
         await self.backtesting_data_provider.initialize_trading_rules(controller_config.connector_name)
+        self.initialize_controller(controller_config, start, end, backtesting_resolution)
+        await self.initialize_backtesting_data_provider()
+        return await self.backtest(trade_cost=trade_cost, vectorized=vectorized, max_loss_quote=max_loss_quote)
+
+    def initialize_controller(self,
+                              controller_config: ControllerConfigBase,
+                              start: int, end: int,
+                              backtesting_resolution: str = "1m"):
+        controller_class = self.__controller_class_cache.get_or_add(controller_config.controller_name, controller_config.get_controller_class)
+        self.backtesting_data_provider.update_backtesting_time(start, end)
         self.controller = controller_class(config=controller_config, market_data_provider=self.backtesting_data_provider,
                                            actions_queue=None)
         self.backtesting_resolution = backtesting_resolution
-        await self.initialize_backtesting_data_provider()
+
+    async def backtest(self, trade_cost=0.0006, vectorized: bool = True, max_loss_quote: Optional[float] = None):
+        """
+        Backtests the controller on the market data already loaded in the backtesting data provider.
+
+        Args:
+            trade_cost (float): The cost per trade.
+            vectorized (bool): Whether to skip the rows at which the controller can't take actions.
+            max_loss_quote (Optional[float]): The net loss at which the backtesting is abandoned, if any.
+        """
         await self.controller.update_processed_data()
-        executors_info = await self.simulate_execution(trade_cost=trade_cost)
-        results = self.summarize_results(executors_info, controller_config.total_amount_quote)
+        executors_info = await self.simulate_execution(trade_cost=trade_cost, vectorized=vectorized,
+                                                       max_loss_quote=max_loss_quote)
+        results = self.summarize_results(executors_info, self.controller.config.total_amount_quote)
         return {
             "executors": executors_info,
             "results": results,
             "processed_data": self.controller.processed_data,
+            "abandoned": self.abandoned,
         }
 
     async def initialize_backtesting_data_provider(self):
@@ -112,36 +142,104 @@ class BacktestingEngineBase:
         for config in self.controller.config.candles_config:
             await self.controller.market_data_provider.initialize_candles_feed(config)
 
-    async def simulate_execution(self, trade_cost: float) -> list:
+    async def simulate_execution(self, trade_cost: float, vectorized: bool = True,
+                                 max_loss_quote: Optional[float] = None) -> list:
         """
         Simulates market making strategy over historical data, considering trading costs.
 
+        In vectorized mode, when the controller tells at which rows it can take actions (see
+        ControllerBase.backtesting_event_mask), only those rows and the rows at which executors stop are visited. The
+        results are the same as when visiting every row.
+
+        With max_loss_quote, the simulation is abandoned at the first row visited at which the net pnl of the executors,
+        stopped and active, is a loss of max_loss_quote or more.
+
         Args:
             trade_cost (float): The cost per trade.
+            vectorized (bool): Whether to skip the rows at which the controller can't take actions.
+            max_loss_quote (Optional[float]): The net loss at which the simulation is abandoned, if any.
 
         Returns:
             List[ExecutorInfo]: List of executor information objects detailing the simulation results.
         """
         processed_features = self.prepare_market_data()
+        self.xemm_market_data = {}
         self.active_executor_simulations: List[ExecutorSimulation] = []
         self.stopped_executors_info: List[ExecutorInfo] = []
-        for i, row in processed_features.iterrows():
+        self.active_executors_info: List[ExecutorInfo] = []
+        self.realized_net_pnl_quote = 0.0
+        self.abandoned = False
+        # The rows are built from the columns only when visited, with Python values for the numeric columns
+        columns = [(column, processed_features[column].to_numpy()) for column in processed_features.columns]
+        numeric_columns = [(column, values, values.dtype.kind in "biuf") for column, values in columns]
+        rows_count = len(processed_features)
+
+        def row_at(position: int) -> dict:
+            return {column: values[position].item() if is_numeric else values[position]
+                    for column, values, is_numeric in numeric_columns}
+
+        event_mask = self.controller.backtesting_event_mask(processed_features) if vectorized else None
+        if event_mask is None:
+            for position in range(rows_count):
+                row = row_at(position)
+                await self.update_state(row)
+                if self.max_loss_reached(max_loss_quote, row["timestamp"]):
+                    break
+                self.execute_actions(processed_features, position, row, trade_cost)
+            return self.controller.executors_info
+
+        # Rows at which an executor is seen as stopped for the first time, as when visiting every row
+        timestamps = processed_features["timestamp"].to_numpy(dtype=float)
+        stop_positions = []
+        event_positions = np.flatnonzero(event_mask).tolist()
+        event_index = 0
+        position = -1
+        while event_index < len(event_positions) or len(stop_positions) > 0:
+            next_event = event_positions[event_index] if event_index < len(event_positions) else rows_count
+            position = min(next_event, stop_positions[0]) if len(stop_positions) > 0 else next_event
+            while len(stop_positions) > 0 and stop_positions[0] == position:
+                heapq.heappop(stop_positions)
+            row = row_at(position)
             await self.update_state(row)
-            for action in self.controller.determine_executor_actions():
-                if isinstance(action, CreateExecutorAction):
-                    executor_simulation = self.simulate_executor(action.executor_config, processed_features.loc[i:], trade_cost)
-                    if executor_simulation is not None and executor_simulation.close_type != CloseType.FAILED:
-                        self.manage_active_executors(executor_simulation)
-                elif isinstance(action, StopExecutorAction):
-                    self.handle_stop_action(action, row["timestamp"])
-
+            if self.max_loss_reached(max_loss_quote, row["timestamp"]):
+                return self.controller.executors_info
+            if position == next_event:
+                event_index += 1
+                for simulation in self.execute_actions(processed_features, position, row, trade_cost):
+                    stop_timestamp = simulation.executor_simulation.index[-1]
+                    stop_position = max(position + 1, int(np.searchsorted(timestamps, stop_timestamp, side="left")))
+                    if stop_position < rows_count:
+                        heapq.heappush(stop_positions, stop_position)
+        if position < rows_count - 1:
+            await self.update_state(row_at(rows_count - 1))
         return self.controller.executors_info
 
-    async def update_state(self, row):
+    def execute_actions(self, processed_features: pd.DataFrame, position: int, row: dict,
+                        trade_cost: float) -> List[ExecutorSimulation]:
+        """
+        Simulates the actions determined by the controller at a row of the market data.
+
+        Returns:
+            List[ExecutorSimulation]: The simulations of the executors created.
+        """
+        simulations = []
+        for action in self.controller.determine_executor_actions():
+            if isinstance(action, CreateExecutorAction):
+                executor_simulation = self.simulate_executor(action.executor_config,
+                                                             processed_features.iloc[position:], trade_cost)
+                if executor_simulation is not None and executor_simulation.close_type != CloseType.FAILED:
+                    self.manage_active_executors(executor_simulation)
+                    if not executor_simulation.executor_simulation.empty:
+                        simulations.append(executor_simulation)
+            elif isinstance(action, StopExecutorAction):
+                self.handle_stop_action(action, row["timestamp"])
+        return simulations
+
+    async def update_state(self, row: dict):
         key = f"{self.controller.config.connector_name}_{self.controller.config.trading_pair}"
         self.controller.market_data_provider.prices = {key: Decimal(row["close_bt"])}
         self.controller.market_data_provider._time = row["timestamp"]
-        self.controller.processed_data.update(row.to_dict())
+        self.controller.processed_data.update(row)
         self.update_executors_info(row["timestamp"])
 
     def update_executors_info(self, timestamp: float):
@@ -151,12 +249,36 @@ class BacktestingEngineBase:
             executor_info = executor.get_executor_info_at_timestamp(timestamp)
             if executor_info.status == RunnableStatus.TERMINATED:
                 self.stopped_executors_info.append(executor_info)
+                self.realized_net_pnl_quote += float(executor_info.net_pnl_quote)
                 simulations_to_remove.append(executor.config.id)
             else:
                 active_executors_info.append(executor_info)
         self.active_executor_simulations = [es for es in self.active_executor_simulations if es.config.id not in simulations_to_remove]
+        self.active_executors_info = active_executors_info
         self.controller.executors_info = active_executors_info + self.stopped_executors_info
 
+    def max_loss_reached(self, max_loss_quote: Optional[float], timestamp: float) -> bool:
+        """
+        Whether the net pnl of the stopped and active executors is a loss of max_loss_quote or more, in which case the
+        simulation is abandoned and the active executors are stopped.
+        """
+        if max_loss_quote is None:
+            return False
+        net_pnl_quote = self.realized_net_pnl_quote + sum(float(executor_info.net_pnl_quote)
+                                                          for executor_info in self.active_executors_info)
+        self.abandoned = net_pnl_quote <= -max_loss_quote
+        if self.abandoned:
+            for executor_info in self.active_executors_info:
+                executor_info.status = RunnableStatus.TERMINATED
+                executor_info.close_type = CloseType.EARLY_STOP
+                executor_info.is_active = False
+                executor_info.close_timestamp = timestamp
+                self.stopped_executors_info.append(executor_info)
+            self.active_executor_simulations = []
+            self.active_executors_info = []
+            self.controller.executors_info = self.stopped_executors_info
+        return self.abandoned
+
     async def update_processed_data(self, row: pd.Series):
         """
         Updates processed data in the controller with the current price and timestamp.
@@ -200,7 +322,10 @@ class BacktestingEngineBase:
         self.controller.processed_data["features"] = backtesting_candles
         return backtesting_candles
 
-    def simulate_executor(self, config: Union[PositionExecutorConfig, DCAExecutorConfig], df: pd.DataFrame,
+    def simulate_executor(self,
+                          config: Union[PositionExecutorConfig, DCAExecutorConfig, GridExecutorConfig,
+                                        XEMMExecutorConfig],
+                          df: pd.DataFrame,
                           trade_cost: float) -> Optional[ExecutorSimulation]:
         """
         Simulates the execution of a trading strategy given a configuration.
@@ -217,8 +342,37 @@ class BacktestingEngineBase:
             return self.dca_executor_simulator.simulate(df, config, trade_cost)
         elif isinstance(config, PositionExecutorConfig):
             return self.position_executor_simulator.simulate(df, config, trade_cost)
+        elif isinstance(config, GridExecutorConfig):
+            return self.grid_executor_simulator.simulate(df, config, trade_cost)
+        elif isinstance(config, XEMMExecutorConfig):
+            return self.xemm_executor_simulator.simulate(self.get_xemm_market_data(config, df), config, trade_cost)
         return None
 
+    def get_xemm_market_data(self, config: XEMMExecutorConfig, df: pd.DataFrame) -> pd.DataFrame:
+        """
+        The candles of the buying and selling markets of an XEMM executor, aligned to the backtesting candles of df. The
+        candles of both markets must be in the candles config of the controller.
+
+        Returns:
+            pd.DataFrame: The timestamp and the high, low and close of each market, prefixed by buying_ and selling_.
+        """
+        key = (config.buying_market, config.selling_market)
+        if key not in self.xemm_market_data:
+            features = self.controller.processed_data["features"]
+            market_data = features[["timestamp"]].astype(float).reset_index(drop=True)
+            for prefix, market in (("buying", config.buying_market), ("selling", config.selling_market)):
+                candles = self.controller.market_data_provider.get_candles_df(
+                    connector_name=market.connector_name,
+                    trading_pair=market.trading_pair,
+                    interval=self.backtesting_resolution
+                )[["timestamp", "high", "low", "close"]].astype(float).sort_values("timestamp").add_prefix(f"{prefix}_")
+                market_data = pd.merge_asof(market_data, candles, left_on="timestamp",
+                                            right_on=f"{prefix}_timestamp", direction="backward")
+            market_data.index = features.index
+            self.xemm_market_data[key] = market_data
+        market_data = self.xemm_market_data[key]
+        return market_data.iloc[market_data.index.searchsorted(df.index[0]):]
+
     def manage_active_executors(self, simulation: ExecutorSimulation):
         """
         Manages the list of active executors based on the simulation results.
@@ -247,6 +401,7 @@ class BacktestingEngineBase:
                 executor_info.is_active = False
                 executor_info.close_timestamp = timestamp
                 self.stopped_executors_info.append(executor_info)
+                self.realized_net_pnl_quote += float(executor_info.net_pnl_quote)
                 self.active_executor_simulations.remove(executor)
 
     @staticmethod
@@ -0,0 +1,176 @@
+import asyncio
+import functools
+import itertools
+import logging
+import multiprocessing
+import traceback
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing.shared_memory import SharedMemory
+from typing import AsyncIterator, Dict, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from hummingbot.client import settings
+from hummingbot.logger import HummingbotLogger
+from hummingbot.strategy_v2.backtesting.backtesting_engine_base import BacktestingEngineBase
+
+# Name, shape and columns of the shared memory block of each candles feed
+SharedCandlesFeeds = Dict[str, Tuple[str, Tuple[int, int], List[str]]]
+
+# State of the worker processes, set by _initialize_worker
+_worker_engine: Optional[BacktestingEngineBase] = None
+_worker_controllers_module: Optional[str] = None
+_worker_shared_memory: List[SharedMemory] = []
+
+
+def _initialize_worker(shared_candles_feeds: SharedCandlesFeeds, trading_rules: Dict, controllers_module: str):
+    global _worker_engine, _worker_controllers_module
+    _worker_engine = BacktestingEngineBase()
+    _worker_controllers_module = controllers_module
+    data_provider = _worker_engine.backtesting_data_provider
+    data_provider.trading_rules = trading_rules
+    # The prices of the backtests come from the candles, the workers don't start the task updating the live rates
+    data_provider.initialize_rate_sources = lambda connector_pairs: None
+    for key, (name, shape, columns) in shared_candles_feeds.items():
+        shared_memory = SharedMemory(name=name)
+        _worker_shared_memory.append(shared_memory)
+        values = np.ndarray(shape, dtype=np.float64, buffer=shared_memory.buf)
+        values.flags.writeable = False
+        data_provider.candles_feeds[key] = pd.DataFrame(values, columns=columns, copy=False)
+
+
+async def _backtest(config: Dict, start: int, end: int, backtesting_resolution: str, trade_cost: float,
+                    max_loss_quote: Optional[float]) -> Dict:
+    controller_config = BacktestingEngineBase.get_controller_config_instance_from_dict(
+        config, _worker_controllers_module)
+    _worker_engine.initialize_controller(controller_config, start, end, backtesting_resolution)
+    return await _worker_engine.backtest(trade_cost=trade_cost, max_loss_quote=max_loss_quote)
+
+
+def _run_backtesting(config: Dict, start: int, end: int, backtesting_resolution: str, trade_cost: float,
+                     max_loss_quote: Optional[float]) -> Dict:
+    try:
+        backtesting_result = asyncio.run(_backtest(config, start, end, backtesting_resolution, trade_cost,
+                                                   max_loss_quote))
+    except Exception:
+        # A configuration that fails is reported with its error, the other backtests of the sweep go on
+        return {"config": config, "results": None, "abandoned": False, "error": traceback.format_exc()}
+    return {
+        "config": config,
+        "results": backtesting_result["results"],
+        "abandoned": backtesting_result["abandoned"],
+        "error": None,
+    }
+
+
+class BacktestingSweep:
+    """
+    Backtests many configurations of controllers across the cores of the machine.
+
+    The market data of all the configurations is loaded once, in the backtesting data provider of backtesting_engine
+    (from the candles store, or preloaded in it), and shared with the worker processes in shared memory. Each worker
+    backtests configurations with its own engine, and the results are streamed as the backtests finish. A configuration
+    that fails does not stop the sweep, its row carries the error instead of the results.
+    """
+    _logger: Optional[HummingbotLogger] = None
+
+    @classmethod
+    def logger(cls) -> HummingbotLogger:
+        if cls._logger is None:
+            cls._logger = logging.getLogger(__name__)
+        return cls._logger
+
+    def __init__(self,
+                 max_workers: Optional[int] = None,
+                 controllers_module: str = settings.CONTROLLERS_MODULE,
+                 backtesting_engine: Optional[BacktestingEngineBase] = None):
+        self.max_workers = max_workers
+        self.controllers_module = controllers_module
+        self.backtesting_engine = backtesting_engine or BacktestingEngineBase()
+
+    @staticmethod
+    def config_grid(base_config: Dict, parameters: Dict[str, List]) -> List[Dict]:
+        """
+        The configurations of the cartesian product of the values of the parameters, each one with its own id.
+
+        Args:
+            base_config (Dict): The configuration shared by all the configurations.
+            parameters (Dict[str, List]): The values of each parameter swept.
+        """
+        configs = []
+        for index, values in enumerate(itertools.product(*parameters.values())):
+            config = {**base_config, **dict(zip(parameters.keys(), values))}
+            config["id"] = f"{base_config.get('id', config['controller_name'])}_{index}"
+            configs.append(config)
+        return configs
+
+    async def load_market_data(self, configs: List[Dict], start: int, end: int, backtesting_resolution: str = "1m"):
+        """
+        Loads the trading rules and the candles of all the configurations in the backtesting data provider. The
+        configurations that are not valid are skipped, their error is reported by the sweep.
+        """
+        data_provider = self.backtesting_engine.backtesting_data_provider
+        for config in configs:
+            try:
+                controller_config = BacktestingEngineBase.get_controller_config_instance_from_dict(
+                    config, self.controllers_module)
+            except Exception:
+                self.logger().warning(f"Invalid backtesting configuration {config.get('id')}.", exc_info=True)
+                continue
+            await data_provider.initialize_trading_rules(controller_config.connector_name)
+            self.backtesting_engine.initialize_controller(controller_config, start, end, backtesting_resolution)
+            await self.backtesting_engine.initialize_backtesting_data_provider()
+
+    async def run(self,
+                  configs: List[Dict],
+                  start: int, end: int,
+                  backtesting_resolution: str = "1m",
+                  trade_cost: float = 0.0006,
+                  max_loss_quote: Optional[float] = None) -> AsyncIterator[Dict]:
+        """
+        Backtests the configurations in the worker processes.
+
+        Args:
+            configs (List[Dict]): The configurations of the controllers, as accepted by
+                BacktestingEngineBase.get_controller_config_instance_from_dict.
+            max_loss_quote (Optional[float]): The net loss at which the backtesting of a configuration is abandoned, if
+                any. The results of an abandoned configuration are the ones up to the loss.
+
+        Yields:
+            Dict: The configuration, the results of BacktestingEngineBase.summarize_results, whether the backtesting
+            was abandoned and the error of the configurations that failed (None otherwise), in the order in which the
+            backtests finish.
+        """
+        await self.load_market_data(configs, start, end, backtesting_resolution)
+        data_provider = self.backtesting_engine.backtesting_data_provider
+        shared_memories = []
+        shared_candles_feeds = {}
+        loop = asyncio.get_running_loop()
+        try:
+            for key, candles_df in data_provider.candles_feeds.items():
+                values = candles_df.to_numpy(dtype=np.float64)
+                shared_memory = SharedMemory(create=True, size=max(values.nbytes, 1))
+                shared_memories.append(shared_memory)
+                np.ndarray(values.shape, dtype=np.float64, buffer=shared_memory.buf)[:] = values
+                shared_candles_feeds[key] = (shared_memory.name, values.shape, list(candles_df.columns))
+
+            # The workers are spawned, they don't inherit the event loop and the threads of this process
+            pool = ProcessPoolExecutor(max_workers=self.max_workers, mp_context=multiprocessing.get_context("spawn"),
+                                       initializer=_initialize_worker,
+                                       initargs=(shared_candles_feeds, data_provider.trading_rules,
+                                                 self.controllers_module))
+            tasks = [loop.run_in_executor(pool, _run_backtesting, config, start, end, backtesting_resolution,
+                                          trade_cost, max_loss_quote) for config in configs]
+            try:
+                for task in asyncio.as_completed(tasks):
+                    yield await task
+            finally:
+                for task in tasks:
+                    task.cancel()
+                # Waits for the running backtests to stop without blocking the event loop
+                await loop.run_in_executor(None, functools.partial(pool.shutdown, wait=True, cancel_futures=True))
+        finally:
+            for shared_memory in shared_memories:
+                shared_memory.close()
+                shared_memory.unlink()
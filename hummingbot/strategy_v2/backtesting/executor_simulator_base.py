@@ -1,21 +1,39 @@
 from decimal import Decimal
-from typing import Union
+from typing import Callable, Dict, Optional, Union
 
+import numpy as np
 import pandas as pd
-from pydantic import BaseModel, ConfigDict, field_validator
+from pydantic import BaseModel, ConfigDict, PrivateAttr, field_validator
 
 from hummingbot.strategy_v2.executors.dca_executor.data_types import DCAExecutorConfig
+from hummingbot.strategy_v2.executors.grid_executor.data_types import GridExecutorConfig
 from hummingbot.strategy_v2.executors.position_executor.data_types import PositionExecutorConfig
+from hummingbot.strategy_v2.executors.xemm_executor.data_types import XEMMExecutorConfig
 from hummingbot.strategy_v2.models.base import RunnableStatus
 from hummingbot.strategy_v2.models.executors import CloseType
 from hummingbot.strategy_v2.models.executors_info import ExecutorInfo
 
 
+class SimulationArrays:
+    """
+    The index and columns of the DataFrame of a simulation as arrays.
+    """
+
+    def __init__(self, timestamps: np.ndarray, columns: Dict[str, np.ndarray]):
+        self.timestamps = timestamps
+        self.columns = columns
+
+
+SimulatedExecutorConfig = Union[PositionExecutorConfig, DCAExecutorConfig, GridExecutorConfig, XEMMExecutorConfig]
+
+
 class ExecutorSimulation(BaseModel):
-    config: Union[PositionExecutorConfig, DCAExecutorConfig]
+    config: SimulatedExecutorConfig
     executor_simulation: pd.DataFrame
     close_type: CloseType
     model_config = ConfigDict(arbitrary_types_allowed=True)
+    # Columns of the simulation as arrays, to look up the state at a timestamp without building rows
+    _arrays: Optional["SimulationArrays"] = PrivateAttr(default=None)
 
     @field_validator('executor_simulation', mode="before")
     @classmethod
@@ -24,23 +42,37 @@ class ExecutorSimulation(BaseModel):
             raise ValueError("executor_simulation must be a pandas DataFrame")
         return v
 
+    @classmethod
+    def from_arrays(cls, config: SimulatedExecutorConfig, index: pd.Index,
+                    columns: Dict[str, np.ndarray], close_type: CloseType) -> "ExecutorSimulation":
+        """
+        Creates the simulation from the columns of its DataFrame, that are kept to look up the executor info.
+        """
+        simulation = cls(config=config, executor_simulation=pd.DataFrame(columns, index=index, copy=False),
+                         close_type=close_type)
+        simulation._arrays = SimulationArrays(index.to_numpy(), columns)
+        return simulation
+
     def get_executor_info_at_timestamp(self, timestamp: float) -> ExecutorInfo:
-        # Initialize tracking of last lookup
-        if not hasattr(self, '_max_timestamp'):
-            self._max_timestamp = self.executor_simulation.index.max()
+        if self._arrays is None:
+            self._arrays = SimulationArrays(
+                self.executor_simulation.index.to_numpy(),
+                {column: self.executor_simulation[column].to_numpy() for column in self.executor_simulation.columns})
+        timestamps = self._arrays.timestamps
 
-        pos = self.executor_simulation.index.searchsorted(timestamp, side='right') - 1
+        pos = int(np.searchsorted(timestamps, timestamp, side='right')) - 1
         if pos < 0:
             # Very rare.
             return self._empty_executor_info()
 
-        last_entry = self.executor_simulation.iloc[pos]
-        is_active = last_entry.name < self._max_timestamp
+        last_entry = {column: values[pos] for column, values in self._arrays.columns.items()}
+        entry_timestamp = timestamps[pos]
+        is_active = bool(entry_timestamp < timestamps[-1])
         return ExecutorInfo(
             id=self.config.id,
             timestamp=self.config.timestamp,
             type=self.config.type,
-            close_timestamp=None if is_active else float(last_entry.name),
+            close_timestamp=None if is_active else float(entry_timestamp),
             close_type=None if is_active else self.close_type,
             status=RunnableStatus.RUNNING if is_active else RunnableStatus.TERMINATED,
             config=self.config,
@@ -49,7 +81,7 @@ class ExecutorSimulation(BaseModel):
             cum_fees_quote=Decimal(last_entry['cum_fees_quote']),
             filled_amount_quote=Decimal(last_entry['filled_amount_quote']),
             is_active=is_active,
-            is_trading=last_entry['filled_amount_quote'] > 0 and is_active,
+            is_trading=bool(last_entry['filled_amount_quote'] > 0) and is_active,
             custom_info=self.get_custom_info(last_entry)
         )
 
@@ -70,16 +102,39 @@ class ExecutorSimulation(BaseModel):
             custom_info={}
         )
 
-    def get_custom_info(self, last_entry: pd.Series) -> dict:
+    def get_custom_info(self, last_entry: Dict[str, float]) -> dict:
         current_position_average_price = last_entry['current_position_average_price'] if "current_position_average_price" in last_entry else None
+        if isinstance(self.config, XEMMExecutorConfig):
+            level_id, side = None, self.config.maker_side
+        else:
+            level_id, side = self.config.level_id, self.config.side
         return {
             "close_price": last_entry['close'],
-            "level_id": self.config.level_id,
-            "side": self.config.side,
+            "level_id": level_id,
+            "side": side,
             "current_position_average_price": current_position_average_price
         }
 
 
+def first_index(condition: Callable[[int, int], np.ndarray], start: int, stop: int,
+                initial_window: int = 256) -> Optional[int]:
+    """
+    Index of the first candle between start and stop for which the condition is True, None if there is none.
+    The condition is evaluated on windows of candles of doubling size, so that the cost depends on the index found
+    rather than on the number of candles left.
+    :param condition: returns the condition of the candles between the two indexes as a boolean array
+    """
+    window = initial_window
+    while start < stop:
+        window_stop = min(start + window, stop)
+        hits = condition(start, window_stop)
+        if hits.any():
+            return start + int(np.argmax(hits))
+        start = window_stop
+        window *= 2
+    return None
+
+
 class ExecutorSimulatorBase:
     """Base class for trading simulators."""
 
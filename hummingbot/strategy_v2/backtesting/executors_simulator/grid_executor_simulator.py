@@ -0,0 +1,398 @@
+from typing import Dict, List, Optional, Set, Tuple
+
+import numpy as np
+import pandas as pd
+
+from hummingbot.core.data_type.common import TradeType
+from hummingbot.strategy_v2.backtesting.executor_simulator_base import (
+    ExecutorSimulation,
+    ExecutorSimulatorBase,
+    first_index,
+)
+from hummingbot.strategy_v2.executors.grid_executor.data_types import GridExecutorConfig, GridLevelStates
+from hummingbot.strategy_v2.models.executors import CloseType
+from hummingbot.strategy_v2.utils.distributions import Distributions
+
+# Candles searched first for the next event of a level or a barrier, doubled until one is found
+INITIAL_WINDOW = 256
+FILL = "fill"
+CANCEL = "cancel"
+PLACE_CLOSE = "place_close"
+
+
+class SimulatedGridLevel:
+    """
+    State of a grid level during the simulation, with the next event of its orders.
+    """
+
+    def __init__(self, position: int, price: float, amount_quote: float, take_profit: float):
+        self.position = position
+        self.price = price
+        self.amount_quote = amount_quote
+        self.take_profit = take_profit
+        self.state = GridLevelStates.NOT_ACTIVE
+        self.order_price = 0.0
+        self.amount_base = 0.0
+        self.entry_price = 0.0
+        self.open_fees_quote = 0.0
+        # Index of the next event and its kind, None if the candles before next_index have no event
+        self.next_index: Optional[int] = None
+        self.next_kind: Optional[str] = None
+        self.search_window = INITIAL_WINDOW
+
+
+class GridSimulation:
+    """
+    Simulation of a grid executor from event to event. The events are the fills and cancels of the orders and the
+    candles at which orders can be placed. Between two events the position doesn't change and the barriers are evaluated
+    with NumPy on all the candles at once.
+
+    At each candle, the orders are filled when the low (buy) or the high (sell) crosses their price, then the barriers
+    are evaluated and the orders are placed and cancelled at the close price, as in GridExecutor.control_task.
+    """
+
+    def __init__(self, df: pd.DataFrame, config: GridExecutorConfig, trade_cost: float):
+        self.df = df
+        self.config = config
+        self.trade_cost = trade_cost
+        self.timestamps = df["timestamp"].to_numpy(dtype=float)
+        self.high = df["high"].to_numpy(dtype=float)
+        self.low = df["low"].to_numpy(dtype=float)
+        self.close = df["close"].to_numpy(dtype=float)
+        self.length = len(df)
+        self.is_buy = config.side == TradeType.BUY
+        self.side_multiplier = 1 if self.is_buy else -1
+        self.activation_bounds = float(config.activation_bounds) if config.activation_bounds else None
+        self.safe_extra_spread = float(config.safe_extra_spread)
+        triple_barrier_config = config.triple_barrier_config
+        self.end_time = config.timestamp + triple_barrier_config.time_limit if triple_barrier_config.time_limit else None
+        self.levels = self.generate_levels(config)
+        self.levels_by_state: Dict[GridLevelStates, Set[SimulatedGridLevel]] = {state: set() for state in GridLevelStates}
+        self.levels_by_state[GridLevelStates.NOT_ACTIVE].update(self.levels)
+        # Levels which state changed, to search their next event
+        self.levels_to_search: List[SimulatedGridLevel] = []
+
+        self.position_base = 0.0
+        self.position_cost_quote = 0.0
+        self.position_fees_quote = 0.0
+        self.filled_levels = 0
+        # Changes of the position and of the realized metrics by candle: index, filled levels, base, cost, fees of the
+        # position, realized pnl, realized volume and realized fees
+        self.changes: List[Tuple[int, int, float, float, float, float, float, float]] = []
+        self.last_open_creation_timestamp = 0.0
+        self.trailing_stop_trigger: Optional[float] = None
+
+    @staticmethod
+    def generate_levels(config: GridExecutorConfig) -> List[SimulatedGridLevel]:
+        """
+        The levels of GridExecutor._generate_grid_levels, without the trading rules of the exchange.
+        """
+        min_quote_amount = float(config.min_order_amount_quote) * 1.05
+        grid_range = float((config.end_price - config.start_price) / config.start_price)
+        max_possible_levels = int(float(config.total_amount_quote) / min_quote_amount)
+        if max_possible_levels == 0:
+            n_levels, amount_quote = 1, min_quote_amount
+        else:
+            n_levels = max(1, min(max_possible_levels, int(grid_range / float(config.min_spread_between_orders))))
+            amount_quote = float(config.total_amount_quote) / n_levels
+        if n_levels > 1:
+            prices = Distributions.linear(n_levels, float(config.start_price), float(config.end_price))
+            step = grid_range / (n_levels - 1)
+        else:
+            prices = [(config.start_price + config.end_price) / 2]
+            step = grid_range
+        take_profit = float(config.triple_barrier_config.take_profit)
+        if config.coerce_tp_to_step:
+            take_profit = max(step, take_profit)
+        return [SimulatedGridLevel(position, float(price), amount_quote, take_profit)
+                for position, price in enumerate(prices)]
+
+    def run(self) -> ExecutorSimulation:
+        index = 0
+        while True:
+            close_index, close_type = self.first_barrier(index, index + 1)
+            if close_index is not None:
+                break
+            self.place_and_cancel_orders(index)
+            next_index = self.next_event_index(index)
+            close_index, close_type = self.first_barrier(index + 1, next_index)
+            if close_index is not None:
+                break
+            if next_index >= self.length:
+                close_index, close_type = self.length - 1, CloseType.TIME_LIMIT
+                break
+            self.fill_orders(next_index)
+            index = next_index
+        self.close_position(close_index, close_type)
+        return self.executor_simulation(close_index, close_type)
+
+    def set_state(self, level: SimulatedGridLevel, state: GridLevelStates):
+        self.levels_by_state[level.state].discard(level)
+        self.levels_by_state[state].add(level)
+        level.state = state
+        level.next_index, level.next_kind, level.search_window = None, None, INITIAL_WINDOW
+        if state != GridLevelStates.NOT_ACTIVE:
+            self.levels_to_search.append(level)
+
+    def take_profit_price(self, level: SimulatedGridLevel) -> float:
+        return level.price * (1 + level.take_profit) if self.is_buy else level.price * (1 - level.take_profit)
+
+    def is_within_bounds(self, price: float, reference_price: float) -> bool:
+        return self.activation_bounds is None or abs(price - reference_price) / reference_price < self.activation_bounds
+
+    def place_and_cancel_orders(self, index: int):
+        close = self.close[index]
+        timestamp = self.timestamps[index]
+        open_orders = self.levels_by_state[GridLevelStates.OPEN_ORDER_PLACED] | \
+            self.levels_by_state[GridLevelStates.CLOSE_ORDER_PLACED]
+        cancelled = [level for level in open_orders if level.next_index == index and level.next_kind == CANCEL]
+
+        if not (self.last_open_creation_timestamp > timestamp - self.config.order_frequency or
+                len(self.levels_by_state[GridLevelStates.OPEN_ORDER_PLACED]) >= self.config.max_open_orders):
+            levels = [level for level in self.levels_by_state[GridLevelStates.NOT_ACTIVE]
+                      if self.activation_bounds is None or self.is_within_open_bounds(level, close)]
+            levels.sort(key=lambda level: (abs(level.price - close), level.position))
+            for level in levels[:self.config.max_orders_per_batch]:
+                if self.is_buy and level.price >= close:
+                    level.order_price = close * (1 - self.safe_extra_spread)
+                elif not self.is_buy and level.price <= close:
+                    level.order_price = close * (1 + self.safe_extra_spread)
+                else:
+                    level.order_price = level.price
+                level.amount_base = level.amount_quote / close
+                self.set_state(level, GridLevelStates.OPEN_ORDER_PLACED)
+                self.last_open_creation_timestamp = timestamp
+
+        # The levels filled before can only be placed at the candle found by search_level_event
+        levels = [level for level in self.levels_by_state[GridLevelStates.OPEN_ORDER_FILLED]
+                  if level.next_index is None or level.next_index == index]
+        for level in sorted(levels, key=lambda level: level.position):
+            take_profit_price = self.take_profit_price(level)
+            if not self.is_within_bounds(take_profit_price, close):
+                continue
+            if self.is_buy and take_profit_price <= close:
+                take_profit_price = close * (1 + self.safe_extra_spread)
+            elif not self.is_buy and take_profit_price >= close:
+                take_profit_price = close * (1 - self.safe_extra_spread)
+            level.order_price = take_profit_price
+            self.set_state(level, GridLevelStates.CLOSE_ORDER_PLACED)
+
+        for level in cancelled:
+            if level.state == GridLevelStates.OPEN_ORDER_PLACED:
+                self.set_state(level, GridLevelStates.NOT_ACTIVE)
+                self.last_open_creation_timestamp = 0.0
+            else:
+                self.set_state(level, GridLevelStates.OPEN_ORDER_FILLED)
+
+        for level in self.levels_to_search:
+            if level.next_index is None:
+                self.search_level_event(level, index + 1)
+        self.levels_to_search = []
+
+    def is_within_open_bounds(self, level: SimulatedGridLevel, close: float) -> bool:
+        if self.is_buy:
+            return level.price >= close * (1 - self.activation_bounds)
+        return level.price <= close * (1 + self.activation_bounds)
+
+    def search_level_event(self, level: SimulatedGridLevel, start: int):
+        """
+        Searches the next event of the level in a window of candles from start, doubled at each search.
+        """
+        stop = min(start + level.search_window, self.length)
+        level.next_index, level.next_kind = stop, None
+        level.search_window *= 2
+        if start >= stop:
+            return
+        close = self.close[start:stop]
+        events = []
+        if level.state == GridLevelStates.OPEN_ORDER_FILLED:
+            take_profit_price = self.take_profit_price(level)
+            events.append((PLACE_CLOSE, np.abs(take_profit_price - close) / close < self.activation_bounds))
+        else:
+            # On the same candle, the fill is before the cancel
+            is_buy_order = (level.state == GridLevelStates.OPEN_ORDER_PLACED) == self.is_buy
+            events.append((FILL, self.low[start:stop] <= level.order_price if is_buy_order
+                           else self.high[start:stop] >= level.order_price))
+            if self.activation_bounds is not None:
+                events.append((CANCEL, np.abs(level.order_price - close) / close > self.activation_bounds))
+        for kind, hits in events:
+            if hits.any():
+                event_index = start + int(np.argmax(hits))
+                if event_index < level.next_index or level.next_kind is None:
+                    level.next_index, level.next_kind = event_index, kind
+
+    def next_event_index(self, index: int) -> int:
+        next_index = min([level.next_index for level in self.levels if level.next_index is not None],
+                         default=self.length)
+        not_active_levels = self.levels_by_state[GridLevelStates.NOT_ACTIVE]
+        if len(not_active_levels) == 0 or \
+                len(self.levels_by_state[GridLevelStates.OPEN_ORDER_PLACED]) >= self.config.max_open_orders:
+            return next_index
+        # Next candle at which the levels not active can be placed
+        start = index + 1
+        if self.config.order_frequency:
+            start = max(start, int(np.searchsorted(
+                self.timestamps, self.last_open_creation_timestamp + self.config.order_frequency, side="left")))
+        if start >= next_index or self.activation_bounds is None:
+            return min(start, next_index)
+        if self.is_buy:
+            limit_price = max(level.price for level in not_active_levels) / (1 - self.activation_bounds)
+            placement_index = first_index(lambda first, last: self.close[first:last] <= limit_price, start, next_index)
+        else:
+            limit_price = min(level.price for level in not_active_levels) / (1 + self.activation_bounds)
+            placement_index = first_index(lambda first, last: self.close[first:last] >= limit_price, start, next_index)
+        return next_index if placement_index is None else placement_index
+
+    def fill_orders(self, index: int):
+        levels = [level for level in self.levels if level.next_index == index]
+        for level in levels:
+            if level.next_kind is None:
+                self.search_level_event(level, index)
+        for level in levels:
+            if level.next_index != index or level.next_kind != FILL:
+                continue
+            amount_quote = level.order_price * level.amount_base
+            fees_quote = self.trade_cost * amount_quote
+            if level.state == GridLevelStates.OPEN_ORDER_PLACED:
+                level.entry_price = level.order_price
+                level.open_fees_quote = fees_quote
+                self.set_state(level, GridLevelStates.OPEN_ORDER_FILLED)
+                self.add_change(index, 1, level.amount_base, amount_quote, fees_quote, 0.0, 0.0, 0.0)
+            else:
+                entry_quote = level.entry_price * level.amount_base
+                realized_pnl = self.side_multiplier * (amount_quote - entry_quote) - level.open_fees_quote - fees_quote
+                self.add_change(index, -1, -level.amount_base, -entry_quote, -level.open_fees_quote, realized_pnl,
+                                entry_quote + amount_quote, level.open_fees_quote + fees_quote)
+                self.set_state(level, GridLevelStates.NOT_ACTIVE)
+
+    def add_change(self, index: int, filled_levels: int, base: float, cost_quote: float, fees_quote: float,
+                   realized_pnl_quote: float, realized_volume_quote: float, realized_fees_quote: float):
+        self.filled_levels += filled_levels
+        self.position_base += base
+        self.position_cost_quote += cost_quote
+        self.position_fees_quote += fees_quote
+        self.changes.append((index, filled_levels, base, cost_quote, fees_quote, realized_pnl_quote,
+                             realized_volume_quote, realized_fees_quote))
+
+    def first_barrier(self, start: int, stop: int) -> Tuple[Optional[int], Optional[CloseType]]:
+        """
+        The first candle between start and stop at which a barrier is hit, with the current position.
+        """
+        window = INITIAL_WINDOW
+        while start < stop:
+            window_stop = min(start + window, stop)
+            close_index, close_type = self.evaluate_barriers(start, window_stop)
+            if close_index is not None:
+                return close_index, close_type
+            start = window_stop
+            window *= 2
+        return None, None
+
+    def evaluate_barriers(self, start: int, stop: int) -> Tuple[Optional[int], Optional[CloseType]]:
+        triple_barrier_config = self.config.triple_barrier_config
+        close = self.close[start:stop]
+        if self.filled_levels > 0:
+            position_pnl_quote = self.side_multiplier * (close * self.position_base - self.position_cost_quote) - \
+                self.position_fees_quote
+            position_pnl_pct = position_pnl_quote / self.position_cost_quote
+        else:
+            position_pnl_pct = np.zeros(len(close))
+
+        # Candles at which each barrier is hit, by order of precedence
+        barriers = []
+        if triple_barrier_config.stop_loss:
+            barriers.append((CloseType.STOP_LOSS, position_pnl_pct <= -float(triple_barrier_config.stop_loss)))
+        if self.config.limit_price:
+            limit_price = float(self.config.limit_price)
+            barriers.append((CloseType.POSITION_HOLD if self.config.keep_position else CloseType.STOP_LOSS,
+                             close <= limit_price if self.is_buy else close >= limit_price))
+        if self.end_time:
+            barriers.append((CloseType.TIME_LIMIT, self.timestamps[start:stop] >= self.end_time))
+        if triple_barrier_config.trailing_stop:
+            barriers.append((CloseType.TRAILING_STOP, self.trailing_stop_hits(position_pnl_pct)))
+        barriers.append((CloseType.TAKE_PROFIT, close > float(self.config.end_price) if self.is_buy
+                         else close < float(self.config.start_price)))
+
+        close_index, close_type = None, None
+        for barrier_close_type, hits in barriers:
+            hit_index = int(np.argmax(hits)) if hits.any() else None
+            if hit_index is not None and (close_index is None or hit_index < close_index):
+                close_index, close_type = hit_index, barrier_close_type
+        return (None, None) if close_index is None else (start + close_index, close_type)
+
+    def trailing_stop_hits(self, position_pnl_pct: np.ndarray) -> np.ndarray:
+        """
+        The candles at which the trailing stop is hit, updating the trigger as GridExecutor.trailing_stop_condition.
+        """
+        trailing_stop = self.config.triple_barrier_config.trailing_stop
+        trailing_delta = float(trailing_stop.trailing_delta)
+        hits = np.zeros(len(position_pnl_pct), dtype=bool)
+        first = 0
+        if self.trailing_stop_trigger is None:
+            activated = position_pnl_pct > float(trailing_stop.activation_price)
+            if not activated.any():
+                return hits
+            first = int(np.argmax(activated))
+            self.trailing_stop_trigger = position_pnl_pct[first] - trailing_delta
+            first += 1
+        position_pnl_pct = position_pnl_pct[first:]
+        triggers = np.maximum.accumulate(np.concatenate([[self.trailing_stop_trigger],
+                                                         position_pnl_pct - trailing_delta]))
+        hits[first:] = position_pnl_pct < triggers[:-1]
+        self.trailing_stop_trigger = float(triggers[-1])
+        return hits
+
+    def close_position(self, index: int, close_type: CloseType):
+        """
+        Closes the position with a market order at the close price, or keeps it out of the pnl of the executor.
+        """
+        if self.filled_levels == 0:
+            return
+        keep_position = close_type == CloseType.POSITION_HOLD or \
+            (self.config.keep_position and close_type != CloseType.TAKE_PROFIT)
+        if keep_position:
+            self.add_change(index, -self.filled_levels, -self.position_base, -self.position_cost_quote,
+                            -self.position_fees_quote, 0.0, 0.0, 0.0)
+            return
+        amount_quote = self.close[index] * self.position_base
+        fees_quote = self.trade_cost * amount_quote
+        realized_pnl = self.side_multiplier * (amount_quote - self.position_cost_quote) - \
+            self.position_fees_quote - fees_quote
+        self.add_change(index, -self.filled_levels, -self.position_base, -self.position_cost_quote,
+                        -self.position_fees_quote, realized_pnl, self.position_cost_quote + amount_quote,
+                        self.position_fees_quote + fees_quote)
+
+    def executor_simulation(self, close_index: int, close_type: CloseType) -> ExecutorSimulation:
+        length = close_index + 1
+        cumulative = np.zeros((length, 7))
+        if len(self.changes) > 0:
+            changes = np.array(self.changes)
+            np.add.at(cumulative, changes[:, 0].astype(int), changes[:, 1:])
+        filled_levels, base, cost_quote, fees_quote, realized_pnl, realized_volume, realized_fees = \
+            np.cumsum(cumulative, axis=0).T
+        close = self.close[:length]
+        is_trading = filled_levels > 0
+        position_pnl = np.where(is_trading, self.side_multiplier * (close * base - cost_quote) - fees_quote, 0.0)
+        net_pnl_quote = realized_pnl + position_pnl
+        filled_amount_quote = np.where(is_trading, cost_quote, 0.0) + realized_volume
+        columns = {
+            "timestamp": self.timestamps[:length],
+            "close": close,
+            "net_pnl_pct": np.divide(net_pnl_quote, filled_amount_quote, out=np.zeros(length),
+                                     where=filled_amount_quote > 0),
+            "net_pnl_quote": net_pnl_quote,
+            "cum_fees_quote": np.where(is_trading, fees_quote, 0.0) + realized_fees,
+            "filled_amount_quote": filled_amount_quote,
+            "current_position_average_price": np.divide(cost_quote, base, out=np.zeros(length), where=is_trading),
+        }
+        return ExecutorSimulation.from_arrays(self.config, self.df.index[:length], columns, close_type)
+
+
+class GridExecutorSimulator(ExecutorSimulatorBase):
+    def simulate(self, df: pd.DataFrame, config: GridExecutorConfig, trade_cost: float) -> ExecutorSimulation:
+        """
+        The grid is simulated from event to event rather than candle by candle (see GridSimulation): the next fill or
+        cancel of each order is searched with NumPy, and so are the barriers between two events. The levels are
+        re-armed when their take profit is filled.
+        """
+        return GridSimulation(df, config, trade_cost).run()
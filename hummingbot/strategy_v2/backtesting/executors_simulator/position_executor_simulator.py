@@ -1,88 +1,127 @@
+from typing import Optional
+
+import numpy as np
 import pandas as pd
 
 from hummingbot.core.data_type.common import TradeType
-from hummingbot.strategy_v2.backtesting.executor_simulator_base import ExecutorSimulation, ExecutorSimulatorBase
+from hummingbot.strategy_v2.backtesting.executor_simulator_base import (
+    ExecutorSimulation,
+    ExecutorSimulatorBase,
+    first_index,
+)
 from hummingbot.strategy_v2.executors.position_executor.data_types import PositionExecutorConfig
 from hummingbot.strategy_v2.models.executors import CloseType
 
+# Candles evaluated first when the executor has no time limit, doubled until a barrier is hit
+INITIAL_WINDOW = 256
+
 
 class PositionExecutorSimulator(ExecutorSimulatorBase):
     def simulate(self, df: pd.DataFrame, config: PositionExecutorConfig, trade_cost: float) -> ExecutorSimulation:
-        if config.triple_barrier_config.open_order_type.is_limit_type():
-            entry_condition = (df['close'] <= config.entry_price) if config.side == TradeType.BUY else (df['close'] >= config.entry_price)
-            start_timestamp = df[entry_condition]['timestamp'].min()
-        else:
-            start_timestamp = df['timestamp'].min()
-        last_timestamp = df['timestamp'].max()
-
-        # Set up barriers
-        tp = float(config.triple_barrier_config.take_profit) if config.triple_barrier_config.take_profit else None
-        trailing_sl_trigger_pct = None
-        trailing_sl_delta_pct = None
-        if config.triple_barrier_config.trailing_stop:
-            trailing_sl_trigger_pct = float(config.triple_barrier_config.trailing_stop.activation_price)
-            trailing_sl_delta_pct = float(config.triple_barrier_config.trailing_stop.trailing_delta)
-        tl = config.triple_barrier_config.time_limit if config.triple_barrier_config.time_limit else None
-        tl_timestamp = config.timestamp + tl if tl else last_timestamp
+        """
+        The barriers are evaluated with NumPy on the candles of the lifetime of the executor only. Without time limit,
+        they are evaluated on a window of candles doubled until one of them is hit.
+        """
+        timestamps = df["timestamp"].to_numpy(dtype=float)
+        close = df["close"].to_numpy(dtype=float)
+        side_multiplier = 1 if config.side == TradeType.BUY else -1
+        triple_barrier_config = config.triple_barrier_config
 
-        # Filter dataframe based on the conditions
-        df_filtered = df[:tl_timestamp].copy()
+        if triple_barrier_config.open_order_type.is_limit_type():
+            entry_price = float(config.entry_price)
+            entry_index = first_index(
+                lambda start, stop: close[start:stop] <= entry_price if config.side == TradeType.BUY
+                else close[start:stop] >= entry_price,
+                0, len(timestamps))
+        else:
+            entry_index = 0
 
-        df_filtered['net_pnl_pct'] = 0.0
-        df_filtered['net_pnl_quote'] = 0.0
-        df_filtered['cum_fees_quote'] = 0.0
-        df_filtered['filled_amount_quote'] = 0.0
-        df_filtered["current_position_average_price"] = float(config.entry_price)
+        tl = triple_barrier_config.time_limit if triple_barrier_config.time_limit else None
+        tl_timestamp = config.timestamp + tl if tl else timestamps[-1]
+        time_limit_stop = int(np.searchsorted(timestamps, tl_timestamp, side="right"))
 
-        if pd.isna(start_timestamp):
-            return ExecutorSimulation(config=config, executor_simulation=df_filtered, close_type=CloseType.TIME_LIMIT)
+        if entry_index is None:
+            return self._executor_simulation(df, config, trade_cost, CloseType.TIME_LIMIT, time_limit_stop,
+                                             np.zeros(time_limit_stop), np.zeros(time_limit_stop))
 
-        entry_price = df.loc[start_timestamp, 'close']
-        side_multiplier = 1 if config.side == TradeType.BUY else -1
+        stop = time_limit_stop if tl else min(INITIAL_WINDOW, time_limit_stop)
+        while True:
+            net_pnl_pct, filled_amount_quote, trailing_stop, close_index, close_type = self._evaluate_barriers(
+                df, config, trade_cost, side_multiplier, entry_index, stop)
+            if close_index is not None or stop == time_limit_stop:
+                break
+            stop = min(2 * stop, time_limit_stop)
 
-        returns_df = df_filtered[start_timestamp:]
-        returns = returns_df['close'].pct_change().fillna(0)
-        cumulative_returns = (((1 + returns).cumprod() - 1) * side_multiplier) - trade_cost
-        df_filtered.loc[start_timestamp:, 'net_pnl_pct'] = cumulative_returns
-        df_filtered.loc[start_timestamp:, 'filled_amount_quote'] = float(config.amount) * entry_price
-        df_filtered['net_pnl_quote'] = df_filtered['net_pnl_pct'] * df_filtered['filled_amount_quote']
-        df_filtered['cum_fees_quote'] = trade_cost * df_filtered['filled_amount_quote']
+        if close_index is None:
+            close_index, close_type = time_limit_stop - 1, CloseType.TIME_LIMIT
+        return self._executor_simulation(df, config, trade_cost, close_type, close_index + 1, net_pnl_pct,
+                                         filled_amount_quote, trailing_stop)
 
-        # Make sure the trailing stop pct rises linearly to the net p/l pct when above the trailing stop trigger pct (if any)
-        if trailing_sl_trigger_pct is not None and trailing_sl_delta_pct is not None:
-            df_filtered.loc[(df_filtered['net_pnl_pct'] > trailing_sl_trigger_pct).cummax(), 'ts'] = (
-                df_filtered['net_pnl_pct'] - float(trailing_sl_delta_pct)
-            ).cummax()
+    @staticmethod
+    def _evaluate_barriers(df: pd.DataFrame, config: PositionExecutorConfig, trade_cost: float, side_multiplier: int,
+                           entry_index: int, stop: int):
+        """
+        Evaluates the barriers on the candles before stop, the executor being filled at entry_index.
+        :return: the net pnl pct, filled amount and trailing stop of the candles, and the index and type of the first
+        barrier hit, if any.
+        """
+        close = df["close"].to_numpy(dtype=float)
+        triple_barrier_config = config.triple_barrier_config
+        entry_price = close[entry_index]
 
-        # Determine the earliest close event
-        first_tp_timestamp = df_filtered[df_filtered['net_pnl_pct'] > tp]['timestamp'].min() if tp else None
-        first_sl_timestamp = None
-        if config.triple_barrier_config.stop_loss:
-            sl = float(config.triple_barrier_config.stop_loss)
-            sl_price = entry_price * (1 - sl * side_multiplier)
-            sl_condition = df_filtered['low'] <= sl_price if config.side == TradeType.BUY else df_filtered['high'] >= sl_price
-            first_sl_timestamp = df_filtered[sl_condition]['timestamp'].min()
-        first_trailing_sl_timestamp = df_filtered[(~df_filtered['ts'].isna()) & (df_filtered['net_pnl_pct'] < df_filtered['ts'])]['timestamp'].min() if trailing_sl_delta_pct and trailing_sl_trigger_pct else None
-        close_timestamp = min([timestamp for timestamp in [first_tp_timestamp, first_sl_timestamp, tl_timestamp, first_trailing_sl_timestamp] if not pd.isna(timestamp)])
+        net_pnl_pct = np.zeros(stop)
+        filled_amount_quote = np.zeros(stop)
+        if entry_index < stop:
+            prices = close[entry_index:stop]
+            returns = np.zeros(len(prices))
+            returns[1:] = prices[1:] / prices[:-1] - 1
+            net_pnl_pct[entry_index:] = ((np.cumprod(1 + returns) - 1) * side_multiplier) - trade_cost
+            filled_amount_quote[entry_index:] = float(config.amount) * entry_price
 
-        # Determine the close type
-        if close_timestamp == first_tp_timestamp:
-            close_type = CloseType.TAKE_PROFIT
-        elif close_timestamp == first_sl_timestamp:
-            close_type = CloseType.STOP_LOSS
-        elif close_timestamp == first_trailing_sl_timestamp:
-            close_type = CloseType.TRAILING_STOP
-        else:
-            close_type = CloseType.TIME_LIMIT
+        # Candles at which each barrier is hit, by order of precedence
+        barriers = []
+        if triple_barrier_config.take_profit:
+            barriers.append((CloseType.TAKE_PROFIT, net_pnl_pct > float(triple_barrier_config.take_profit)))
+        if triple_barrier_config.stop_loss:
+            stop_loss_price = entry_price * (1 - float(triple_barrier_config.stop_loss) * side_multiplier)
+            if config.side == TradeType.BUY:
+                barriers.append((CloseType.STOP_LOSS, df["low"].to_numpy(dtype=float)[:stop] <= stop_loss_price))
+            else:
+                barriers.append((CloseType.STOP_LOSS, df["high"].to_numpy(dtype=float)[:stop] >= stop_loss_price))
+        trailing_stop = None
+        if triple_barrier_config.trailing_stop:
+            # The trailing stop rises with the net pnl pct once it is above the activation pct
+            activated = np.maximum.accumulate(
+                net_pnl_pct > float(triple_barrier_config.trailing_stop.activation_price))
+            trailing_stop = np.where(activated, np.maximum.accumulate(
+                net_pnl_pct - float(triple_barrier_config.trailing_stop.trailing_delta)), np.nan)
+            barriers.append((CloseType.TRAILING_STOP, activated & (net_pnl_pct < trailing_stop)))
 
-        # Set the final state of the DataFrame
-        df_filtered = df_filtered[:close_timestamp]
-        df_filtered.loc[df_filtered.index[-1], "filled_amount_quote"] = df_filtered["filled_amount_quote"].iloc[-1] * 2
+        close_index, close_type = None, None
+        for barrier_close_type, hit in barriers:
+            hit_index = int(np.argmax(hit)) if hit.any() else None
+            if hit_index is not None and (close_index is None or hit_index < close_index):
+                close_index, close_type = hit_index, barrier_close_type
+        return net_pnl_pct, filled_amount_quote, trailing_stop, close_index, close_type
 
-        # Construct and return ExecutorSimulation object
-        simulation = ExecutorSimulation(
-            config=config,
-            executor_simulation=df_filtered,
-            close_type=close_type
-        )
-        return simulation
+    @staticmethod
+    def _executor_simulation(df: pd.DataFrame, config: PositionExecutorConfig, trade_cost: float,
+                             close_type: CloseType, length: int, net_pnl_pct: np.ndarray,
+                             filled_amount_quote: np.ndarray,
+                             trailing_stop: Optional[np.ndarray] = None) -> ExecutorSimulation:
+        net_pnl_pct = net_pnl_pct[:length]
+        filled_amount_quote = filled_amount_quote[:length].copy()
+        columns = {
+            "timestamp": df["timestamp"].to_numpy()[:length],
+            "close": df["close"].to_numpy()[:length],
+            "net_pnl_pct": net_pnl_pct,
+            "net_pnl_quote": net_pnl_pct * filled_amount_quote,
+            "cum_fees_quote": trade_cost * filled_amount_quote,
+            "filled_amount_quote": filled_amount_quote,
+            "current_position_average_price": np.full(length, float(config.entry_price)),
+        }
+        if trailing_stop is not None:
+            columns["ts"] = trailing_stop[:length]
+        # The amount of the closing trade is added to the last candle
+        filled_amount_quote[-1] *= 2
+        return ExecutorSimulation.from_arrays(config, df.index[:length], columns, close_type)
@@ -0,0 +1,92 @@
+import numpy as np
+import pandas as pd
+
+from hummingbot.core.data_type.common import TradeType
+from hummingbot.strategy_v2.backtesting.executor_simulator_base import (
+    ExecutorSimulation,
+    ExecutorSimulatorBase,
+    first_index,
+)
+from hummingbot.strategy_v2.executors.xemm_executor.data_types import XEMMExecutorConfig
+from hummingbot.strategy_v2.models.executors import CloseType
+
+
+class XEMMExecutorSimulator(ExecutorSimulatorBase):
+    def simulate(self, df: pd.DataFrame, config: XEMMExecutorConfig, trade_cost: float) -> ExecutorSimulation:
+        """
+        Simulates the maker order and the taker hedge on the candles of the buying and selling markets, aligned in df
+        (see BacktestingEngineBase.get_xemm_market_data).
+
+        The maker order is placed at the close of a candle at the target profitability from the taker close price, and
+        filled during the next candles when the low (buy) or the high (sell) of the maker market crosses its price. It
+        is cancelled when its profitability against the taker close price leaves the min and max profitability, and
+        placed again at the next candle. The hedge is a market order at the taker close price of the candle of the
+        fill. The transaction cost is the trade cost of both orders, and both markets are expected to have the same
+        quote asset.
+        """
+        maker_buys = config.maker_side == TradeType.BUY
+        maker_market, taker_market = ("buying", "selling") if maker_buys else ("selling", "buying")
+        maker_crossing_price = df[f"{maker_market}_low" if maker_buys else f"{maker_market}_high"].to_numpy(dtype=float)
+        taker_close = df[f"{taker_market}_close"].to_numpy(dtype=float)
+        tx_cost_pct = 2 * trade_cost
+        target_profitability = float(config.target_profitability)
+        min_profitability = float(config.min_profitability)
+        max_profitability = float(config.max_profitability)
+        length = len(df)
+
+        index = first_index(lambda start, stop: ~np.isnan(taker_close[start:stop]), 0, length)
+        fill_index = None
+        while index is not None and index < length:
+            taker_price = taker_close[index]
+            if maker_buys:
+                maker_price = taker_price * (1 - target_profitability - tx_cost_pct)
+            else:
+                maker_price = taker_price * (1 + target_profitability + tx_cost_pct)
+
+            def is_filled(start: int, stop: int) -> np.ndarray:
+                if maker_buys:
+                    return maker_crossing_price[start:stop] <= maker_price
+                return maker_crossing_price[start:stop] >= maker_price
+
+            def is_filled_or_cancelled(start: int, stop: int) -> np.ndarray:
+                if maker_buys:
+                    profitability = (taker_close[start:stop] - maker_price) / maker_price - tx_cost_pct
+                else:
+                    profitability = (maker_price - taker_close[start:stop]) / maker_price - tx_cost_pct
+                return is_filled(start, stop) | (profitability < min_profitability) | \
+                    (profitability > max_profitability)
+
+            event_index = first_index(is_filled_or_cancelled, index + 1, length)
+            if event_index is None:
+                break
+            if is_filled(event_index, event_index + 1)[0]:
+                fill_index = event_index
+                break
+            # Cancelled at the close of the candle, placed again at the next one
+            index = event_index + 1
+
+        simulation_length = length if fill_index is None else fill_index + 1
+        columns = {
+            "timestamp": df["timestamp"].to_numpy(dtype=float)[:simulation_length],
+            "close": df[f"{maker_market}_close"].to_numpy(dtype=float)[:simulation_length],
+            "net_pnl_pct": np.zeros(simulation_length),
+            "net_pnl_quote": np.zeros(simulation_length),
+            "cum_fees_quote": np.zeros(simulation_length),
+            "filled_amount_quote": np.zeros(simulation_length),
+        }
+        if fill_index is None:
+            return ExecutorSimulation.from_arrays(config, df.index[:simulation_length], columns, CloseType.EXPIRED)
+
+        order_amount = float(config.order_amount)
+        maker_amount_quote = order_amount * maker_price
+        taker_amount_quote = order_amount * taker_close[fill_index]
+        fees_quote = trade_cost * (maker_amount_quote + taker_amount_quote)
+        if maker_buys:
+            net_pnl_quote = taker_amount_quote - maker_amount_quote - fees_quote
+        else:
+            net_pnl_quote = maker_amount_quote - taker_amount_quote - fees_quote
+        columns["net_pnl_pct"][-1] = net_pnl_quote / maker_amount_quote
+        columns["net_pnl_quote"][-1] = net_pnl_quote
+        columns["cum_fees_quote"][-1] = fees_quote
+        columns["filled_amount_quote"][-1] = maker_amount_quote + taker_amount_quote
+        return ExecutorSimulation.from_arrays(config, df.index[:simulation_length], columns, CloseType.COMPLETED)
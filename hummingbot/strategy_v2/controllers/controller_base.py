@@ -2,7 +2,10 @@ import asyncio
 import importlib
 import inspect
 from decimal import Decimal
-from typing import TYPE_CHECKING, Callable, List
+from typing import TYPE_CHECKING, Callable, List, Optional
+
+import numpy as np
+import pandas as pd
 
 from pydantic import ConfigDict, Field, field_validator
 
@@ -142,6 +145,8 @@ class ControllerBase(RunnableBase):
         self.processed_data = {}
         self.executors_update_event = asyncio.Event()
         self.executors_info_queue = asyncio.Queue()
+        self._markets: Optional[MarketDict] = None
+        self._markets_ready = False
 
     def start(self):
         """
@@ -168,8 +173,25 @@ class ControllerBase(RunnableBase):
             if json_schema_extra.get("is_updatable", False):
                 setattr(self.config, name, getattr(new_config, name))
 
+    @property
+    def markets_ready(self) -> bool:
+        """
+        Whether the markets of the controller are ready. Only the trading pairs of the controller are checked, so it can
+        start while the connectors are still initializing other pairs. Controllers that don't declare their markets wait
+        for the market data provider to be fully ready. The markets of a controller don't change while it runs, so they
+        are computed once and the check stops once they are ready.
+        """
+        if not self._markets_ready:
+            if self._markets is None:
+                self._markets = self.config.update_markets(MarketDict())
+            if not self._markets:
+                self._markets_ready = self.market_data_provider.ready
+            else:
+                self._markets_ready = self.market_data_provider.markets_ready(self._markets)
+        return self._markets_ready
+
     async def control_task(self):
-        if self.market_data_provider.ready and self.executors_update_event.is_set():
+        if self.markets_ready and self.executors_update_event.is_set():
             await self.update_processed_data()
             executor_actions: List[ExecutorAction] = self.determine_executor_actions()
             if len(executor_actions) > 0:
@@ -200,6 +222,15 @@ class ControllerBase(RunnableBase):
         """
         raise NotImplementedError
 
+    def backtesting_event_mask(self, features: pd.DataFrame) -> Optional[np.ndarray]:
+        """
+        This method can be overridden by the derived classes to speed up backtesting. It returns a boolean array that
+        tells for each row of the backtesting features if determine_executor_actions can return actions at that row,
+        given the values of the row and the executors. The backtesting engine then skips the other rows. Returns None
+        when determine_executor_actions has to be evaluated at every row.
+        """
+        return None
+
     def to_format_status(self) -> List[str]:
         """
         This method should be overridden by the derived classes to implement the logic to format the status of the
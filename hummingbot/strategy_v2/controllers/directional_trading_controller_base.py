@@ -1,6 +1,7 @@
 from decimal import Decimal
 from typing import List, Optional
 
+import numpy as np
 import pandas as pd
 from pydantic import Field, field_validator
 
@@ -176,6 +177,17 @@ class DirectionalTradingControllerBase(ControllerBase):
         """
         self.processed_data = {"signal": 0, "features": pd.DataFrame()}
 
+    def backtesting_event_mask(self, features: pd.DataFrame) -> Optional[np.ndarray]:
+        """
+        Executors are only created when the signal is not 0 and never stopped by the controller, unless a subclass
+        changes how the actions are determined.
+        """
+        actions_methods = ["determine_executor_actions", "create_actions_proposal", "stop_actions_proposal"]
+        if "signal" not in features.columns or any(getattr(type(self), method) is not getattr(
+                DirectionalTradingControllerBase, method) for method in actions_methods):
+            return None
+        return features["signal"].to_numpy() != 0
+
     def create_actions_proposal(self) -> List[ExecutorAction]:
         """
         Create actions based on the provided executor handler report.
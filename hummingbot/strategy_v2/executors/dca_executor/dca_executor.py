@@ -2,7 +2,7 @@ import asyncio
 import logging
 import math
 from decimal import Decimal
-from typing import Dict, List, Optional, Union
+from typing import Dict, Hashable, List, Optional, Union
 
 from hummingbot.connector.connector_base import ConnectorBase
 from hummingbot.core.data_type.common import OrderType, PositionAction, PriceType, TradeType
@@ -23,6 +23,7 @@ from hummingbot.strategy_v2.models.executors import CloseType, TrackedOrder
 
 class DCAExecutor(ExecutorBase):
     _logger = None
+    wake_on_top_of_book_ticks = 1
 
     @classmethod
     def logger(cls) -> HummingbotLogger:
@@ -127,6 +128,13 @@ class DCAExecutor(ExecutorBase):
     def is_expired(self):
         return self.end_time and self.end_time <= self._strategy.current_timestamp
 
+    def change_fingerprint(self) -> Optional[Hashable]:
+        """
+        Adds the time limit to the fingerprint, so the executor runs as soon as it expires.
+        """
+        fingerprint = super().change_fingerprint()
+        return None if fingerprint is None else (fingerprint, bool(self.is_expired))
+
     @property
     def min_price(self) -> Decimal:
         return min(self.config.prices)
@@ -1,6 +1,6 @@
 from decimal import Decimal
 from functools import lru_cache
-from typing import Dict, List, Optional, Tuple, Union
+from typing import Callable, Dict, Hashable, List, Optional, Tuple, Union
 
 from hummingbot.client.settings import AllConnectorSettings
 from hummingbot.connector.connector_base import ConnectorBase
@@ -18,6 +18,7 @@ from hummingbot.core.event.events import (
     SellOrderCompletedEvent,
     SellOrderCreatedEvent,
 )
+from hummingbot.data_feed.market_subscriptions import MarketSubscription
 from hummingbot.strategy.script_strategy_base import ScriptStrategyBase
 from hummingbot.strategy_v2.executors.data_types import ExecutorConfigBase
 from hummingbot.strategy_v2.models.base import RunnableStatus
@@ -30,6 +31,9 @@ class ExecutorBase(RunnableBase):
     """
     Base class for all executors. Executors are responsible for executing orders based on the strategy.
     """
+    # When set and the executor is driven by a scheduler, the executor is woken when the top of book of its watched
+    # markets moves by this number of ticks, and is otherwise only run on updates of its own orders
+    wake_on_top_of_book_ticks: Optional[int] = None
 
     def __init__(self, strategy: ScriptStrategyBase, connectors: List[str], config: ExecutorConfigBase, update_interval: float = 0.5):
         """
@@ -48,14 +52,21 @@ class ExecutorBase(RunnableBase):
         self.connectors = {connector_name: connector for connector_name, connector in strategy.connectors.items() if
                            connector_name in connectors}
 
+        # Ids of the orders placed by the executor, and number of events received for them
+        self._order_ids = set()
+        self._order_updates_count = 0
+        # Market subscriptions waking the executor, and number of times they fired
+        self._market_subscriptions: List[MarketSubscription] = []
+        self._market_wakes_count = 0
+
         # Event forwarders for different order events
-        self._create_buy_order_forwarder = SourceInfoEventForwarder(self.process_order_created_event)
-        self._create_sell_order_forwarder = SourceInfoEventForwarder(self.process_order_created_event)
-        self._fill_order_forwarder = SourceInfoEventForwarder(self.process_order_filled_event)
-        self._complete_buy_order_forwarder = SourceInfoEventForwarder(self.process_order_completed_event)
-        self._complete_sell_order_forwarder = SourceInfoEventForwarder(self.process_order_completed_event)
-        self._cancel_order_forwarder = SourceInfoEventForwarder(self.process_order_canceled_event)
-        self._failed_order_forwarder = SourceInfoEventForwarder(self.process_order_failed_event)
+        self._create_buy_order_forwarder = SourceInfoEventForwarder(self._counting_order_updates(self.process_order_created_event))
+        self._create_sell_order_forwarder = SourceInfoEventForwarder(self._counting_order_updates(self.process_order_created_event))
+        self._fill_order_forwarder = SourceInfoEventForwarder(self._counting_order_updates(self.process_order_filled_event))
+        self._complete_buy_order_forwarder = SourceInfoEventForwarder(self._counting_order_updates(self.process_order_completed_event))
+        self._complete_sell_order_forwarder = SourceInfoEventForwarder(self._counting_order_updates(self.process_order_completed_event))
+        self._cancel_order_forwarder = SourceInfoEventForwarder(self._counting_order_updates(self.process_order_canceled_event))
+        self._failed_order_forwarder = SourceInfoEventForwarder(self._counting_order_updates(self.process_order_failed_event))
 
         # Pairs of market events and their corresponding event forwarders
         self._event_pairs: List[Tuple[MarketEvent, SourceInfoEventForwarder]] = [
@@ -131,6 +142,84 @@ class ExecutorBase(RunnableBase):
         ei.net_pnl_pct = ei.net_pnl_pct if not ei.net_pnl_pct.is_nan() else Decimal("0")
         return ei
 
+    def _counting_order_updates(self, process_event: Callable) -> Callable:
+        def forward(event_tag: int, market: ConnectorBase, event):
+            if getattr(event, "order_id", None) in self._order_ids:
+                self._order_updates_count += 1
+                self.wake()
+            process_event(event_tag, market, event)
+        return forward
+
+    def subscribe_to_market_changes(self):
+        """
+        Subscribes to the top of book changes of the watched markets, if the executor is driven by a scheduler that
+        can wake it and the strategy has a market data provider.
+        """
+        market_data_provider = getattr(self._strategy, "market_data_provider", None)
+        if self.wake_on_top_of_book_ticks is None or self.scheduler is None or market_data_provider is None:
+            return
+        for connector_name, trading_pair in self.watched_markets:
+            self._market_subscriptions.append(market_data_provider.subscribe_top_of_book(
+                connector_name, trading_pair, self._on_market_change, ticks=self.wake_on_top_of_book_ticks))
+
+    def unsubscribe_from_market_changes(self):
+        market_data_provider = getattr(self._strategy, "market_data_provider", None)
+        if market_data_provider is not None:
+            for subscription in self._market_subscriptions:
+                market_data_provider.unsubscribe(subscription)
+        self._market_subscriptions.clear()
+
+    def _on_market_change(self, subscription: MarketSubscription):
+        self._market_wakes_count += 1
+        self.wake()
+
+    @property
+    def watched_markets(self) -> List[Tuple[str, str]]:
+        """
+        Returns the (connector name, trading pair) markets whose order books the control task depends on. By default,
+        the market of the config if it has a connector_name and a trading_pair, and can be reimplemented by subclasses.
+        """
+        connector_name = getattr(self.config, "connector_name", None)
+        trading_pair = getattr(self.config, "trading_pair", None)
+        if connector_name is None or trading_pair is None:
+            return []
+        return [(connector_name, trading_pair)]
+
+    def get_market_version(self, connector_name: str, trading_pair: str) -> Optional[Tuple]:
+        """
+        Returns a value that changes when the order book of the market is updated, or None if there is no order book.
+        """
+        connector = self.connectors.get(connector_name)
+        if connector is None:
+            return None
+        try:
+            order_book = connector.get_order_book(trading_pair)
+        except Exception:
+            return None
+        return order_book.snapshot_uid, order_book.last_diff_uid, order_book.last_applied_trade
+
+    def change_fingerprint(self) -> Optional[Hashable]:
+        """
+        Returns the updates of the executor's orders and the order book versions of the watched markets while the
+        executor is running, so an executor is only skipped when neither its orders nor its markets changed. When the
+        executor is subscribed to market changes, the number of times they fired replaces the order book versions.
+        Returns None when the executor is not running or its markets are unknown.
+        """
+        if self._status != RunnableStatus.RUNNING:
+            return None
+        if self._market_subscriptions:
+            return self._order_updates_count, self._market_wakes_count
+        markets = self.watched_markets
+        if not markets:
+            return None
+        market_versions = []
+        for connector_name, trading_pair in markets:
+            version = self.get_market_version(connector_name, trading_pair)
+            if version is None:
+                return None
+            market_versions.append(version)
+        return self._order_updates_count, tuple(market_versions)
+
     def get_custom_info(self) -> Dict:
         """
         Returns the custom info of the executor. Returns an empty dictionary by default, and can be reimplemented
@@ -169,12 +258,15 @@ class ExecutorBase(RunnableBase):
         self.close_timestamp = self._strategy.current_timestamp
         super().stop()
         self.unregister_events()
+        self.unsubscribe_from_market_changes()
 
     async def on_start(self):
         """
         Called when the executor is started.
         """
         await self.validate_sufficient_balance()
+        if self._status == RunnableStatus.RUNNING:
+            self.subscribe_to_market_changes()
 
     def on_stop(self):
         """
@@ -287,9 +379,11 @@ class ExecutorBase(RunnableBase):
         :return: The result of the order placement.
         """
         if side == TradeType.BUY:
-            return self._strategy.buy(connector_name, trading_pair, amount, order_type, price, position_action)
+            order_id = self._strategy.buy(connector_name, trading_pair, amount, order_type, price, position_action)
         else:
-            return self._strategy.sell(connector_name, trading_pair, amount, order_type, price, position_action)
+            order_id = self._strategy.sell(connector_name, trading_pair, amount, order_type, price, position_action)
+        self._order_ids.add(order_id)
+        return order_id
 
     def get_price(self, connector_name: str, trading_pair: str, price_type: PriceType = PriceType.MidPrice):
         """
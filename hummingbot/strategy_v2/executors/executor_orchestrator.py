@@ -3,7 +3,7 @@ import logging
 import uuid
 from collections import deque
 from decimal import Decimal
-from typing import TYPE_CHECKING, Dict, List, Optional
+from typing import TYPE_CHECKING, Dict, Hashable, List, Optional, Tuple
 
 from hummingbot.connector.markets_recorder import MarketsRecorder
 from hummingbot.core.data_type.common import PositionAction, PositionMode, PriceType, TradeType
@@ -16,6 +16,8 @@ if TYPE_CHECKING:
 from hummingbot.strategy_v2.executors.arbitrage_executor.arbitrage_executor import ArbitrageExecutor
 from hummingbot.strategy_v2.executors.data_types import PositionSummary
 from hummingbot.strategy_v2.executors.dca_executor.dca_executor import DCAExecutor
+from hummingbot.strategy_v2.executors.executor_base import ExecutorBase
+from hummingbot.strategy_v2.executors.executor_scheduler import ExecutorScheduler
 from hummingbot.strategy_v2.executors.grid_executor.grid_executor import GridExecutor
 from hummingbot.strategy_v2.executors.order_executor.order_executor import OrderExecutor
 from hummingbot.strategy_v2.executors.position_executor.position_executor import PositionExecutor
@@ -132,6 +134,44 @@ class PositionHold:
             cum_fees_quote=self.cum_fees_quote)
 
 
+class ActiveExecutorsPerformance:
+    """
+    Running PnL, volume and close type aggregates of the active executors of a controller. The executor info of each
+    executor is kept with the key it was computed for, and the aggregates are updated by the difference between the
+    previous and the new info of the executors that changed.
+    """
+
+    def __init__(self):
+        self.unrealized_pnl_quote = Decimal("0")
+        self.realized_pnl_quote = Decimal("0")
+        self.volume_traded = Decimal("0")
+        self.close_type_counts: Dict[CloseType, int] = {}
+        self.executors_info: Dict[ExecutorBase, Tuple[Optional[Hashable], ExecutorInfo]] = {}
+
+    def add(self, executor_info: ExecutorInfo):
+        if executor_info.is_done:
+            self.realized_pnl_quote += executor_info.net_pnl_quote
+            if executor_info.close_type:
+                self.close_type_counts[executor_info.close_type] = self.close_type_counts.get(executor_info.close_type,
+                                                                                              0) + 1
+        else:
+            self.unrealized_pnl_quote += executor_info.net_pnl_quote
+        self.volume_traded += executor_info.filled_amount_quote
+
+    def remove(self, executor_info: ExecutorInfo):
+        if executor_info.is_done:
+            self.realized_pnl_quote -= executor_info.net_pnl_quote
+            if executor_info.close_type:
+                count = self.close_type_counts.get(executor_info.close_type, 0) - 1
+                if count > 0:
+                    self.close_type_counts[executor_info.close_type] = count
+                else:
+                    self.close_type_counts.pop(executor_info.close_type, None)
+        else:
+            self.unrealized_pnl_quote -= executor_info.net_pnl_quote
+        self.volume_traded -= executor_info.filled_amount_quote
+
+
 class ExecutorOrchestrator:
     """
     Orchestrator for various executors.
@@ -157,7 +197,8 @@ class ExecutorOrchestrator:
                  strategy: "StrategyV2Base",
                  executors_update_interval: float = 1.0,
                  executors_max_retries: int = 10,
-                 initial_positions_by_controller: Optional[dict] = None):
+                 initial_positions_by_controller: Optional[dict] = None,
+                 use_executors_scheduler: bool = True):
         self.strategy = strategy
         self.executors_update_interval = executors_update_interval
         self.executors_max_retries = executors_max_retries
@@ -166,6 +207,15 @@ class ExecutorOrchestrator:
         self.executors_ids_position_held = deque(maxlen=50)
         self.cached_performance = {}
         self.initial_positions_by_controller = initial_positions_by_controller or {}
+        # Drives the control task of all the executors, instead of a control loop task per executor
+        self.executors_scheduler: Optional[ExecutorScheduler] = ExecutorScheduler() if use_executors_scheduler else None
+        # Running aggregates of the active executors, and the last reports with the version they were generated at
+        self.active_executors_performance: Dict[str, ActiveExecutorsPerformance] = {}
+        self._reports: Dict[str, Dict] = {}
+        self._reports_version = 0
+        # Position summaries of each controller keyed on the mid price and the orders of the position they were
+        # computed with, so a summary is computed again only when the price moved or the position changed
+        self._positions_summaries: Dict[str, Dict[PositionHold, Tuple[Tuple, PositionSummary, PositionSummary]]] = {}
         self._initialize_cached_performance()
 
     def _initialize_cached_performance(self):
@@ -301,6 +351,8 @@ class ExecutorOrchestrator:
                     for executor in executors_list]):
                 continue
             await asyncio.sleep(2.0)
+        if self.executors_scheduler is not None:
+            self.executors_scheduler.stop()
         # Store all positions
         self.store_all_positions()
         # Clear executors and trigger garbage collection
@@ -397,6 +449,7 @@ class ExecutorOrchestrator:
         else:
             raise ValueError("Unsupported executor config type")
 
+        executor.scheduler = self.executors_scheduler
         executor.start()
         self.active_executors[controller_id].append(executor)
         # MarketsRecorder.get_instance().store_or_update_executor(executor)
@@ -417,47 +470,86 @@ class ExecutorOrchestrator:
             return
         executor.early_stop(action.keep_position)
 
-    def _update_positions_from_done_executors(self):
+    def _update_positions_from_done_executor(self, controller_id: str, executor_info: ExecutorInfo) -> bool:
         """
-        Update positions from executors that are done but haven't been processed yet.
-        This is called before generating reports to ensure position state is current.
+        Add the orders of an executor that is done holding its position to the positions held by the controller.
+        Returns whether the positions changed.
         """
-        for controller_id, executors_list in self.active_executors.items():
-            # Filter executors that need position updates
-            executors_to_process = [
-                executor for executor in executors_list
-                if (executor.executor_info.is_done and
-                    executor.executor_info.close_type == CloseType.POSITION_HOLD and
-                    executor.executor_info.config.id not in self.executors_ids_position_held)
-            ]
-
-            # Skip if no executors to process
-            if not executors_to_process:
-                continue
+        if (not executor_info.is_done or executor_info.close_type != CloseType.POSITION_HOLD or
+                executor_info.config.id in self.executors_ids_position_held):
+            return False
+        self.executors_ids_position_held.append(executor_info.config.id)
+        positions = self.positions_held.setdefault(controller_id, [])
 
-            positions = self.positions_held.get(controller_id, [])
+        # Determine position side (handling perpetual markets)
+        position_side = self._determine_position_side(executor_info)
 
-            for executor in executors_to_process:
-                executor_info = executor.executor_info
-                self.executors_ids_position_held.append(executor_info.config.id)
+        # Find or create position
+        existing_position = self._find_existing_position(positions, executor_info, position_side)
 
-                # Determine position side (handling perpetual markets)
-                position_side = self._determine_position_side(executor_info)
+        if existing_position:
+            existing_position.add_orders_from_executor(executor_info)
+        else:
+            # Create new position
+            position = PositionHold(
+                executor_info.connector_name,
+                executor_info.trading_pair,
+                position_side if position_side else executor_info.config.side
+            )
+            position.add_orders_from_executor(executor_info)
+            positions.append(position)
+        return True
 
-                # Find or create position
-                existing_position = self._find_existing_position(positions, executor_info, position_side)
+    def _get_executor_info_key(self, executor: ExecutorBase) -> Optional[Hashable]:
+        """
+        Returns a key that changes whenever the executor info of the executor may have changed, or None if it can't be
+        known and the executor info has to be computed every time. The state of a scheduled executor only changes in its
+        runs, or when it is stopped from outside.
+        """
+        if self.executors_scheduler is None:
+            return None
+        stats = self.executors_scheduler.get_stats(executor)
+        if stats is None:
+            return None
+        return executor.status, stats.runs
 
-                if existing_position:
-                    existing_position.add_orders_from_executor(executor_info)
-                else:
-                    # Create new position
-                    position = PositionHold(
-                        executor_info.connector_name,
-                        executor_info.trading_pair,
-                        position_side if position_side else executor_info.config.side
-                    )
-                    position.add_orders_from_executor(executor_info)
-                    positions.append(position)
+    def _refresh_executors_info(self, controller_id: str) -> Tuple[List[ExecutorInfo], bool]:
+        """
+        Update the running aggregates of the active executors of a controller with the executors whose state changed,
+        and the positions held with the executors that just finished holding their position.
+        Returns the executor info of the active executors, and whether any of them changed.
+        """
+        performance = self.active_executors_performance.setdefault(controller_id, ActiveExecutorsPerformance())
+        executors_list = self.active_executors.get(controller_id, [])
+        executors_info = []
+        changed = False
+        for executor in executors_list:
+            if not executor:
+                continue
+            key = self._get_executor_info_key(executor)
+            cached = performance.executors_info.get(executor)
+            # The info of a done executor is final
+            if cached is not None and (cached[1].is_done or (key is not None and cached[0] == key)):
+                executors_info.append(cached[1])
+                continue
+            executor_info = executor.executor_info
+            if cached is not None:
+                performance.remove(cached[1])
+                changed = changed or cached[1] != executor_info
+            else:
+                changed = True
+            performance.add(executor_info)
+            performance.executors_info[executor] = (key, executor_info)
+            changed = self._update_positions_from_done_executor(controller_id, executor_info) or changed
+            executors_info.append(executor_info)
+
+        if len(performance.executors_info) != len(executors_info):
+            # Drop the executors that were removed without being stored
+            active = set(executors_list)
+            for executor in [executor for executor in performance.executors_info if executor not in active]:
+                performance.remove(performance.executors_info.pop(executor)[1])
+            changed = True
+        return executors_info, changed
 
     def _determine_position_side(self, executor_info: ExecutorInfo) -> Optional[TradeType]:
         """
@@ -522,6 +614,11 @@ class ExecutorOrchestrator:
             self.logger().error(f"Executor info: {executor.executor_info} | Config: {executor.config}")
 
         self.active_executors[controller_id].remove(executor)
+        performance = self.active_executors_performance.get(controller_id)
+        if performance is not None and executor in performance.executors_info:
+            performance.remove(performance.executors_info.pop(executor)[1])
+        if self.executors_scheduler is not None:
+            self.executors_scheduler.forget(executor)
         del executor
         # Trigger garbage collection after executor cleanup
 
@@ -529,53 +626,134 @@ class ExecutorOrchestrator:
         """
         Generate a report of all executors.
         """
+        return {controller_id: self._refresh_executors_info(controller_id)[0]
+                for controller_id in list(self.active_executors.keys())}
+
+    def get_executors_scheduler_report(self) -> Dict[str, Dict[str, Dict]]:
+        """
+        Generate a report of the runs, skipped runs and CPU time of the active executors, by controller and executor id.
+        """
         report = {}
+        if self.executors_scheduler is None:
+            return report
         for controller_id, executors_list in self.active_executors.items():
-            report[controller_id] = [executor.executor_info for executor in executors_list if executor]
+            controller_report = {}
+            for executor in executors_list:
+                stats = self.executors_scheduler.get_stats(executor)
+                if stats is not None:
+                    controller_report[executor.config.id] = stats.to_dict()
+            report[controller_id] = controller_report
         return report
 
     def get_positions_report(self) -> Dict[str, List[PositionSummary]]:
         """
         Generate a report of all positions held.
         """
-        report = {}
-        for controller_id, positions_list in self.positions_held.items():
-            positions_summary = []
-            for position in positions_list:
-                mid_price = self.strategy.market_data_provider.get_price_by_type(
-                    position.connector_name, position.trading_pair, PriceType.MidPrice)
-                positions_summary.append(position.get_position_summary(mid_price))
-            report[controller_id] = positions_summary
-        return report
+        return {controller_id: self._get_positions_summaries(controller_id)[0]
+                for controller_id in self.positions_held.keys()}
+
+    def _get_positions_summaries(self, controller_id: str) -> Tuple[List[PositionSummary], List[PositionSummary]]:
+        """
+        Compute the summaries of the positions held by a controller, reading the mid price of each position once.
+        Returns the summaries of all the positions, and the summaries used in the performance report, which skip the
+        positions outside of the current strategy markets. The summaries of a position are reused while its mid price
+        and its orders are the same as when they were computed.
+        """
+        positions_summary = []
+        performance_summary = []
+        previous_summaries = self._positions_summaries.get(controller_id, {})
+        summaries = {}
+        for position in self.positions_held.get(controller_id, []):
+            mid_price = self.strategy.market_data_provider.get_price_by_type(
+                position.connector_name, position.trading_pair, PriceType.MidPrice)
+            key = (mid_price, len(position.order_ids))
+            cached = previous_summaries.get(position)
+            if cached is not None and cached[0] == key:
+                position_summary, position_performance_summary = cached[1], cached[2]
+            else:
+                position_summary = position.get_position_summary(mid_price)
+                position_performance_summary = position.get_position_summary(Decimal("0")) \
+                    if mid_price.is_nan() else position_summary
+            summaries[position] = (key, position_summary, position_performance_summary)
+            positions_summary.append(position_summary)
+            # Skip if the connector/trading pair is not in the current strategy markets
+            if (position.connector_name not in self.strategy.markets or
+                    position.trading_pair not in self.strategy.markets.get(position.connector_name, set())):
+                self.logger().warning(f"Skipping position in performance report for {position.connector_name}.{position.trading_pair} - "
+                                      f"not available in current strategy markets")
+                continue
+            performance_summary.append(position_performance_summary)
+        self._positions_summaries[controller_id] = summaries
+        return positions_summary, performance_summary
 
     def get_all_reports(self) -> Dict[str, Dict]:
         """
         Generate a unified report containing executors, positions, and performance for all controllers.
         Returns a dictionary with controller_id as key and a dict containing all reports as value.
+        Only the executors whose state changed since the previous call are read again, and the report of a controller
+        is built again only when its executors or the summaries of its positions changed, in which case the reports
+        version is increased.
         """
-        # Update any pending position holds from done executors
-        self._update_positions_from_done_executors()
-
-        # Generate all reports
-        executors_report = self.get_executors_report()
-        positions_report = self.get_positions_report()
-
         # Get all controller IDs
         all_controller_ids = set(list(self.active_executors.keys()) +
                                  list(self.positions_held.keys()) +
                                  list(self.cached_performance.keys()))
 
-        # Use dict comprehension to compile reports for each controller
-        return {
-            controller_id: {
-                "executors": executors_report.get(controller_id, []),
-                "positions": positions_report.get(controller_id, []),
-                "performance": self.generate_performance_report(controller_id)
+        reports = {}
+        changed = set(self._reports.keys()) != all_controller_ids
+        for controller_id in all_controller_ids:
+            # Updates any pending position holds from done executors
+            executors_info, executors_changed = self._refresh_executors_info(controller_id)
+            positions_summary, performance_summary = self._get_positions_summaries(controller_id)
+            previous_report = self._reports.get(controller_id)
+            if not executors_changed and previous_report is not None and \
+                    self._same_summaries(previous_report["performance"].positions_summary, performance_summary) and \
+                    self._same_summaries(previous_report["positions"], positions_summary):
+                reports[controller_id] = previous_report
+                continue
+            reports[controller_id] = {
+                "executors": executors_info,
+                "positions": positions_summary,
+                "performance": self._build_performance_report(controller_id, performance_summary),
             }
-            for controller_id in all_controller_ids
-        }
+            changed = True
+
+        if changed:
+            self._reports_version += 1
+        self._reports = reports
+        return reports
+
+    @staticmethod
+    def _same_summaries(previous: List[PositionSummary], current: List[PositionSummary]) -> bool:
+        """
+        The summaries are reused while their position did not change, so comparing their identity is enough.
+        """
+        return len(previous) == len(current) and all(a is b for a, b in zip(previous, current))
+
+    @property
+    def reports_version(self) -> int:
+        """
+        Version of the reports, increased by get_all_reports every time the reports change.
+        """
+        return self._reports_version
+
+    def get_reports_snapshot(self) -> Tuple[int, Dict[str, Dict]]:
+        """
+        Returns the version and the reports generated by the last get_all_reports call, without generating them again.
+        Remote consumers can compare the version with the one they last received to skip unchanged reports.
+        """
+        return self._reports_version, self._reports
 
     def generate_performance_report(self, controller_id: str) -> PerformanceReport:
+        self._refresh_executors_info(controller_id)
+        return self._build_performance_report(controller_id, self._get_positions_summaries(controller_id)[1])
+
+    def _build_performance_report(self, controller_id: str,
+                                  positions_summary: List[PositionSummary]) -> PerformanceReport:
+        """
+        Build the performance report of a controller from the cached performance of its stored executors, the running
+        aggregates of its active executors and the summaries of its positions held.
+        """
         # Create a new report starting from cached base values
         report = PerformanceReport()
         cached_report = self.cached_performance.get(controller_id, PerformanceReport())
@@ -586,38 +764,19 @@ class ExecutorOrchestrator:
         report.close_type_counts = cached_report.close_type_counts.copy() if cached_report.close_type_counts else {}
 
         # Add data from active executors
-        active_executors = self.active_executors.get(controller_id, [])
-        positions = self.positions_held.get(controller_id, [])
-
-        for executor in active_executors:
-            executor_info = executor.executor_info
-            if not executor_info.is_done:
-                report.unrealized_pnl_quote += executor_info.net_pnl_quote
-            else:
-                report.realized_pnl_quote += executor_info.net_pnl_quote
-                if executor_info.close_type:
-                    report.close_type_counts[executor_info.close_type] = report.close_type_counts.get(executor_info.close_type, 0) + 1
-
-            report.volume_traded += executor_info.filled_amount_quote
-
-        # Add data from positions held and collect position summaries
-        positions_summary = []
-        for position in positions:
-            # Skip if the connector/trading pair is not in the current strategy markets
-            if (position.connector_name not in self.strategy.markets or
-                    position.trading_pair not in self.strategy.markets.get(position.connector_name, set())):
-                self.logger().warning(f"Skipping position in performance report for {position.connector_name}.{position.trading_pair} - "
-                                      f"not available in current strategy markets")
-                continue
-            mid_price = self.strategy.market_data_provider.get_price_by_type(
-                position.connector_name, position.trading_pair, PriceType.MidPrice)
-            position_summary = position.get_position_summary(mid_price if not mid_price.is_nan() else Decimal("0"))
-
-            # Update report with position data
+        performance = self.active_executors_performance.get(controller_id)
+        if performance is not None:
+            report.unrealized_pnl_quote += performance.unrealized_pnl_quote
+            report.realized_pnl_quote += performance.realized_pnl_quote
+            report.volume_traded += performance.volume_traded
+            for close_type, count in performance.close_type_counts.items():
+                report.close_type_counts[close_type] = report.close_type_counts.get(close_type, 0) + count
+
+        # Add data from positions held
+        for position_summary in positions_summary:
             report.realized_pnl_quote += position_summary.realized_pnl_quote - position_summary.cum_fees_quote
             report.volume_traded += position_summary.volume_traded_quote
             report.unrealized_pnl_quote += position_summary.unrealized_pnl_quote
-            positions_summary.append(position_summary)
 
         # Set the positions summary (don't use dynamic attribute)
         report.positions_summary = positions_summary
@@ -0,0 +1,261 @@
+import asyncio
+import heapq
+import logging
+import math
+import time
+from typing import Any, Coroutine, Dict, Generator, Hashable, List, Optional
+
+from hummingbot.core.clock_metrics import TimingHistogram
+from hummingbot.core.utils.async_utils import safe_ensure_future
+from hummingbot.logger import HummingbotLogger
+from hummingbot.strategy_v2.runnable_base import RunnableBase
+
+
+class RunnableStats:
+    """
+    Scheduling statistics of a runnable driven by the ExecutorScheduler.
+    """
+
+    __slots__ = ("runs", "skips", "cpu_time")
+
+    def __init__(self):
+        self.runs: int = 0
+        self.skips: int = 0
+        # CPU time of the thread spent running control_task, per run. The time it waits suspended is not included.
+        self.cpu_time: TimingHistogram = TimingHistogram()
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "runs": self.runs,
+            "skips": self.skips,
+            "cpu_time_total": self.cpu_time.total,
+            "cpu_time": self.cpu_time.to_dict(),
+        }
+
+
+class CpuTimedCoroutine:
+    """
+    Awaitable that runs a coroutine and adds up the CPU time of the thread spent in its synchronous steps only, so the
+    other tasks that run while the coroutine is suspended are not charged to it.
+    """
+    __slots__ = ("coroutine", "cpu_time")
+
+    def __init__(self, coroutine: Coroutine):
+        self.coroutine = coroutine
+        self.cpu_time: float = 0.0
+
+    def __await__(self) -> Generator[Any, Any, Any]:
+        value, error = None, None
+        while True:
+            step_start = time.thread_time()
+            try:
+                future = self.coroutine.send(value) if error is None else self.coroutine.throw(error)
+            except StopIteration as stop:
+                return stop.value
+            finally:
+                self.cpu_time += time.thread_time() - step_start
+            try:
+                value, error = (yield future), None
+            except GeneratorExit:
+                self.coroutine.close()
+                raise
+            except BaseException as e:
+                value, error = None, e
+
+
+class ScheduledRunnable:
+    __slots__ = ("runnable", "stats", "started", "fingerprint", "last_run", "due_key", "running", "woken")
+
+    def __init__(self, runnable: RunnableBase, stats: RunnableStats):
+        self.runnable = runnable
+        self.stats = stats
+        self.started: bool = False
+        # Change fingerprint of the runnable when its last run started, None if it can't be skipped
+        self.fingerprint: Optional[Hashable] = None
+        self.last_run: float = 0.0
+        # Key of the bucket the runnable is due in, the runnable is ignored in the buckets it was moved out of
+        self.due_key: Optional[int] = None
+        self.running: bool = False
+        self.woken: bool = False
+
+
+class ExecutorScheduler:
+    """
+    Drives the control task of many runnables from a single asyncio task, instead of one control loop task per
+    runnable.
+
+    Runnables are kept in time buckets of bucket_size seconds. When a bucket is due, its runnables run as one batch
+    and each one is put back in the bucket of its next run, update_interval seconds after its run finished, as
+    RunnableBase.control_loop does. A runnable whose change fingerprint did not change since its last run is skipped,
+    unless it has not run for max_idle_interval seconds. A woken runnable is moved to the current bucket, or runs
+    again right after its current run.
+    """
+    _logger = None
+
+    @classmethod
+    def logger(cls) -> HummingbotLogger:
+        if cls._logger is None:
+            cls._logger = logging.getLogger(__name__)
+        return cls._logger
+
+    def __init__(self,
+                 bucket_size: float = 0.05,
+                 skip_unchanged: bool = True,
+                 max_idle_interval: float = 10.0):
+        """
+        :param bucket_size: The width of the time buckets, in seconds. Runnables due within the same bucket run together.
+        :param skip_unchanged: Whether runnables with an unchanged fingerprint are skipped.
+        :param max_idle_interval: The longest time, in seconds, a runnable can be skipped for.
+        """
+        self.bucket_size = bucket_size
+        self.skip_unchanged = skip_unchanged
+        self.max_idle_interval = max_idle_interval
+        self._entries: Dict[RunnableBase, ScheduledRunnable] = {}
+        self._stats: Dict[RunnableBase, RunnableStats] = {}
+        self._buckets: Dict[int, List[ScheduledRunnable]] = {}
+        self._bucket_keys: List[int] = []
+        self._wakeup: Optional[asyncio.Event] = None
+        self._loop_task: Optional[asyncio.Task] = None
+
+    @property
+    def scheduled_count(self) -> int:
+        return len(self._entries)
+
+    def add(self, runnable: RunnableBase):
+        """
+        Schedules a started runnable. Its on_start and first control task run in the next batch.
+        """
+        if runnable in self._entries:
+            return
+        stats = self._stats.setdefault(runnable, RunnableStats())
+        entry = ScheduledRunnable(runnable, stats)
+        self._entries[runnable] = entry
+        if self._loop_task is None or self._loop_task.done():
+            self._wakeup = asyncio.Event()
+            self._loop_task = safe_ensure_future(self._run_loop())
+        self._schedule(entry, self._now())
+
+    def wake(self, runnable: RunnableBase):
+        """
+        Runs a scheduled runnable as soon as possible, instead of after its update interval.
+        """
+        entry = self._entries.get(runnable)
+        if entry is None:
+            return
+        if entry.running:
+            entry.woken = True
+            return
+        now = self._now()
+        if entry.due_key is not None and entry.due_key * self.bucket_size <= now:
+            return
+        self._schedule(entry, now)
+
+    def forget(self, runnable: RunnableBase):
+        """
+        Drops the statistics of a runnable that is no longer scheduled.
+        """
+        if runnable not in self._entries:
+            self._stats.pop(runnable, None)
+
+    def get_stats(self, runnable: RunnableBase) -> Optional[RunnableStats]:
+        return self._stats.get(runnable)
+
+    def stop(self):
+        if self._loop_task is not None:
+            self._loop_task.cancel()
+            self._loop_task = None
+        self._entries.clear()
+        self._buckets.clear()
+        self._bucket_keys.clear()
+
+    @staticmethod
+    def _now() -> float:
+        return time.monotonic()
+
+    def _schedule(self, entry: ScheduledRunnable, due: float):
+        key = math.ceil(due / self.bucket_size)
+        bucket = self._buckets.get(key)
+        if bucket is None:
+            bucket = self._buckets[key] = []
+            heapq.heappush(self._bucket_keys, key)
+            if self._bucket_keys[0] == key and self._wakeup is not None:
+                # The loop may be sleeping until a later bucket, or waiting for the first one
+                self._wakeup.set()
+        bucket.append(entry)
+        entry.due_key = key
+
+    async def _run_loop(self):
+        loop = asyncio.get_event_loop()
+        while True:
+            self._wakeup.clear()
+            if not self._bucket_keys:
+                await self._wakeup.wait()
+                continue
+            delay = self._bucket_keys[0] * self.bucket_size - self._now()
+            if delay > 0:
+                timer = loop.call_later(delay, self._wakeup.set)
+                try:
+                    await self._wakeup.wait()
+                finally:
+                    timer.cancel()
+                continue
+            key = heapq.heappop(self._bucket_keys)
+            safe_ensure_future(self._run_batch(key, self._buckets.pop(key)))
+
+    async def _run_batch(self, key: int, batch: List[ScheduledRunnable]):
+        now = self._now()
+        runs = []
+        for entry in batch:
+            if self._entries.get(entry.runnable) is not entry or entry.due_key != key:
+                continue
+            entry.due_key = None
+            if entry.runnable.terminated.is_set():
+                self._finish(entry)
+            elif self._can_skip(entry, now):
+                entry.stats.skips += 1
+                self._schedule(entry, now + entry.runnable.update_interval)
+            else:
+                runs.append(self._run(entry))
+        if runs:
+            await asyncio.gather(*runs)
+
+    def _can_skip(self, entry: ScheduledRunnable, now: float) -> bool:
+        if not self.skip_unchanged or entry.fingerprint is None or now - entry.last_run >= self.max_idle_interval:
+            return False
+        return entry.runnable.change_fingerprint() == entry.fingerprint
+
+    async def _run(self, entry: ScheduledRunnable):
+        runnable = entry.runnable
+        entry.running = True
+        entry.woken = False
+        if not entry.started:
+            entry.started = True
+            try:
+                await runnable.on_start()
+            except Exception as e:
+                self.logger().error(e, exc_info=True)
+                self._entries.pop(runnable, None)
+                return
+        entry.last_run = self._now()
+        entry.fingerprint = runnable.change_fingerprint() if self.skip_unchanged else None
+        control_task = CpuTimedCoroutine(runnable.control_task())
+        try:
+            await control_task
+        except Exception as e:
+            self.logger().error(e, exc_info=True)
+        finally:
+            entry.running = False
+            entry.stats.runs += 1
+            entry.stats.cpu_time.record(control_task.cpu_time)
+        if self._entries.get(runnable) is entry:
+            if runnable.terminated.is_set():
+                self._finish(entry)
+            else:
+                self._schedule(entry, self._now() + (0 if entry.woken else runnable.update_interval))
+
+    def _finish(self, entry: ScheduledRunnable):
+        del self._entries[entry.runnable]
+        try:
+            entry.runnable.on_stop()
+        except Exception as e:
+            self.logger().error(e, exc_info=True)
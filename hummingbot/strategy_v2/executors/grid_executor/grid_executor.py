@@ -2,7 +2,7 @@ import asyncio
 import logging
 import math
 from decimal import Decimal
-from typing import Dict, List, Optional, Union
+from typing import Dict, Hashable, List, Optional, Union
 
 from hummingbot.connector.connector_base import ConnectorBase
 from hummingbot.core.data_type.common import OrderType, PositionAction, PriceType, TradeType
@@ -27,6 +27,7 @@ from hummingbot.strategy_v2.utils.distributions import Distributions
 
 class GridExecutor(ExecutorBase):
     _logger = None
+    wake_on_top_of_book_ticks = 1
 
     @classmethod
     def logger(cls) -> HummingbotLogger:
@@ -223,6 +224,18 @@ class GridExecutor(ExecutorBase):
         """
         return self.end_time and self.end_time <= self._strategy.current_timestamp
 
+    def change_fingerprint(self) -> Optional[Hashable]:
+        """
+        Adds the time limit and the order frequency to the fingerprint, so the executor runs as soon as it expires or
+        it is allowed to create open orders again.
+        """
+        fingerprint = super().change_fingerprint()
+        if fingerprint is None:
+            return None
+        can_create_open_orders = (self.max_open_creation_timestamp <=
+                                  self._strategy.current_timestamp - self.config.order_frequency)
+        return fingerprint, bool(self.is_expired), can_create_open_orders
+
     @property
     def is_trading(self):
         """
@@ -1,7 +1,7 @@
 import asyncio
 import logging
 from decimal import Decimal
-from typing import Dict, List, Optional, Union
+from typing import Dict, Hashable, List, Optional, Union
 
 from hummingbot.connector.connector_base import ConnectorBase
 from hummingbot.core.data_type.common import OrderType, PositionAction, PriceType, TradeType
@@ -25,6 +25,7 @@ from hummingbot.strategy_v2.models.executors import CloseType, TrackedOrder
 
 class PositionExecutor(ExecutorBase):
     _logger = None
+    wake_on_top_of_book_ticks = 1
 
     @classmethod
     def logger(cls) -> HummingbotLogger:
@@ -162,6 +163,13 @@ class PositionExecutor(ExecutorBase):
         """
         return self.end_time and self.end_time <= self._strategy.current_timestamp
 
+    def change_fingerprint(self) -> Optional[Hashable]:
+        """
+        Adds the time limit to the fingerprint, so the executor runs as soon as it expires.
+        """
+        fingerprint = super().change_fingerprint()
+        return None if fingerprint is None else (fingerprint, bool(self.is_expired))
+
     @property
     def current_market_price(self) -> Decimal:
         """
@@ -1,7 +1,7 @@
 import asyncio
 import logging
 from decimal import Decimal
-from typing import Dict, Optional, Union
+from typing import Dict, Hashable, Optional, Union
 
 from hummingbot.connector.connector_base import ConnectorBase
 from hummingbot.core.data_type.common import PositionAction, PriceType, TradeType
@@ -88,6 +88,12 @@ class TWAPExecutor(ExecutorBase):
             self.logger().error("Not enough budget to open position.")
             self.stop()
 
+    def change_fingerprint(self) -> Optional[Hashable]:
+        """
+        The orders are created and refreshed on a timetable, so the control task is never skipped.
+        """
+        return None
+
     async def control_task(self):
         if self.status == RunnableStatus.RUNNING:
             self.evaluate_create_order()
@@ -1,7 +1,7 @@
 import asyncio
 import logging
 from decimal import Decimal
-from typing import Dict
+from typing import Dict, List, Tuple
 
 from hummingbot.connector.connector_base import ConnectorBase, Union
 from hummingbot.connector.utils import split_hb_trading_pair
@@ -129,6 +129,10 @@ class XEMMExecutor(ExecutorBase):
             self.logger().error("Not enough budget to open position.")
             self.stop()
 
+    @property
+    def watched_markets(self) -> List[Tuple[str, str]]:
+        return [(self.maker_connector, self.maker_trading_pair), (self.taker_connector, self.taker_trading_pair)]
+
     async def control_task(self):
         if self.status == RunnableStatus.RUNNING:
             await self.update_prices_and_tx_costs()
@@ -1,11 +1,15 @@
 import asyncio
 import logging
 from abc import ABC
+from typing import TYPE_CHECKING, Hashable, Optional
 
 from hummingbot.core.utils.async_utils import safe_ensure_future
 from hummingbot.logger import HummingbotLogger
 from hummingbot.strategy_v2.models.base import RunnableStatus
 
+if TYPE_CHECKING:
+    from hummingbot.strategy_v2.executors.executor_scheduler import ExecutorScheduler
+
 
 class RunnableBase(ABC):
     """
@@ -29,6 +33,8 @@ class RunnableBase(ABC):
         self.update_interval = update_interval
         self._status: RunnableStatus = RunnableStatus.NOT_STARTED
         self.terminated = asyncio.Event()
+        # When set before start, the scheduler drives the control task instead of a dedicated control loop task
+        self.scheduler: Optional["ExecutorScheduler"] = None
 
     @property
     def status(self):
@@ -42,12 +48,16 @@ class RunnableBase(ABC):
     def start(self):
         """
         Start the control loop of the smart component.
-        If the component is not already started, it will start the control loop.
+        If the component is not already started, it will start the control loop, or hand the component to its
+        scheduler if it has one.
         """
         if self._status == RunnableStatus.NOT_STARTED:
             self.terminated.clear()
             self._status = RunnableStatus.RUNNING
-            safe_ensure_future(self.control_loop())
+            if self.scheduler is not None:
+                self.scheduler.add(self)
+            else:
+                safe_ensure_future(self.control_loop())
 
     def stop(self):
         """
@@ -93,3 +103,19 @@ class RunnableBase(ABC):
         This method should be overridden in subclasses to provide specific behavior.
         """
         pass
+
+    def wake(self):
+        """
+        Asks the scheduler to run the control task as soon as possible. Does nothing without a scheduler, the control
+        loop keeps its update interval.
+        """
+        if self.scheduler is not None:
+            self.scheduler.wake(self)
+
+    def change_fingerprint(self) -> Optional[Hashable]:
+        """
+        A value that changes whenever the inputs of the control task may have changed. A scheduler can skip the
+        control task while the fingerprint is equal to the one taken before the previous run. Returns None by
+        default, meaning the control task can't be skipped.
+        """
+        return None
@@ -0,0 +1,87 @@
+#!/usr/bin/env python
+"""
+Compares AsyncThrottler against AsyncSlidingWindowThrottler:
+
+- the cost of letting a request through while the window already holds many requests on linked limits
+- the wait of an order cancel arriving while the limit is saturated by polling requests
+
+    python -m test.benchmarks.bench_async_throttler [--requests 2000]
+"""
+import argparse
+import asyncio
+import time
+
+from hummingbot.core.api_throttler.async_request_context_base import AsyncRequestContextBase
+from hummingbot.core.api_throttler.async_sliding_window_throttler import AsyncSlidingWindowThrottler
+from hummingbot.core.api_throttler.async_throttler import AsyncThrottler
+from hummingbot.core.api_throttler.data_types import LinkedLimitWeightPair, RateLimit, RequestPriority
+
+REQUEST_WEIGHT = "REQUEST_WEIGHT"
+ORDERS = "ORDERS"
+POLL_PATH = "/account"
+CANCEL_PATH = "/order"
+
+
+def rate_limits(weight_limit: int):
+    return [
+        RateLimit(limit_id=REQUEST_WEIGHT, limit=weight_limit, time_interval=60),
+        RateLimit(limit_id=ORDERS, limit=weight_limit, time_interval=10),
+        RateLimit(limit_id=POLL_PATH, limit=weight_limit, time_interval=60,
+                  linked_limits=[LinkedLimitWeightPair(REQUEST_WEIGHT, 2)]),
+        RateLimit(limit_id=CANCEL_PATH, limit=weight_limit, time_interval=60,
+                  linked_limits=[LinkedLimitWeightPair(REQUEST_WEIGHT, 1), LinkedLimitWeightPair(ORDERS, 1)]),
+    ]
+
+
+async def acquire_cost(throttler_class, requests: int) -> float:
+    throttler = throttler_class(rate_limits=rate_limits(weight_limit=requests * 4))
+    start = time.perf_counter()
+    for index in range(requests):
+        async with throttler.execute_task(limit_id=POLL_PATH if index % 2 else CANCEL_PATH):
+            pass
+    return (time.perf_counter() - start) / requests * 1e6
+
+
+async def cancel_wait(throttler_class) -> float:
+    throttler = throttler_class(rate_limits=[
+        RateLimit(limit_id=REQUEST_WEIGHT, limit=10, time_interval=0.5),
+        RateLimit(limit_id=POLL_PATH, limit=1000, time_interval=0.5, linked_limits=[LinkedLimitWeightPair(REQUEST_WEIGHT)]),
+        RateLimit(limit_id=CANCEL_PATH, limit=1000, time_interval=0.5, linked_limits=[LinkedLimitWeightPair(REQUEST_WEIGHT)]),
+    ])
+    # Keeps the capacity warnings (which notify the running application) out of the measurement
+    AsyncRequestContextBase._last_max_cap_warning_ts = float("inf")
+    throttler._last_max_cap_warning_ts = float("inf")
+
+    async def poll():
+        async with throttler.execute_task(limit_id=POLL_PATH):
+            pass
+
+    polls = [asyncio.ensure_future(poll()) for _ in range(30)]
+    await asyncio.sleep(0.01)
+    start = time.perf_counter()
+    if isinstance(throttler, AsyncSlidingWindowThrottler):
+        context = throttler.execute_task(limit_id=CANCEL_PATH, priority=RequestPriority.HIGH)
+    else:
+        context = throttler.execute_task(limit_id=CANCEL_PATH)
+    async with context:
+        pass
+    elapsed = time.perf_counter() - start
+    for task in polls:
+        task.cancel()
+    await asyncio.gather(*polls, return_exceptions=True)
+    return elapsed * 1e3
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--requests", type=int, default=2000)
+    args = parser.parse_args()
+
+    for throttler_class in (AsyncThrottler, AsyncSlidingWindowThrottler):
+        cost = asyncio.run(acquire_cost(throttler_class, args.requests))
+        wait = asyncio.run(cancel_wait(throttler_class))
+        print(f"{throttler_class.__name__:<28} {cost:>10.1f} us/request  cancel wait {wait:>7.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,109 @@
+#!/usr/bin/env python
+"""
+Times the backtesting of the reference controllers with the per-row engine and with the vectorized engine, on
+generated 1m candles, and checks that both give the same executors:
+
+- directional controllers (bollinger_v1, macd_bb_v1, supertrend_v1): the vectorized engine only visits the rows with
+  a signal and the rows at which executors stop
+- market making controllers (pmm_simple): both engines visit every row, the position executors are simulated with
+  NumPy in both
+- grid_strike: both engines visit every row, the grid executors are simulated from fill to fill
+
+    python -m test.benchmarks.bench_backtesting [--days 180] [--controllers bollinger_v1 pmm_simple]
+"""
+import argparse
+import asyncio
+import time
+from decimal import Decimal
+
+import numpy as np
+import pandas as pd
+
+from hummingbot.connector.trading_rule import TradingRule
+from hummingbot.strategy_v2.backtesting.backtesting_engine_base import BacktestingEngineBase
+
+CONNECTOR = "binance_perpetual"
+TRADING_PAIR = "BTC-USDT"
+START_TIMESTAMP = 1_700_000_040
+CONTROLLERS = {
+    "bollinger_v1": {"controller_type": "directional_trading", "candles_connector": CONNECTOR,
+                     "candles_trading_pair": TRADING_PAIR, "interval": "1m"},
+    "macd_bb_v1": {"controller_type": "directional_trading", "candles_connector": CONNECTOR,
+                   "candles_trading_pair": TRADING_PAIR, "interval": "1m"},
+    "supertrend_v1": {"controller_type": "directional_trading", "candles_connector": CONNECTOR,
+                      "candles_trading_pair": TRADING_PAIR, "interval": "1m"},
+    "pmm_simple": {"controller_type": "market_making", "buy_spreads": "0.002,0.005", "sell_spreads": "0.002,0.005",
+                   "buy_amounts_pct": "1,1", "sell_amounts_pct": "1,1"},
+    "grid_strike": {"controller_type": "generic", "start_price": 29000, "end_price": 31500, "limit_price": 28000},
+}
+
+
+def generate_candles(minutes: int, seed: int = 42) -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    timestamps = START_TIMESTAMP + 60 * np.arange(minutes, dtype=float)
+    close = 30000 * np.exp(np.cumsum(rng.normal(0, 0.001, minutes)))
+    open_ = np.concatenate([[close[0]], close[:-1]])
+    spread = np.abs(rng.normal(0, 0.0007, minutes))
+    volume = rng.uniform(1, 100, minutes)
+    return pd.DataFrame({
+        "timestamp": timestamps,
+        "open": open_,
+        "high": np.maximum(open_, close) * (1 + spread),
+        "low": np.minimum(open_, close) * (1 - spread),
+        "close": close,
+        "volume": volume,
+        "quote_asset_volume": volume * close,
+        "n_trades": rng.integers(10, 1000, minutes).astype(float),
+        "taker_buy_base_volume": volume / 2,
+        "taker_buy_quote_volume": volume * close / 2,
+    })
+
+
+def set_up_engine(candles: pd.DataFrame) -> BacktestingEngineBase:
+    engine = BacktestingEngineBase()
+    data_provider = engine.backtesting_data_provider
+    # The candles and trading rules are preloaded and the live rates are not started, the backtests don't use the
+    # network
+    data_provider.initialize_rate_sources = lambda connector_pairs: None
+    data_provider.candles_feeds[f"{CONNECTOR}_{TRADING_PAIR}_1m"] = candles
+    data_provider.trading_rules[CONNECTOR] = {TRADING_PAIR: TradingRule(
+        TRADING_PAIR, min_base_amount_increment=Decimal("0.00001"), min_price_increment=Decimal("0.01"))}
+    return engine
+
+
+async def backtest(candles: pd.DataFrame, controller_name: str, vectorized: bool):
+    engine = set_up_engine(candles)
+    config = BacktestingEngineBase.get_controller_config_instance_from_dict(
+        {"id": controller_name, "controller_name": controller_name, "connector_name": CONNECTOR,
+         "trading_pair": TRADING_PAIR, "total_amount_quote": 1000, **CONTROLLERS[controller_name]},
+        controllers_module="controllers")
+    start = time.perf_counter()
+    result = await engine.run_backtesting(config, int(candles["timestamp"].iloc[0]),
+                                          int(candles["timestamp"].iloc[-1]), "1m", vectorized=vectorized)
+    return time.perf_counter() - start, result
+
+
+def executors_summary(result) -> list:
+    return [(executor.timestamp, executor.side, executor.close_type, executor.close_timestamp,
+             executor.net_pnl_quote, executor.filled_amount_quote) for executor in result["executors"]]
+
+
+async def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--days", type=int, default=180)
+    parser.add_argument("--controllers", nargs="+", default=list(CONTROLLERS))
+    args = parser.parse_args()
+
+    candles = generate_candles(args.days * 24 * 60)
+    print(f"{len(candles)} candles")
+    print(f"{'controller':<16}{'executors':>10}{'per row (s)':>14}{'vectorized (s)':>16}{'speedup':>10}{'same':>6}")
+    for controller_name in args.controllers:
+        per_row_time, per_row_result = await backtest(candles, controller_name, vectorized=False)
+        vectorized_time, vectorized_result = await backtest(candles, controller_name, vectorized=True)
+        same = executors_summary(per_row_result) == executors_summary(vectorized_result)
+        print(f"{controller_name:<16}{len(vectorized_result['executors']):>10}{per_row_time:>14.2f}"
+              f"{vectorized_time:>16.2f}{per_row_time / vectorized_time:>9.1f}x{str(same):>6}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
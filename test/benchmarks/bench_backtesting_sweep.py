@@ -0,0 +1,68 @@
+#!/usr/bin/env python
+"""
+Times a parameter sweep of the grid_strike controller on generated 1m candles, backtested one configuration after the
+other and with BacktestingSweep across the cores of the machine, and checks that both give the same results. With
+--max-loss, the sweep abandons the configurations that lose more than it.
+
+    python -m test.benchmarks.bench_backtesting_sweep [--days 90] [--workers 8] [--max-loss 50]
+"""
+import argparse
+import asyncio
+import os
+import time
+
+from hummingbot.strategy_v2.backtesting.backtesting_engine_base import BacktestingEngineBase
+from hummingbot.strategy_v2.backtesting.backtesting_sweep import BacktestingSweep
+from test.benchmarks.bench_backtesting import CONNECTOR, TRADING_PAIR, generate_candles, set_up_engine
+
+BASE_CONFIG = {"id": "grid_strike", "controller_name": "grid_strike", "controller_type": "generic",
+               "connector_name": CONNECTOR, "trading_pair": TRADING_PAIR, "total_amount_quote": 1000,
+               "start_price": 29000, "end_price": 31500}
+PARAMETERS = {
+    "limit_price": [27000, 28000, 28500],
+    "min_spread_between_orders": [0.0005, 0.001, 0.002, 0.004],
+    "max_open_orders": [2, 5],
+}
+
+
+async def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--days", type=int, default=90)
+    parser.add_argument("--workers", type=int, default=os.cpu_count())
+    parser.add_argument("--max-loss", type=float, default=None)
+    args = parser.parse_args()
+
+    candles = generate_candles(args.days * 24 * 60)
+    start, end = int(candles["timestamp"].iloc[0]), int(candles["timestamp"].iloc[-1])
+    configs = BacktestingSweep.config_grid(BASE_CONFIG, PARAMETERS)
+    print(f"{len(candles)} candles, {len(configs)} configurations, {args.workers} workers")
+
+    sequential_start = time.perf_counter()
+    sequential_results = {}
+    for config in configs:
+        controller_config = BacktestingEngineBase.get_controller_config_instance_from_dict(
+            config, controllers_module="controllers")
+        result = await set_up_engine(candles).run_backtesting(controller_config, start, end, "1m")
+        sequential_results[config["id"]] = result["results"]
+    sequential_time = time.perf_counter() - sequential_start
+
+    sweep = BacktestingSweep(max_workers=args.workers, controllers_module="controllers",
+                             backtesting_engine=set_up_engine(candles))
+    sweep_start = time.perf_counter()
+    first_row_time = None
+    same = True
+    abandoned = 0
+    async for row in sweep.run(configs, start, end, "1m", max_loss_quote=args.max_loss):
+        first_row_time = first_row_time or time.perf_counter() - sweep_start
+        abandoned += row["abandoned"]
+        same &= row["error"] is None and (row["abandoned"] or
+                                          row["results"] == sequential_results[row["config"]["id"]])
+    sweep_time = time.perf_counter() - sweep_start
+
+    print(f"{'sequential (s)':>16}{'sweep (s)':>12}{'first row (s)':>16}{'speedup':>10}{'abandoned':>11}{'same':>6}")
+    print(f"{sequential_time:>16.2f}{sweep_time:>12.2f}{first_row_time:>16.2f}{sequential_time / sweep_time:>9.1f}x"
+          f"{abandoned:>11}{str(same):>6}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,106 @@
+#!/usr/bin/env python
+"""
+Compares the native order book depth walk, with and without the cumulative depth index, against the generator
+based walk it replaced.
+
+    python -m test.benchmarks.bench_order_book_depth_walk [--levels 1000] [--iterations 2000]
+"""
+import argparse
+import time
+from typing import Callable, List
+
+import numpy as np
+
+from hummingbot.core.data_type.order_book import OrderBook
+
+
+def generator_price_for_volume(order_book: OrderBook, is_buy: bool, volume: float) -> float:
+    cumulative_volume = 0
+    for row in (order_book.ask_entries() if is_buy else order_book.bid_entries()):
+        cumulative_volume += row.amount
+        if cumulative_volume >= volume:
+            return row.price
+    return float("nan")
+
+
+def generator_vwap_for_volume(order_book: OrderBook, is_buy: bool, volume: float) -> float:
+    total_cost = 0
+    total_volume = 0
+    for row in (order_book.ask_entries() if is_buy else order_book.bid_entries()):
+        total_cost += row.amount * row.price
+        total_volume += row.amount
+        if total_volume >= volume:
+            total_cost -= row.amount * row.price
+            total_volume -= row.amount
+            incremental_amount = volume - total_volume
+            total_cost += incremental_amount * row.price
+            total_volume += incremental_amount
+            return total_cost / total_volume
+    return float("nan")
+
+
+def build_order_book(levels: int) -> OrderBook:
+    rng = np.random.default_rng(42)
+    order_book = OrderBook()
+    bids = np.column_stack([100 - np.arange(levels) * 0.01, rng.uniform(0.1, 5, levels), np.ones(levels)])
+    asks = np.column_stack([100.01 + np.arange(levels) * 0.01, rng.uniform(0.1, 5, levels), np.ones(levels)])
+    order_book.apply_numpy_snapshot(bids, asks)
+    return order_book
+
+
+def measure(label: str, iterations: int, func: Callable[[], object]) -> float:
+    start = time.perf_counter()
+    for _ in range(iterations):
+        func()
+    elapsed = (time.perf_counter() - start) / iterations * 1e6
+    print(f"{label:<48} {elapsed:>10.2f} us/call")
+    return elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--levels", type=int, default=1000)
+    parser.add_argument("--iterations", type=int, default=2000)
+    args = parser.parse_args()
+
+    order_book = build_order_book(args.levels)
+    total_depth = sum(row.amount for row in order_book.ask_entries())
+    # Query sizes spread across the whole book, as a market maker asking for several order levels would.
+    volumes: List[float] = list(np.linspace(total_depth / 50, total_depth * 0.9, 10))
+
+    for volume in volumes:
+        assert order_book.get_price_for_volume(True, volume).result_price == \
+            generator_price_for_volume(order_book, True, volume)
+        assert abs(order_book.get_vwap_for_volume(False, volume).result_price -
+                   generator_vwap_for_volume(order_book, False, volume)) < 1e-9
+
+    print(f"{args.levels} levels per side, {len(volumes)} volume queries per call")
+    results = {
+        "generator": measure("generator price + vwap for volumes", args.iterations, lambda: [
+            (generator_price_for_volume(order_book, True, v), generator_vwap_for_volume(order_book, True, v))
+            for v in volumes]),
+        "native": measure("native price + vwap for volumes", args.iterations, lambda: [
+            (order_book.get_price_for_volume(True, v), order_book.get_vwap_for_volume(True, v))
+            for v in volumes]),
+        "batched": measure("batched walk_depth_for_volumes", args.iterations,
+                           lambda: order_book.walk_depth_for_volumes(True, volumes)),
+    }
+
+    indexed_order_book = build_order_book(args.levels)
+    indexed_order_book.depth_index_enabled = True
+    results["indexed"] = measure("indexed price + vwap for volumes", args.iterations, lambda: [
+        (indexed_order_book.get_price_for_volume(True, v), indexed_order_book.get_vwap_for_volume(True, v))
+        for v in volumes])
+
+    def rebuild_and_query():
+        indexed_order_book.depth_index_enabled = True
+        return [(indexed_order_book.get_price_for_volume(True, v), indexed_order_book.get_vwap_for_volume(True, v))
+                for v in volumes]
+    results["indexed_rebuild"] = measure("indexed, rebuilt every call", args.iterations, rebuild_and_query)
+
+    for name in ("native", "batched", "indexed", "indexed_rebuild"):
+        print(f"{name + ' speedup:':<24} {results['generator'] / results[name]:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,51 @@
+#!/usr/bin/env python
+"""
+Compares OrderBook.to_numpy and the snapshot built on it against the generator based snapshot it replaced.
+
+    python -m test.benchmarks.bench_order_book_export [--levels 5000] [--iterations 200]
+"""
+import argparse
+from typing import Tuple
+
+import numpy as np
+import pandas as pd
+
+from hummingbot.core.data_type.order_book import ORDER_BOOK_ROW_DTYPE
+from hummingbot.core.data_type.order_book_row import OrderBookRow
+from test.benchmarks.bench_order_book_depth_walk import build_order_book, measure
+
+
+def generator_snapshot(order_book) -> Tuple[pd.DataFrame, pd.DataFrame]:
+    bids_df = pd.DataFrame(data=list(order_book.bid_entries()), columns=OrderBookRow._fields, dtype="float64")
+    asks_df = pd.DataFrame(data=list(order_book.ask_entries()), columns=OrderBookRow._fields, dtype="float64")
+    return bids_df, asks_df
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--levels", type=int, default=5000)
+    parser.add_argument("--iterations", type=int, default=200)
+    args = parser.parse_args()
+
+    order_book = build_order_book(args.levels)
+    expected_bids, expected_asks = generator_snapshot(order_book)
+    bids, asks = order_book.snapshot
+    assert expected_bids.equals(bids) and expected_asks.equals(asks)
+
+    bids_out = np.empty(args.levels, dtype=ORDER_BOOK_ROW_DTYPE)
+    asks_out = np.empty(args.levels, dtype=ORDER_BOOK_ROW_DTYPE)
+
+    print(f"{args.levels} levels per side")
+    results = {
+        "generator": measure("generator snapshot", args.iterations, lambda: generator_snapshot(order_book)),
+        "snapshot": measure("snapshot", args.iterations, lambda: order_book.snapshot),
+        "to_numpy": measure("to_numpy", args.iterations, lambda: order_book.to_numpy()),
+        "to_numpy_buffers": measure("to_numpy into preallocated buffers", args.iterations,
+                                    lambda: order_book.to_numpy(bids_out=bids_out, asks_out=asks_out)),
+    }
+    for name in ("snapshot", "to_numpy", "to_numpy_buffers"):
+        print(f"{name + ' speedup:':<26} {results['generator'] / results[name]:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
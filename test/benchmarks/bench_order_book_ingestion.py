@@ -0,0 +1,68 @@
+#!/usr/bin/env python
+"""
+Compares diff ingestion through OrderBookMessage.bids_array / asks_array and OrderBook.apply_raw_diffs against the
+OrderBookRow based apply_diffs path it replaced in OrderBookTracker.
+
+    python -m test.benchmarks.bench_order_book_ingestion [--levels 20] [--messages 20000]
+"""
+import argparse
+import time
+from typing import List
+
+import numpy as np
+
+from hummingbot.core.data_type.order_book import OrderBook
+from hummingbot.core.data_type.order_book_message import OrderBookMessage, OrderBookMessageType
+from hummingbot.core.data_type.order_book_row import OrderBookRow
+from test.benchmarks.bench_order_book_depth_walk import build_order_book
+
+
+def build_messages(count: int, levels: int) -> List[OrderBookMessage]:
+    rng = np.random.default_rng(42)
+    messages = []
+    for update_id in range(count):
+        bids = [[f"{price:.2f}", f"{amount:.4f}"] for price, amount in
+                zip(100 - rng.integers(0, 1000, levels) * 0.01, rng.uniform(0, 5, levels))]
+        asks = [[f"{price:.2f}", f"{amount:.4f}"] for price, amount in
+                zip(100.01 + rng.integers(0, 1000, levels) * 0.01, rng.uniform(0, 5, levels))]
+        messages.append(OrderBookMessage(OrderBookMessageType.DIFF, {
+            "trading_pair": "COINALPHA-HBOT", "update_id": update_id + 2, "bids": bids, "asks": asks,
+        }, timestamp=update_id))
+    return messages
+
+
+def apply_rows(order_book: OrderBook, message: OrderBookMessage):
+    # OrderBookMessage.bids / asks as they were before being cached on the message
+    bids = [OrderBookRow(float(price), float(amount), message.update_id) for price, amount, *_ in message.content["bids"]]
+    asks = [OrderBookRow(float(price), float(amount), message.update_id) for price, amount, *_ in message.content["asks"]]
+    order_book.apply_diffs(bids, asks, message.update_id)
+
+
+def apply_arrays(order_book: OrderBook, message: OrderBookMessage):
+    order_book.apply_raw_diffs(message.bids_array, message.asks_array, message.update_id)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--levels", type=int, default=20)
+    parser.add_argument("--messages", type=int, default=20000)
+    args = parser.parse_args()
+
+    results = {}
+    books = {}
+    for name, apply in (("rows", apply_rows), ("arrays", apply_arrays)):
+        messages = build_messages(args.messages, args.levels)
+        order_book = build_order_book(1000)
+        start = time.perf_counter()
+        for message in messages:
+            apply(order_book, message)
+        results[name] = (time.perf_counter() - start) / args.messages * 1e6
+        books[name] = order_book
+        print(f"{name:<8} {results[name]:>8.2f} us/message")
+
+    assert [tuple(row) for row in books["rows"].bid_entries()] == [tuple(row) for row in books["arrays"].bid_entries()]
+    print(f"speedup: {results['rows'] / results['arrays']:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,91 @@
+#!/usr/bin/env python
+"""
+Compares the per-pair routing of OrderBookTracker (one queue and one tracking task per pair) against the batched
+routing mode (a single queue drained in batches, with consecutive diffs of a pair coalesced).
+
+    python -m test.benchmarks.bench_order_book_tracker_routing [--pairs 100] [--messages 50000] [--levels 2]
+"""
+import argparse
+import asyncio
+import gc
+import time
+from typing import Dict, List, Optional
+
+from hummingbot.core.data_type.order_book import OrderBook
+from hummingbot.core.data_type.order_book_message import OrderBookMessage
+from hummingbot.core.data_type.order_book_tracker import OrderBookTracker
+from hummingbot.core.data_type.order_book_tracker_data_source import OrderBookTrackerDataSource
+from test.benchmarks.bench_order_book_ingestion import build_messages
+
+
+class BenchmarkDataSource(OrderBookTrackerDataSource):
+
+    async def get_last_traded_prices(self, trading_pairs: List[str], domain: Optional[str] = None) -> Dict[str, float]:
+        return {}
+
+    async def get_new_order_book(self, trading_pair: str) -> OrderBook:
+        order_book = OrderBook()
+        order_book.apply_raw_snapshot([], [], 1)
+        return order_book
+
+    async def _parse_trade_message(self, raw_message, message_queue: asyncio.Queue):
+        pass
+
+    async def _parse_order_book_diff_message(self, raw_message, message_queue: asyncio.Queue):
+        pass
+
+    async def _connected_websocket_assistant(self):
+        pass
+
+    async def _subscribe_channels(self, ws):
+        pass
+
+    async def _order_book_snapshot(self, trading_pair: str):
+        pass
+
+
+async def run(batched: bool, trading_pairs: List[str], messages: List[OrderBookMessage]) -> float:
+    tracker = OrderBookTracker(BenchmarkDataSource(trading_pairs), trading_pairs, batched_routing=batched)
+    await tracker._init_order_books()
+    router = asyncio.ensure_future(
+        tracker._order_book_batch_router() if batched else tracker._order_book_diff_router())
+    last_update_ids = {message.trading_pair: message.update_id for message in messages}
+
+    start = time.perf_counter()
+    for message in messages:
+        tracker._order_book_diff_stream.put_nowait(message)
+    while any(tracker.order_books[trading_pair].last_diff_uid != update_id
+              for trading_pair, update_id in last_update_ids.items()):
+        await asyncio.sleep(0)
+    elapsed = time.perf_counter() - start
+
+    router.cancel()
+    tracker.stop()
+    if batched:
+        print(f"  {tracker.batch_routing_stats}")
+    return elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--pairs", type=int, default=100)
+    parser.add_argument("--messages", type=int, default=50000)
+    parser.add_argument("--levels", type=int, default=2)
+    args = parser.parse_args()
+
+    trading_pairs = [f"COIN{index}-HBOT" for index in range(args.pairs)]
+
+    results = {}
+    for name, batched in (("per-pair", False), ("batched", True)):
+        # Fresh messages for each run, the parsed levels are cached on them
+        messages = build_messages(args.messages, args.levels)
+        for index, message in enumerate(messages):
+            message.content["trading_pair"] = trading_pairs[index % args.pairs]
+        gc.collect()
+        results[name] = asyncio.run(run(batched, trading_pairs, messages)) / args.messages * 1e6
+        print(f"{name:<10} {results[name]:>8.2f} us/message")
+    print(f"speedup: {results['per-pair'] / results['batched']:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
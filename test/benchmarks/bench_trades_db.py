@@ -0,0 +1,179 @@
+#!/usr/bin/env python
+"""
+Times the trades database queries that grow with the history of the bot, on a generated database, before and after
+the SQLite performance profile (WAL journal and pragmas) and the AddQueryIndexes migration:
+
+- history: the trades of a config since a timestamp, as queried by the history command
+- startup restore: the latest trades and orders with exchange order id of a config, as loaded by the MarketsRecorder
+- order fills: the fills of orders loaded by id
+- recording: order updates committed one at a time, as the markets recorder does before it is started
+
+    python -m test.benchmarks.bench_trades_db [--trades 2000000] [--path /tmp/bench_trades.sqlite]
+"""
+import argparse
+import asyncio
+import json
+import os
+import time
+from types import SimpleNamespace
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from hummingbot.client.config.client_config_map import ClientConfigMap, MarketDataCollectionConfigMap
+from hummingbot.client.config.config_helpers import ClientConfigAdapter
+from hummingbot.connector.markets_recorder import MarketsRecorder
+from hummingbot.model.db_migration.transformations import AddQueryIndexes
+from hummingbot.model.order import Order
+from hummingbot.model.sql_connection_manager import SQLConnectionManager, SQLConnectionType
+from hummingbot.model.trade_fill import TradeFill
+
+CONFIGS = [f"conf_pmm_{index}.yml" for index in range(20)]
+MARKETS = ["binance", "kucoin", "gate_io", "okx", "bybit"]
+START_TIMESTAMP = 1_600_000_000_000
+TRADE_INTERVAL_MS = 500
+FILLS_PER_ORDER = 2
+BATCH_SIZE = 50_000
+
+
+def generate_database(path: str, trades: int):
+    for suffix in ("", "-wal", "-shm"):
+        if os.path.exists(path + suffix):
+            os.remove(path + suffix)
+    manager = SQLConnectionManager(ClientConfigAdapter(ClientConfigMap()), SQLConnectionType.TRADE_FILLS, db_path=path)
+    trade_fee = json.dumps({"percent": "0.001", "flat_fees": []})
+    with manager.engine.begin() as conn:
+        orders = []
+        fills = []
+        for index in range(trades):
+            order_index = index // FILLS_PER_ORDER
+            config = CONFIGS[order_index % len(CONFIGS)]
+            market = MARKETS[order_index // len(CONFIGS) % len(MARKETS)]
+            timestamp = START_TIMESTAMP + index * TRADE_INTERVAL_MS
+            if index % FILLS_PER_ORDER == 0:
+                orders.append((f"OID{order_index}", config, "pure_market_making", market, "BTC-USDT", "BTC", "USDT",
+                               timestamp, "LIMIT", 1000000, 1, 30000000000, "OrderFilled", timestamp,
+                               f"EOID{order_index}", "NIL"))
+            fills.append((config, "pure_market_making", market, "BTC-USDT", "BTC", "USDT", timestamp,
+                          f"OID{order_index}", "BUY", "LIMIT", 30000000000, 500000, 1, trade_fee, 0,
+                          f"TID{index}", "NIL"))
+            if len(fills) == BATCH_SIZE:
+                _insert(conn, orders, fills)
+                orders, fills = [], []
+        if len(fills) > 0:
+            _insert(conn, orders, fills)
+    manager.engine.dispose()
+
+
+def _insert(conn, orders, fills):
+    conn.exec_driver_sql(
+        'INSERT INTO "Order" (id, config_file_path, strategy, market, symbol, base_asset, quote_asset, '
+        'creation_timestamp, order_type, amount, leverage, price, last_status, last_update_timestamp, '
+        'exchange_order_id, position) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)', orders)
+    conn.exec_driver_sql(
+        'INSERT INTO TradeFill (config_file_path, strategy, market, symbol, base_asset, quote_asset, timestamp, '
+        'order_id, trade_type, order_type, price, amount, leverage, trade_fee, trade_fee_in_quote, '
+        'exchange_trade_id, position) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)', fills)
+
+
+def set_up_baseline(path: str):
+    """
+    Brings the database back to the previous profile: rollback journal, full synchronous commits and no new indexes
+    """
+    engine = create_engine(f"sqlite:///{path}")
+    with engine.begin() as conn:
+        conn.exec_driver_sql("PRAGMA journal_mode=DELETE")
+        for index_name in ("o_config_market_timestamp_index", "tf_timestamp_index", "tf_order_id_index"):
+            conn.exec_driver_sql(f"DROP INDEX IF EXISTS {index_name}")
+    return engine
+
+
+def set_up_profile(path: str):
+    engine = create_engine(f"sqlite:///{path}")
+    AddQueryIndexes(migrator=None).apply(SimpleNamespace(engine=engine))
+    engine.dispose()
+    manager = SQLConnectionManager(ClientConfigAdapter(ClientConfigMap()), SQLConnectionType.TRADE_FILLS, db_path=path)
+    return manager.engine
+
+
+def timed(function, repeat: int = 5) -> float:
+    """
+    Best of the repetitions, in milliseconds
+    """
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        best = min(best, time.perf_counter() - start)
+    return best * 1e3
+
+
+def measure(engine, trades: int):
+    session_factory = sessionmaker(bind=engine)
+    recorder = MarketsRecorder(sql=SimpleNamespace(get_new_session=session_factory),
+                               markets=[],
+                               config_file_path=CONFIGS[0],
+                               strategy_name="pure_market_making",
+                               market_data_collection=MarketDataCollectionConfigMap())
+    last_timestamp = START_TIMESTAMP + trades * TRADE_INTERVAL_MS
+    history_start = last_timestamp - 3600 * 1000
+
+    def history():
+        # Same query as TradingCore._get_trades_from_session
+        with session_factory() as session:
+            (session.query(TradeFill)
+             .filter(TradeFill.timestamp >= history_start, TradeFill.config_file_path.like(f"%{CONFIGS[0]}%"))
+             .order_by(TradeFill.timestamp.desc())
+             .all())
+
+    def startup_restore():
+        recorder.get_trades_for_config(CONFIGS[0], 2000)
+        recorder.get_orders_for_config_and_market(CONFIGS[0], SimpleNamespace(display_name=MARKETS[0]), True, 2000)
+
+    def order_fills():
+        with session_factory() as session:
+            for order_index in range(0, trades // FILLS_PER_ORDER, trades // FILLS_PER_ORDER // 200):
+                session.get(Order, f"OID{order_index}").trade_fills
+
+    def recording():
+        for index in range(200):
+            with session_factory() as session:
+                with session.begin():
+                    session.execute(Order.__table__.update()
+                                    .where(Order.id == f"OID{index}")
+                                    .values(last_update_timestamp=last_timestamp + index))
+
+    results = {
+        "history (ms)": timed(history),
+        "startup restore (ms)": timed(startup_restore),
+        "200 order fills (ms)": timed(order_fills, repeat=1),
+        "200 commits (ms)": timed(recording, repeat=2),
+    }
+    engine.dispose()
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--trades", type=int, default=2_000_000)
+    parser.add_argument("--path", type=str, default="/tmp/bench_trades.sqlite")
+    args = parser.parse_args()
+
+    # The recorder expects an event loop in the main thread
+    asyncio.set_event_loop(asyncio.new_event_loop())
+
+    start = time.perf_counter()
+    generate_database(args.path, args.trades)
+    print(f"Generated {args.trades} trades and {args.trades // FILLS_PER_ORDER} orders in "
+          f"{time.perf_counter() - start:.1f} s ({os.path.getsize(args.path) / 2 ** 20:.0f} MiB)")
+
+    baseline = measure(set_up_baseline(args.path), args.trades)
+    profile = measure(set_up_profile(args.path), args.trades)
+
+    print(f"{'':<24}{'before':>12}{'after':>12}{'speedup':>10}")
+    for name in baseline:
+        print(f"{name:<24}{baseline[name]:>12.2f}{profile[name]:>12.2f}{baseline[name] / profile[name]:>9.1f}x")
+
+
+if __name__ == "__main__":
+    main()
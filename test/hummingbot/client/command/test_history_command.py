@@ -33,7 +33,9 @@ class HistoryCommandTest(IsolatedAsyncioWrapperTestCase):
     def tearDown(self) -> None:
         self.cli_mock_assistant.stop()
         db_path = Path(SQLConnectionManager.create_db_path(db_name=self.mock_strategy_name))
-        db_path.unlink(missing_ok=True)
+        # The write-ahead log mode leaves the -wal and -shm files next to the database
+        for path in (db_path, db_path.with_name(f"{db_path.name}-wal"), db_path.with_name(f"{db_path.name}-shm")):
+            path.unlink(missing_ok=True)
         super().tearDown()
 
     @staticmethod
@@ -0,0 +1,190 @@
+import asyncio
+import unittest
+from decimal import Decimal
+from typing import Awaitable, List
+from unittest.mock import patch
+
+from sqlalchemy import create_engine
+
+from hummingbot.client.config.client_config_map import ClientConfigMap
+from hummingbot.client.config.config_helpers import ClientConfigAdapter
+from hummingbot.client.performance import PerformanceMetrics
+from hummingbot.client.trades_aggregator import AGGREGATION_PERIOD_MS, TradesAggregator
+from hummingbot.core.data_type.common import PositionAction
+from hummingbot.core.data_type.trade_fee import AddedToCostTradeFee, DeductedFromReturnsTradeFee, TokenAmount
+from hummingbot.core.rate_oracle.rate_oracle import RateOracle
+from hummingbot.model.order import Order  # noqa — Order needs to be defined for TradeFill
+from hummingbot.model.sql_connection_manager import SQLConnectionManager, SQLConnectionType
+from hummingbot.model.trade_fill import TradeFill
+
+DAY_MS = AGGREGATION_PERIOD_MS
+NOW = 20 * DAY_MS + 12 * 60 * 60 * 1000
+
+
+class TradesAggregatorTest(unittest.TestCase):
+
+    @patch("hummingbot.model.sql_connection_manager.create_engine")
+    def setUp(self, engine_mock) -> None:
+        super().setUp()
+        engine_mock.return_value = create_engine("sqlite:///:memory:")
+        self.manager = SQLConnectionManager(
+            ClientConfigAdapter(ClientConfigMap()), SQLConnectionType.TRADE_FILLS, db_name="test_DB"
+        )
+        self.aggregator = TradesAggregator(self.manager)
+        current_timestamp_patch = patch.object(TradesAggregator, "_current_timestamp", return_value=NOW)
+        current_timestamp_patch.start()
+        self.addCleanup(current_timestamp_patch.stop)
+
+        rate_oracle = RateOracle()
+        rate_oracle._prices = {"HBOT-USDT": Decimal("1.5"), "BNB-USDT": Decimal("300")}
+        RateOracle._shared_instance = rate_oracle
+        self.trade_index = 0
+
+    def tearDown(self) -> None:
+        RateOracle._shared_instance = None
+        super().tearDown()
+
+    @staticmethod
+    def async_run_with_timeout(coroutine: Awaitable, timeout: int = 1):
+        return asyncio.get_event_loop().run_until_complete(asyncio.wait_for(coroutine, timeout))
+
+    def add_trade(self,
+                  timestamp: int,
+                  trade_type: str,
+                  price: str,
+                  amount: str,
+                  trade_fee=None,
+                  market: str = "binance",
+                  symbol: str = "HBOT-USDT",
+                  position: str = PositionAction.NIL.value,
+                  config_file_path: str = "test_config.yml") -> TradeFill:
+        trade_fee = trade_fee or AddedToCostTradeFee(percent=Decimal("0.001"))
+        trade = TradeFill(config_file_path=config_file_path,
+                          strategy="pure_market_making",
+                          market=market,
+                          symbol=symbol,
+                          base_asset=symbol.split("-")[0],
+                          quote_asset=symbol.split("-")[1],
+                          timestamp=timestamp,
+                          order_id=f"OID{self.trade_index}",
+                          trade_type=trade_type,
+                          order_type="LIMIT",
+                          price=Decimal(price),
+                          amount=Decimal(amount),
+                          leverage=1,
+                          trade_fee=trade_fee.to_json(),
+                          exchange_trade_id=f"TID{self.trade_index}",
+                          position=position)
+        self.trade_index += 1
+        with self.manager.get_new_session() as session:
+            with session.begin():
+                session.add(trade)
+        return trade
+
+    def add_trades(self) -> List[TradeFill]:
+        bnb_fee = AddedToCostTradeFee(flat_fees=[TokenAmount("BNB", Decimal("0.0001"))])
+        deducted_fee = DeductedFromReturnsTradeFee(percent=Decimal("0.002"))
+        return [
+            self.add_trade(10 * DAY_MS + 1000, "BUY", "1.2", "100"),
+            self.add_trade(10 * DAY_MS + 2000, "BUY", "1.2", "50"),
+            self.add_trade(12 * DAY_MS, "SELL", "1.3", "120.5", bnb_fee),
+            self.add_trade(15 * DAY_MS + 5000, "SELL", "1.3", "20", bnb_fee),
+            self.add_trade(18 * DAY_MS + 5000, "BUY", "1.25", "10", deducted_fee),
+            self.add_trade(NOW - 1000, "SELL", "1.45", "7.123456", deducted_fee),
+        ]
+
+    def test_aggregate(self):
+        self.add_trades()
+        self.add_trade(11 * DAY_MS, "BUY", "3000", "1", symbol="ETH-USDT")
+        self.add_trade(11 * DAY_MS, "BUY", "1", "1", config_file_path="other_config.yml")
+
+        aggregates = self.aggregator.aggregate("test_config.yml", 10 * DAY_MS + 1500)
+
+        self.assertEqual({("binance", "HBOT-USDT"), ("binance", "ETH-USDT")}, set(aggregates))
+        aggregate = aggregates[("binance", "HBOT-USDT")]
+        self.assertEqual(2, aggregate.num_buys)
+        self.assertEqual(3, aggregate.num_sells)
+        self.assertEqual(Decimal("60"), aggregate.b_vol_base)
+        self.assertEqual(Decimal("72.5"), aggregate.b_vol_quote)
+        self.assertEqual(Decimal("147.623456"), aggregate.s_vol_base)
+        self.assertEqual(Decimal("182.65") + Decimal("10.3290112"), aggregate.s_vol_quote)
+        self.assertEqual(Decimal("0.0250") + Decimal("0.0206580224"), aggregate.deducted_fees_in_quote)
+        self.assertEqual({"USDT": Decimal("0.06") + Decimal("0.0250") + Decimal("0.0206580224"),
+                          "BNB": Decimal("0.0002")},
+                         aggregate.fees)
+        self.assertEqual(Decimal("1.2"), aggregate.first_price)
+        self.assertEqual(Decimal("1.45"), aggregate.last_price)
+        self.assertFalse(aggregate.are_derivatives)
+
+    def test_flat_fees_do_not_split_the_trade_groups(self):
+        for index in range(5):
+            flat_fee = AddedToCostTradeFee(percent=Decimal("0.001"),
+                                           flat_fees=[TokenAmount("BNB", Decimal("0.0001") * (index + 1))])
+            self.add_trade(10 * DAY_MS + index, "BUY", "1.2", "10", flat_fee)
+
+        with self.manager.get_new_session() as session:
+            groups = list(TradesAggregator._query_trade_groups(session, "test_config.yml", [(0, None)]))
+        aggregate = self.aggregator.aggregate("test_config.yml", 0)[("binance", "HBOT-USDT")]
+
+        self.assertEqual(1, len(groups))
+        self.assertEqual(5, aggregate.num_buys)
+        self.assertEqual({"USDT": Decimal("0.06"), "BNB": Decimal("0.0015")}, aggregate.fees)
+
+    def test_other_database_engines_aggregate_the_loaded_trades(self):
+        self.add_trades()
+        self.add_trade(11 * DAY_MS, "BUY", "3000", "1", symbol="ETH-USDT")
+        expected = self.aggregator.aggregate("test_config.yml", 10 * DAY_MS + 1500)
+
+        with patch.object(self.manager.engine.dialect, "name", "mysql"), \
+                patch.object(TradesAggregator, "_query_trade_groups") as query_mock:
+            self.assertFalse(self.aggregator.aggregates_in_sql)
+            aggregates = self.aggregator.aggregate("test_config.yml", 10 * DAY_MS + 1500)
+
+        query_mock.assert_not_called()
+        self.assertEqual(expected, aggregates)
+
+    def test_past_periods_are_cached(self):
+        self.add_trades()
+        with patch.object(TradesAggregator, "_query_trade_groups",
+                          wraps=TradesAggregator._query_trade_groups) as query_mock:
+            first_aggregate = self.aggregator.aggregate("test_config.yml", 10 * DAY_MS + 1500)[("binance", "HBOT-USDT")]
+            self.assertEqual([(10 * DAY_MS + 1500, 11 * DAY_MS), (11 * DAY_MS, 20 * DAY_MS), (20 * DAY_MS, None)],
+                             query_mock.call_args[0][2])
+
+            # A longer history only queries the days that are not cached yet
+            self.aggregator.aggregate("test_config.yml", 5 * DAY_MS)
+            self.assertEqual([(5 * DAY_MS, 11 * DAY_MS), (20 * DAY_MS, None)], query_mock.call_args[0][2])
+
+        # New trades of the current day are always taken into account
+        self.add_trade(NOW - 500, "BUY", "1.5", "1")
+        aggregate = self.aggregator.aggregate("test_config.yml", 10 * DAY_MS + 1500)[("binance", "HBOT-USDT")]
+        self.assertEqual(first_aggregate.num_buys + 1, aggregate.num_buys)
+        self.assertEqual(first_aggregate.b_vol_base + 1, aggregate.b_vol_base)
+        self.assertEqual(Decimal("1.5"), aggregate.last_price)
+
+    def test_performance_metrics_from_aggregate_match_the_trades(self):
+        self.add_trades()
+        current_balances = {"HBOT": Decimal("1000"), "USDT": Decimal("500")}
+
+        aggregate = self.aggregator.aggregate("test_config.yml", 0)[("binance", "HBOT-USDT")]
+        aggregated_metrics = self.async_run_with_timeout(
+            PerformanceMetrics.create_from_aggregate("HBOT-USDT", aggregate, current_balances))
+        with self.manager.get_new_session() as session:
+            trades = session.query(TradeFill).order_by(TradeFill.timestamp.asc()).all()
+        metrics = self.async_run_with_timeout(PerformanceMetrics.create("HBOT-USDT", trades, current_balances))
+
+        # Same volumes, prices, balances, PnL and fees
+        self.assertEqual(metrics, aggregated_metrics)
+        self.assertEqual(dict(metrics.fees), dict(aggregated_metrics.fees))
+
+    def test_derivative_trades(self):
+        self.add_trade(10 * DAY_MS, "BUY", "10", "1", position=PositionAction.OPEN.value)
+        self.add_trade(11 * DAY_MS, "SELL", "12", "1", position=PositionAction.CLOSE.value)
+        self.add_trade(11 * DAY_MS, "BUY", "12", "1", symbol="ETH-USDT")
+
+        aggregates = self.aggregator.aggregate("test_config.yml", 0)
+
+        self.assertTrue(aggregates[("binance", "HBOT-USDT")].are_derivatives)
+        self.assertFalse(aggregates[("binance", "ETH-USDT")].are_derivatives)
+        trades = self.aggregator.get_trades("test_config.yml", 0, "binance", "HBOT-USDT")
+        self.assertEqual(["BUY", "SELL"], [trade.trade_type for trade in trades])
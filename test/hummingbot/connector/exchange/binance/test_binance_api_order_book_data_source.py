@@ -331,6 +331,44 @@ class BinanceAPIOrderBookDataSourceUnitTests(IsolatedAsyncioWrapperTestCase):
 
         self.assertEqual(diff_event["u"], msg.update_id)
 
+    async def test_connector_order_book_tracker_routes_diffs_in_batches(self):
+        connector = BinanceExchange(
+            binance_api_key="",
+            binance_api_secret="",
+            trading_pairs=[self.trading_pair],
+            trading_required=False,
+            domain=self.domain)
+        connector._set_trading_pair_symbol_map(bidict({self.ex_trading_pair: self.trading_pair}))
+        tracker = connector.order_book_tracker
+        self.assertTrue(tracker.batched_routing)
+        tracker.data_source._request_order_book_snapshot = AsyncMock(return_value=self._snapshot_response())
+
+        diff_event = self._order_diff_event()
+        diff_event.update({"U": 1027025, "u": 1027026})
+        diff_queue = asyncio.Queue()
+        diff_queue.put_nowait(diff_event)
+        tracker.data_source._message_queue[CONSTANTS.DIFF_EVENT_TYPE] = diff_queue
+
+        await tracker._init_order_books()
+        tasks = [
+            self.local_event_loop.create_task(tracker.data_source.listen_for_order_book_diffs(
+                self.local_event_loop, tracker._order_book_diff_stream)),
+            self.local_event_loop.create_task(tracker._order_book_batch_router()),
+        ]
+        try:
+            order_book = tracker.order_books[self.trading_pair]
+            for _ in range(100):
+                if order_book.last_diff_uid == 1027026:
+                    break
+                await asyncio.sleep(0.01)
+        finally:
+            for task in tasks:
+                task.cancel()
+
+        self.assertEqual(1027026, order_book.last_diff_uid)
+        self.assertEqual(0.0024, order_book.get_price(False))
+        self.assertEqual(1, tracker.batch_routing_stats["batches"])
+
     @aioresponses()
     async def test_listen_for_order_book_snapshots_cancelled_when_fetching_snapshot(self, mock_api):
         url = web_utils.public_rest_url(path_url=CONSTANTS.SNAPSHOT_PATH_URL, domain=self.domain)
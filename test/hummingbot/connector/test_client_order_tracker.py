@@ -1130,3 +1130,135 @@ class ClientOrderTrackerUnitTest(unittest.TestCase):
         self.tracker.lost_order_count_limit = 2
 
         self.assertEqual(2, self.tracker.lost_order_count_limit)
+
+    def _create_order(self, client_order_id: str, exchange_order_id=None, trading_pair=None) -> InFlightOrder:
+        return InFlightOrder(
+            client_order_id=client_order_id,
+            exchange_order_id=exchange_order_id,
+            trading_pair=trading_pair or self.trading_pair,
+            order_type=OrderType.LIMIT,
+            trade_type=TradeType.BUY,
+            amount=Decimal("1000.0"),
+            creation_timestamp=1640001112.0,
+            price=Decimal("1.0"),
+        )
+
+    def test_orders_by_exchange_order_id_follow_the_order_lifecycle(self):
+        order = self._create_order("someClientOrderId", exchange_order_id="someExchangeOrderId")
+        self.tracker.start_tracking_order(order)
+
+        self.assertIs(order, self.tracker.all_fillable_orders_by_exchange_order_id["someExchangeOrderId"])
+        self.assertIs(order, self.tracker.all_updatable_orders_by_exchange_order_id["someExchangeOrderId"])
+
+        self.tracker.stop_tracking_order(order.client_order_id)
+
+        self.assertIs(order, self.tracker.all_fillable_orders_by_exchange_order_id["someExchangeOrderId"])
+        self.assertNotIn("someExchangeOrderId", self.tracker.all_updatable_orders_by_exchange_order_id)
+        self.assertIs(order, self.tracker.fetch_order(exchange_order_id="someExchangeOrderId"))
+
+        del self.tracker._cached_orders[order.client_order_id]
+
+        self.assertNotIn("someExchangeOrderId", self.tracker.all_fillable_orders_by_exchange_order_id)
+        self.assertIsNone(self.tracker.fetch_order(exchange_order_id="someExchangeOrderId"))
+
+    def test_orders_by_exchange_order_id_are_read_only(self):
+        with self.assertRaises(TypeError):
+            self.tracker.all_fillable_orders_by_exchange_order_id["someExchangeOrderId"] = None
+
+    def test_exchange_order_id_assigned_after_tracking_is_indexed(self):
+        order = self._create_order("someClientOrderId")
+        self.tracker.start_tracking_order(order)
+
+        self.assertEqual(0, len(self.tracker.all_fillable_orders_by_exchange_order_id))
+
+        order.update_exchange_order_id("someExchangeOrderId")
+
+        self.assertIs(order, self.tracker.fetch_order(exchange_order_id="someExchangeOrderId"))
+        self.assertIs(order, self.tracker.all_updatable_orders_by_exchange_order_id["someExchangeOrderId"])
+
+    @patch("hummingbot.connector.client_order_tracker.ClientOrderTracker.CACHED_ORDER_TTL", 0.1)
+    def test_expired_cached_orders_are_removed_from_the_index(self):
+        tracker = ClientOrderTracker(self.connector)
+        order = self._create_order("someClientOrderId", exchange_order_id="someExchangeOrderId")
+        tracker.start_tracking_order(order)
+        tracker.stop_tracking_order(order.client_order_id)
+
+        self.ev_loop.run_until_complete(asyncio.sleep(0.2))
+
+        self.assertNotIn("someExchangeOrderId", tracker.all_fillable_orders_by_exchange_order_id)
+
+    def test_lost_order_fetched_by_exchange_order_id(self):
+        order = self._create_order("someClientOrderId", exchange_order_id="someExchangeOrderId")
+        self.tracker.start_tracking_order(order)
+
+        for _ in range(self.tracker._lost_order_count_limit + 1):
+            self.async_run_with_timeout(self.tracker.process_order_not_found(client_order_id=order.client_order_id))
+
+        self.assertIs(order, self.tracker.fetch_lost_order(exchange_order_id="someExchangeOrderId"))
+        self.assertIsNone(self.tracker.fetch_order(exchange_order_id="someExchangeOrderId"))
+        self.assertIs(order, self.tracker.all_updatable_orders_by_exchange_order_id["someExchangeOrderId"])
+        self.assertEqual(0, len(self.tracker.fetch_active_orders_by_trading_pair(self.trading_pair)))
+
+    def test_active_orders_by_trading_pair(self):
+        first_order = self._create_order("firstOrder")
+        second_order = self._create_order("secondOrder", trading_pair="OTHER-HBOT")
+        self.tracker.start_tracking_order(first_order)
+        self.tracker.start_tracking_order(second_order)
+
+        self.assertEqual({"firstOrder": first_order},
+                         dict(self.tracker.fetch_active_orders_by_trading_pair(self.trading_pair)))
+        self.assertEqual({"secondOrder": second_order},
+                         dict(self.tracker.fetch_active_orders_by_trading_pair("OTHER-HBOT")))
+
+        self.tracker.stop_tracking_order(second_order.client_order_id)
+
+        self.assertEqual(0, len(self.tracker.fetch_active_orders_by_trading_pair("OTHER-HBOT")))
+        self.assertEqual(0, len(self.tracker.fetch_active_orders_by_trading_pair("UNKNOWN-HBOT")))
+
+    def test_active_orders_by_state_follow_order_updates(self):
+        order = self._create_order("someClientOrderId")
+        self.tracker.start_tracking_order(order)
+
+        self.assertIn(order.client_order_id, self.tracker.fetch_active_orders_by_state(OrderState.PENDING_CREATE))
+
+        update: OrderUpdate = OrderUpdate(
+            client_order_id=order.client_order_id,
+            exchange_order_id="someExchangeOrderId",
+            trading_pair=self.trading_pair,
+            update_timestamp=1,
+            new_state=OrderState.OPEN,
+        )
+        self.async_run_with_timeout(self.tracker.process_order_update(update))
+
+        self.assertEqual(0, len(self.tracker.fetch_active_orders_by_state(OrderState.PENDING_CREATE)))
+        self.assertEqual({order.client_order_id: order},
+                         dict(self.tracker.fetch_active_orders_by_state(OrderState.OPEN)))
+        self.assertIs(order, self.tracker.fetch_order(exchange_order_id="someExchangeOrderId"))
+
+    def test_pop_tracking_state_changes(self):
+        first_order = self._create_order("firstOrder", exchange_order_id="firstExchangeOrderId")
+        second_order = self._create_order("secondOrder")
+        self.tracker.start_tracking_order(first_order)
+        self.tracker.start_tracking_order(second_order)
+
+        # The first call reports all the tracked orders
+        self.assertEqual({"firstOrder": first_order.to_json(), "secondOrder": second_order.to_json()},
+                         self.tracker.pop_tracking_state_changes())
+        self.assertEqual({}, self.tracker.pop_tracking_state_changes())
+
+        update: OrderUpdate = OrderUpdate(
+            client_order_id=first_order.client_order_id,
+            trading_pair=self.trading_pair,
+            update_timestamp=1,
+            new_state=OrderState.OPEN,
+        )
+        self.async_run_with_timeout(self.tracker.process_order_update(update))
+        third_order = self._create_order("thirdOrder")
+        self.tracker.start_tracking_order(third_order)
+        self.tracker.stop_tracking_order(third_order.client_order_id)
+
+        self.assertEqual({"firstOrder": first_order.to_json()}, self.tracker.pop_tracking_state_changes())
+
+        self.tracker.stop_tracking_order(second_order.client_order_id)
+
+        self.assertEqual({"secondOrder": None}, self.tracker.pop_tracking_state_changes())
@@ -1,4 +1,5 @@
 import asyncio
+import threading
 import time
 from decimal import Decimal
 from test.isolated_asyncio_wrapper_test_case import IsolatedAsyncioWrapperTestCase
@@ -7,6 +8,7 @@ from unittest.mock import MagicMock, PropertyMock, patch
 
 import numpy as np
 from sqlalchemy import create_engine
+from sqlalchemy.pool import StaticPool
 
 from hummingbot.client.config.client_config_map import ClientConfigMap, MarketDataCollectionConfigMap
 from hummingbot.client.config.config_helpers import ClientConfigAdapter
@@ -24,6 +26,8 @@ from hummingbot.core.event.events import (
 from hummingbot.logger import HummingbotLogger
 from hummingbot.model.executors import Executors
 from hummingbot.model.market_data import MarketData
+from hummingbot.model.market_state import MarketState
+from hummingbot.model.market_state_change import MarketStateChange
 from hummingbot.model.order import Order
 from hummingbot.model.position import Position
 from hummingbot.model.sql_connection_manager import SQLConnectionManager, SQLConnectionType
@@ -92,6 +96,12 @@ class MarketsRecorderTests(IsolatedAsyncioWrapperTestCase):
     def add_exchange_order_ids_from_market_recorder(self, current_exchange_order_ids):
         pass
 
+    def pop_tracking_state_changes(self):
+        return None
+
+    def restore_tracking_states(self, saved_states):
+        self.restored_tracking_states = saved_states
+
     def test_properties(self):
         recorder = MarketsRecorder(
             sql=self.manager,
@@ -970,3 +980,201 @@ class MarketsRecorderTests(IsolatedAsyncioWrapperTestCase):
         self.assertEqual("integration_test_market", orders[0].market)
         self.assertEqual("BTC-USDT", orders[0].symbol)
         self.assertEqual("NEW_MARKET_OID1", orders[0].id)
+
+    @patch("hummingbot.model.sql_connection_manager.create_engine")
+    def _create_write_behind_recorder(self, engine_mock, **kwargs) -> MarketsRecorder:
+        # The writer thread and the test have to share the in memory database
+        engine_mock.return_value = create_engine(
+            "sqlite://", poolclass=StaticPool, connect_args={"check_same_thread": False})
+        self.manager = SQLConnectionManager(
+            ClientConfigAdapter(ClientConfigMap()), SQLConnectionType.TRADE_FILLS, db_name="test_DB"
+        )
+        recorder = MarketsRecorder(
+            sql=self.manager,
+            markets=[self],
+            config_file_path=self.config_file_path,
+            strategy_name=self.strategy_name,
+            market_data_collection=MarketDataCollectionConfigMap(
+                market_data_collection_enabled=False,
+                market_data_collection_interval=60,
+                market_data_collection_depth=20,
+            ),
+            **kwargs,
+        )
+        recorder._start_writer()
+        self.addCleanup(recorder._stop_writer)
+        return recorder
+
+    def _create_event(self, order_id: str) -> BuyOrderCreatedEvent:
+        return BuyOrderCreatedEvent(
+            timestamp=1642010000,
+            type=OrderType.LIMIT,
+            trading_pair=self.trading_pair,
+            amount=Decimal(1),
+            price=Decimal(1000),
+            order_id=order_id,
+            creation_timestamp=1640001112.223,
+            exchange_order_id=f"E{order_id}",
+        )
+
+    async def test_write_behind_records_are_written_on_flush(self):
+        recorder = self._create_write_behind_recorder(flush_interval=60)
+
+        recorder._did_create_order(MarketEvent.BuyOrderCreated.value, self, self._create_event("OID1"))
+        fill_event = OrderFilledEvent(
+            timestamp=1642020000,
+            order_id="OID1",
+            trading_pair=self.trading_pair,
+            trade_type=TradeType.BUY,
+            order_type=OrderType.LIMIT,
+            price=Decimal(1010),
+            amount=Decimal(1),
+            trade_fee=AddedToCostTradeFee(),
+            exchange_trade_id="TradeId1"
+        )
+        recorder._did_fill_order(MarketEvent.OrderFilled.value, self, fill_event)
+
+        with self.manager.get_new_session() as session:
+            self.assertEqual(0, session.query(Order).count())
+
+        self.assertTrue(await recorder.flush())
+
+        with self.manager.get_new_session() as session:
+            order = session.query(Order).one()
+            self.assertEqual(MarketEvent.OrderFilled.name, order.last_status)
+            self.assertEqual(2, len(order.status))
+            self.assertEqual(1, len(order.trade_fills))
+
+    async def test_write_behind_full_batch_is_written_without_waiting_for_the_interval(self):
+        recorder = self._create_write_behind_recorder(flush_interval=60, flush_batch_size=3)
+
+        for index in range(3):
+            recorder._did_create_order(MarketEvent.BuyOrderCreated.value, self, self._create_event(f"OID{index}"))
+
+        self.assertEqual([], recorder._pending_writes)
+        self.assertTrue(await recorder.flush())
+        with self.manager.get_new_session() as session:
+            self.assertEqual(3, session.query(Order).count())
+
+    async def test_write_behind_saves_market_states_once_per_batch(self):
+        recorder = self._create_write_behind_recorder(flush_interval=60)
+        snapshots = []
+
+        with patch.object(MarketsRecorderTests, "tracking_states", create=True, new_callable=PropertyMock) as states:
+            states.side_effect = lambda: snapshots.append(len(snapshots)) or {"snapshot": len(snapshots)}
+            for index in range(5):
+                recorder._did_create_order(MarketEvent.BuyOrderCreated.value, self, self._create_event(f"OID{index}"))
+            await recorder.flush()
+
+        self.assertEqual(1, len(snapshots))
+        with self.manager.get_new_session() as session:
+            market_state = session.query(MarketState).one()
+            self.assertEqual({"snapshot": 1}, market_state.saved_state)
+
+    async def test_write_behind_flush_does_not_block_the_event_loop(self):
+        recorder = self._create_write_behind_recorder(flush_interval=60)
+        release_writer = threading.Event()
+        write_batch = recorder._write_batch
+
+        def slow_write_batch(batch):
+            release_writer.wait(1)
+            write_batch(batch)
+
+        recorder._write_batch = slow_write_batch
+        recorder._did_create_order(MarketEvent.BuyOrderCreated.value, self, self._create_event("OID1"))
+
+        self.assertFalse(await recorder.flush(timeout=0.01))
+        flush_task = asyncio.ensure_future(recorder.flush())
+        await asyncio.sleep(0.01)
+        self.assertFalse(flush_task.done())
+
+        release_writer.set()
+        self.assertTrue(await flush_task)
+        with self.manager.get_new_session() as session:
+            self.assertEqual(1, session.query(Order).count())
+
+    async def test_write_behind_invalid_record_does_not_discard_the_batch(self):
+        recorder = self._create_write_behind_recorder(flush_interval=60)
+
+        recorder._did_create_order(MarketEvent.BuyOrderCreated.value, self, self._create_event("OID1"))
+        recorder._did_create_order(MarketEvent.BuyOrderCreated.value, self, self._create_event("OID1"))
+        recorder._did_create_order(MarketEvent.BuyOrderCreated.value, self, self._create_event("OID2"))
+        await recorder.flush()
+
+        with self.manager.get_new_session() as session:
+            self.assertEqual({"OID1", "OID2"}, {order.id for order in session.query(Order).all()})
+
+    async def _save_market_states_with_changes(self, recorder: MarketsRecorder, changes):
+        with patch.object(self, "pop_tracking_state_changes", return_value=changes):
+            recorder._record(None, self)
+            await recorder.flush()
+
+    async def test_market_states_changes_are_logged_after_the_first_snapshot(self):
+        recorder = self._create_write_behind_recorder()
+        self.tracking_states = {"OID1": {"state": "1"}}
+
+        await self._save_market_states_with_changes(recorder, {"OID1": {"state": "1"}})
+        self.tracking_states = {"OID1": {"state": "2"}, "OID2": {"state": "1"}}
+        await self._save_market_states_with_changes(recorder, {"OID1": {"state": "2"}, "OID2": {"state": "1"}})
+        self.tracking_states = {"OID2": {"state": "1"}}
+        await self._save_market_states_with_changes(recorder, {"OID1": None})
+        await recorder.flush()
+
+        with self.manager.get_new_session() as session:
+            self.assertEqual({"OID1": {"state": "1"}}, session.query(MarketState).one().saved_state)
+            changes = session.query(MarketStateChange).order_by(MarketStateChange.id).all()
+            self.assertEqual([("OID1", {"state": "2"}), ("OID2", {"state": "1"}), ("OID1", None)],
+                             [(change.client_order_id, change.saved_state) for change in changes])
+
+        recorder.restore_market_states(self.config_file_path, self)
+
+        self.assertEqual({"OID2": {"state": "1"}}, self.restored_tracking_states)
+
+    async def test_market_states_snapshot_after_a_failed_changes_write(self):
+        recorder = self._create_write_behind_recorder()
+        self.tracking_states = {"OID1": {"state": "1"}}
+        await self._save_market_states_with_changes(recorder, {"OID1": {"state": "1"}})
+
+        self.tracking_states = {"OID1": {"state": "2"}}
+        with patch.object(MarketsRecorder, "_save_market_state_changes", side_effect=Exception("write failed")):
+            await self._save_market_states_with_changes(recorder, {"OID1": {"state": "2"}})
+        self.tracking_states = {"OID1": {"state": "2"}, "OID2": {"state": "1"}}
+        await self._save_market_states_with_changes(recorder, {"OID2": {"state": "1"}})
+
+        # The change lost with the failed write is in the snapshot that replaces the log
+        with self.manager.get_new_session() as session:
+            self.assertEqual(self.tracking_states, session.query(MarketState).one().saved_state)
+            self.assertEqual(0, session.query(MarketStateChange).count())
+        recorder.restore_market_states(self.config_file_path, self)
+        self.assertEqual(self.tracking_states, self.restored_tracking_states)
+
+    @patch("hummingbot.connector.markets_recorder.MarketsRecorder.MARKET_STATES_COMPACTION_THRESHOLD", 3)
+    async def test_market_states_changes_are_compacted_into_a_snapshot(self):
+        recorder = self._create_write_behind_recorder()
+
+        await self._save_market_states_with_changes(recorder, {})
+        await self._save_market_states_with_changes(recorder, {"OID1": {"state": "1"}, "OID2": {"state": "1"}})
+        self.tracking_states = {"OID1": {"state": "2"}, "OID2": {"state": "1"}}
+        await self._save_market_states_with_changes(recorder, {"OID1": {"state": "2"}})
+        await recorder.flush()
+
+        with self.manager.get_new_session() as session:
+            self.assertEqual(self.tracking_states, session.query(MarketState).one().saved_state)
+            self.assertEqual(0, session.query(MarketStateChange).count())
+
+        recorder.restore_market_states(self.config_file_path, self)
+
+        self.assertEqual(self.tracking_states, self.restored_tracking_states)
+
+    async def test_market_states_snapshot_for_connectors_without_changes(self):
+        recorder = self._create_write_behind_recorder()
+        self.tracking_states = {"OID1": {"state": "1"}}
+
+        recorder._record(None, self)
+        self.tracking_states = {"OID1": {"state": "2"}}
+        recorder._record(None, self)
+        await recorder.flush()
+
+        with self.manager.get_new_session() as session:
+            self.assertEqual({"OID1": {"state": "2"}}, session.query(MarketState).one().saved_state)
+            self.assertEqual(0, session.query(MarketStateChange).count())
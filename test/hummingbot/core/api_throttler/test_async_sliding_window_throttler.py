@@ -0,0 +1,248 @@
+import asyncio
+from decimal import Decimal
+from test.isolated_asyncio_wrapper_test_case import IsolatedAsyncioWrapperTestCase
+from typing import List
+
+from hummingbot.core.api_throttler.async_sliding_window_throttler import (
+    AsyncSlidingWindowThrottler,
+    LimitWindow,
+    current_request_priority,
+    request_priority,
+)
+from hummingbot.core.api_throttler.data_types import LinkedLimitWeightPair, RateLimit, RequestPriority
+
+TEST_POOL_ID = "TEST"
+TEST_PATH_URL = "/hummingbot"
+TEST_OTHER_PATH_URL = "/other"
+TEST_WEIGHTED_POOL_ID = "TEST_WEIGHTED"
+TEST_WEIGHTED_TASK_ID = "/weighted_task"
+
+
+class LimitWindowTests(IsolatedAsyncioWrapperTestCase):
+
+    def test_capacity_is_released_after_the_interval(self):
+        window = LimitWindow(RateLimit(limit_id=TEST_POOL_ID, limit=2, time_interval=1.0),
+                             safety_margin_pct=0.0,
+                             buckets_per_window=10)
+        window.record(100.0, 1)
+        window.record(100.5, 1)
+
+        window.expire(100.9)
+        self.assertFalse(window.has_capacity(1))
+        self.assertEqual(101.0, window.available_at(1))
+        self.assertEqual(101.5, window.available_at(2))
+
+        window.expire(101.0)
+        self.assertTrue(window.has_capacity(1))
+        self.assertEqual(1, window.used)
+
+    def test_requests_within_a_bucket_are_merged(self):
+        window = LimitWindow(RateLimit(limit_id=TEST_POOL_ID, limit=100, time_interval=1.0),
+                             safety_margin_pct=0.05,
+                             buckets_per_window=10)
+        for offset in (0.0, 0.05, 0.09, 0.15):
+            window.record(100.0 + offset, 2)
+
+        self.assertEqual(2, len(window.buckets))
+        self.assertEqual(8, window.used)
+        # The first bucket is held until its latest request leaves the window, including the safety margin
+        window.expire(100.09 + 1.05 - 0.001)
+        self.assertEqual(8, window.used)
+        window.expire(100.09 + 1.05 + 0.001)
+        self.assertEqual(2, window.used)
+
+    def test_request_heavier_than_the_limit_goes_through_alone(self):
+        window = LimitWindow(RateLimit(limit_id=TEST_POOL_ID, limit=2, time_interval=1.0),
+                             safety_margin_pct=0.0,
+                             buckets_per_window=10)
+        self.assertTrue(window.has_capacity(5))
+        window.record(100.0, 5)
+        self.assertFalse(window.has_capacity(5))
+
+    def test_capacity_within_a_part_of_the_limit(self):
+        window = LimitWindow(RateLimit(limit_id=TEST_POOL_ID, limit=10, time_interval=1.0),
+                             safety_margin_pct=0.0,
+                             buckets_per_window=10)
+        window.record(100.0, 6)
+        window.record(100.5, 2)
+
+        self.assertTrue(window.has_capacity(2))
+        self.assertFalse(window.has_capacity(1, limit=8))
+        self.assertEqual(101.0, window.available_at(1, limit=8))
+        self.assertEqual(101.5, window.available_at(7, limit=8))
+
+
+class AsyncSlidingWindowThrottlerTests(IsolatedAsyncioWrapperTestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.rate_limits: List[RateLimit] = [
+            RateLimit(limit_id=TEST_POOL_ID, limit=2, time_interval=0.2),
+            RateLimit(limit_id=TEST_PATH_URL, limit=100, time_interval=0.2,
+                      linked_limits=[LinkedLimitWeightPair(TEST_POOL_ID)]),
+            RateLimit(limit_id=TEST_OTHER_PATH_URL, limit=100, time_interval=0.2),
+            RateLimit(limit_id=TEST_WEIGHTED_POOL_ID, limit=10, time_interval=0.2),
+            RateLimit(limit_id=TEST_WEIGHTED_TASK_ID, limit=1000, time_interval=0.2,
+                      linked_limits=[LinkedLimitWeightPair(TEST_WEIGHTED_POOL_ID, 5)]),
+        ]
+        self.throttler = AsyncSlidingWindowThrottler(rate_limits=self.rate_limits, safety_margin_pct=0.0)
+        self.completed: List[str] = []
+
+    async def _request(self, limit_id: str, name: str, priority: RequestPriority = RequestPriority.NORMAL):
+        async with self.throttler.execute_task(limit_id=limit_id, priority=priority):
+            self.completed.append(name)
+
+    def test_init_with_rate_limits_share_pct(self):
+        throttler = AsyncSlidingWindowThrottler(rate_limits=self.rate_limits, limits_share_percentage=Decimal("50"))
+        self.assertEqual(1, throttler._windows[TEST_POOL_ID].limit)
+        self.assertEqual(5, throttler._windows[TEST_WEIGHTED_POOL_ID].limit)
+
+    async def test_requests_within_capacity_are_not_delayed(self):
+        await self._request(TEST_PATH_URL, "first")
+        await self._request(TEST_PATH_URL, "second")
+
+        self.assertEqual(["first", "second"], self.completed)
+        self.assertEqual(2, self.throttler._windows[TEST_POOL_ID].used)
+        self.assertEqual([], self.throttler._waiters)
+
+    async def test_unknown_limit_id_is_not_throttled(self):
+        for index in range(10):
+            await self._request("unknown", str(index))
+        self.assertEqual(10, len(self.completed))
+
+    async def test_linked_limits_delay_until_capacity_is_released(self):
+        start = self.throttler._time()
+        for index in range(3):
+            await self._request(TEST_PATH_URL, str(index))
+
+        self.assertGreaterEqual(self.throttler._time() - start, 0.2)
+        self.assertIsNone(self.throttler._wake_up_handle)
+
+    async def test_weighted_linked_limit(self):
+        await self._request(TEST_WEIGHTED_TASK_ID, "first")
+        await self._request(TEST_WEIGHTED_TASK_ID, "second")
+
+        task = asyncio.ensure_future(self._request(TEST_WEIGHTED_TASK_ID, "third"))
+        await asyncio.sleep(0.05)
+        self.assertEqual(["first", "second"], self.completed)
+        self.assertEqual(10, self.throttler._windows[TEST_WEIGHTED_POOL_ID].used)
+
+        await asyncio.wait_for(task, timeout=1)
+        self.assertEqual(["first", "second", "third"], self.completed)
+
+    async def test_waiting_requests_go_through_by_priority_then_arrival(self):
+        await self._request(TEST_POOL_ID, "first")
+        await self._request(TEST_POOL_ID, "second")
+
+        tasks = [
+            asyncio.ensure_future(self._request(TEST_POOL_ID, "low", RequestPriority.LOW)),
+            asyncio.ensure_future(self._request(TEST_POOL_ID, "normal_1")),
+            asyncio.ensure_future(self._request(TEST_POOL_ID, "normal_2")),
+            asyncio.ensure_future(self._request(TEST_POOL_ID, "high", RequestPriority.HIGH)),
+        ]
+        await asyncio.wait_for(asyncio.gather(*tasks), timeout=2)
+
+        self.assertEqual(["first", "second", "high", "normal_1", "normal_2", "low"], self.completed)
+
+    async def test_requests_on_other_limits_are_not_blocked_by_waiting_requests(self):
+        await self._request(TEST_POOL_ID, "first")
+        await self._request(TEST_POOL_ID, "second")
+        waiting_task = asyncio.ensure_future(self._request(TEST_POOL_ID, "waiting"))
+        await asyncio.sleep(0)
+
+        await asyncio.wait_for(self._request(TEST_OTHER_PATH_URL, "other"), timeout=0.05)
+
+        self.assertEqual(["first", "second", "other"], self.completed)
+        await asyncio.wait_for(waiting_task, timeout=1)
+
+    async def test_cancelled_request_leaves_the_queue(self):
+        await self._request(TEST_POOL_ID, "first")
+        await self._request(TEST_POOL_ID, "second")
+        cancelled_task = asyncio.ensure_future(self._request(TEST_POOL_ID, "cancelled"))
+        waiting_task = asyncio.ensure_future(self._request(TEST_POOL_ID, "waiting"))
+        await asyncio.sleep(0)
+        self.assertEqual(2, len(self.throttler._waiters))
+
+        cancelled_task.cancel()
+        await asyncio.wait_for(waiting_task, timeout=1)
+
+        self.assertEqual(["first", "second", "waiting"], self.completed)
+        self.assertEqual([], self.throttler._waiters)
+
+    def test_invalid_reserved_capacity_raises(self):
+        with self.assertRaises(ValueError):
+            AsyncSlidingWindowThrottler(rate_limits=self.rate_limits,
+                                        reserved_capacity={RequestPriority.HIGH: 0.6, RequestPriority.NORMAL: 0.4})
+        with self.assertRaises(ValueError):
+            AsyncSlidingWindowThrottler(rate_limits=self.rate_limits, reserved_capacity={RequestPriority.HIGH: -0.1})
+
+    def test_usable_share_per_priority(self):
+        throttler = AsyncSlidingWindowThrottler(
+            rate_limits=self.rate_limits,
+            reserved_capacity={RequestPriority.HIGH: 0.2, RequestPriority.NORMAL: 0.1})
+
+        self.assertEqual(1.0, throttler.usable_share(RequestPriority.HIGH))
+        self.assertAlmostEqual(0.8, throttler.usable_share(RequestPriority.NORMAL))
+        self.assertAlmostEqual(0.7, throttler.usable_share(RequestPriority.LOW))
+
+    async def test_reserved_capacity_is_kept_for_higher_priorities(self):
+        self.throttler = AsyncSlidingWindowThrottler(
+            rate_limits=[RateLimit(limit_id=TEST_POOL_ID, limit=10, time_interval=0.2)],
+            safety_margin_pct=0.0,
+            reserved_capacity={RequestPriority.HIGH: 0.3})
+
+        low_tasks = [asyncio.ensure_future(self._request(TEST_POOL_ID, f"low_{index}", RequestPriority.LOW))
+                     for index in range(10)]
+        await asyncio.sleep(0.05)
+        self.assertEqual(7, len(self.completed))
+
+        # The background requests used all the capacity they can, the order request goes through without waiting
+        await asyncio.wait_for(self._request(TEST_POOL_ID, "cancel", RequestPriority.HIGH), timeout=0.05)
+        self.assertEqual("cancel", self.completed[-1])
+
+        await asyncio.wait_for(asyncio.gather(*low_tasks), timeout=2)
+        self.assertEqual(11, len(self.completed))
+
+    def test_reserved_capacity_only_applies_to_the_reserved_limits_and_their_linked_limits(self):
+        throttler = AsyncSlidingWindowThrottler(
+            rate_limits=[
+                RateLimit(limit_id="weight", limit=10, time_interval=1.0),
+                RateLimit(limit_id="order", limit=10, time_interval=1.0,
+                          linked_limits=[LinkedLimitWeightPair("weight", 1)]),
+                RateLimit(limit_id="snapshot", limit=2, time_interval=1.0,
+                          linked_limits=[LinkedLimitWeightPair("weight", 1)]),
+            ],
+            reserved_capacity={RequestPriority.HIGH: 0.5},
+            reserved_limit_ids=["order"])
+
+        usable_limits = {window.rate_limit.limit_id: limit
+                         for window, _, limit in throttler._usages("snapshot", RequestPriority.NORMAL)}
+
+        self.assertEqual({"snapshot": 2, "weight": 5}, usable_limits)
+
+    def test_no_reserved_capacity_without_reserved_limits(self):
+        throttler = AsyncSlidingWindowThrottler(rate_limits=self.rate_limits,
+                                                reserved_capacity={RequestPriority.HIGH: 0.5},
+                                                reserved_limit_ids=[])
+
+        for window, _, limit in throttler._usages(TEST_POOL_ID, RequestPriority.LOW):
+            self.assertEqual(window.limit, limit)
+
+    async def test_priority_is_taken_from_the_task_context(self):
+        self.assertEqual(RequestPriority.NORMAL, current_request_priority())
+        await self._request(TEST_POOL_ID, "first")
+        await self._request(TEST_POOL_ID, "second")
+
+        async def request_in_context(name: str, priority: RequestPriority):
+            with request_priority(priority):
+                async with self.throttler.execute_task(limit_id=TEST_POOL_ID):
+                    self.completed.append(name)
+
+        tasks = [
+            asyncio.ensure_future(request_in_context("low", RequestPriority.LOW)),
+            asyncio.ensure_future(request_in_context("high", RequestPriority.HIGH)),
+        ]
+        await asyncio.wait_for(asyncio.gather(*tasks), timeout=2)
+
+        self.assertEqual(["first", "second", "high", "low"], self.completed)
+        self.assertEqual(RequestPriority.NORMAL, current_request_priority())
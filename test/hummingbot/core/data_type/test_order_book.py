@@ -2,9 +2,15 @@
 
 import logging
 import unittest
-from hummingbot.core.data_type.order_book import OrderBook
 import numpy as np
 
+from hummingbot.core.data_type.common import OrderType, TradeType
+from hummingbot.core.data_type.composite_order_book import CompositeOrderBook
+from hummingbot.core.data_type.order_book import ORDER_BOOK_ROW_DTYPE, OrderBook
+from hummingbot.core.data_type.order_book_message import OrderBookMessage, OrderBookMessageType
+from hummingbot.core.data_type.trade_fee import AddedToCostTradeFee
+from hummingbot.core.event.events import OrderFilledEvent
+
 
 class OrderBookUnitTest(unittest.TestCase):
     @classmethod
@@ -50,6 +56,232 @@ class OrderBookUnitTest(unittest.TestCase):
         self.assertEqual(best_bid, [50., 0.01, 6.])
         self.assertEqual(best_ask, 0)
 
+    def _depth_order_book(self) -> OrderBook:
+        order_book = OrderBook()
+        bids_array = np.array([[10, 1, 1], [9, 2, 1], [8, 3, 1]], dtype=np.float64)
+        asks_array = np.array([[11, 1, 1], [12, 2, 1], [13, 3, 1]], dtype=np.float64)
+        order_book.apply_numpy_snapshot(bids_array, asks_array)
+        return order_book
+
+    def test_depth_queries(self):
+        order_book = self._depth_order_book()
+
+        result = order_book.get_price_for_volume(True, 2)
+        self.assertEqual(12, result.result_price)
+        self.assertEqual(2, result.result_volume)
+        result = order_book.get_price_for_volume(False, 10)
+        self.assertTrue(np.isnan(result.result_price))
+        self.assertEqual(6, result.result_volume)
+
+        result = order_book.get_vwap_for_volume(True, 3)
+        self.assertAlmostEqual((11 + 12 * 2) / 3, result.result_price)
+        result = order_book.get_vwap_for_volume(False, 2)
+        self.assertAlmostEqual((10 + 9) / 2, result.result_price)
+
+        self.assertEqual(12, order_book.get_price_for_quote_volume(True, 20).result_price)
+        self.assertEqual(11 + 12 * 2 + 13, order_book.get_quote_volume_for_base_amount(True, 4).result_volume)
+
+        result = order_book.get_volume_for_price(False, 9)
+        self.assertEqual(3, result.result_volume)
+        self.assertEqual(9, result.result_price)
+        result = order_book.get_quote_volume_for_price(True, 12.5)
+        self.assertEqual(11 + 24, result.result_volume)
+        self.assertEqual(12, result.result_price)
+
+    def test_simulate_fills(self):
+        order_book = self._depth_order_book()
+
+        self.assertEqual([(11, 1, 1), (12, 1.5, 1)], [tuple(row) for row in order_book.simulate_buy(2.5)])
+        self.assertEqual([(10, 1, 1), (9, 2, 1), (8, 3, 1)], [tuple(row) for row in order_book.simulate_sell(7)])
+
+    def test_walk_depth_for_volumes_matches_single_queries(self):
+        order_book = self._depth_order_book()
+        volumes = [5, 0.5, 100, 2]
+
+        for is_buy in (True, False):
+            prices, vwaps, filled_volumes, quote_volumes = order_book.walk_depth_for_volumes(is_buy, volumes)
+            for i, volume in enumerate(volumes):
+                price_result = order_book.get_price_for_volume(is_buy, volume)
+                vwap_result = order_book.get_vwap_for_volume(is_buy, volume)
+                quote_result = order_book.get_quote_volume_for_base_amount(is_buy, volume)
+                np.testing.assert_equal(price_result.result_price, prices[i])
+                np.testing.assert_almost_equal(vwap_result.result_price, vwaps[i])
+                self.assertAlmostEqual(price_result.result_volume, filled_volumes[i])
+                self.assertAlmostEqual(quote_result.result_volume, quote_volumes[i])
+
+        results = order_book.get_prices_for_volumes(True, volumes)
+        self.assertEqual([13, 11, 12], [result.result_price for result in results if not np.isnan(result.result_price)])
+        self.assertEqual(0, len(order_book.get_vwaps_for_volumes(True, [])))
+
+    def test_depth_index_matches_depth_walk(self):
+        rng = np.random.default_rng(7)
+        bids_array = np.column_stack([100 - np.arange(200) * 0.1, rng.uniform(0.1, 3, 200), np.ones(200)])
+        asks_array = np.column_stack([100.1 + np.arange(200) * 0.1, rng.uniform(0.1, 3, 200), np.ones(200)])
+        order_book = OrderBook()
+        indexed_order_book = OrderBook(depth_index=True)
+        for book in (order_book, indexed_order_book):
+            book.apply_numpy_snapshot(bids_array, asks_array)
+
+        for is_buy in (True, False):
+            for volume in (0, 0.05, 1, 37.5, 250, 1e6, float("nan")):
+                for query in ("get_price_for_volume", "get_vwap_for_volume", "get_price_for_quote_volume",
+                              "get_quote_volume_for_base_amount"):
+                    expected = getattr(order_book, query)(is_buy, volume)
+                    result = getattr(indexed_order_book, query)(is_buy, volume)
+                    np.testing.assert_equal(expected.result_price, result.result_price)
+                    np.testing.assert_equal(expected.result_volume, result.result_volume)
+            for price in (90, 99.95, 100, 100.1, 105.05, 200, 0):
+                for query in ("get_volume_for_price", "get_quote_volume_for_price"):
+                    expected = getattr(order_book, query)(is_buy, price)
+                    result = getattr(indexed_order_book, query)(is_buy, price)
+                    np.testing.assert_equal(expected.result_price, result.result_price)
+                    np.testing.assert_equal(expected.result_volume, result.result_volume)
+            np.testing.assert_almost_equal(order_book.walk_depth_for_volumes(is_buy, [3, 1, 1e6]),
+                                           indexed_order_book.walk_depth_for_volumes(is_buy, [3, 1, 1e6]))
+
+    def test_depth_index_invalidated_by_updates(self):
+        order_book = self._depth_order_book()
+        order_book.depth_index_enabled = True
+        self.assertEqual(12, order_book.get_price_for_volume(True, 2).result_price)
+
+        order_book.apply_numpy_diffs(np.empty((0, 3)), np.array([[11, 5, 2]], dtype=np.float64))
+        self.assertEqual(11, order_book.get_price_for_volume(True, 2).result_price)
+
+        order_book.apply_numpy_snapshot(np.array([[1, 1, 3]], dtype=np.float64),
+                                        np.array([[20, 1, 3]], dtype=np.float64))
+        self.assertEqual(20, order_book.get_price_for_volume(True, 1).result_price)
+        self.assertEqual(1, order_book.get_volume_for_price(False, 0.5).result_volume)
+
+    def test_apply_raw_diffs_and_snapshot(self):
+        order_book = OrderBook()
+
+        order_book.apply_raw_snapshot([["10", "1"], ["9", "2", "extra"]], np.array([[11, 1], [12, 2]]), 5)
+
+        self.assertEqual(5, order_book.snapshot_uid)
+        self.assertEqual([(10, 1, 5), (9, 2, 5)], [tuple(row) for row in order_book.bid_entries()])
+        self.assertEqual([(11, 1, 5), (12, 2, 5)], [tuple(row) for row in order_book.ask_entries()])
+
+        order_book.apply_raw_diffs(np.array([[10, 0], [9.5, 3]]), [], 6)
+
+        self.assertEqual(6, order_book.last_diff_uid)
+        self.assertEqual([(9.5, 3, 6), (9, 2, 5)], [tuple(row) for row in order_book.bid_entries()])
+        self.assertEqual(9.5, order_book.get_price(False))
+
+        order_book.apply_raw_diffs(np.empty((0, 2)), np.array([[11, 0, 7]])[:, :2], 7)
+
+        self.assertEqual([(12, 2, 5)], [tuple(row) for row in order_book.ask_entries()])
+
+    def test_apply_diff_messages(self):
+        order_book = OrderBook()
+        order_book.apply_raw_snapshot([["10", "1"], ["9", "2"]], [["11", "1"], ["12", "2"]], 5)
+        diffs = [
+            OrderBookMessage(OrderBookMessageType.DIFF, {
+                "trading_pair": "A-B", "update_id": 6, "bids": [["10", "0"], ["9.5", "3"]], "asks": [["11", "4"]]},
+                timestamp=1),
+            OrderBookMessage(OrderBookMessageType.DIFF, {
+                "trading_pair": "A-B", "update_id": 7, "bids": [["9.5", "1"]], "asks": [["12", "0"]]},
+                timestamp=1),
+        ]
+
+        order_book.apply_diff_messages(diffs)
+
+        self.assertEqual(7, order_book.last_diff_uid)
+        self.assertEqual([(9.5, 1, 7), (9, 2, 5)], [tuple(row) for row in order_book.bid_entries()])
+        self.assertEqual([(11, 4, 6)], [tuple(row) for row in order_book.ask_entries()])
+
+        order_book.apply_diff_messages([])
+
+        self.assertEqual(7, order_book.last_diff_uid)
+
+    def test_restore_from_snapshot_and_diffs(self):
+        order_book = OrderBook()
+        snapshot = OrderBookMessage(OrderBookMessageType.SNAPSHOT, {
+            "trading_pair": "A-B", "update_id": 2, "bids": [["10", "1"]], "asks": [["11", "1"]]}, timestamp=1)
+        diffs = [
+            OrderBookMessage(OrderBookMessageType.DIFF, {
+                "trading_pair": "A-B", "update_id": update_id, "bids": [[str(9 + update_id / 10), "1"]], "asks": []},
+                timestamp=1)
+            for update_id in (1, 2, 3, 4)
+        ]
+
+        order_book.restore_from_snapshot_and_diffs(snapshot, diffs)
+
+        self.assertEqual([10, 9.4, 9.3], [row.price for row in order_book.bid_entries()])
+        self.assertEqual(4, order_book.last_diff_uid)
+
+    def test_to_numpy(self):
+        order_book = self._depth_order_book()
+
+        bids, asks = order_book.to_numpy()
+        self.assertEqual(ORDER_BOOK_ROW_DTYPE, bids.dtype)
+        self.assertEqual([10, 9, 8], bids["price"].tolist())
+        self.assertEqual([(11, 1, 1), (12, 2, 1), (13, 3, 1)], asks.tolist())
+
+        bids, asks = order_book.to_numpy(depth=2)
+        self.assertEqual([10, 9], bids["price"].tolist())
+        self.assertEqual([11, 12], asks["price"].tolist())
+
+        bids, asks = order_book.to_numpy(depth=0)
+        self.assertEqual(0, len(bids))
+        self.assertEqual(0, len(asks))
+
+    def test_to_numpy_keeps_large_update_ids(self):
+        order_book = OrderBook()
+        update_id = 2 ** 53 + 1
+        order_book.apply_raw_snapshot([["10", "1"]], [["11", "1"]], update_id)
+
+        bids, asks = order_book.to_numpy()
+
+        self.assertEqual(np.int64, bids["update_id"].dtype)
+        self.assertEqual([update_id], bids["update_id"].tolist())
+        self.assertEqual([update_id], asks["update_id"].tolist())
+
+    def test_to_numpy_fills_supplied_buffers(self):
+        order_book = self._depth_order_book()
+        bids_out = np.zeros(5, dtype=ORDER_BOOK_ROW_DTYPE)
+        asks_out = np.zeros(5, dtype=ORDER_BOOK_ROW_DTYPE)
+
+        bids, asks = order_book.to_numpy(bids_out=bids_out, asks_out=asks_out)
+
+        self.assertIs(bids_out, bids.base)
+        self.assertEqual([10, 9, 8, 0, 0], bids_out["price"].tolist())
+        self.assertEqual([11, 12, 13], asks["price"].tolist())
+
+        with self.assertRaises(ValueError):
+            order_book.to_numpy(bids_out=np.zeros(2, dtype=ORDER_BOOK_ROW_DTYPE))
+        with self.assertRaises(ValueError):
+            order_book.to_numpy(asks_out=np.zeros((5, 3)))
+        with self.assertRaises(ValueError):
+            order_book.to_numpy(depth=-1)
+
+    def test_snapshot(self):
+        order_book = self._depth_order_book()
+
+        bids_df, asks_df = order_book.snapshot
+
+        self.assertEqual(["price", "amount", "update_id"], list(bids_df.columns))
+        self.assertEqual([[10, 1, 1], [9, 2, 1], [8, 3, 1]], bids_df.values.tolist())
+        self.assertEqual([[11, 1, 1], [12, 2, 1], [13, 3, 1]], asks_df.values.tolist())
+        self.assertTrue(all(dtype == np.float64 for dtype in asks_df.dtypes))
+
+    def test_composite_order_book_depth_queries_exclude_traded_amounts(self):
+        order_book = CompositeOrderBook()
+        bids_array = np.array([[10, 1, 1], [9, 2, 1]], dtype=np.float64)
+        asks_array = np.array([[11, 1, 1], [12, 2, 1]], dtype=np.float64)
+        order_book.apply_numpy_snapshot(bids_array, asks_array)
+        order_book.record_filled_order(OrderFilledEvent(
+            timestamp=1, order_id="1", trading_pair="A-B", trade_type=TradeType.BUY, order_type=OrderType.LIMIT,
+            price=11, amount=1, trade_fee=AddedToCostTradeFee()))
+
+        self.assertEqual(12, order_book.get_price_for_volume(True, 1).result_price)
+        self.assertEqual([(12, 2, 1)], [tuple(row) for row in order_book.simulate_buy(5)])
+        self.assertEqual(10, order_book.get_price_for_volume(False, 1).result_price)
+
+        order_book.depth_index_enabled = True
+        self.assertEqual(12, order_book.get_price_for_volume(True, 1).result_price)
+        order_book.clear_traded_order_book()
+        self.assertEqual(11, order_book.get_price_for_volume(True, 1).result_price)
+
 
 def main():
     logging.basicConfig(level=logging.INFO)
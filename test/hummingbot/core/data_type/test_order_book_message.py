@@ -1,6 +1,8 @@
 import time
 import unittest
 
+import numpy as np
+
 from hummingbot.core.data_type.order_book_message import OrderBookMessage, \
     OrderBookMessageType
 from hummingbot.core.data_type.order_book_row import OrderBookRow
@@ -119,6 +121,52 @@ class OrderBookMessageTest(unittest.TestCase):
         self.assertEqual(6, bids[0].amount)
         self.assertEqual(update_id, bids[0].update_id)
 
+    def test_bids_and_asks_are_parsed_once(self):
+        msg = OrderBookMessage(
+            message_type=OrderBookMessageType.DIFF,
+            content={"update_id": 1, "asks": [("1", "2")], "bids": [("5", "6")]},
+            timestamp=time.time(),
+        )
+
+        self.assertIs(msg.asks, msg.asks)
+        self.assertIs(msg.bids, msg.bids)
+        self.assertIs(msg.asks_array, msg.asks_array)
+        self.assertIs(msg.bids_array, msg.bids_array)
+
+    def test_bids_and_asks_arrays(self):
+        msg = OrderBookMessage(
+            message_type=OrderBookMessageType.DIFF,
+            content={
+                "update_id": 1,
+                "asks": [["1.5", "2", "extra"], ["3", "4", "extra"]],
+                "bids": [("5", "6"), (7, 8.5)],
+            },
+            timestamp=time.time(),
+        )
+
+        self.assertEqual((2, 2), msg.asks_array.shape)
+        self.assertEqual(np.float64, msg.asks_array.dtype)
+        self.assertEqual([[1.5, 2], [3, 4]], msg.asks_array.tolist())
+        self.assertEqual([[5, 6], [7, 8.5]], msg.bids_array.tolist())
+
+        msg = OrderBookMessage(
+            message_type=OrderBookMessageType.DIFF,
+            content={"update_id": 1, "asks": np.array([[1, 2, 3]], dtype=np.float64), "bids": []},
+            timestamp=time.time(),
+        )
+
+        self.assertEqual([[1, 2]], msg.asks_array.tolist())
+        self.assertEqual((0, 2), msg.bids_array.shape)
+
+        msg = OrderBookMessage(
+            message_type=OrderBookMessageType.DIFF,
+            content={"update_id": 1, "asks": [["1", "2", {"flag": True}]], "bids": (level for level in [[3, 4]])},
+            timestamp=time.time(),
+        )
+
+        self.assertEqual([[1, 2]], msg.asks_array.tolist())
+        self.assertEqual([[3, 4]], msg.bids_array.tolist())
+
     def test_has_update_id(self):
         update_id = "someId"
 
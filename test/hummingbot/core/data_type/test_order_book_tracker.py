@@ -0,0 +1,377 @@
+import asyncio
+from test.isolated_asyncio_wrapper_test_case import IsolatedAsyncioWrapperTestCase
+from typing import Dict, List, Optional
+from unittest.mock import AsyncMock, patch
+
+from hummingbot.core.data_type.order_book import OrderBook
+from hummingbot.core.data_type.order_book_message import OrderBookMessage, OrderBookMessageType
+from hummingbot.core.data_type.order_book_row import OrderBookRow
+from hummingbot.core.data_type.order_book_tracker import OrderBookTracker
+from hummingbot.core.data_type.order_book_tracker_data_source import OrderBookTrackerDataSource
+
+
+class MockOrderBookTrackerDataSource(OrderBookTrackerDataSource):
+
+    def __init__(self, trading_pairs: List[str]):
+        super().__init__(trading_pairs=trading_pairs)
+        self.release_events: Dict[str, asyncio.Event] = {pair: asyncio.Event() for pair in trading_pairs}
+        self.failures: Dict[str, int] = {}
+        self.in_flight: int = 0
+        self.max_in_flight: int = 0
+
+    async def get_last_traded_prices(self, trading_pairs: List[str], domain: Optional[str] = None) -> Dict[str, float]:
+        return {}
+
+    async def get_new_order_book(self, trading_pair: str) -> OrderBook:
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await self.release_events[trading_pair].wait()
+            if self.failures.get(trading_pair, 0) > 0:
+                self.failures[trading_pair] -= 1
+                raise IOError("Snapshot request failed")
+        finally:
+            self.in_flight -= 1
+        order_book = OrderBook()
+        order_book.apply_snapshot([OrderBookRow(1.0, 1.0, 1)], [OrderBookRow(2.0, 1.0, 1)], 1)
+        return order_book
+
+    async def _parse_trade_message(self, raw_message, message_queue: asyncio.Queue):
+        pass
+
+    async def _parse_order_book_diff_message(self, raw_message, message_queue: asyncio.Queue):
+        pass
+
+    async def _connected_websocket_assistant(self):
+        pass
+
+    async def _subscribe_channels(self, ws):
+        pass
+
+    async def _order_book_snapshot(self, trading_pair: str):
+        pass
+
+
+class SequencedOrderBookTrackerDataSource(MockOrderBookTrackerDataSource):
+    CONTIGUOUS_DIFF_UPDATE_IDS = True
+
+    def __init__(self, trading_pairs: List[str]):
+        super().__init__(trading_pairs=trading_pairs)
+        self.snapshots: asyncio.Queue = asyncio.Queue()
+
+    async def get_order_book_snapshot(self, trading_pair: str) -> OrderBookMessage:
+        return await self.snapshots.get()
+
+
+class OrderBookTrackerTests(IsolatedAsyncioWrapperTestCase):
+
+    async def asyncSetUp(self):
+        await super().asyncSetUp()
+        self.trading_pairs = ["COINALPHA-HBOT", "COINBETA-HBOT", "COINGAMMA-HBOT"]
+        self.data_source = MockOrderBookTrackerDataSource(trading_pairs=self.trading_pairs)
+        self.tracker = OrderBookTracker(data_source=self.data_source, trading_pairs=self.trading_pairs)
+
+    async def asyncTearDown(self):
+        self.tracker.stop()
+        await super().asyncTearDown()
+
+    async def _wait_until(self, condition, timeout: float = 1.0):
+        async def _wait():
+            while not condition():
+                await asyncio.sleep(0)
+        await asyncio.wait_for(_wait(), timeout=timeout)
+
+    async def test_order_books_are_initialized_concurrently_and_ready_per_pair(self):
+        init_task = asyncio.create_task(self.tracker._init_order_books())
+        await self._wait_until(lambda: self.data_source.in_flight == 3)
+
+        self.data_source.release_events["COINBETA-HBOT"].set()
+        await asyncio.wait_for(self.tracker.wait_order_book_ready("COINBETA-HBOT"), timeout=1)
+
+        self.assertTrue(self.tracker.is_order_book_ready("COINBETA-HBOT"))
+        self.assertFalse(self.tracker.is_order_book_ready("COINALPHA-HBOT"))
+        self.assertEqual(["COINBETA-HBOT"], self.tracker.ready_trading_pairs)
+        self.assertIn("COINBETA-HBOT", self.tracker.order_books)
+        self.assertIn("COINBETA-HBOT", self.tracker._tracking_tasks)
+        self.assertFalse(self.tracker.ready)
+        self.assertIsNone(self.tracker.init_metrics["total_seconds"])
+
+        self.data_source.release_events["COINALPHA-HBOT"].set()
+        self.data_source.release_events["COINGAMMA-HBOT"].set()
+        await asyncio.wait_for(init_task, timeout=1)
+
+        self.assertTrue(self.tracker.ready)
+        self.assertEqual(3, self.data_source.max_in_flight)
+        metrics = self.tracker.init_metrics
+        self.assertEqual(3, metrics["initialized"])
+        self.assertEqual(3, metrics["total"])
+        self.assertIsNotNone(metrics["total_seconds"])
+        self.assertEqual(set(self.trading_pairs), set(metrics["seconds_per_pair"]))
+        self.assertEqual({pair: 1 for pair in self.trading_pairs}, metrics["attempts_per_pair"])
+
+    async def test_concurrent_snapshot_requests_are_bounded(self):
+        self.tracker.MAX_CONCURRENT_SNAPSHOT_REQUESTS = 2
+        init_task = asyncio.create_task(self.tracker._init_order_books())
+        await self._wait_until(lambda: self.data_source.in_flight == 2)
+        await asyncio.sleep(0)
+        self.assertEqual(2, self.data_source.in_flight)
+
+        for event in self.data_source.release_events.values():
+            event.set()
+        await asyncio.wait_for(init_task, timeout=1)
+
+        self.assertEqual(2, self.data_source.max_in_flight)
+        self.assertTrue(self.tracker.ready)
+
+    async def test_seconds_per_pair_exclude_the_wait_for_a_request_slot(self):
+        self.tracker.MAX_CONCURRENT_SNAPSHOT_REQUESTS = 1
+        init_task = asyncio.create_task(self.tracker._init_order_books())
+        for trading_pair in self.trading_pairs:
+            await asyncio.sleep(0.05)
+            self.data_source.release_events[trading_pair].set()
+        await asyncio.wait_for(init_task, timeout=1)
+
+        metrics = self.tracker.init_metrics
+        self.assertGreaterEqual(metrics["total_seconds"], 0.15)
+        self.assertLess(max(metrics["seconds_per_pair"].values()), 0.1)
+
+    @patch("hummingbot.core.data_type.order_book_tracker.OrderBookTracker._sleep", new_callable=AsyncMock)
+    async def test_failed_snapshot_is_retried_without_blocking_other_pairs(self, sleep_mock):
+        self.data_source.failures["COINALPHA-HBOT"] = 1
+        for event in self.data_source.release_events.values():
+            event.set()
+
+        await asyncio.wait_for(self.tracker._init_order_books(), timeout=1)
+
+        self.assertTrue(self.tracker.ready)
+        self.assertEqual(2, self.tracker.init_metrics["attempts_per_pair"]["COINALPHA-HBOT"])
+        self.assertEqual(set(self.trading_pairs), set(self.tracker.ready_trading_pairs))
+        sleep_mock.assert_awaited_once_with(delay=OrderBookTracker.SNAPSHOT_RETRY_INTERVAL)
+
+    async def test_stop_resets_readiness(self):
+        for event in self.data_source.release_events.values():
+            event.set()
+        await asyncio.wait_for(self.tracker._init_order_books(), timeout=1)
+
+        self.tracker.stop()
+
+        self.assertFalse(self.tracker.ready)
+        self.assertEqual([], self.tracker.ready_trading_pairs)
+        self.assertFalse(self.tracker._order_book_ready_events["COINALPHA-HBOT"].is_set())
+        self.assertEqual(0, self.tracker.init_metrics["initialized"])
+
+    def _diff(self, trading_pair: str, update_id: int, bids: List, asks: List) -> OrderBookMessage:
+        return OrderBookMessage(OrderBookMessageType.DIFF, {
+            "trading_pair": trading_pair, "update_id": update_id, "bids": bids, "asks": asks}, timestamp=update_id)
+
+    async def test_batched_routing_coalesces_diffs_per_pair(self):
+        tracker = OrderBookTracker(data_source=self.data_source, trading_pairs=self.trading_pairs, batched_routing=True)
+        early_diff = self._diff("COINALPHA-HBOT", 2, [["0.5", "3"]], [])
+        tracker._process_message_batch([early_diff])
+        for event in self.data_source.release_events.values():
+            event.set()
+        await asyncio.wait_for(tracker._init_order_books(), timeout=1)
+
+        self.assertEqual({}, tracker._tracking_tasks)
+        alpha_book = tracker.order_books["COINALPHA-HBOT"]
+        self.assertEqual(2, alpha_book.last_diff_uid)
+        self.assertEqual([(1, 1, 1), (0.5, 3, 2)], [tuple(row) for row in alpha_book.bid_entries()])
+
+        for message in [
+            self._diff("COINALPHA-HBOT", 3, [["1", "2"]], []),
+            self._diff("COINBETA-HBOT", 3, [], [["3", "1"]]),
+            self._diff("COINALPHA-HBOT", 4, [["0.5", "0"]], [["2", "5"]]),
+            self._diff("COINBETA-HBOT", 0, [["1", "9"]], []),
+        ]:
+            tracker._order_book_diff_stream.put_nowait(message)
+        router_task = asyncio.create_task(tracker._order_book_batch_router())
+        await self._wait_until(lambda: tracker._order_book_diff_stream.empty() and tracker._batches_processed == 1)
+        router_task.cancel()
+
+        self.assertEqual(4, alpha_book.last_diff_uid)
+        self.assertEqual([(1, 2, 3)], [tuple(row) for row in alpha_book.bid_entries()])
+        self.assertEqual([(2, 5, 4)], [tuple(row) for row in alpha_book.ask_entries()])
+        beta_book = tracker.order_books["COINBETA-HBOT"]
+        self.assertEqual([(1, 1, 1)], [tuple(row) for row in beta_book.bid_entries()])
+        self.assertEqual([(2, 1, 1), (3, 1, 3)], [tuple(row) for row in beta_book.ask_entries()])
+
+        stats = tracker.batch_routing_stats
+        self.assertEqual(1, stats["batches"])
+        self.assertEqual(4, stats["messages"])
+        self.assertEqual(4, stats["diff_messages"])
+        self.assertEqual(3, stats["diff_updates"])
+        self.assertAlmostEqual(4 / 3, stats["coalescing_ratio"])
+        self.assertEqual(4, stats["max_queue_depth"])
+
+    async def test_batched_routing_applies_snapshots_in_order(self):
+        tracker = OrderBookTracker(data_source=self.data_source, trading_pairs=self.trading_pairs, batched_routing=True)
+        for event in self.data_source.release_events.values():
+            event.set()
+        await asyncio.wait_for(tracker._init_order_books(), timeout=1)
+
+        snapshot = OrderBookMessage(OrderBookMessageType.SNAPSHOT, {
+            "trading_pair": "COINALPHA-HBOT", "update_id": 5, "bids": [["1.5", "1"]], "asks": [["2.5", "1"]]},
+            timestamp=5)
+        tracker._process_message_batch([
+            snapshot,
+            self._diff("COINALPHA-HBOT", 6, [["1.4", "2"]], []),
+        ])
+
+        order_book = tracker.order_books["COINALPHA-HBOT"]
+        self.assertEqual(5, order_book.snapshot_uid)
+        self.assertEqual([(1.5, 1, 5), (1.4, 2, 6)], [tuple(row) for row in order_book.bid_entries()])
+        self.assertEqual(1, tracker.batch_routing_stats["diff_updates"])
+
+    async def test_update_listeners_are_notified_of_order_book_changes(self):
+        updates = []
+        self.tracker.add_update_listener(updates.append)
+        self.data_source.release_events["COINALPHA-HBOT"].set()
+        init_task = asyncio.create_task(self.tracker._init_order_book("COINALPHA-HBOT", asyncio.Semaphore(1)))
+        await asyncio.wait_for(init_task, timeout=1)
+        self.assertEqual(["COINALPHA-HBOT"], updates)
+
+        self.tracker._tracking_message_queues["COINALPHA-HBOT"].put_nowait(
+            self._diff("COINALPHA-HBOT", 2, [["0.5", "3"]], []))
+        await self._wait_until(lambda: len(updates) == 2)
+
+        self.tracker.remove_update_listener(updates.append)
+        self.tracker._tracking_message_queues["COINALPHA-HBOT"].put_nowait(
+            self._diff("COINALPHA-HBOT", 3, [["0.4", "3"]], []))
+        await self._wait_until(lambda: self.tracker.order_books["COINALPHA-HBOT"].last_diff_uid == 3)
+        self.assertEqual(["COINALPHA-HBOT"] * 2, updates)
+
+    async def test_batched_routing_notifies_update_listeners_once_per_batch(self):
+        tracker = OrderBookTracker(data_source=self.data_source, trading_pairs=self.trading_pairs, batched_routing=True)
+        for event in self.data_source.release_events.values():
+            event.set()
+        await asyncio.wait_for(tracker._init_order_books(), timeout=1)
+        updates = []
+        tracker.add_update_listener(updates.append)
+
+        tracker._process_message_batch([
+            self._diff("COINALPHA-HBOT", 2, [["0.5", "3"]], []),
+            self._diff("COINALPHA-HBOT", 3, [["0.4", "3"]], []),
+            self._diff("COINBETA-HBOT", 2, [["0.5", "3"]], []),
+        ])
+
+        self.assertEqual(["COINALPHA-HBOT", "COINBETA-HBOT"], sorted(updates))
+
+    def _sequenced_diff(self, first_update_id: int, update_id: int, bids: List) -> OrderBookMessage:
+        return OrderBookMessage(OrderBookMessageType.DIFF, {
+            "trading_pair": "COINALPHA-HBOT", "first_update_id": first_update_id, "update_id": update_id,
+            "bids": bids, "asks": []}, timestamp=update_id)
+
+    def _snapshot(self, update_id: int, bids: List) -> OrderBookMessage:
+        return OrderBookMessage(OrderBookMessageType.SNAPSHOT, {
+            "trading_pair": "COINALPHA-HBOT", "update_id": update_id, "bids": bids, "asks": [["2", "1"]]},
+            timestamp=update_id)
+
+    async def _sequenced_tracker(self, batched_routing: bool) -> OrderBookTracker:
+        data_source = SequencedOrderBookTrackerDataSource(trading_pairs=self.trading_pairs)
+        for event in data_source.release_events.values():
+            event.set()
+        tracker = OrderBookTracker(data_source=data_source, trading_pairs=self.trading_pairs,
+                                   batched_routing=batched_routing)
+        await asyncio.wait_for(tracker._init_order_books(), timeout=1)
+        self.addCleanup(tracker.stop)
+        return tracker
+
+    async def test_sequence_gap_triggers_targeted_resync(self):
+        tracker = await self._sequenced_tracker(batched_routing=False)
+        order_book = tracker.order_books["COINALPHA-HBOT"]
+        message_queue = tracker._tracking_message_queues["COINALPHA-HBOT"]
+
+        message_queue.put_nowait(self._sequenced_diff(2, 3, [["0.9", "1"]]))
+        message_queue.put_nowait(self._sequenced_diff(1, 1, [["0.1", "1"]]))
+        message_queue.put_nowait(self._sequenced_diff(6, 7, [["0.8", "1"]]))
+        await self._wait_until(lambda: "COINALPHA-HBOT" in tracker._resync_tasks)
+
+        self.assertEqual(3, order_book.last_diff_uid)
+        self.assertEqual([(1, 1, 1), (0.9, 1, 3)], [tuple(row) for row in order_book.bid_entries()])
+        self.assertEqual({"gaps": {"COINALPHA-HBOT": 1}, "resyncs": {}}, tracker.sequence_gap_stats)
+
+        message_queue.put_nowait(self._sequenced_diff(8, 8, [["0.7", "1"]]))
+        tracker.data_source.snapshots.put_nowait(self._snapshot(6, [["1.1", "1"]]))
+        await self._wait_until(lambda: order_book.snapshot_uid == 6)
+
+        self.assertEqual(8, order_book.last_diff_uid)
+        self.assertEqual([(1.1, 1, 6), (0.8, 1, 7), (0.7, 1, 8)],
+                         [tuple(row) for row in order_book.bid_entries()])
+        self.assertEqual({"gaps": {"COINALPHA-HBOT": 1}, "resyncs": {"COINALPHA-HBOT": 1}}, tracker.sequence_gap_stats)
+        self.assertNotIn("COINALPHA-HBOT", tracker._resyncing_pairs)
+        self.assertNotIn("COINALPHA-HBOT", tracker._resync_tasks)
+        self.assertNotIn("COINBETA-HBOT", tracker.sequence_gap_stats["gaps"])
+
+        message_queue.put_nowait(self._sequenced_diff(9, 9, [["0.6", "1"]]))
+        await self._wait_until(lambda: order_book.last_diff_uid == 9)
+
+    async def test_snapshot_older_than_the_gap_requests_another_resync(self):
+        tracker = await self._sequenced_tracker(batched_routing=False)
+        order_book = tracker.order_books["COINALPHA-HBOT"]
+        tracker._past_diffs_windows["COINALPHA-HBOT"].extend([
+            self._sequenced_diff(2, 3, [["0.9", "1"]]),
+            self._sequenced_diff(6, 7, [["0.8", "1"]]),
+        ])
+
+        tracker._restore_order_book("COINALPHA-HBOT", order_book, self._snapshot(4, [["1.1", "1"]]))
+
+        self.assertEqual(4, order_book.snapshot_uid)
+        self.assertIn("COINALPHA-HBOT", tracker._resyncing_pairs)
+        self.assertIn("COINALPHA-HBOT", tracker._resync_tasks)
+        self.assertEqual(1, tracker.sequence_gap_stats["gaps"]["COINALPHA-HBOT"])
+
+    async def test_resync_replays_all_diffs_received_during_the_snapshot_request(self):
+        tracker = await self._sequenced_tracker(batched_routing=True)
+        order_book = tracker.order_books["COINALPHA-HBOT"]
+        window_size = tracker.PAST_DIFF_WINDOW_SIZE
+
+        tracker._process_message_batch([self._sequenced_diff(4, 5, [["0.9", "1"]])])
+        self.assertIn("COINALPHA-HBOT", tracker._resyncing_pairs)
+        update_ids = range(6, 6 + 2 * window_size)
+        tracker._process_message_batch([self._sequenced_diff(update_id, update_id, [[str(update_id), "1"]])
+                                        for update_id in update_ids])
+
+        tracker.data_source.snapshots.put_nowait(self._snapshot(5, [["1", "1"]]))
+        await self._wait_until(lambda: not tracker._order_book_diff_stream.empty())
+        tracker._process_message_batch([tracker._order_book_diff_stream.get_nowait()])
+
+        self.assertEqual(5, order_book.snapshot_uid)
+        self.assertEqual(update_ids[-1], order_book.last_diff_uid)
+        self.assertEqual(2 * window_size + 1, len(list(order_book.bid_entries())))
+        self.assertNotIn("COINALPHA-HBOT", tracker._resyncing_pairs)
+        self.assertNotIn("COINALPHA-HBOT", tracker._resync_buffers)
+        self.assertEqual({"gaps": {"COINALPHA-HBOT": 1}, "resyncs": {"COINALPHA-HBOT": 1}}, tracker.sequence_gap_stats)
+
+    async def test_batched_routing_resyncs_on_sequence_gap(self):
+        tracker = await self._sequenced_tracker(batched_routing=True)
+        order_book = tracker.order_books["COINALPHA-HBOT"]
+
+        tracker._process_message_batch([
+            self._sequenced_diff(2, 3, [["0.9", "1"]]),
+            self._sequenced_diff(4, 5, [["0.8", "1"]]),
+            self._sequenced_diff(7, 8, [["0.7", "1"]]),
+        ])
+
+        self.assertEqual(5, order_book.last_diff_uid)
+        self.assertEqual(1, tracker.batch_routing_stats["diff_updates"])
+        self.assertEqual(1, tracker.sequence_gap_stats["gaps"]["COINALPHA-HBOT"])
+
+        tracker.data_source.snapshots.put_nowait(self._snapshot(7, [["1.1", "1"]]))
+        await self._wait_until(lambda: not tracker._order_book_diff_stream.empty())
+        tracker._process_message_batch([tracker._order_book_diff_stream.get_nowait()])
+
+        self.assertEqual(7, order_book.snapshot_uid)
+        self.assertEqual(8, order_book.last_diff_uid)
+        self.assertEqual([(1.1, 1, 7), (0.7, 1, 8)], [tuple(row) for row in order_book.bid_entries()])
+        self.assertEqual(1, tracker.sequence_gap_stats["resyncs"]["COINALPHA-HBOT"])
+
+    async def test_sequence_is_not_checked_without_contiguous_update_ids(self):
+        for event in self.data_source.release_events.values():
+            event.set()
+        await asyncio.wait_for(self.tracker._init_order_books(), timeout=1)
+        order_book = self.tracker.order_books["COINALPHA-HBOT"]
+
+        self.tracker._tracking_message_queues["COINALPHA-HBOT"].put_nowait(self._sequenced_diff(10, 12, [["0.9", "1"]]))
+        await self._wait_until(lambda: order_book.last_diff_uid == 12)
+
+        self.assertEqual({"gaps": {}, "resyncs": {}}, self.tracker.sequence_gap_stats)
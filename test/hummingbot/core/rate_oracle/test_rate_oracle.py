@@ -2,6 +2,7 @@ from copy import deepcopy
 from decimal import Decimal
 from test.isolated_asyncio_wrapper_test_case import IsolatedAsyncioWrapperTestCase
 from typing import Dict, Optional
+from unittest.mock import patch
 
 from hummingbot.client.config.client_config_map import ClientConfigMap
 from hummingbot.client.config.config_helpers import ClientConfigAdapter
@@ -51,6 +52,21 @@ class RateOracleTest(IsolatedAsyncioWrapperTestCase):
         rate = self.run_async_with_timeout(rate_oracle.rate_async(self.trading_pair))
         self.assertEqual(expected_rate, rate)
 
+    def test_stored_or_live_rates_fetches_the_prices_once(self):
+        source = DummyRateSource(price_dict={self.trading_pair: Decimal("10"), "USDT-HBOT": Decimal("2")})
+        rate_oracle = RateOracle(source=source)
+
+        with patch.object(source, "get_prices", wraps=source.get_prices) as get_prices_mock:
+            rates = self.run_async_with_timeout(
+                rate_oracle.stored_or_live_rates([self.trading_pair, "HBOT-USDT", "ZBOT-USDT"]))
+
+        self.assertEqual({self.trading_pair: Decimal("10"), "HBOT-USDT": Decimal("0.5"), "ZBOT-USDT": None}, rates)
+        get_prices_mock.assert_called_once()
+
+        rate_oracle.set_price(self.trading_pair, Decimal("11"))
+        rates = self.run_async_with_timeout(rate_oracle.stored_or_live_rates([self.trading_pair]))
+        self.assertEqual({self.trading_pair: Decimal("11")}, rates)
+
     def test_rate_oracle_network(self):
         expected_rate = Decimal("10")
         rate_oracle = RateOracle(source=DummyRateSource(price_dict={self.trading_pair: expected_rate}))
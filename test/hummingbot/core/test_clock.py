@@ -5,9 +5,19 @@ import unittest
 import pandas as pd
 
 from hummingbot.core.clock import Clock, ClockMode
+from hummingbot.core.py_time_iterator import PyTimeIterator
 from hummingbot.core.time_iterator import TimeIterator
 
 
+class SlowTimeIterator(PyTimeIterator):
+    def __init__(self, tick_duration: float):
+        super().__init__()
+        self.tick_duration = tick_duration
+
+    def tick(self, timestamp: float):
+        time.sleep(self.tick_duration)
+
+
 class ClockUnitTest(unittest.TestCase):
 
     backtest_start_timestamp: float = pd.Timestamp("2021-01-01", tz="UTC").timestamp()
@@ -110,6 +120,27 @@ class ClockUnitTest(unittest.TestCase):
 
         self.assertGreaterEqual(self.clock_realtime.current_timestamp, self.realtime_end_timestamp)
 
+    def test_run_til_records_tick_timings(self):
+        clock = Clock(ClockMode.REALTIME, tick_size=0.1, slow_tick_threshold=0.02)
+        fast_iterator = SlowTimeIterator(tick_duration=0.0)
+        slow_iterator = SlowTimeIterator(tick_duration=0.03)
+        clock.add_iterator(fast_iterator)
+        clock.add_iterator(slow_iterator)
+        reports = []
+        clock.add_slow_tick_listener(reports.append)
+
+        with clock:
+            self.ev_loop.run_until_complete(clock.run_til(time.time() + 0.35))
+
+        metrics = clock.tick_metrics
+        self.assertEqual(0.02, clock.slow_tick_threshold)
+        self.assertGreaterEqual(metrics.tick_duration.count, 2)
+        self.assertEqual(metrics.tick_duration.count, metrics.iterator_durations["SlowTimeIterator"].count / 2)
+        self.assertGreaterEqual(metrics.tick_duration.max, 0.03)
+        self.assertEqual(metrics.tick_duration.count, metrics.slow_tick_count)
+        self.assertEqual(metrics.slow_tick_count, len(reports))
+        self.assertEqual(0.03, round(reports[0].iterator_durations[0][1], 2))
+
     def test_backtest(self):
         # Note: Technically you do not execute `backtest()` when in REALTIME mode
 
@@ -0,0 +1,112 @@
+import unittest
+
+from hummingbot.core.clock_metrics import ClockMetrics, SlowTickReport, TimingHistogram, iterator_name
+
+
+class NamedIterator:
+    def __init__(self, name: str):
+        self.name = name
+
+
+class TimingHistogramTests(unittest.TestCase):
+
+    def test_empty_histogram(self):
+        histogram = TimingHistogram()
+
+        self.assertEqual(0, histogram.count)
+        self.assertEqual(0.0, histogram.mean)
+        self.assertEqual(0.0, histogram.percentile(99))
+
+    def test_record_and_percentiles(self):
+        histogram = TimingHistogram()
+        for _ in range(98):
+            histogram.record(0.0008)
+        histogram.record(0.02)
+        histogram.record(0.3)
+
+        self.assertEqual(100, histogram.count)
+        self.assertAlmostEqual((98 * 0.0008 + 0.32) / 100, histogram.mean)
+        self.assertEqual(0.001, histogram.percentile(50))
+        self.assertEqual(0.025, histogram.percentile(99))
+        self.assertEqual(0.3, histogram.percentile(100))
+        self.assertEqual(0.3, histogram.max)
+        self.assertEqual(0.3, histogram.last)
+
+    def test_percentile_above_the_last_bucket_is_the_max(self):
+        histogram = TimingHistogram()
+        histogram.record(0.3)
+        histogram.record(12.0)
+
+        self.assertEqual(0.5, histogram.percentile(50))
+        self.assertEqual(12.0, histogram.percentile(99))
+
+
+class ClockMetricsTests(unittest.TestCase):
+
+    def test_iterator_name(self):
+        self.assertEqual("binance", iterator_name(NamedIterator("binance")))
+        self.assertEqual("NamedIterator", iterator_name(NamedIterator("")))
+        self.assertEqual("object", iterator_name(object()))
+
+    def test_fast_tick_is_not_reported(self):
+        metrics = ClockMetrics()
+
+        report = metrics.record_tick(timestamp=100.0,
+                                     loop_lag=0.001,
+                                     duration=0.01,
+                                     iterator_durations=[(NamedIterator("binance"), 0.01)],
+                                     slow_tick_threshold=1.0)
+
+        self.assertIsNone(report)
+        self.assertEqual(1, metrics.tick_duration.count)
+        self.assertEqual(1, metrics.iterator_durations["binance"].count)
+        self.assertEqual(0, metrics.slow_tick_count)
+
+    def test_slow_tick_is_reported_with_the_slowest_iterators_first(self):
+        metrics = ClockMetrics()
+
+        report = metrics.record_tick(timestamp=100.0,
+                                     loop_lag=0.3,
+                                     duration=0.9,
+                                     iterator_durations=[(NamedIterator("binance"), 0.1),
+                                                         (NamedIterator("strategy"), 0.8)],
+                                     slow_tick_threshold=1.0)
+
+        self.assertIsInstance(report, SlowTickReport)
+        self.assertEqual([("strategy", 0.8), ("binance", 0.1)], report.iterator_durations)
+        self.assertEqual(1, metrics.slow_tick_count)
+        self.assertEqual([report], list(metrics.slow_ticks))
+        self.assertIn("strategy 800.0 ms", report.format())
+
+    def test_slow_tick_reports_are_bounded(self):
+        metrics = ClockMetrics()
+        for index in range(ClockMetrics.MAX_SLOW_TICK_REPORTS + 5):
+            metrics.record_tick(float(index), 0.0, 2.0, [], slow_tick_threshold=1.0)
+
+        self.assertEqual(ClockMetrics.MAX_SLOW_TICK_REPORTS + 5, metrics.slow_tick_count)
+        self.assertEqual(ClockMetrics.MAX_SLOW_TICK_REPORTS, len(metrics.slow_ticks))
+        self.assertEqual(5.0, metrics.slow_ticks[0].timestamp)
+
+    def test_report(self):
+        metrics = ClockMetrics()
+        self.assertEqual("", metrics.format_report())
+
+        metrics.record_tick(100.0, 0.002, 0.01, [(NamedIterator("binance"), 0.01)], slow_tick_threshold=1.0)
+        metrics.record_tick(101.0, 0.5, 0.7, [(NamedIterator("binance"), 0.7)], slow_tick_threshold=1.0)
+
+        report = metrics.report()
+        self.assertEqual(2, report["ticks"])
+        self.assertEqual(1, report["slow_ticks"])
+        self.assertEqual(0.5, report["loop_lag"]["max"])
+        self.assertEqual(2, report["iterators"]["binance"]["count"])
+        self.assertEqual([{"timestamp": 101.0, "duration": 0.7, "loop_lag": 0.5,
+                           "iterator_durations": {"binance": 0.7}}],
+                         report["last_slow_ticks"])
+
+        formatted = metrics.format_report()
+        self.assertIn("Ticks: 2 (1 slow)", formatted)
+        self.assertIn("binance: mean 355.00 ms", formatted)
+        self.assertIn("Last slow tick", formatted)
+
+        metrics.reset()
+        self.assertEqual(0, metrics.report()["ticks"])
@@ -9,6 +9,7 @@ from sqlalchemy.orm import Session
 
 from hummingbot.client.config.client_config_map import ClientConfigMap
 from hummingbot.client.config.config_helpers import ClientConfigAdapter
+from hummingbot.client.trades_aggregator import TradesAggregate
 from hummingbot.connector.connector_metrics_collector import DummyMetricsCollector, MetricsCollector
 from hummingbot.connector.exchange_base import ExchangeBase
 from hummingbot.core.clock import Clock
@@ -595,8 +596,7 @@ class TradingCoreTest(IsolatedAsyncioWrapperTestCase):
 
         self.assertEqual(result, Decimal("0"))
 
-    @patch("hummingbot.core.trading_core.PerformanceMetrics")
-    async def test_calculate_profitability_with_trades(self, mock_perf_metrics):
+    async def test_calculate_profitability_with_trades(self):
         """Test calculate_profitability with trades"""
         # Set up markets recorder and ready connector
         self.trading_core.markets_recorder = Mock()
@@ -606,30 +606,80 @@ class TradingCoreTest(IsolatedAsyncioWrapperTestCase):
         self.mock_connector.ready = True
         self.trading_core.connector_manager.connectors["binance"] = self.mock_connector
 
-        # Set up mock trades
-        mock_trade1 = Mock(spec=TradeFill)
-        mock_trade1.market = "binance"
-        mock_trade1.symbol = "BTC-USDT"
-        mock_trades = [mock_trade1]
-
-        # Mock session and trades retrieval
-        mock_session = Mock(spec=Session)
-        self.trading_core.trade_fill_db.get_new_session.return_value.__enter__ = Mock(return_value=mock_session)
-        self.trading_core.trade_fill_db.get_new_session.return_value.__exit__ = Mock(return_value=None)
-
-        # Mock calculate_performance_metrics_by_connector_pair
+        # Mock calculate_performance_metrics_by_market
         mock_perf = Mock()
         mock_perf.return_pct = Decimal("5.0")
 
-        with patch.object(self.trading_core, "_get_trades_from_session", return_value=mock_trades):
-            with patch.object(self.trading_core, "calculate_performance_metrics_by_connector_pair",
-                              return_value=[mock_perf]) as mock_calc_perf:
+        with patch.object(self.trading_core, "calculate_performance_metrics_by_market",
+                          return_value={("binance", "BTC-USDT"): mock_perf}) as mock_calc_perf:
 
-                result = await self.trading_core.calculate_profitability()
+            result = await self.trading_core.calculate_profitability()
 
-                # Verify
-                self.assertEqual(result, Decimal("5.0"))
-                mock_calc_perf.assert_called_once_with(mock_trades)
+            # Verify
+            self.assertEqual(result, Decimal("5.0"))
+            mock_calc_perf.assert_called_once_with(self.trading_core.init_time)
+
+    @patch("hummingbot.core.trading_core.PerformanceMetrics")
+    async def test_calculate_performance_metrics_by_market(self, mock_perf_metrics_class):
+        """Test calculate_performance_metrics_by_market"""
+        spot_aggregate = TradesAggregate(market="binance", symbol="BTC-USDT", num_buys=1, num_nil_position_buys=1)
+        derivative_aggregate = TradesAggregate(market="binance", symbol="ETH-USDT", num_buys=1)
+        self.trading_core.strategy_file_name = "test_strategy.yml"
+        self.trading_core.trades_aggregator = Mock()
+        self.trading_core.trades_aggregator.aggregate.return_value = {("binance", "BTC-USDT"): spot_aggregate,
+                                                                      ("binance", "ETH-USDT"): derivative_aggregate}
+        derivative_trades = [Mock(spec=TradeFill)]
+        self.trading_core.trades_aggregator.get_trades.return_value = derivative_trades
+
+        mock_perf1 = Mock()
+        mock_perf2 = Mock()
+        mock_perf_metrics_class.rate_pairs.side_effect = lambda symbol, aggregate: [symbol]
+        mock_perf_metrics_class.create_from_aggregate = AsyncMock(return_value=mock_perf1)
+        mock_perf_metrics_class.create = AsyncMock(return_value=mock_perf2)
+        rate_oracle = Mock()
+        rate_oracle.stored_or_live_rates = AsyncMock(return_value={"BTC-USDT": Decimal("30000")})
+        balances = {"BTC": Decimal("1.0"), "USDT": Decimal("1000.0")}
+
+        with patch.object(self.trading_core, "get_current_balances", return_value=balances), \
+                patch("hummingbot.core.trading_core.RateOracle.get_instance", return_value=rate_oracle):
+            result = await self.trading_core.calculate_performance_metrics_by_market(1000.0)
+
+        self.assertEqual({("binance", "BTC-USDT"): mock_perf1, ("binance", "ETH-USDT"): mock_perf2}, result)
+        self.trading_core.trades_aggregator.aggregate.assert_called_once_with("test_strategy.yml", 1000000)
+        rate_oracle.stored_or_live_rates.assert_called_once()
+        mock_perf_metrics_class.create_from_aggregate.assert_called_once_with(
+            "BTC-USDT", spot_aggregate, balances, {"BTC-USDT": Decimal("30000")})
+        # The PnL of derivatives is calculated from the trades
+        self.trading_core.trades_aggregator.get_trades.assert_called_once_with(
+            "test_strategy.yml", 1000000, "binance", "ETH-USDT")
+        mock_perf_metrics_class.create.assert_called_once_with("ETH-USDT", derivative_trades, balances)
+
+    @patch("hummingbot.core.trading_core.PerformanceMetrics")
+    async def test_calculate_performance_metrics_by_market_without_sql_aggregation(self, mock_perf_metrics_class):
+        """Test calculate_performance_metrics_by_market when the database engine cannot aggregate the trades"""
+        spot_aggregate = TradesAggregate(market="binance", symbol="BTC-USDT", num_buys=1, num_nil_position_buys=1)
+        self.trading_core.strategy_file_name = "test_strategy.yml"
+        self.trading_core.trades_aggregator = Mock()
+        self.trading_core.trades_aggregator.aggregates_in_sql = False
+        self.trading_core.trades_aggregator.aggregate.return_value = {("binance", "BTC-USDT"): spot_aggregate}
+        trades = [Mock(spec=TradeFill)]
+        self.trading_core.trades_aggregator.get_trades.return_value = trades
+
+        mock_perf = Mock()
+        mock_perf_metrics_class.rate_pairs.side_effect = lambda symbol, aggregate: [symbol]
+        mock_perf_metrics_class.create_from_aggregate = AsyncMock()
+        mock_perf_metrics_class.create = AsyncMock(return_value=mock_perf)
+        rate_oracle = Mock()
+        rate_oracle.stored_or_live_rates = AsyncMock(return_value={})
+        balances = {"BTC": Decimal("1.0"), "USDT": Decimal("1000.0")}
+
+        with patch.object(self.trading_core, "get_current_balances", return_value=balances), \
+                patch("hummingbot.core.trading_core.RateOracle.get_instance", return_value=rate_oracle):
+            result = await self.trading_core.calculate_performance_metrics_by_market(1000.0)
+
+        self.assertEqual({("binance", "BTC-USDT"): mock_perf}, result)
+        mock_perf_metrics_class.create_from_aggregate.assert_not_called()
+        mock_perf_metrics_class.create.assert_called_once_with("BTC-USDT", trades, balances)
 
     @patch("hummingbot.core.trading_core.PerformanceMetrics")
     async def test_calculate_performance_metrics_by_connector_pair(self, mock_perf_metrics_class):
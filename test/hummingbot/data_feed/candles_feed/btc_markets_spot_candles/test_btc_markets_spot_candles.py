@@ -385,7 +385,7 @@ class TestBtcMarketsSpotCandles(TestCandlesBase):
         self.data_feed._fill_gaps_and_append(new_candle)
 
         self.assertEqual(len(self.data_feed._candles), 1)
-        self.assertEqual(self.data_feed._candles[0], new_candle)
+        self.assertEqual(list(self.data_feed._candles[0]), new_candle)
 
     def test_fill_gaps_and_append_with_gap(self):
         """Test filling gaps between candles"""
@@ -90,6 +90,30 @@ class TestCandlesBase(IsolatedAsyncioWrapperTestCase, ABC):
 
         pd.testing.assert_frame_equal(self.data_feed.candles_df, expected_df)
 
+    def test_in_place_changes_do_not_modify_the_cached_candles(self):
+        self.data_feed._candles.extend(self._candles_data_mock())
+        expected_df = self.data_feed.candles_df
+
+        candles_df = self.data_feed.candles_df
+        candles_df.loc[0, "close"] = -1
+        candles_df.iloc[1:, 0] = 0
+        self.data_feed.get_candles_since(0).candles.loc[1, "open"] = -1
+
+        pd.testing.assert_frame_equal(expected_df, self.data_feed.candles_df)
+        pd.testing.assert_frame_equal(expected_df, self.data_feed.get_candles_since(0).candles)
+
+    def test_get_candles_since(self):
+        self.data_feed._candles.extend(self._candles_data_mock())
+        update = self.data_feed.get_candles_since(0)
+        self.assertTrue(update.is_reset)
+        self.assertEqual(4, len(update.candles))
+        self.assertEqual(self.data_feed.candles_version, update.version)
+
+        self.data_feed._candles[-1] = self._candles_data_mock()[-1]
+        next_update = self.data_feed.get_candles_since(update.version)
+        self.assertFalse(next_update.is_reset)
+        self.assertEqual(1, len(next_update.candles))
+
     def test_get_exchange_trading_pair(self):
         result = self.data_feed.get_exchange_trading_pair(self.trading_pair)
         self.assertEqual(result, self.ex_trading_pair)
@@ -0,0 +1,112 @@
+import unittest
+
+import numpy as np
+
+from hummingbot.data_feed.candles_feed.candles_buffer import CandlesBuffer
+
+COLUMNS = ["timestamp", "open", "close"]
+
+
+def candle(timestamp: int):
+    return [timestamp, timestamp + 0.5, timestamp + 0.25]
+
+
+class CandlesBufferTest(unittest.TestCase):
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.buffer = CandlesBuffer(columns=COLUMNS, maxlen=3)
+
+    def test_append_drops_the_oldest_candles_when_full(self):
+        self.buffer.extend(candle(timestamp) for timestamp in range(5))
+
+        self.assertEqual(3, len(self.buffer))
+        self.assertEqual(3, self.buffer.maxlen)
+        self.assertEqual([2, 3, 4], list(self.buffer.column("timestamp")))
+        self.assertEqual(candle(2), list(self.buffer[0]))
+        self.assertEqual(candle(4), list(self.buffer[-1]))
+        np.testing.assert_array_equal(np.array([candle(2), candle(3), candle(4)]), np.array(self.buffer))
+
+    def test_appendleft_drops_the_newest_candles_when_full(self):
+        self.buffer.extend(candle(timestamp) for timestamp in range(5, 8))
+        self.buffer.extendleft([candle(4), candle(3)])
+
+        self.assertEqual([3, 4, 5], list(self.buffer.column("timestamp")))
+        self.assertEqual([3, 4, 5], [row[0] for row in self.buffer])
+
+    def test_set_item_and_index_errors(self):
+        self.buffer.extend([candle(1), candle(2)])
+        self.buffer[-1] = candle(10)
+
+        self.assertEqual([1, 10], list(self.buffer.column("timestamp")))
+        with self.assertRaises(IndexError):
+            self.buffer[2]
+        with self.assertRaises(IndexError):
+            self.buffer[-3] = candle(0)
+
+    def test_dataframe_is_cached_until_the_next_change(self):
+        self.buffer.extend([candle(1), candle(2)])
+
+        dataframe = self.buffer.to_dataframe()
+        self.assertIs(dataframe, self.buffer.to_dataframe())
+        self.assertEqual(COLUMNS, list(dataframe.columns))
+        self.assertEqual([1, 2], dataframe["timestamp"].tolist())
+
+        self.buffer.append(candle(3))
+        self.assertIsNot(dataframe, self.buffer.to_dataframe())
+        self.assertEqual([1, 2], dataframe["timestamp"].tolist())
+        self.assertEqual([1, 2, 3], self.buffer.to_dataframe()["timestamp"].tolist())
+
+    def test_candles_since_returns_the_appended_and_updated_candles(self):
+        self.buffer.extend([candle(1), candle(2)])
+        first_update = self.buffer.candles_since(0)
+        self.assertTrue(first_update.is_reset)
+        self.assertEqual([1, 2], first_update.candles["timestamp"].tolist())
+
+        no_change = self.buffer.candles_since(first_update.version)
+        self.assertFalse(no_change.is_reset)
+        self.assertEqual(0, len(no_change.candles))
+        self.assertEqual(first_update.version, no_change.version)
+
+        self.buffer[-1] = [2, 2.5, 2.75]
+        self.buffer.append(candle(3))
+        update = self.buffer.candles_since(first_update.version)
+        self.assertFalse(update.is_reset)
+        self.assertEqual([2, 3], update.candles["timestamp"].tolist())
+        self.assertEqual([2.75, 3.25], update.candles["close"].tolist())
+        self.assertGreater(update.version, first_update.version)
+
+    def test_candles_since_resets(self):
+        self.buffer.extend([candle(1), candle(2)])
+        version = self.buffer.version
+
+        # Candles inserted before the candles already seen
+        self.buffer.appendleft(candle(0))
+        self.assertTrue(self.buffer.candles_since(version).is_reset)
+
+        # Candles dropped before being seen
+        version = self.buffer.version
+        self.buffer.extend([candle(3), candle(4), candle(5)])
+        self.buffer.append(candle(6))
+        self.assertTrue(self.buffer.candles_since(version).is_reset)
+
+        # Cleared buffer
+        version = self.buffer.version
+        self.buffer.clear()
+        update = self.buffer.candles_since(version)
+        self.assertTrue(update.is_reset)
+        self.assertEqual(0, len(update.candles))
+
+        # Version of another buffer
+        other_buffer = CandlesBuffer(columns=COLUMNS, maxlen=3)
+        self.assertTrue(self.buffer.candles_since(other_buffer.version).is_reset)
+
+    def test_candles_since_after_dropping_seen_candles(self):
+        self.buffer.extend([candle(1), candle(2), candle(3)])
+        version = self.buffer.version
+
+        self.buffer.append(candle(4))
+        update = self.buffer.candles_since(version)
+
+        self.assertFalse(update.is_reset)
+        self.assertEqual([4], update.candles["timestamp"].tolist())
@@ -0,0 +1,182 @@
+import json
+import os
+import tempfile
+import threading
+from test.isolated_asyncio_wrapper_test_case import IsolatedAsyncioWrapperTestCase
+from unittest.mock import AsyncMock, patch
+
+import numpy as np
+import pandas as pd
+
+from hummingbot.data_feed.candles_feed.binance_spot_candles import BinanceSpotCandles
+from hummingbot.data_feed.candles_feed.candles_store import INDEX_FILE_NAME, CandlesStore
+from hummingbot.data_feed.candles_feed.data_types import HistoricalCandlesConfig
+
+START = 1_700_000_040
+
+
+def candles_df(start: int, end: int, interval: int = 60) -> pd.DataFrame:
+    timestamps = np.arange(start, end, interval, dtype=float)
+    values = np.column_stack([timestamps] + [timestamps / 1000 + column for column in range(9)])
+    return pd.DataFrame(values, columns=BinanceSpotCandles.columns)
+
+
+class CandlesStoreTest(IsolatedAsyncioWrapperTestCase):
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.directory = tempfile.TemporaryDirectory()
+        self.addCleanup(self.directory.cleanup)
+        self.store = CandlesStore(root_path=self.directory.name)
+
+    def candles_directory(self) -> str:
+        return os.path.join(self.directory.name, "binance", "BTC-USDT", "1m")
+
+    def test_missing_ranges_of_an_empty_store(self):
+        self.assertIsNone(self.store.read("binance", "BTC-USDT", "1m", START, START + 600))
+        self.assertEqual([(START, START + 660)],
+                         self.store.missing_ranges("binance", "BTC-USDT", "1m", 60, START - 30, START + 630))
+
+    def test_write_and_read(self):
+        self.store.write("binance", "BTC-USDT", "1m", candles_df(START, START + 600), START, START + 600)
+
+        candles = self.store.read("binance", "BTC-USDT", "1m", START + 60, START + 180)
+        pd.testing.assert_frame_equal(candles_df(START + 60, START + 240), candles)
+        self.assertEqual([], self.store.missing_ranges("binance", "BTC-USDT", "1m", 60, START, START + 540))
+
+    def test_only_gaps_are_missing(self):
+        self.store.write("binance", "BTC-USDT", "1m", candles_df(START, START + 600), START, START + 600)
+        # A range without candles is covered as well
+        self.store.write("binance", "BTC-USDT", "1m", candles_df(0, 0), START + 1200, START + 1800)
+        self.store.write("binance", "BTC-USDT", "1m", candles_df(START + 3000, START + 3600),
+                         START + 3000, START + 3600)
+
+        self.assertEqual([(START, START + 600), (START + 1200, START + 1800), (START + 3000, START + 3600)],
+                         self.store.covered_ranges("binance", "BTC-USDT", "1m"))
+        self.assertEqual([(START - 600, START), (START + 600, START + 1200), (START + 1800, START + 3000),
+                          (START + 3600, START + 4200)],
+                         self.store.missing_ranges("binance", "BTC-USDT", "1m", 60, START - 600, START + 4140))
+
+        self.store.write("binance", "BTC-USDT", "1m", candles_df(START + 600, START + 1200), START + 600, START + 1200)
+        self.assertEqual([(START, START + 1800), (START + 3000, START + 3600)],
+                         self.store.covered_ranges("binance", "BTC-USDT", "1m"))
+        self.assertEqual(30, len(self.store.read("binance", "BTC-USDT", "1m", 0, START + 10000)))
+
+    def test_write_replaces_the_candles_of_the_range(self):
+        self.store.write("binance", "BTC-USDT", "1m", candles_df(START, START + 600), START, START + 600)
+        updated = candles_df(START + 120, START + 240)
+        updated["close"] = 1.0
+        self.store.write("binance", "BTC-USDT", "1m", updated, START + 120, START + 240)
+
+        candles = self.store.read("binance", "BTC-USDT", "1m", START, START + 600)
+        self.assertEqual(10, len(candles))
+        self.assertTrue(candles["timestamp"].is_monotonic_increasing)
+        self.assertEqual([1.0, 1.0], candles["close"].iloc[2:4].tolist())
+
+    def test_readers_share_the_files_of_other_stores(self):
+        self.store.write("binance", "BTC-USDT", "1m", candles_df(START, START + 600), START, START + 600)
+        other_store = CandlesStore(root_path=self.directory.name)
+        self.assertEqual(10, len(other_store.read("binance", "BTC-USDT", "1m", START, START + 600)))
+
+        self.store.write("binance", "BTC-USDT", "1m", candles_df(START + 600, START + 1200), START + 600, START + 1200)
+        self.store.write("binance", "BTC-USDT", "1m", candles_df(START + 1200, START + 1800),
+                         START + 1200, START + 1800)
+
+        self.assertEqual(30, len(other_store.read("binance", "BTC-USDT", "1m", START, START + 1800)))
+
+    def index(self) -> dict:
+        with open(os.path.join(self.candles_directory(), INDEX_FILE_NAME)) as index_file:
+            return json.load(index_file)
+
+    def chunk_files(self) -> set:
+        return {name for name in os.listdir(self.candles_directory()) if name.endswith(".npy")}
+
+    def test_writes_add_chunk_files(self):
+        self.store.write("binance", "BTC-USDT", "1m", candles_df(START, START + 600), START, START + 600)
+        first_chunk_files = self.chunk_files()
+        self.store.write("binance", "BTC-USDT", "1m", candles_df(START + 600, START + 1200), START + 600, START + 1200)
+
+        # The new candles are written in their own file, the stored ones are not written again
+        self.assertEqual(1, len(first_chunk_files))
+        self.assertTrue(first_chunk_files < self.chunk_files())
+        self.assertEqual(2, len(self.chunk_files()))
+        pd.testing.assert_frame_equal(candles_df(START + 300, START + 900),
+                                      self.store.read("binance", "BTC-USDT", "1m", START + 300, START + 840))
+
+    def test_write_inside_a_chunk_splits_it(self):
+        self.store.write("binance", "BTC-USDT", "1m", candles_df(START, START + 600), START, START + 600)
+        self.store.write("binance", "BTC-USDT", "1m", candles_df(START + 600, START + 1200), START + 600, START + 1200)
+        updated = candles_df(START + 120, START + 240)
+        updated["close"] = 1.0
+        self.store.write("binance", "BTC-USDT", "1m", updated, START + 120, START + 240)
+        self.store.write("binance", "BTC-USDT", "1m", candles_df(START + 1200, START + 1800),
+                         START + 1200, START + 1800)
+        # The first chunk is split around the candles written
+        self.assertEqual([(START, START + 60), (START + 120, START + 180), (START + 240, START + 540),
+                          (START + 600, START + 1140), (START + 1200, START + 1740)],
+                         [(first, last) for _, first, last in self.index()["chunks"]])
+
+        with patch("hummingbot.data_feed.candles_feed.candles_store.MAX_CHUNK_FILES", 4):
+            self.store.write("binance", "BTC-USDT", "1m", candles_df(START + 1800, START + 2400),
+                             START + 1800, START + 2400)
+
+        # The chunks are merged into one file once there are too many of them
+        self.assertEqual(1, len(self.index()["chunks"]))
+        expected = candles_df(START, START + 2400)
+        expected.loc[2:3, "close"] = 1.0
+        pd.testing.assert_frame_equal(expected, self.store.read("binance", "BTC-USDT", "1m", START, START + 2400))
+
+    def test_missing_data_file_is_a_missing_range(self):
+        self.store.write("binance", "BTC-USDT", "1m", candles_df(START, START + 600), START, START + 600)
+        with open(os.path.join(self.candles_directory(), INDEX_FILE_NAME)) as index_file:
+            chunk_file = json.load(index_file)["chunks"][0][0]
+        os.remove(os.path.join(self.candles_directory(), chunk_file))
+        other_store = CandlesStore(root_path=self.directory.name)
+
+        self.assertIsNone(other_store.read("binance", "BTC-USDT", "1m", START, START + 600))
+        self.assertEqual([(START, START + 600)],
+                         other_store.missing_ranges("binance", "BTC-USDT", "1m", 60, START, START + 540))
+
+        other_store.write("binance", "BTC-USDT", "1m", candles_df(START + 600, START + 1200), START + 600, START + 1200)
+        self.assertEqual([(START + 600, START + 1200)], other_store.covered_ranges("binance", "BTC-USDT", "1m"))
+        self.assertEqual(10, len(other_store.read("binance", "BTC-USDT", "1m", START, START + 1200)))
+
+    def test_writes_of_different_stores_do_not_lose_candles(self):
+        # Stores do not share their thread lock, only the lock file serializes their writes, as for processes
+        def write_ranges(first_range: int):
+            store = CandlesStore(root_path=self.directory.name)
+            for range_number in range(first_range, 40, 2):
+                start = START + range_number * 600
+                store.write("binance", "BTC-USDT", "1m", candles_df(start, start + 600), start, start + 600)
+
+        writers = [threading.Thread(target=write_ranges, args=(first_range,)) for first_range in range(2)]
+        for writer in writers:
+            writer.start()
+        for writer in writers:
+            writer.join()
+
+        self.assertEqual([(START, START + 40 * 600)], self.store.covered_ranges("binance", "BTC-USDT", "1m"))
+        self.assertEqual(400, len(self.store.read("binance", "BTC-USDT", "1m", START, START + 40 * 600)))
+
+    async def test_historical_candles_fetch_only_the_missing_ranges(self):
+        data_feed = BinanceSpotCandles(trading_pair="BTC-USDT", interval="1m")
+        now = START + 1830
+
+        async def fetch(config: HistoricalCandlesConfig):
+            return candles_df(config.start_time, config.end_time + 60)
+
+        with patch.object(data_feed, "_fetch_historical_candles", AsyncMock(side_effect=fetch)) as fetch_mock, \
+                patch.object(data_feed, "_time", return_value=now):
+            first = await data_feed.get_historical_candles(HistoricalCandlesConfig(
+                connector_name="binance", trading_pair="BTC-USDT", interval="1m",
+                start_time=START + 600, end_time=START + 1200), store=self.store)
+            second = await data_feed.get_historical_candles(HistoricalCandlesConfig(
+                connector_name="binance", trading_pair="BTC-USDT", interval="1m",
+                start_time=START, end_time=now), store=self.store)
+
+        self.assertEqual(11, len(first))
+        self.assertEqual([(START + 600, START + 1260), (START, START + 600), (START + 1260, START + 1860)],
+                         [(call.args[0].start_time, call.args[0].end_time + 60) for call in fetch_mock.call_args_list])
+        pd.testing.assert_frame_equal(candles_df(START, START + 1860), second)
+        # The open candle is returned but not stored
+        self.assertEqual([(START, START + 1800)], self.store.covered_ranges("binance", "BTC-USDT", "1m"))
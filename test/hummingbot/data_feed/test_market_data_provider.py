@@ -47,6 +47,29 @@ class TestMarketDataProvider(IsolatedAsyncioWrapperTestCase):
         # Should return the same instance due to caching
         self.assertIs(connector1, connector2)
 
+    async def test_subscribe_top_of_book(self):
+        self.mock_connector.get_price_by_type.return_value = Decimal("100")
+        callback = MagicMock()
+
+        subscription = self.provider.subscribe_top_of_book("mock_connector", "BTC-USDT", callback, ticks=3)
+
+        self.assertEqual(Decimal("0.01"), subscription.tick_size)
+        self.assertEqual(1, self.provider.market_subscriptions.subscriptions_count)
+        self.provider.unsubscribe(subscription)
+        self.assertEqual(0, self.provider.market_subscriptions.subscriptions_count)
+
+    async def test_subscribe_price_threshold(self):
+        self.mock_connector.get_price_by_type.return_value = Decimal("100")
+        callback = MagicMock()
+
+        subscription = self.provider.subscribe_price_threshold("mock_connector", "BTC-USDT", callback,
+                                                               upper=Decimal("100"))
+        self.provider.market_subscriptions.poll()
+
+        callback.assert_called_once_with(subscription)
+        self.provider.stop()
+        self.assertEqual(0, self.provider.market_subscriptions.subscriptions_count)
+
     def test_stop(self):
         mock_candles_feed = MagicMock()
         self.provider.candles_feeds = {"mock_feed": mock_candles_feed}
@@ -54,6 +77,18 @@ class TestMarketDataProvider(IsolatedAsyncioWrapperTestCase):
         mock_candles_feed.stop.assert_called_once()
         self.assertEqual(len(self.provider.candles_feeds), 0)
 
+    def test_markets_ready(self):
+        self.mock_connector.is_trading_pair_ready.side_effect = lambda trading_pair: trading_pair == "BTC-USDT"
+        self.provider.candles_feeds = {"mock_feed": MagicMock(ready=True)}
+
+        self.assertTrue(self.provider.is_trading_pair_ready("mock_connector", "BTC-USDT"))
+        self.assertFalse(self.provider.is_trading_pair_ready("other_connector", "BTC-USDT"))
+        self.assertTrue(self.provider.markets_ready({"mock_connector": {"BTC-USDT"}}))
+        self.assertFalse(self.provider.markets_ready({"mock_connector": {"BTC-USDT", "ETH-USDT"}}))
+
+        self.provider.candles_feeds["mock_feed"].ready = False
+        self.assertFalse(self.provider.markets_ready({"mock_connector": {"BTC-USDT"}}))
+
     def test_get_order_book(self):
         self.mock_connector.get_order_book.return_value = "mock_order_book"
         result = self.provider.get_order_book("mock_connector", "BTC-USDT")
@@ -71,6 +106,14 @@ class TestMarketDataProvider(IsolatedAsyncioWrapperTestCase):
         result = self.provider.get_candles_df("binance", "BTC-USDT", "1m", 100)
         self.assertIsInstance(result, pd.DataFrame)
 
+    @patch.object(CandlesBase, "start", MagicMock())
+    def test_get_candles_since(self):
+        self.provider.initialize_candles_feed(
+            CandlesConfig(connector="binance", trading_pair="BTC-USDT", interval="1m", max_records=100))
+        result = self.provider.get_candles_since("binance", "BTC-USDT", "1m", 0, 100)
+        self.assertIsInstance(result.candles, pd.DataFrame)
+        self.assertTrue(result.is_reset)
+
     def test_get_trading_pairs(self):
         self.mock_connector.trading_pairs = ["BTC-USDT"]
         trading_pairs = self.provider.get_trading_pairs("mock_connector")
@@ -498,6 +541,26 @@ class TestMarketDataProvider(IsolatedAsyncioWrapperTestCase):
             mock_feed.get_historical_candles.assert_called_once()
             mock_feed._candles.clear.assert_called()
 
+    async def test_get_historical_candles_df_with_candles_store(self):
+        self.provider.candles_store = MagicMock()
+        with patch.object(self.provider, 'get_candles_feed') as mock_get_feed:
+            mock_feed = MagicMock()
+            historical_data = pd.DataFrame({'timestamp': [1640995200, 1640995260, 1640995320]})
+            mock_feed.get_historical_candles = AsyncMock(return_value=historical_data)
+            mock_get_feed.return_value = mock_feed
+
+            result = await self.provider.get_historical_candles_df(
+                "binance", "BTC-USDT", "1m",
+                start_time=1640995200, end_time=1640995320, max_records=2
+            )
+
+            # The candles come from the store, the in memory candles are not rebuilt
+            config = mock_feed.get_historical_candles.call_args.args[0]
+            self.assertEqual((1640995200, 1640995320), (config.start_time, config.end_time))
+            self.assertIs(self.provider.candles_store, mock_feed.get_historical_candles.call_args.kwargs["store"])
+            self.assertEqual([1640995260, 1640995320], result["timestamp"].tolist())
+            mock_feed._candles.clear.assert_not_called()
+
     async def test_get_historical_candles_df_fallback(self):
         # Test fallback to regular method when no time range specified
         with patch.object(self.provider, 'get_candles_df') as mock_get_candles:
@@ -0,0 +1,142 @@
+import asyncio
+from decimal import Decimal
+from test.isolated_asyncio_wrapper_test_case import IsolatedAsyncioWrapperTestCase
+from unittest.mock import MagicMock
+
+from hummingbot.core.data_type.common import PriceType
+from hummingbot.core.data_type.order_book_tracker import OrderBookTracker
+from hummingbot.data_feed.market_subscriptions import (
+    MarketSubscriptions,
+    PriceThresholdSubscription,
+    TopOfBookSubscription,
+)
+
+
+class TestMarketSubscriptions(IsolatedAsyncioWrapperTestCase):
+    def setUp(self):
+        self.prices = {PriceType.BestBid: Decimal("99"), PriceType.BestAsk: Decimal("101")}
+        self.order_book = MagicMock(snapshot_uid=1, last_diff_uid=1, last_applied_trade=0)
+        self.connector = MagicMock()
+        self.connector.get_price_by_type.side_effect = lambda trading_pair, price_type: self.prices[price_type]
+        self.connector.get_order_book.return_value = self.order_book
+        self.subscriptions = MarketSubscriptions(lambda connector_name: self.connector, poll_interval=0.01)
+        self.fired = []
+
+    def tearDown(self):
+        self.subscriptions.stop()
+        super().tearDown()
+
+    def set_top_of_book(self, best_bid: str, best_ask: str):
+        self.prices[PriceType.BestBid] = Decimal(best_bid)
+        self.prices[PriceType.BestAsk] = Decimal(best_ask)
+        self.order_book.last_diff_uid += 1
+
+    async def test_top_of_book_fires_after_ticks(self):
+        self.subscriptions.subscribe(TopOfBookSubscription(
+            "connector", "BTC-USDT", self.fired.append, ticks=2, tick_size=Decimal("0.5")))
+
+        self.subscriptions.poll()
+        self.assertEqual(0, len(self.fired))
+        self.set_top_of_book("99.5", "101")
+        self.subscriptions.poll()
+        self.assertEqual(0, len(self.fired))
+        self.set_top_of_book("100", "101")
+        self.subscriptions.poll()
+        self.assertEqual(1, len(self.fired))
+        # The reference prices are taken again when the trigger fires
+        self.set_top_of_book("100.5", "101")
+        self.subscriptions.poll()
+        self.assertEqual(1, len(self.fired))
+
+    async def test_unchanged_order_book_is_not_evaluated(self):
+        self.subscriptions.subscribe(TopOfBookSubscription("connector", "BTC-USDT", self.fired.append))
+        self.subscriptions.poll()
+        self.connector.get_price_by_type.reset_mock()
+
+        self.subscriptions.poll()
+
+        self.connector.get_price_by_type.assert_not_called()
+
+    async def test_price_threshold_fires_once(self):
+        subscription = self.subscriptions.subscribe(PriceThresholdSubscription(
+            "connector", "BTC-USDT", self.fired.append, lower=Decimal("95"), upper=Decimal("105")))
+
+        self.set_top_of_book("104", "106")
+        self.subscriptions.poll()
+        self.assertEqual([subscription], self.fired)
+        self.set_top_of_book("106", "108")
+        self.subscriptions.poll()
+        self.assertEqual(1, len(self.fired))
+
+        subscription.set_thresholds(lower=Decimal("100"), upper=None)
+        self.set_top_of_book("98", "100")
+        self.subscriptions.poll()
+        self.assertEqual(2, len(self.fired))
+
+    async def test_price_threshold_on_best_bid(self):
+        self.subscriptions.subscribe(PriceThresholdSubscription(
+            "connector", "BTC-USDT", self.fired.append, lower=Decimal("98"), price_type=PriceType.BestBid))
+
+        self.set_top_of_book("98.5", "99")
+        self.subscriptions.poll()
+        self.assertEqual(0, len(self.fired))
+        self.set_top_of_book("98", "99")
+        self.subscriptions.poll()
+        self.assertEqual(1, len(self.fired))
+
+    async def test_unsubscribe(self):
+        subscription = self.subscriptions.subscribe(TopOfBookSubscription("connector", "BTC-USDT", self.fired.append))
+        self.assertEqual(1, self.subscriptions.subscriptions_count)
+
+        self.subscriptions.unsubscribe(subscription)
+        self.set_top_of_book("90", "91")
+        self.subscriptions.poll()
+
+        self.assertEqual(0, self.subscriptions.subscriptions_count)
+        self.assertEqual(0, len(self.fired))
+
+    async def test_polling_task_calls_callbacks(self):
+        self.subscriptions.subscribe(TopOfBookSubscription("connector", "BTC-USDT", self.fired.append))
+        self.set_top_of_book("100", "101")
+
+        await asyncio.sleep(0.05)
+
+        self.assertEqual(1, len(self.fired))
+
+    def hook_order_book_tracker(self) -> OrderBookTracker:
+        tracker = OrderBookTracker(data_source=MagicMock(), trading_pairs=["BTC-USDT"])
+        self.connector.order_book_tracker = tracker
+        return tracker
+
+    async def test_order_book_updates_call_callbacks_without_polling(self):
+        tracker = self.hook_order_book_tracker()
+        self.subscriptions.subscribe(TopOfBookSubscription("connector", "BTC-USDT", self.fired.append))
+        self.assertIsNone(self.subscriptions._poll_task)
+
+        self.set_top_of_book("100", "101")
+        tracker._notify_update("BTC-USDT")
+        await asyncio.sleep(0)
+
+        self.assertEqual(1, len(self.fired))
+
+    async def test_order_book_updates_are_evaluated_once_per_loop_iteration(self):
+        tracker = self.hook_order_book_tracker()
+        self.subscriptions.subscribe(TopOfBookSubscription("connector", "BTC-USDT", self.fired.append))
+        self.connector.get_price_by_type.reset_mock()
+
+        for _ in range(10):
+            tracker._notify_update("BTC-USDT")
+        tracker._notify_update("ETH-USDT")
+        await asyncio.sleep(0)
+
+        # One read of the best bid and the best ask for the subscribed market only
+        self.assertEqual(2, self.connector.get_price_by_type.call_count)
+
+    async def test_unsubscribing_the_last_market_removes_the_order_book_listener(self):
+        tracker = self.hook_order_book_tracker()
+        subscription = self.subscriptions.subscribe(TopOfBookSubscription("connector", "BTC-USDT", self.fired.append))
+        self.assertEqual(1, len(tracker._update_listeners))
+
+        self.subscriptions.unsubscribe(subscription)
+
+        self.assertEqual(0, len(tracker._update_listeners))
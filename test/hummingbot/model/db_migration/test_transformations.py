@@ -1,7 +1,13 @@
 from unittest import TestCase
 from unittest.mock import MagicMock
 
-from hummingbot.model.db_migration.transformations import AddTradeFeeInQuote, ConvertPriceAndAmountColumnsToBigint
+from sqlalchemy import create_engine, inspect
+
+from hummingbot.model.db_migration.transformations import (
+    AddQueryIndexes,
+    AddTradeFeeInQuote,
+    ConvertPriceAndAmountColumnsToBigint,
+)
 
 
 class ConvertPriceAndAmountColumnsToBigintTests(TestCase):
@@ -41,3 +47,51 @@ class AddTradeFeeInQuoteTests(TestCase):
 
     def test_to_version(self):
         self.assertEqual(20230516, AddTradeFeeInQuote(self).to_version)
+
+
+class AddQueryIndexesTests(TestCase):
+    def test_name(self):
+        self.assertEqual("AddQueryIndexes", AddQueryIndexes(self).name)
+
+    def test_to_version(self):
+        self.assertEqual(20261018, AddQueryIndexes(self).to_version)
+
+    def test_apply_creates_the_missing_indexes(self):
+        db_handle = MagicMock()
+        db_handle.engine = create_engine("sqlite://")
+        with db_handle.engine.begin() as conn:
+            conn.exec_driver_sql('CREATE TABLE "Order" (id TEXT, config_file_path TEXT, market TEXT, '
+                                 'creation_timestamp BIGINT)')
+            conn.exec_driver_sql("CREATE TABLE TradeFill (order_id TEXT, timestamp BIGINT)")
+            conn.exec_driver_sql("CREATE TABLE MarketState (config_file_path TEXT, market TEXT)")
+            conn.exec_driver_sql("CREATE INDEX tf_timestamp_index ON TradeFill (timestamp)")
+
+        AddQueryIndexes(migrator=self).apply(db_handle)
+
+        inspector = inspect(db_handle.engine)
+        self.assertEqual(["o_config_market_timestamp_index"],
+                         [index["name"] for index in inspector.get_indexes("Order")])
+        self.assertEqual({"tf_timestamp_index", "tf_order_id_index"},
+                         {index["name"] for index in inspector.get_indexes("TradeFill")})
+        market_state_index = inspector.get_indexes("MarketState")[0]
+        self.assertEqual("ms_config_market_index", market_state_index["name"])
+        self.assertTrue(market_state_index["unique"])
+
+    def test_apply_keeps_the_last_duplicated_market_states(self):
+        db_handle = MagicMock()
+        db_handle.engine = create_engine("sqlite://")
+        with db_handle.engine.begin() as conn:
+            conn.exec_driver_sql('CREATE TABLE "Order" (id TEXT, config_file_path TEXT, market TEXT, '
+                                 'creation_timestamp BIGINT)')
+            conn.exec_driver_sql("CREATE TABLE TradeFill (order_id TEXT, timestamp BIGINT)")
+            conn.exec_driver_sql("CREATE TABLE MarketState (id INTEGER PRIMARY KEY, config_file_path TEXT, "
+                                 "market TEXT, saved_state TEXT)")
+            conn.exec_driver_sql("INSERT INTO MarketState (config_file_path, market, saved_state) VALUES "
+                                 "('conf.yml', 'binance', 'old'), ('conf.yml', 'kucoin', 'kucoin'), "
+                                 "('conf.yml', 'binance', 'new')")
+
+        AddQueryIndexes(migrator=self).apply(db_handle)
+
+        with db_handle.engine.begin() as conn:
+            rows = conn.exec_driver_sql("SELECT market, saved_state FROM MarketState ORDER BY market").fetchall()
+        self.assertEqual([("binance", "new"), ("kucoin", "kucoin")], [tuple(row) for row in rows])
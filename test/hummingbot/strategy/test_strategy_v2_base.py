@@ -48,6 +48,18 @@ class TestStrategyV2Base(IsolatedAsyncioWrapperTestCase):
         self.strategy.tick(self.start_timestamp + 10)
         self.assertTrue(self.strategy.ready_to_trade)
 
+    def test_candles_store_is_opt_in(self):
+        for store_historical_candles in (False, True):
+            config = StrategyV2ConfigBase(markets={self.connector_name: {self.trading_pair}}, candles_config=[],
+                                          store_historical_candles=store_historical_candles)
+            with patch("asyncio.create_task", return_value=MagicMock()), \
+                    patch("hummingbot.strategy.strategy_v2_base.StrategyV2Base.listen_to_executor_actions"), \
+                    patch("hummingbot.strategy.strategy_v2_base.ExecutorOrchestrator"), \
+                    patch("hummingbot.strategy.strategy_v2_base.MarketDataProvider") as market_data_provider_mock:
+                StrategyV2Base({self.connector_name: self.connector}, config=config)
+            candles_store = market_data_provider_mock.call_args.kwargs["candles_store"]
+            self.assertEqual(store_historical_candles, candles_store is not None)
+
     def test_init_markets(self):
         StrategyV2Base.init_markets(self.strategy_config)
         self.assertIn(self.connector_name, StrategyV2Base.markets)
@@ -301,6 +313,32 @@ class TestStrategyV2Base(IsolatedAsyncioWrapperTestCase):
             close_type_counts={CloseType.TAKE_PROFIT: 10, CloseType.STOP_LOSS: 5}
         )
 
+    @patch("hummingbot.strategy.strategy_v2_base.StrategyV2Base.current_timestamp", new_callable=PropertyMock)
+    def test_update_executors_info_publishes_changed_performance(self, current_timestamp_mock):
+        current_timestamp_mock.return_value = self.start_timestamp
+        reports = {"controller_1": {"executors": [], "positions": [],
+                                    "performance": self.create_mock_performance_report()}}
+        self.strategy.executor_orchestrator.get_all_reports.return_value = reports
+        self.strategy.executor_orchestrator.get_reports_snapshot.return_value = (1, reports)
+        self.strategy._pub = MagicMock()
+
+        self.strategy.update_executors_info()
+        current_timestamp_mock.return_value = self.start_timestamp + self.strategy.performance_publish_interval
+        self.strategy.update_executors_info()
+
+        self.strategy._pub.assert_called_once()
+        published = self.strategy._pub.call_args[0][0]
+        self.assertEqual("150", published["controller_1"]["global_pnl_quote"])
+
+        # Changed reports are published at most once per interval
+        self.strategy.executor_orchestrator.get_reports_snapshot.return_value = (2, reports)
+        current_timestamp_mock.return_value = self.start_timestamp + self.strategy.performance_publish_interval - 1
+        self.strategy.update_executors_info()
+        self.assertEqual(1, self.strategy._pub.call_count)
+        current_timestamp_mock.return_value = self.start_timestamp + self.strategy.performance_publish_interval
+        self.strategy.update_executors_info()
+        self.assertEqual(2, self.strategy._pub.call_count)
+
     def test_format_status(self):
         # Mock dependencies
         self.strategy.ready_to_trade = True
@@ -107,3 +107,83 @@ class RingBufferTest(unittest.TestCase):
         self.assertTrue(np.array_equal(buffer.get_as_numpy_array(), np.array([0, 1, 2, 3])))
         buffer.add_value(4)
         self.assertTrue(np.array_equal(buffer.get_as_numpy_array(), np.array([1, 2, 3, 4])))
+
+    def test_size(self):
+        self.assertEqual(0, self.buffer.size)
+        for i in range(self.BUFFER_LENGTH + 5):
+            self.buffer.add_value(i)
+            self.assertEqual(min(i + 1, self.BUFFER_LENGTH), self.buffer.size)
+
+    def test_numpy_view_is_ordered_and_read_only(self):
+        buffer = RingBuffer(4)
+        for i in range(6):
+            buffer.add_value(i)
+
+        view = buffer.get_as_numpy_view()
+        self.assertTrue(np.array_equal(view, np.array([2, 3, 4, 5])))
+        with self.assertRaises(ValueError):
+            view[0] = 10
+
+        array = buffer.get_as_numpy_array()
+        buffer.add_value(6)
+        # The view shares the buffer storage, the array is a copy
+        self.assertTrue(np.array_equal(buffer.get_as_numpy_view(), np.array([3, 4, 5, 6])))
+        self.assertTrue(np.array_equal(array, np.array([2, 3, 4, 5])))
+
+    def test_statistics_match_numpy_on_a_sliding_window(self):
+        rng = np.random.default_rng(42)
+        values = 30000 + rng.normal(scale=0.01, size=self.BUFFER_LENGTH * 10 + 7)
+        for value in values:
+            self.buffer.add_value(value)
+            if self.buffer.is_full:
+                window = self.buffer.get_as_numpy_array()
+                self.assertAlmostEqual(np.mean(window), self.buffer.mean_value, places=9)
+                self.assertAlmostEqual(np.var(window) / self.buffer.variance, 1, places=6)
+                self.assertAlmostEqual(np.std(window) / self.buffer.std_dev, 1, places=6)
+
+    def test_statistics_recover_once_a_nan_leaves_the_window(self):
+        values = [float(i) for i in range(self.BUFFER_LENGTH * 3)]
+        values[self.BUFFER_LENGTH + 2] = np.nan
+        for index, value in enumerate(values):
+            self.buffer.add_value(value)
+            if self.buffer.is_full:
+                window = self.buffer.get_as_numpy_array()
+                if np.isnan(window).any():
+                    self.assertTrue(np.isnan(self.buffer.mean_value))
+                    self.assertTrue(np.isnan(self.buffer.std_dev))
+                else:
+                    self.assertAlmostEqual(np.mean(window), self.buffer.mean_value, places=9)
+                    self.assertAlmostEqual(np.std(window), self.buffer.std_dev, places=9)
+
+    def test_statistics_when_the_first_value_is_nan(self):
+        self.buffer.add_value(np.nan)
+        for i in range(self.BUFFER_LENGTH):
+            self.buffer.add_value(100 + i)
+
+        window = self.buffer.get_as_numpy_array()
+        self.assertAlmostEqual(np.mean(window), self.buffer.mean_value, places=9)
+        self.assertAlmostEqual(np.std(window), self.buffer.std_dev, places=9)
+
+    def test_window_larger_than_int16(self):
+        length = 40000
+        buffer = RingBuffer(length)
+        for i in range(length + 10):
+            buffer.add_value(i)
+
+        array = buffer.get_as_numpy_array()
+        self.assertEqual(length, array.size)
+        self.assertEqual(10, array[0])
+        self.assertEqual(length + 9, array[-1])
+        self.assertEqual(np.mean(array), buffer.mean_value)
+
+    def test_change_length(self):
+        for i in range(self.BUFFER_LENGTH):
+            self.buffer.add_value(i)
+
+        self.buffer.length = 10
+        self.assertTrue(np.array_equal(self.buffer.get_as_numpy_array(), np.arange(20, 30)))
+        self.assertEqual(24.5, self.buffer.mean_value)
+
+        self.buffer.length = 20
+        self.assertFalse(self.buffer.is_full)
+        self.assertEqual(10, self.buffer.size)
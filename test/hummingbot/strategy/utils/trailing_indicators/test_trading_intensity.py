@@ -4,6 +4,7 @@ from decimal import Decimal
 
 import numpy as np
 import pandas as pd
+from scipy.optimize import curve_fit
 
 from hummingbot.connector.exchange.paper_trade.paper_trade_exchange import QuantizationParams
 from hummingbot.connector.test_support.mock_paper_exchange import MockPaperExchange
@@ -11,7 +12,10 @@ from hummingbot.core.data_type.common import TradeType
 from hummingbot.core.data_type.order_book import OrderBook
 from hummingbot.core.data_type.trade_fee import TradeFeeSchema
 from hummingbot.core.event.events import OrderBookTradeEvent
-from hummingbot.strategy.__utils__.trailing_indicators.trading_intensity import TradingIntensityIndicator
+from hummingbot.strategy.__utils__.trailing_indicators.trading_intensity import (
+    TradingIntensityIndicator,
+    fit_exponential_decay,
+)
 from hummingbot.strategy.market_trading_pair_tuple import MarketTradingPairTuple
 from hummingbot.strategy.order_book_asset_price_delegate import OrderBookAssetPriceDelegate
 
@@ -256,3 +260,52 @@ class TradingIntensityTest(unittest.TestCase):
 
         self.assertAlmostEqual(a, alpha, 10)
         self.assertAlmostEqual(b, kappa, 10)
+
+    def test_fit_exponential_decay_matches_nonlinear_least_squares(self):
+        price_levels = np.linspace(0.5, 12, 40)
+        amounts = 3 * np.exp(-0.4 * price_levels) * np.random.lognormal(sigma=0.3, size=price_levels.size)
+
+        expected, _ = curve_fit(lambda t, a, b: a * np.exp(-b * t),
+                                price_levels,
+                                amounts,
+                                p0=(1, 1),
+                                method='dogbox',
+                                bounds=([0, 0], [np.inf, np.inf]),
+                                ftol=1e-14, xtol=1e-14, gtol=1e-14)
+        alpha, kappa = fit_exponential_decay(price_levels, amounts)
+
+        self.assertAlmostEqual(expected[0], alpha, 5)
+        self.assertAlmostEqual(expected[1], kappa, 5)
+        # A warm start from a previous estimate converges to the same parameters
+        self.assertAlmostEqual(kappa, fit_exponential_decay(price_levels, amounts, initial_kappa=2.5)[1], 8)
+
+    def test_fit_exponential_decay_requires_two_price_levels(self):
+        self.assertIsNone(fit_exponential_decay(np.array([1.0]), np.array([2.0])))
+        self.assertIsNone(fit_exponential_decay(np.array([1.0, 1.0]), np.array([2.0, 3.0])))
+
+    def _feed_ticks(self, indicator: TradingIntensityIndicator, ticks):
+        timestamp = self.start_timestamp
+        indicator.last_quotes = [{"timestamp": timestamp, "price": 1}]
+        for trades in ticks:
+            timestamp += 1
+            for price, amount in trades:
+                indicator.register_trade(OrderBookTradeEvent(trading_pair="COINALPHAHBOT",
+                                                             timestamp=timestamp,
+                                                             price=price,
+                                                             amount=amount,
+                                                             type=TradeType.SELL))
+            indicator.calculate(timestamp)
+            indicator.last_quotes = [{"timestamp": timestamp, "price": 1}] + indicator.last_quotes
+
+    def test_samples_leaving_the_window_are_removed_from_the_estimate(self):
+        old_tick = [(2, 100.0), (4, 1.0), (9, 50.0)]
+        ticks = [[(2, 2.0), (3, 1.5), (5, 0.8)], [(2, 1.8), (4, 1.1), (7, 0.3)]]
+
+        indicator = TradingIntensityIndicator(OrderBook(), self.price_delegate, 2)
+        self._feed_ticks(indicator, [old_tick] + ticks)
+        window_indicator = TradingIntensityIndicator(OrderBook(), self.price_delegate, 2)
+        self._feed_ticks(window_indicator, ticks)
+
+        self.assertTrue(indicator.is_sampling_buffer_full)
+        self.assertAlmostEqual(window_indicator.current_value[0], indicator.current_value[0], 8)
+        self.assertAlmostEqual(window_indicator.current_value[1], indicator.current_value[1], 8)
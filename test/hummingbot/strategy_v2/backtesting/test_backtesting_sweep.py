@@ -0,0 +1,95 @@
+from decimal import Decimal
+from test.hummingbot.strategy_v2.backtesting.simulation_candles import START
+from test.isolated_asyncio_wrapper_test_case import IsolatedAsyncioWrapperTestCase
+from unittest import TestCase
+from unittest.mock import MagicMock
+
+import numpy as np
+import pandas as pd
+
+from hummingbot.connector.trading_rule import TradingRule
+from hummingbot.strategy_v2.backtesting.backtesting_engine_base import BacktestingEngineBase
+from hummingbot.strategy_v2.backtesting.backtesting_sweep import BacktestingSweep
+from hummingbot.strategy_v2.models.executors import CloseType
+
+BASE_CONFIG = {"id": "grid", "controller_name": "grid_strike", "controller_type": "generic",
+               "connector_name": "binance", "trading_pair": "BTC-USDT", "total_amount_quote": 1000,
+               "start_price": 29000, "end_price": 31000, "limit_price": 28000}
+
+
+def set_up_engine(minutes: int = 3 * 24 * 60) -> BacktestingEngineBase:
+    rng = np.random.default_rng(1)
+    close = 30000 * np.exp(np.cumsum(rng.normal(0, 0.001, minutes)))
+    candles = pd.DataFrame({"timestamp": START + 60 * np.arange(minutes, dtype=float), "open": close,
+                            "high": close * 1.0005, "low": close * 0.9995, "close": close, "volume": 10.0})
+    engine = BacktestingEngineBase()
+    # The backtests of the tests run without the live rates of the connectors
+    engine.backtesting_data_provider.initialize_rate_sources = MagicMock()
+    engine.backtesting_data_provider.candles_feeds["binance_BTC-USDT_1m"] = candles
+    engine.backtesting_data_provider.trading_rules["binance"] = {"BTC-USDT": TradingRule(
+        "BTC-USDT", min_base_amount_increment=Decimal("0.00001"), min_price_increment=Decimal("0.01"))}
+    return engine
+
+
+def end_timestamp(engine: BacktestingEngineBase) -> int:
+    return int(engine.backtesting_data_provider.candles_feeds["binance_BTC-USDT_1m"]["timestamp"].iloc[-1])
+
+
+class ConfigGridTest(TestCase):
+
+    def test_config_grid(self):
+        configs = BacktestingSweep.config_grid(BASE_CONFIG, {"limit_price": [27000, 28000],
+                                                             "max_open_orders": [2, 5, 10]})
+
+        self.assertEqual(6, len(configs))
+        self.assertEqual([f"grid_{index}" for index in range(6)], [config["id"] for config in configs])
+        self.assertEqual({(limit_price, max_open_orders) for limit_price in [27000, 28000]
+                          for max_open_orders in [2, 5, 10]},
+                         {(config["limit_price"], config["max_open_orders"]) for config in configs})
+        self.assertTrue(all(config["start_price"] == 29000 for config in configs))
+
+
+class BacktestingSweepTest(IsolatedAsyncioWrapperTestCase):
+
+    async def backtest(self, config: dict, max_loss_quote=None) -> dict:
+        engine = set_up_engine()
+        controller_config = BacktestingEngineBase.get_controller_config_instance_from_dict(config, "controllers")
+        return await engine.run_backtesting(controller_config, START, end_timestamp(engine),
+                                            max_loss_quote=max_loss_quote)
+
+    async def test_max_loss_abandons_the_backtesting(self):
+        result = await self.backtest(BASE_CONFIG)
+        abandoned_result = await self.backtest(BASE_CONFIG, max_loss_quote=1)
+
+        self.assertFalse(result["abandoned"])
+        self.assertTrue(abandoned_result["abandoned"])
+        self.assertLessEqual(abandoned_result["results"]["net_pnl_quote"], -1)
+        self.assertLess(max(executor_info.close_timestamp for executor_info in abandoned_result["executors"]),
+                        max(executor_info.close_timestamp for executor_info in result["executors"]))
+        self.assertTrue(all(executor_info.close_type == CloseType.EARLY_STOP and not executor_info.is_active
+                            for executor_info in abandoned_result["executors"]))
+
+    async def test_sweep_results_are_the_results_of_the_backtests(self):
+        engine = set_up_engine()
+        configs = BacktestingSweep.config_grid(BASE_CONFIG, {"min_spread_between_orders": [0.001, 0.002]})
+        sweep = BacktestingSweep(max_workers=2, controllers_module="controllers", backtesting_engine=engine)
+
+        rows = [row async for row in sweep.run(configs, START, end_timestamp(engine))]
+
+        self.assertEqual({"grid_0", "grid_1"}, {row["config"]["id"] for row in rows})
+        for row in rows:
+            self.assertFalse(row["abandoned"])
+            self.assertEqual((await self.backtest(row["config"]))["results"], row["results"])
+
+    async def test_failing_config_does_not_stop_the_sweep(self):
+        engine = set_up_engine()
+        configs = BacktestingSweep.config_grid(BASE_CONFIG, {"min_spread_between_orders": [0.001, "not a number"]})
+        sweep = BacktestingSweep(max_workers=2, controllers_module="controllers", backtesting_engine=engine)
+
+        rows = {row["config"]["id"]: row async for row in sweep.run(configs, START, end_timestamp(engine))}
+
+        self.assertEqual({"grid_0", "grid_1"}, set(rows))
+        self.assertIsNone(rows["grid_0"]["error"])
+        self.assertIsNotNone(rows["grid_0"]["results"])
+        self.assertIsNone(rows["grid_1"]["results"])
+        self.assertIn("min_spread_between_orders", rows["grid_1"]["error"])
@@ -0,0 +1,112 @@
+import unittest
+from decimal import Decimal
+from test.hummingbot.strategy_v2.backtesting.simulation_candles import START, candles
+
+import numpy as np
+
+from hummingbot.core.data_type.common import OrderType, TradeType
+from hummingbot.strategy_v2.backtesting.executors_simulator.grid_executor_simulator import (
+    GridExecutorSimulator,
+    GridSimulation,
+)
+from hummingbot.strategy_v2.executors.grid_executor.data_types import GridExecutorConfig
+from hummingbot.strategy_v2.executors.position_executor.data_types import TripleBarrierConfig
+from hummingbot.strategy_v2.models.executors import CloseType
+
+
+def oscillations(count: int, low: float = 99, high: float = 101, candles_per_leg: int = 20) -> np.ndarray:
+    leg = np.linspace(100, low, candles_per_leg)
+    cycle = np.concatenate([leg, np.linspace(low, high, 2 * candles_per_leg), np.linspace(high, 100, candles_per_leg)])
+    return np.tile(cycle, count)
+
+
+class GridExecutorSimulatorTest(unittest.TestCase):
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.simulator = GridExecutorSimulator()
+
+    @staticmethod
+    def get_config(side: TradeType = TradeType.BUY, **kwargs) -> GridExecutorConfig:
+        config = {
+            "id": "test", "timestamp": START, "connector_name": "binance", "trading_pair": "ETH-USDT", "side": side,
+            "start_price": Decimal("95"), "end_price": Decimal("105"), "limit_price": Decimal("90"),
+            "total_amount_quote": Decimal("1000"), "min_spread_between_orders": Decimal("0.002"),
+            "max_open_orders": 100,
+            "triple_barrier_config": TripleBarrierConfig(take_profit=Decimal("0.004"),
+                                                         open_order_type=OrderType.LIMIT_MAKER,
+                                                         take_profit_order_type=OrderType.LIMIT_MAKER),
+        }
+        config.update(kwargs)
+        return GridExecutorConfig(**config)
+
+    def test_generate_levels(self):
+        levels = GridSimulation.generate_levels(self.get_config())
+
+        self.assertEqual(52, len(levels))
+        self.assertAlmostEqual(95, levels[0].price)
+        self.assertAlmostEqual(105, levels[-1].price)
+        self.assertAlmostEqual(1000 / 52, levels[0].amount_quote)
+        self.assertAlmostEqual(0.004, levels[0].take_profit)
+
+    def test_levels_are_re_armed_after_their_take_profit(self):
+        results = []
+        for count in range(1, 4):
+            simulation = self.simulator.simulate(candles(oscillations(count)), self.get_config(), trade_cost=0.0002)
+            self.assertEqual(CloseType.TIME_LIMIT, simulation.close_type)
+            self.assertEqual(count * 80, len(simulation.executor_simulation))
+            results.append(simulation.executor_simulation[["filled_amount_quote", "net_pnl_quote"]].iloc[-1])
+
+        # Each oscillation fills the levels it crosses and their take profits again
+        first_cycle, second_cycle = results[1] - results[0], results[2] - results[1]
+        self.assertGreater(first_cycle["filled_amount_quote"], 300)
+        self.assertGreater(first_cycle["net_pnl_quote"], 0)
+        self.assertAlmostEqual(first_cycle["filled_amount_quote"], second_cycle["filled_amount_quote"])
+        self.assertAlmostEqual(first_cycle["net_pnl_quote"], second_cycle["net_pnl_quote"])
+
+    def test_take_profit_above_the_end_price(self):
+        close = np.concatenate([oscillations(2), np.linspace(100, 106, 60)])
+        simulation = self.simulator.simulate(candles(close), self.get_config(), trade_cost=0.0002)
+
+        self.assertEqual(CloseType.TAKE_PROFIT, simulation.close_type)
+        self.assertGreater(simulation.executor_simulation["close"].iloc[-1], 105)
+        self.assertLessEqual(simulation.executor_simulation["close"].iloc[-2], 105)
+
+    def test_limit_price_and_stop_loss(self):
+        close = np.linspace(100, 89, 110)
+        stop_loss = self.simulator.simulate(candles(close), self.get_config(), trade_cost=0.0002)
+        position_hold = self.simulator.simulate(candles(close), self.get_config(keep_position=True),
+                                                trade_cost=0.0002)
+
+        self.assertEqual(CloseType.STOP_LOSS, stop_loss.close_type)
+        self.assertLess(stop_loss.executor_simulation["net_pnl_quote"].iloc[-1], -50)
+        self.assertEqual(CloseType.POSITION_HOLD, position_hold.close_type)
+        # The position held is not part of the pnl of the executor
+        self.assertEqual(0, position_hold.executor_simulation["filled_amount_quote"].iloc[-1])
+        self.assertEqual(0, position_hold.executor_simulation["net_pnl_quote"].iloc[-1])
+        self.assertEqual(len(stop_loss.executor_simulation), len(position_hold.executor_simulation))
+
+    def test_short_grid(self):
+        close = np.concatenate([200 - oscillations(3), np.linspace(100, 94, 60)])
+        simulation = self.simulator.simulate(candles(close), self.get_config(side=TradeType.SELL, limit_price=110),
+                                             trade_cost=0.0002)
+
+        self.assertEqual(CloseType.TAKE_PROFIT, simulation.close_type)
+        self.assertLess(simulation.executor_simulation["close"].iloc[-1], 95)
+        self.assertGreater(simulation.executor_simulation["net_pnl_quote"].iloc[-1], 0)
+
+    def test_activation_bounds_and_max_open_orders(self):
+        close = oscillations(3)
+        triple_barrier_config = TripleBarrierConfig(take_profit=Decimal("0.004"), time_limit=60 * 100)
+        bounded = self.simulator.simulate(candles(close), self.get_config(
+            activation_bounds=Decimal("0.005"), max_open_orders=2, max_orders_per_batch=1,
+            triple_barrier_config=triple_barrier_config), trade_cost=0.0002)
+        unbounded = self.simulator.simulate(candles(close), self.get_config(
+            triple_barrier_config=triple_barrier_config), trade_cost=0.0002)
+
+        self.assertEqual(CloseType.TIME_LIMIT, bounded.close_type)
+        self.assertEqual(101, len(bounded.executor_simulation))
+        # Without bounds, the levels above the price are all filled at once
+        self.assertGreater(unbounded.executor_simulation["filled_amount_quote"].iloc[5], 400)
+        self.assertLess(bounded.executor_simulation["filled_amount_quote"].iloc[5], 100)
+        self.assertGreater(bounded.executor_simulation["filled_amount_quote"].iloc[-1], 0)
@@ -0,0 +1,111 @@
+import unittest
+from decimal import Decimal
+from test.hummingbot.strategy_v2.backtesting.simulation_candles import START, candles
+
+import numpy as np
+
+from hummingbot.core.data_type.common import OrderType, TradeType
+from hummingbot.strategy_v2.backtesting.executor_simulator_base import first_index
+from hummingbot.strategy_v2.backtesting.executors_simulator.position_executor_simulator import (
+    INITIAL_WINDOW,
+    PositionExecutorSimulator,
+)
+from hummingbot.strategy_v2.executors.position_executor.data_types import (
+    PositionExecutorConfig,
+    TrailingStop,
+    TripleBarrierConfig,
+)
+from hummingbot.strategy_v2.models.base import RunnableStatus
+from hummingbot.strategy_v2.models.executors import CloseType
+
+
+class PositionExecutorSimulatorTest(unittest.TestCase):
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.simulator = PositionExecutorSimulator()
+
+    @staticmethod
+    def get_config(side: TradeType = TradeType.BUY, entry_price: Decimal = Decimal("100"),
+                   open_order_type: OrderType = OrderType.MARKET, **barriers) -> PositionExecutorConfig:
+        return PositionExecutorConfig(id="test", timestamp=START, trading_pair="ETH-USDT", connector_name="binance",
+                                      side=side, entry_price=entry_price, amount=Decimal("1"),
+                                      triple_barrier_config=TripleBarrierConfig(open_order_type=open_order_type,
+                                                                                **barriers))
+
+    def test_first_index(self):
+        values = np.zeros(1000, dtype=bool)
+        values[700] = True
+
+        self.assertEqual(700, first_index(lambda start, stop: values[start:stop], 0, 1000, initial_window=8))
+        self.assertEqual(700, first_index(lambda start, stop: values[start:stop], 700, 1000))
+        self.assertIsNone(first_index(lambda start, stop: values[start:stop], 701, 1000, initial_window=8))
+
+    def test_take_profit(self):
+        df = candles(np.linspace(100, 110, 101))
+        simulation = self.simulator.simulate(df, self.get_config(take_profit=Decimal("0.05"), time_limit=6000),
+                                             trade_cost=0.0006)
+
+        self.assertEqual(CloseType.TAKE_PROFIT, simulation.close_type)
+        last_row = simulation.executor_simulation.iloc[-1]
+        self.assertGreater(last_row["net_pnl_pct"], 0.05)
+        self.assertLess(simulation.executor_simulation["net_pnl_pct"].iloc[-2], 0.05)
+        # The amount of the closing trade is added to the last candle
+        self.assertEqual(200, last_row["filled_amount_quote"])
+
+    def test_stop_loss_of_a_short_position(self):
+        df = candles(np.linspace(100, 110, 101))
+        simulation = self.simulator.simulate(df, self.get_config(side=TradeType.SELL, stop_loss=Decimal("0.03"),
+                                                                 take_profit=Decimal("0.05"), time_limit=6000),
+                                             trade_cost=0.0006)
+
+        self.assertEqual(CloseType.STOP_LOSS, simulation.close_type)
+        self.assertGreaterEqual(df.loc[simulation.executor_simulation.index[-1], "high"], 103)
+        self.assertLess(df.loc[simulation.executor_simulation.index[-2], "high"], 103)
+        self.assertLess(simulation.executor_simulation["net_pnl_pct"].iloc[-1], 0)
+
+    def test_trailing_stop(self):
+        close = np.concatenate([np.linspace(100, 110, 51), np.linspace(110, 100, 51)[1:]])
+        simulation = self.simulator.simulate(candles(close), self.get_config(
+            trailing_stop=TrailingStop(activation_price=Decimal("0.05"), trailing_delta=Decimal("0.01"))),
+            trade_cost=0.0006)
+
+        self.assertEqual(CloseType.TRAILING_STOP, simulation.close_type)
+        self.assertIn("ts", simulation.executor_simulation.columns)
+        self.assertGreater(simulation.executor_simulation["net_pnl_pct"].iloc[-1], 0.05)
+
+    def test_barrier_after_the_initial_window_without_time_limit(self):
+        close = np.full(4 * INITIAL_WINDOW, 100.0)
+        close[3 * INITIAL_WINDOW:] = 120
+        simulation = self.simulator.simulate(candles(close), self.get_config(take_profit=Decimal("0.1")),
+                                             trade_cost=0.0006)
+
+        self.assertEqual(CloseType.TAKE_PROFIT, simulation.close_type)
+        self.assertEqual(3 * INITIAL_WINDOW + 1, len(simulation.executor_simulation))
+
+    def test_limit_order_not_filled(self):
+        df = candles(np.linspace(100, 110, 101))
+        simulation = self.simulator.simulate(df, self.get_config(entry_price=Decimal("95"),
+                                                                 open_order_type=OrderType.LIMIT,
+                                                                 take_profit=Decimal("0.05"), time_limit=600),
+                                             trade_cost=0.0006)
+
+        self.assertEqual(CloseType.TIME_LIMIT, simulation.close_type)
+        self.assertEqual(11, len(simulation.executor_simulation))
+        self.assertEqual(0, simulation.executor_simulation["filled_amount_quote"].abs().sum())
+
+    def test_executor_info_at_timestamp(self):
+        df = candles(np.linspace(100, 110, 101))
+        simulation = self.simulator.simulate(df, self.get_config(take_profit=Decimal("0.05"), time_limit=6000),
+                                             trade_cost=0.0006)
+        close_timestamp = simulation.executor_simulation.index[-1]
+
+        self.assertEqual(RunnableStatus.TERMINATED, simulation.get_executor_info_at_timestamp(START - 60).status)
+        active_info = simulation.get_executor_info_at_timestamp(START + 90)
+        self.assertTrue(active_info.is_active)
+        self.assertEqual(Decimal("100"), active_info.filled_amount_quote)
+        self.assertAlmostEqual(100.1, active_info.custom_info["close_price"])
+        closed_info = simulation.get_executor_info_at_timestamp(close_timestamp + 600)
+        self.assertFalse(closed_info.is_active)
+        self.assertEqual(CloseType.TAKE_PROFIT, closed_info.close_type)
+        self.assertEqual(close_timestamp, closed_info.close_timestamp)
@@ -0,0 +1,104 @@
+import unittest
+from decimal import Decimal
+from test.hummingbot.strategy_v2.backtesting.simulation_candles import START
+from unittest.mock import MagicMock
+
+import numpy as np
+import pandas as pd
+
+from hummingbot.core.data_type.common import TradeType
+from hummingbot.strategy_v2.backtesting.backtesting_engine_base import BacktestingEngineBase
+from hummingbot.strategy_v2.backtesting.executors_simulator.xemm_executor_simulator import XEMMExecutorSimulator
+from hummingbot.strategy_v2.executors.data_types import ConnectorPair
+from hummingbot.strategy_v2.executors.xemm_executor.data_types import XEMMExecutorConfig
+from hummingbot.strategy_v2.models.executors import CloseType
+
+
+def market_data(buying_close: np.ndarray, selling_close: np.ndarray) -> pd.DataFrame:
+    timestamps = START + 60 * np.arange(len(buying_close), dtype=float)
+    df = pd.DataFrame({"timestamp": timestamps})
+    for prefix, close in (("buying", buying_close), ("selling", selling_close)):
+        df[f"{prefix}_high"] = close * 1.001
+        df[f"{prefix}_low"] = close * 0.999
+        df[f"{prefix}_close"] = close
+    df.index = timestamps
+    return df
+
+
+class XEMMExecutorSimulatorTest(unittest.TestCase):
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.simulator = XEMMExecutorSimulator()
+
+    @staticmethod
+    def get_config(maker_side: TradeType = TradeType.BUY) -> XEMMExecutorConfig:
+        maker_market = ConnectorPair(connector_name="kucoin", trading_pair="ETH-USDT")
+        taker_market = ConnectorPair(connector_name="binance", trading_pair="ETH-USDT")
+        return XEMMExecutorConfig(
+            id="test", timestamp=START, maker_side=maker_side, order_amount=Decimal("2"),
+            buying_market=maker_market if maker_side == TradeType.BUY else taker_market,
+            selling_market=taker_market if maker_side == TradeType.BUY else maker_market,
+            min_profitability=Decimal("0.002"), target_profitability=Decimal("0.004"),
+            max_profitability=Decimal("0.008"))
+
+    def test_maker_buy_filled_and_hedged(self):
+        buying_close = np.array([100, 100, 99.9, 99.5, 99.4, 99.3])
+        selling_close = np.full(6, 100.0)
+        simulation = self.simulator.simulate(market_data(buying_close, selling_close), self.get_config(),
+                                             trade_cost=0.0005)
+
+        # Maker order at 100 * (1 - 0.004 - 0.001), filled when the low of the buying market is below it
+        self.assertEqual(CloseType.COMPLETED, simulation.close_type)
+        self.assertEqual(4, len(simulation.executor_simulation))
+        last_row = simulation.executor_simulation.iloc[-1]
+        self.assertAlmostEqual(2 * 100 - 2 * 99.5 - 0.0005 * (2 * 99.5 + 2 * 100), last_row["net_pnl_quote"])
+        self.assertAlmostEqual(2 * 99.5 + 2 * 100, last_row["filled_amount_quote"])
+        self.assertEqual(0, simulation.executor_simulation["filled_amount_quote"].iloc[-2])
+
+    def test_maker_sell_is_placed_again_when_the_taker_price_moves(self):
+        # The taker price rises, the maker order is cancelled and placed again at 102 * 1.005
+        selling_close = np.array([100, 100, 100, 100, 100, 100, 102.6])
+        buying_close = np.array([100, 100, 102, 102, 102, 102, 102])
+        simulation = self.simulator.simulate(market_data(buying_close, selling_close),
+                                             self.get_config(TradeType.SELL), trade_cost=0.0005)
+
+        self.assertEqual(CloseType.COMPLETED, simulation.close_type)
+        self.assertEqual(7, len(simulation.executor_simulation))
+        maker_price = 102 * 1.005
+        self.assertAlmostEqual(2 * maker_price - 2 * 102 - 0.0005 * (2 * maker_price + 2 * 102),
+                               simulation.executor_simulation["net_pnl_quote"].iloc[-1])
+
+    def test_not_filled(self):
+        simulation = self.simulator.simulate(market_data(np.full(10, 100.0), np.full(10, 100.0)),
+                                             self.get_config(), trade_cost=0.0005)
+
+        self.assertEqual(CloseType.EXPIRED, simulation.close_type)
+        self.assertEqual(10, len(simulation.executor_simulation))
+        self.assertEqual(0, simulation.executor_simulation["net_pnl_quote"].abs().sum())
+
+    def test_engine_aligns_the_candles_of_both_markets(self):
+        timestamps = START + 60 * np.arange(6, dtype=float)
+        features = pd.DataFrame({"timestamp": timestamps, "close": 100.0}, index=timestamps)
+        candles = {
+            "kucoin": pd.DataFrame({"timestamp": timestamps, "high": 100.1, "low": [100, 100, 99.9, 99.4, 99, 99],
+                                    "close": 100.0}),
+            # Missing candle of the taker market
+            "binance": pd.DataFrame({"timestamp": np.delete(timestamps, 2), "high": 100.1, "low": 99.9,
+                                     "close": 100.0}),
+        }
+        engine = BacktestingEngineBase()
+        engine.backtesting_resolution = "1m"
+        engine.controller = MagicMock()
+        engine.controller.processed_data = {"features": features}
+        engine.controller.market_data_provider.get_candles_df.side_effect = \
+            lambda connector_name, trading_pair, interval: candles[connector_name]
+
+        market_data_from_row = engine.get_xemm_market_data(self.get_config(), features.iloc[1:])
+        self.assertEqual(list(timestamps[1:]), list(market_data_from_row.index))
+        self.assertEqual([100.0] * 5, market_data_from_row["selling_close"].tolist())
+        self.assertEqual(99.4, market_data_from_row["buying_low"].iloc[2])
+
+        simulation = engine.simulate_executor(self.get_config(), features.iloc[1:], trade_cost=0.0005)
+        self.assertEqual(CloseType.COMPLETED, simulation.close_type)
+        self.assertEqual(timestamps[3], simulation.executor_simulation.index[-1])
@@ -1,6 +1,6 @@
 import asyncio
 from test.isolated_asyncio_wrapper_test_case import IsolatedAsyncioWrapperTestCase
-from unittest.mock import AsyncMock, MagicMock, PropertyMock
+from unittest.mock import AsyncMock, MagicMock, PropertyMock, patch
 
 from hummingbot.data_feed.candles_feed.data_types import CandlesConfig
 from hummingbot.data_feed.market_data_provider import MarketDataProvider
@@ -86,6 +86,32 @@ class TestControllerBase(IsolatedAsyncioWrapperTestCase):
         # Check that no action is put in the queue
         self.mock_actions_queue.put.assert_not_called()
 
+    async def test_control_task_waits_only_for_the_controller_markets(self):
+        type(self.controller.market_data_provider).ready = PropertyMock(return_value=False)
+        self.mock_market_data_provider.markets_ready.return_value = True
+        self.controller.executors_update_event.set()
+        self.controller.update_processed_data = AsyncMock()
+        self.controller.determine_executor_actions = MagicMock(return_value=[])
+
+        with patch.object(ControllerConfigBase, "update_markets",
+                          lambda config, markets: markets.add_or_update("binance", "ETH-USDT")):
+            await self.controller.control_task()
+
+        self.controller.update_processed_data.assert_awaited_once()
+        self.mock_market_data_provider.markets_ready.assert_called_once_with({"binance": {"ETH-USDT"}})
+
+    def test_markets_are_computed_once_and_ready_is_kept(self):
+        self.mock_market_data_provider.markets_ready.side_effect = [False, True]
+        update_markets = MagicMock(side_effect=lambda markets: markets.add_or_update("binance", "ETH-USDT"))
+
+        with patch.object(ControllerConfigBase, "update_markets", lambda config, markets: update_markets(markets)):
+            self.assertFalse(self.controller.markets_ready)
+            self.assertTrue(self.controller.markets_ready)
+            self.assertTrue(self.controller.markets_ready)
+
+        update_markets.assert_called_once()
+        self.assertEqual(2, self.mock_market_data_provider.markets_ready.call_count)
+
     def test_to_format_status(self):
         # Test the to_format_status method
         status = self.controller.to_format_status()
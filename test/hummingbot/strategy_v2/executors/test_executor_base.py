@@ -152,6 +152,52 @@ class TestExecutorBase(IsolatedAsyncioWrapperTestCase, LoggerMixinForTest):
         self.component.stop()
         self.assertEqual(RunnableStatus.TERMINATED, self.component.status)
 
+    def test_change_fingerprint(self):
+        self.assertIsNone(self.component.change_fingerprint())
+        self.component._status = RunnableStatus.RUNNING
+        # The base config has no market to watch
+        self.assertIsNone(self.component.change_fingerprint())
+
+        self.component.config = MagicMock(connector_name="connector1", trading_pair="ETH-USDT")
+        fingerprint = self.component.change_fingerprint()
+        self.assertEqual(fingerprint, self.component.change_fingerprint())
+
+        # Events of orders placed by other executors are ignored
+        self.component._fill_order_forwarder(MagicMock(order_id="OID-OTHER"))
+        self.assertEqual(fingerprint, self.component.change_fingerprint())
+
+        order_id = self.component.place_order(connector_name="connector1", trading_pair="ETH-USDT",
+                                              order_type=OrderType.LIMIT, side=TradeType.BUY,
+                                              amount=Decimal("1.0"), price=Decimal("1000.0"))
+        self.component._fill_order_forwarder(MagicMock(order_id=order_id))
+        self.assertEqual(1, self.component._order_updates_count)
+        self.assertNotEqual(fingerprint, self.component.change_fingerprint())
+
+        self.strategy.connectors["connector1"].get_order_book.side_effect = ValueError("No order book")
+        self.assertIsNone(self.component.change_fingerprint())
+
+    async def test_subscribe_to_market_changes_wakes_executor(self):
+        self.component.wake_on_top_of_book_ticks = 2
+        self.component.config = MagicMock(connector_name="connector1", trading_pair="ETH-USDT")
+        self.strategy.market_data_provider = MagicMock()
+        self.component.subscribe_to_market_changes()
+        # Without a scheduler there is nothing to wake
+        self.strategy.market_data_provider.subscribe_top_of_book.assert_not_called()
+
+        self.component.scheduler = MagicMock()
+        self.component._status = RunnableStatus.RUNNING
+        self.component.subscribe_to_market_changes()
+        self.strategy.market_data_provider.subscribe_top_of_book.assert_called_once_with(
+            "connector1", "ETH-USDT", self.component._on_market_change, ticks=2)
+        fingerprint = self.component.change_fingerprint()
+
+        self.component._on_market_change(MagicMock())
+
+        self.component.scheduler.wake.assert_called_once_with(self.component)
+        self.assertNotEqual(fingerprint, self.component.change_fingerprint())
+        self.component.unsubscribe_from_market_changes()
+        self.strategy.market_data_provider.unsubscribe.assert_called_once()
+
     def test_get_price_by_type(self):
         price = self.component.get_price("connector1", "EHT-USDT", PriceType.MidPrice)
         self.assertEqual(price, Decimal("1000.0"))
@@ -105,6 +105,24 @@ class TestExecutorOrchestrator(unittest.TestCase):
         ]
         self.orchestrator.execute_actions(actions)
         self.assertEqual(len(self.orchestrator.active_executors["test"]), 5)
+        for executor in self.orchestrator.active_executors["test"]:
+            self.assertIs(self.orchestrator.executors_scheduler, executor.scheduler)
+
+    def test_get_executors_scheduler_report(self):
+        position_executor = MagicMock(spec=PositionExecutor)
+        position_executor.config = MagicMock(PositionExecutorConfig)
+        position_executor.config.id = "test"
+        stats = MagicMock()
+        stats.to_dict.return_value = {"runs": 3, "skips": 1}
+        self.orchestrator.executors_scheduler = MagicMock()
+        self.orchestrator.executors_scheduler.get_stats.return_value = stats
+        self.orchestrator.active_executors["test"] = [position_executor]
+
+        report = self.orchestrator.get_executors_scheduler_report()
+
+        self.assertEqual({"test": {"test": {"runs": 3, "skips": 1}}}, report)
+        self.orchestrator.executors_scheduler = None
+        self.assertEqual({}, self.orchestrator.get_executors_scheduler_report())
 
     def test_execute_actions_store_executor_active(self):
         position_executor = MagicMock(spec=PositionExecutor)
@@ -181,6 +199,92 @@ class TestExecutorOrchestrator(unittest.TestCase):
         self.assertEqual(report.realized_pnl_quote, Decimal(10))
         self.assertEqual(report.unrealized_pnl_quote, Decimal(10))
 
+    def create_scheduled_executor(self, executor_id: str, net_pnl_quote: Decimal, status: RunnableStatus):
+        config = PositionExecutorConfig(
+            timestamp=1234, trading_pair="ETH-USDT", connector_name="binance",
+            side=TradeType.BUY, amount=Decimal(10), entry_price=Decimal(100),
+        )
+        config.id = executor_id
+        executor = MagicMock(spec=PositionExecutor)
+        executor.config = config
+        executor.status = status
+        executor.is_active = status != RunnableStatus.TERMINATED
+        executor_info = PropertyMock(return_value=ExecutorInfo(
+            id=executor_id, timestamp=1234, type="position_executor", status=status, config=config,
+            close_type=CloseType.TAKE_PROFIT if status == RunnableStatus.TERMINATED else None,
+            filled_amount_quote=Decimal(100), net_pnl_quote=net_pnl_quote, net_pnl_pct=Decimal(1),
+            cum_fees_quote=Decimal(1), is_trading=True, is_active=True, custom_info={"side": TradeType.BUY}
+        ))
+        type(executor).executor_info = executor_info
+        return executor, executor_info
+
+    @patch.object(MarketsRecorder, "get_instance")
+    def test_get_all_reports_reads_only_changed_executors(self, _):
+        stats = {}
+        self.orchestrator.executors_scheduler = MagicMock()
+        self.orchestrator.executors_scheduler.get_stats.side_effect = lambda executor: stats[executor]
+        running, running_info = self.create_scheduled_executor("running", Decimal(5), RunnableStatus.RUNNING)
+        done, done_info = self.create_scheduled_executor("done", Decimal(10), RunnableStatus.TERMINATED)
+        stats[running] = MagicMock(runs=1)
+        stats[done] = MagicMock(runs=1)
+        self.orchestrator.active_executors["test"] = [running, done]
+        self.orchestrator.cached_performance["test"] = PerformanceReport()
+
+        version, reports = self.orchestrator.get_reports_snapshot()
+        self.assertEqual({}, reports)
+        reports = self.orchestrator.get_all_reports()
+        performance = reports["test"]["performance"]
+        self.assertEqual(Decimal(5), performance.unrealized_pnl_quote)
+        self.assertEqual(Decimal(10), performance.realized_pnl_quote)
+        self.assertEqual(Decimal(200), performance.volume_traded)
+        self.assertEqual({CloseType.TAKE_PROFIT: 1}, performance.close_type_counts)
+        self.assertEqual((version + 1, reports), self.orchestrator.get_reports_snapshot())
+
+        # Nothing ran since the previous reports
+        self.orchestrator.get_all_reports()
+        self.assertEqual(1, running_info.call_count)
+        self.assertEqual(1, done_info.call_count)
+        self.assertEqual(version + 1, self.orchestrator.reports_version)
+
+        # Only the executor that ran is read again, and the done executor is never read again
+        stats[running].runs = 2
+        stats[done].runs = 2
+        running_info.return_value = running_info.return_value.model_copy(update={"net_pnl_quote": Decimal(7)})
+        reports = self.orchestrator.get_all_reports()
+        self.assertEqual(2, running_info.call_count)
+        self.assertEqual(1, done_info.call_count)
+        self.assertEqual(Decimal(7), reports["test"]["performance"].unrealized_pnl_quote)
+        self.assertEqual(version + 2, self.orchestrator.reports_version)
+
+        # A stored executor moves from the running aggregates to the cached performance
+        self.orchestrator.execute_action(StoreExecutorAction(executor_id="done", controller_id="test"))
+        self.assertEqual(Decimal(0), self.orchestrator.active_executors_performance["test"].realized_pnl_quote)
+        performance = self.orchestrator.get_all_reports()["test"]["performance"]
+        self.assertEqual(Decimal(10), performance.realized_pnl_quote)
+        self.assertEqual({CloseType.TAKE_PROFIT: 1}, performance.close_type_counts)
+
+    def test_get_all_reports_computes_position_summaries_again_only_when_mid_price_moved(self):
+        position = PositionHold("binance", "ETH-USDT", TradeType.BUY)
+        position.buy_amount_base = Decimal("2")
+        position.buy_amount_quote = Decimal("400")
+        self.orchestrator.positions_held = {"test": [position]}
+        self.orchestrator.cached_performance = {"test": PerformanceReport()}
+
+        with patch.object(PositionHold, "get_position_summary", wraps=position.get_position_summary) as summary_mock:
+            reports = self.orchestrator.get_all_reports()
+            version = self.orchestrator.reports_version
+            self.assertEqual(Decimal(60), reports["test"]["performance"].unrealized_pnl_quote)
+
+            self.assertIs(reports["test"], self.orchestrator.get_all_reports()["test"])
+            self.assertEqual(1, summary_mock.call_count)
+            self.assertEqual(version, self.orchestrator.reports_version)
+
+            self.orchestrator.strategy.market_data_provider.get_price_by_type.return_value = Decimal(240)
+            reports = self.orchestrator.get_all_reports()
+            self.assertEqual(2, summary_mock.call_count)
+            self.assertEqual(Decimal(80), reports["test"]["performance"].unrealized_pnl_quote)
+            self.assertEqual(version + 1, self.orchestrator.reports_version)
+
     @patch("hummingbot.strategy_v2.executors.executor_orchestrator.MarketsRecorder.get_instance")
     def test_initialize_cached_performance(self, mock_get_instance: MagicMock):
         # Create mock markets recorder
@@ -0,0 +1,177 @@
+import asyncio
+import time
+from test.isolated_asyncio_wrapper_test_case import IsolatedAsyncioWrapperTestCase
+from test.logger_mixin_for_test import LoggerMixinForTest
+
+from hummingbot.strategy_v2.executors.executor_scheduler import ExecutorScheduler
+from hummingbot.strategy_v2.models.base import RunnableStatus
+from hummingbot.strategy_v2.runnable_base import RunnableBase
+
+
+class CountingRunnable(RunnableBase):
+    def __init__(self, update_interval: float = 0.01):
+        super().__init__(update_interval)
+        self.starts = 0
+        self.runs = 0
+        self.stops = 0
+        self.fingerprint = None
+
+    async def on_start(self):
+        self.starts += 1
+
+    async def control_task(self):
+        self.runs += 1
+
+    def on_stop(self):
+        self.stops += 1
+
+    def change_fingerprint(self):
+        return self.fingerprint
+
+
+class TestExecutorScheduler(IsolatedAsyncioWrapperTestCase, LoggerMixinForTest):
+    def setUp(self):
+        super().setUp()
+        self.scheduler = ExecutorScheduler(bucket_size=0.005, max_idle_interval=10.0)
+        self.set_loggers(loggers=[self.scheduler.logger()])
+
+    def tearDown(self):
+        self.scheduler.stop()
+        super().tearDown()
+
+    def start_runnable(self, runnable: RunnableBase):
+        runnable.scheduler = self.scheduler
+        runnable.start()
+
+    async def test_start_hands_runnable_to_scheduler(self):
+        runnable = CountingRunnable()
+        self.start_runnable(runnable)
+        self.assertEqual(RunnableStatus.RUNNING, runnable.status)
+        self.assertEqual(1, self.scheduler.scheduled_count)
+
+        await asyncio.sleep(0.1)
+
+        self.assertEqual(1, runnable.starts)
+        self.assertGreater(runnable.runs, 1)
+        self.assertEqual(runnable.runs, self.scheduler.get_stats(runnable).runs)
+
+    async def test_runs_many_runnables_from_one_task(self):
+        runnables = [CountingRunnable() for _ in range(50)]
+        tasks_before = len(asyncio.all_tasks())
+        for runnable in runnables:
+            self.start_runnable(runnable)
+
+        self.assertEqual(tasks_before + 1, len(asyncio.all_tasks()))
+        await asyncio.sleep(0.1)
+        self.assertTrue(all(runnable.runs > 1 for runnable in runnables))
+
+    async def test_stopped_runnable_is_finished(self):
+        runnable = CountingRunnable()
+        self.start_runnable(runnable)
+        await asyncio.sleep(0.05)
+
+        runnable.stop()
+        await asyncio.sleep(0.05)
+        runs = runnable.runs
+        await asyncio.sleep(0.05)
+
+        self.assertEqual(1, runnable.stops)
+        self.assertEqual(runs, runnable.runs)
+        self.assertEqual(0, self.scheduler.scheduled_count)
+        self.assertIsNotNone(self.scheduler.get_stats(runnable))
+        self.scheduler.forget(runnable)
+        self.assertIsNone(self.scheduler.get_stats(runnable))
+
+    async def test_unchanged_runnable_is_skipped(self):
+        runnable = CountingRunnable()
+        runnable.fingerprint = 1
+        self.start_runnable(runnable)
+        await asyncio.sleep(0.1)
+
+        self.assertEqual(1, runnable.runs)
+        self.assertGreater(self.scheduler.get_stats(runnable).skips, 0)
+
+        runnable.fingerprint = 2
+        await asyncio.sleep(0.05)
+        self.assertEqual(2, runnable.runs)
+
+    async def test_unchanged_runnable_runs_after_max_idle_interval(self):
+        self.scheduler.max_idle_interval = 0.03
+        runnable = CountingRunnable()
+        runnable.fingerprint = 1
+        self.start_runnable(runnable)
+        await asyncio.sleep(0.15)
+
+        self.assertGreater(runnable.runs, 1)
+        self.assertGreater(self.scheduler.get_stats(runnable).skips, 0)
+
+    async def test_wake_runs_runnable_before_its_update_interval(self):
+        runnable = CountingRunnable(update_interval=10.0)
+        self.start_runnable(runnable)
+        await asyncio.sleep(0.02)
+        self.assertEqual(1, runnable.runs)
+
+        runnable.wake()
+        # Waking a runnable that is already due does not run it twice
+        runnable.wake()
+        await asyncio.sleep(0.02)
+
+        self.assertEqual(2, runnable.runs)
+
+    async def test_wake_while_running_runs_again(self):
+        runnable = CountingRunnable(update_interval=10.0)
+
+        async def control_task():
+            runnable.runs += 1
+            if runnable.runs == 1:
+                runnable.wake()
+
+        runnable.control_task = control_task
+        self.start_runnable(runnable)
+        await asyncio.sleep(0.03)
+
+        self.assertEqual(2, runnable.runs)
+
+    async def test_control_task_exception_is_logged_and_runnable_rescheduled(self):
+        runnable = CountingRunnable()
+
+        async def raise_exception():
+            runnable.runs += 1
+            raise Exception("Test")
+
+        runnable.control_task = raise_exception
+        self.start_runnable(runnable)
+        await asyncio.sleep(0.1)
+
+        self.assertTrue(self.is_logged("ERROR", "Test"))
+        self.assertGreater(runnable.runs, 1)
+
+    async def test_stats_report_cpu_time(self):
+        runnable = CountingRunnable()
+        self.start_runnable(runnable)
+        await asyncio.sleep(0.05)
+
+        stats = self.scheduler.get_stats(runnable).to_dict()
+        self.assertEqual(stats["runs"], stats["cpu_time"]["count"])
+        self.assertGreaterEqual(stats["cpu_time_total"], 0)
+        self.assertEqual(0, stats["skips"])
+
+    async def test_cpu_time_excludes_the_time_control_task_waits(self):
+        async def wait():
+            await asyncio.sleep(0.05)
+
+        async def busy():
+            deadline = time.thread_time() + 0.05
+            while time.thread_time() < deadline:
+                pass
+
+        runnable = CountingRunnable(update_interval=10)
+        runnable.control_task = wait
+        self.start_runnable(runnable)
+        await asyncio.sleep(0.01)
+        await busy()
+        await asyncio.sleep(0.06)
+
+        stats = self.scheduler.get_stats(runnable)
+        self.assertEqual(1, stats.runs)
+        self.assertLess(stats.cpu_time.total, 0.02)